@@ -65,27 +65,15 @@ License:
 import argparse
 import socket
 from collections import OrderedDict
+from importlib import import_module
 from inspect import getsourcefile
-from os import environ, getcwd, mkdir, path, rename
+from os import environ, getcwd, mkdir, path, rename, replace
 from os import sep as directory_separator
 from os import walk
 from platform import system
 from random import choice
 from shutil import copy, rmtree
-from time import mktime, strftime, strptime, time
-
-import requests
-from colorama import Back, Fore, Style
-from colorama import init as initiate
-
-from PyFunceble.check import Check
-from PyFunceble.clean import Clean
-from PyFunceble.config import Load, Merge, Version
-from PyFunceble.core import Core
-from PyFunceble.directory_structure import DirectoryStructure
-from PyFunceble.iana import IANA
-from PyFunceble.production import Production
-from PyFunceble.publicsuffix import PublicSuffix
+from time import mktime, sleep, strftime, strptime, time
 
 # We set our project name.
 NAME = "PyFunceble"
@@ -95,17 +83,106 @@ VERSION = "1.17.1. (Blue Bontebok: Caterpillar)"
 # We set the list of windows "platforms"
 WINDOWS_PLATFORMS = ["windows", "cygwin", "cygwin_nt-10.0"]
 
-if "PYFUNCEBLE_OUTPUT_DIR" in environ:  # pragma: no cover
-    # We handle the case that the `PYFUNCEBLE_OUTPUT_DIR` environnement variable is set.
-    CURRENT_DIRECTORY = environ["PYFUNCEBLE_OUTPUT_DIR"]
-elif Version(True).is_cloned():  # pragma: no cover
-    # We handle the case that we are in a cloned.
-    CURRENT_DIRECTORY = getcwd() + directory_separator
-elif "TRAVIS_BUILD_DIR" in environ:  # pragma: no cover
-    # We handle the case that we are under Travis CI.
-    CURRENT_DIRECTORY = getcwd() + directory_separator
-else:  # pragma: no cover
-    # We handle all other case and distributions specific cases.
+
+class LazyImport:
+    """
+    Import the given module (or a name from it) on first use.
+
+    It lets us expose (for example) :code:`PyFunceble.requests` without
+    importing :code:`requests` along with the package.
+
+    :param module: The module to import.
+    :type module: str
+
+    :param attribute:
+        The name to get from the module.
+        :code:`None` means the module itself.
+    :type attribute: str
+
+    .. note::
+        The attribute assignments and deletions are forwarded to the imported
+        object so that we can still mock (for example)
+        :code:`PyFunceble.requests.get`.
+    """
+
+    def __init__(self, module, attribute=None):
+        # We save what we have to import.
+        # Note: We do not use the usual assignment as we forward them.
+        object.__setattr__(self, "lazy_import", (module, attribute))
+
+    def lazy_target(self):
+        """
+        Import (if needed) and give the object we represent.
+
+        .. note::
+            The name is not a usual one on purpose, as any other attribute
+            is forwarded to the object we represent.
+        """
+
+        # We get the module to import and the name to get from it.
+        module, attribute = object.__getattribute__(self, "lazy_import")
+
+        # We import the module.
+        # Note: It is only imported once, the next calls get it from sys.modules.
+        result = import_module(module)
+
+        if attribute:
+            # We have to get a name from the module.
+
+            # We get it.
+            result = getattr(result, attribute)
+
+        # We return the result.
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.lazy_target(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.lazy_target(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.lazy_target(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.lazy_target()(*args, **kwargs)
+
+
+# We initiate the third-party modules we only import on first use so that
+# `import PyFunceble` stays light.
+requests = LazyImport("requests")
+urllib3 = LazyImport("urllib3")
+yaml = LazyImport("yaml")
+Back = LazyImport("colorama", "Back")
+Fore = LazyImport("colorama", "Fore")
+Style = LazyImport("colorama", "Style")
+initiate = LazyImport("colorama", "init")
+
+# We initiate the classes we only import on first use.
+Check = LazyImport("PyFunceble.check", "Check")
+Clean = LazyImport("PyFunceble.clean", "Clean")
+Load = LazyImport("PyFunceble.config", "Load")
+Merge = LazyImport("PyFunceble.config", "Merge")
+Version = LazyImport("PyFunceble.config", "Version")
+Core = LazyImport("PyFunceble.core", "Core")
+DirectoryStructure = LazyImport(
+    "PyFunceble.directory_structure", "DirectoryStructure"
+)
+IANA = LazyImport("PyFunceble.iana", "IANA")
+Production = LazyImport("PyFunceble.production", "Production")
+PublicSuffix = LazyImport("PyFunceble.publicsuffix", "PublicSuffix")
+
+
+def _get_default_directory():  # pragma: no cover
+    """
+    Get the directory we are working with when it is not given and we are
+    not in the cloned version of PyFunceble.
+
+    :rtype: str
+    """
+
+    # We initiate the directory we are working with.
+    current_directory = getcwd() + directory_separator
 
     if system().lower() == "linux" or system().lower() == "darwin":
         # We are under a Linux distribution.
@@ -118,55 +195,88 @@ else:  # pragma: no cover
         if path.isdir(config_dir_path):
             # Everything went right:
             #   * `~/.config` exists.
-            # We set our configuration location path as the directory we are working with.
-            CURRENT_DIRECTORY = config_dir_path
+            # We set our configuration location path as the directory we are
+            # working with.
+            current_directory = config_dir_path
         elif path.isdir(path.expanduser("~")):
             # Something went wrong:
             #   * `~/.config` does not exists.
             #   * `~` exists.
             # We set `~/` as the directory we are working with.
             #
-            # Note: The `.` at the end is because we want to hide the directory we are
-            # going to create.
-            CURRENT_DIRECTORY = (
-                path.expanduser("~") + directory_separator + "."
-            )  # pylint: disable=line-too-long
-        else:
-            # Everything went wrong:
-            #   * `~/.config` does not exists.
-            #   * `~` soes not exists.
-            # We set the current directory as the directory we are working with.
-            CURRENT_DIRECTORY = getcwd() + directory_separator
-    elif system().lower() in WINDOWS_PLATFORMS:
-        # We are under Windows or CygWin.
-
-        if "APPDATA" in environ:
-            # Everything went right:
-            #   * `APPDATA` is into the environnement variables.
-            # We set it as the directory we are working with.
-            CURRENT_DIRECTORY = environ["APPDATA"]
-        else:
-            # Everything went wrong:
-            #   * `APPDATA` is not into the environnement variables.
-            # We set the current directory as the directory we are working with.
-            CURRENT_DIRECTORY = getcwd() + directory_separator
-
-    if not CURRENT_DIRECTORY.endswith(directory_separator):
+            # Note: The `.` at the end is because we want to hide the directory
+            # we are going to create.
+            current_directory = path.expanduser("~") + directory_separator + "."
+        # Otherwise, everything went wrong:
+        #   * `~/.config` does not exists.
+        #   * `~` soes not exists.
+        # We keep the current directory as the directory we are working with.
+    elif system().lower() in WINDOWS_PLATFORMS and "APPDATA" in environ:
+        # We are under Windows or CygWin and everything went right:
+        #   * `APPDATA` is into the environnement variables.
+        # We set it as the directory we are working with.
+        # Note: Otherwise, we keep the current directory.
+        current_directory = environ["APPDATA"]
+
+    if not current_directory.endswith(directory_separator):
         # If the directory we are working with does not ends with the directory
         # separator, we append it to the end.
-        CURRENT_DIRECTORY += directory_separator
+        current_directory += directory_separator
 
     # We append the name of the project to the directory we are working with.
-    CURRENT_DIRECTORY += NAME + directory_separator
+    current_directory += NAME + directory_separator
 
-    if not path.isdir(CURRENT_DIRECTORY):
+    if not path.isdir(current_directory):
         # If the directory does not exist we create it.
-        mkdir(CURRENT_DIRECTORY)
+        mkdir(current_directory)
+
+    # We return the directory we are working with.
+    return current_directory
+
 
-if not CURRENT_DIRECTORY.endswith(directory_separator):  # pragma: no cover
-    # Again for safety, if the directory we are working with does not ends with
-    # the directory separator, we append it to the end.
-    CURRENT_DIRECTORY += directory_separator
+def get_current_directory():  # pragma: no cover
+    """
+    Get the directory we are working with (configuration files, databases ...).
+
+    :rtype: str
+
+    .. note::
+        It is computed only once (and then saved into
+        :code:`PyFunceble.CURRENT_DIRECTORY`) because we have to know if we are
+        in the cloned version of PyFunceble.
+    """
+
+    if "CURRENT_DIRECTORY" in globals():
+        # The directory was already computed or given.
+
+        # We return it.
+        return globals()["CURRENT_DIRECTORY"]
+
+    if "PYFUNCEBLE_OUTPUT_DIR" in environ:
+        # We handle the case that the `PYFUNCEBLE_OUTPUT_DIR` environnement variable
+        # is set.
+        current_directory = environ["PYFUNCEBLE_OUTPUT_DIR"]
+    elif Version(True).is_cloned() or "TRAVIS_BUILD_DIR" in environ:
+        # We handle the case that we are in a cloned or under Travis CI.
+        current_directory = getcwd() + directory_separator
+    else:
+        # We handle all other case and distributions specific cases.
+        current_directory = _get_default_directory()
+
+    if not current_directory.endswith(directory_separator):
+        # Again for safety, if the directory we are working with does not ends with
+        # the directory separator, we append it to the end.
+        current_directory += directory_separator
+
+    # We save the directory we are working with.
+    globals()["CURRENT_DIRECTORY"] = current_directory
+
+    # We return the directory we are working with.
+    return current_directory
+
+
+# We set the directory we are working with.
+CURRENT_DIRECTORY = get_current_directory()
 
 # We set the location of the `output` directory which should always be in the current
 # directory.
@@ -309,6 +419,31 @@ def syntax_check(domain):  # pragma: no cover
     return None
 
 
+def syntax_check_many(domains):  # pragma: no cover
+    """
+    Check the syntax of each of the given domains.
+
+    :param domains: The domains to check the syntax for.
+    :type domains: iterable
+
+    :return: A generator of the checked domain and its syntax validity.
+    :rtype: generator
+
+    .. warning::
+        If an empty or a non-string domain is given, its validity is :code:`None`.
+
+    .. note::
+        Each domain is checked while we iterate, so it is safe to give
+        a (very) large generator.
+    """
+
+    # We silently load the configuration.
+    load_config(True)
+
+    # We return the validity of each domain.
+    return Check.is_domain_valid_many(domains)
+
+
 def is_subdomain(domain):  # pragma: no cover
     """
     Check if the given domain is a subdomain.
@@ -496,7 +631,7 @@ def load_config(under_test=False, custom=None):  # pragma: no cover
 
         # We load and download the different configuration file if they are non
         # existant.
-        Load(CURRENT_DIRECTORY)
+        Load(get_current_directory())
 
         if not under_test:
             # If we are not under test which means that we want to save informations,
@@ -553,6 +688,59 @@ def stay_safe():  # pragma: no cover
         )
 
 
+def _update_configuration(arguments):  # pragma: no cover
+    """
+    Update the configuration indexes which are directly given or switched
+    by the given command line arguments.
+
+    :param arguments: The parsed command line arguments.
+    :type arguments: argparse.Namespace
+    """
+
+    # We list the arguments which switch the value of their index.
+    switches = [
+        "adaptive_timeout",
+        "bulk",
+        "circuit_breaker",
+        "coordinator",
+        "incremental",
+        "metrics",
+        "progress",
+        "scheduler",
+        "short_circuit",
+        "timings",
+        "whois_preconnect",
+    ]
+
+    # We list the arguments which give the value of their index.
+    values = [
+        "days_between_incremental_retest",
+        "distributed_address",
+        "distributed_authkey",
+        "distributed_authkey_file",
+        "metrics_format",
+        "processes",
+    ]
+
+    for index in switches:
+        # We loop through the switching arguments.
+
+        if getattr(arguments, index):
+            # The argument is given.
+
+            # We switch the value of the index.
+            CONFIGURATION.update({index: Core.switch(index)})
+
+    for index in values:
+        # We loop through the value arguments.
+
+        if getattr(arguments, index):
+            # The argument is given.
+
+            # We set the value of the index.
+            CONFIGURATION.update({index: getattr(arguments, index)})
+
+
 def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-many-statements
     """
     Provide the command line interface.
@@ -593,6 +781,18 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     Fore.YELLOW + Style.BRIGHT + "Configured value: " + Fore.BLUE
                 )
 
+                PARSER.add_argument(
+                    "--adaptive-timeout",
+                    action="store_true",
+                    help="Switch the value of the adaptation of the timeouts "
+                    "to the durations we observe. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["adaptive_timeout"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-ad",
                     "--adblock",
@@ -642,6 +842,30 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--bulk",
+                    action="store_true",
+                    help="Switch the value of the bulk mode. "
+                    "(Only with the syntax mode.) %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["bulk"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                PARSER.add_argument(
+                    "--circuit-breaker",
+                    action="store_true",
+                    help="Switch the value of the circuit breakers of the "
+                    "WHOIS servers and the HTTP IPs. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["circuit_breaker"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "--clean", action="store_true", help="Clean all files under output."
                 )
@@ -698,6 +922,17 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--coordinator",
+                    action="store_true",
+                    help="Switch the value of the coordinator mode. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["coordinator"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-d", "--domain", type=str, help="Set and test the given domain."
                 )
@@ -728,6 +963,19 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "-dir",
+                    "--days-between-incremental-retest",
+                    type=int,
+                    help="Set the numbers of days between each retest of domains under "
+                    "the incremental testing. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["days_between_incremental_retest"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "--debug",
                     action="store_true",
@@ -739,6 +987,37 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--distributed-address",
+                    type=str,
+                    help="Set the address (host:port) the coordinator listens on "
+                    "and the workers connect to. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["distributed_address"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                PARSER.add_argument(
+                    "--distributed-authkey",
+                    type=str,
+                    help="Set the key the workers use to authenticate against "
+                    "the coordinator.",
+                )
+
+                PARSER.add_argument(
+                    "--distributed-authkey-file",
+                    type=str,
+                    help="Set the file to read the key the workers use to "
+                    "authenticate against the coordinator from. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["distributed_authkey_file"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "--directory-structure",
                     action="store_true",
@@ -828,6 +1107,17 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--incremental",
+                    action="store_true",
+                    help="Switch the value of the incremental testing. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["incremental"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-ip",
                     type=str,
@@ -877,6 +1167,29 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     "--link", type=str, help="Download and test the given file."
                 )
 
+                PARSER.add_argument(
+                    "--metrics",
+                    action="store_true",
+                    help="Switch the value of the export of the metrics. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["metrics"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                PARSER.add_argument(
+                    "--metrics-format",
+                    type=str,
+                    choices=["json", "prometheus"],
+                    help="Set the format of the exported metrics. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["metrics_format"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-m",
                     "--mining",
@@ -975,12 +1288,34 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--processes",
+                    type=int,
+                    help="Set the number of processes to use to test a file. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["processes"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "--production",
                     action="store_true",
                     help="Prepare the repository for production.",
                 )
 
+                PARSER.add_argument(
+                    "--progress",
+                    action="store_true",
+                    help="Switch the value of the live progress reporting. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["progress"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-psl",
                     "--public-suffix",
@@ -1000,6 +1335,17 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--scheduler",
+                    action="store_true",
+                    help="Switch the value of the usage of the scheduler. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["scheduler"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "--share-logs",
                     action="store_true",
@@ -1011,6 +1357,19 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--short-circuit",
+                    action="store_true",
+                    help="Switch the value of the short-circuit mode. "
+                    "Order the checks by cost and skip those which are "
+                    "already settled. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["short_circuit"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-s",
                     "--simple",
@@ -1058,6 +1417,17 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--timings",
+                    action="store_true",
+                    help="Switch the value of the timing of each stage. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["timings"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "--travis",
                     action="store_true",
@@ -1135,6 +1505,24 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--whois-preconnect",
+                    action="store_true",
+                    help="Switch the value of the connection - in the background - "
+                    "to the whois server for the next subject. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["whois_preconnect"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                PARSER.add_argument(
+                    "--worker",
+                    action="store_true",
+                    help="Work for the coordinator until everything is tested.",
+                )
+
                 ARGS = PARSER.parse_args()
 
                 if ARGS.less:
@@ -1306,6 +1694,10 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                         {"whois_database": Core.switch("whois_database")}
                     )
 
+                # We update the configuration indexes which are directly given
+                # or switched by an argument.
+                _update_configuration(ARGS)
+
                 if not CONFIGURATION["quiet"]:
                     Core.colorify_logo(home=True)
 
@@ -1320,13 +1712,14 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     url_to_test=ARGS.url,
                     url_file=ARGS.url_file,
                     link_to_test=ARGS.link,
+                    distributed_worker=ARGS.worker,
                 )
             except KeyError as e:
                 if not Version(True).is_cloned():
                     # We are not into the cloned version.
 
                     # We merge the local with the upstream configuration.
-                    Merge(CURRENT_DIRECTORY)
+                    Merge(get_current_directory())
                 else:
                     # We are in the cloned version.
 
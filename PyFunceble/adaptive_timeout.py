@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the adaptive timeout interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+from threading import Lock
+from urllib.parse import urlparse
+
+import PyFunceble
+from PyFunceble.timings import Timings
+
+
+class AdaptiveTimeout:
+    """
+    Adapt the timeout of each WHOIS server and of each (HTTP) extension from
+    the durations we observed (when activated).
+
+    The durations are saved into histograms - the same as
+    :class:`PyFunceble.timings.Timings` - so that we can tell their
+    percentiles without keeping each duration.
+
+    .. note::
+        The timeout is never greater than the configured one
+        (:code:`seconds_before_http_timeout`) which is used as long as we
+        did not observe enough durations.
+    """
+
+    # We set the number of durations we need before we adapt a timeout.
+    minimal_samples = 20
+
+    # We set the percentile of the durations we adapt the timeout to.
+    percentile = 99
+
+    # We set the number of times the percentile we give as timeout.
+    # Note: This is the margin we give to the jitter of the network.
+    factor = 3
+
+    # We set the minimal timeout (in seconds) we give.
+    minimal_timeout = 1
+
+    # We save the histogram of each WHOIS server and each extension.
+    # Note: The index is (kind, key), for example ("whois", "whois.nic.fr")
+    # or ("http", "fr").
+    histograms = {}
+
+    # We save the lock to use when we update the histograms.
+    lock = Lock()
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if the adaptive timeouts are activated.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION.get("adaptive_timeout", False)
+
+    @classmethod
+    def extension(cls, subject):
+        """
+        Get the extension of the given domain or URL.
+
+        :param subject: The domain, IP or URL to get the extension of.
+        :type subject: str
+
+        :rtype: str
+        """
+
+        if "://" in subject:
+            # The subject is a URL.
+
+            # We get its host.
+            subject = urlparse(subject).hostname or ""
+
+        # We return the last (non empty) label of the domain.
+        return ([x for x in subject.lower().split(".") if x] or [""])[-1]
+
+    @classmethod
+    def add(cls, kind, key, duration):
+        """
+        Save the given duration of a successful request.
+
+        :param kind: The kind of request (:code:`whois` or :code:`http`).
+        :type kind: str
+
+        :param key: The WHOIS server or the extension we requested.
+        :type key: str
+
+        :param duration: The duration (in seconds).
+        :type duration: float
+        """
+
+        if not cls.is_activated():
+            # The adaptive timeouts are not activated.
+
+            # We stop here.
+            return
+
+        # We get the bucket of the duration.
+        bucket = Timings._bucket(duration)  # pylint: disable=protected-access
+
+        with cls.lock:
+            if (kind, key) not in cls.histograms:
+                # The WHOIS server or the extension is not known yet.
+
+                # We initiate its histogram.
+                cls.histograms[(kind, key)] = {
+                    "count": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "buckets": {},
+                }
+
+            # We get the histogram.
+            histogram = cls.histograms[(kind, key)]
+
+            # We update the histogram.
+            histogram["count"] += 1
+            histogram["total"] += duration
+            histogram["max"] = max(histogram["max"], duration)
+            histogram["buckets"][bucket] = histogram["buckets"].get(bucket, 0) + 1
+
+    @classmethod
+    def get(cls, kind, key, maximum=None):
+        """
+        Get the timeout to give to the given WHOIS server or extension.
+
+        :param kind: The kind of request (:code:`whois` or :code:`http`).
+        :type kind: str
+
+        :param key: The WHOIS server or the extension we request.
+        :type key: str
+
+        :param maximum:
+            The maximal timeout.
+            If not given, we use :code:`seconds_before_http_timeout`.
+        :type maximum: int|float
+
+        :return: The timeout (in seconds).
+        :rtype: int|float
+        """
+
+        if maximum is None:
+            # The maximal timeout is not given.
+
+            # We use the configured one.
+            maximum = PyFunceble.CONFIGURATION["seconds_before_http_timeout"]
+
+        if not cls.is_activated():
+            # The adaptive timeouts are not activated.
+
+            # We return the maximal timeout.
+            return maximum
+
+        with cls.lock:
+            # We get the histogram.
+            histogram = cls.histograms.get((kind, key))
+
+            if not histogram or histogram["count"] < cls.minimal_samples:
+                # We did not observe enough durations.
+
+                # We return the maximal timeout.
+                return maximum
+
+            # We get the percentile of the durations.
+            percentile = Timings.percentile(histogram, cls.percentile)
+
+        # We return the adapted timeout, bounded by the minimal and the
+        # maximal timeout.
+        return min(maximum, max(cls.minimal_timeout, percentile * cls.factor))
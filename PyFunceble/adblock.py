@@ -63,8 +63,10 @@ License:
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
 
+from re import compile as comp
+
 from PyFunceble.check import Check
-from PyFunceble.helpers import List, Regex
+from PyFunceble.helpers import List
 
 
 class AdBlock:  # pylint: disable=too-few-public-methods
@@ -72,11 +74,39 @@ class AdBlock:  # pylint: disable=too-few-public-methods
     Provide the adblock decoding logic.
 
     :param list_from_file: The file in list format.
-    :type list_from_file: list
+    :type list_from_file: list|iterable
+
+    .. note::
+        The lines are read one by one (see :func:`stream`) so we can give any
+        iterable (a list, an opened file, a generator ...).
     """
 
+    # We set the beginning of the lines we have to ignore.
+    to_ignore = ("!", "@@", "/", "[", ".", "-", "_", "?", "&")
+
+    # We compile - once - the regex which extracts the element of the rules
+    # which start with ||.
+    regex_rule = comp(r"^(?:.*\|\|)([^\/\$\^]{1,}).*$")
+
+    # We compile - once - the regex which extracts the element of the rules
+    # which are between two |.
+    regex_bar = comp(r"^\|(.*\..*)\|$")
+
+    # We compile - once - the regex which extracts the element of the
+    # element hiding rules.
+    regex_element_hiding = comp(
+        r"(?:#+(?:[a-z]+?)?\[[a-z]+(?:\^|\*)\=(?:\'|\"))(.*\..*)(?:(?:\'|\")\])"
+    )
+
+    # We compile - once - the regex which extracts the domains listed under the
+    # option domain=.
+    regex_domain_option = comp(r"domain=(.*)")
+
+    # We compile - once - the regex which splits the extracted elements.
+    regex_separators = comp(r"[\^#,!|]")
+
     def __init__(self, list_from_file, aggressive=False):
-        self.to_format = self._remove_ignored(list_from_file)
+        self.to_format = list_from_file
         self.aggressive = aggressive
 
         # We set the options separator.
@@ -88,20 +118,6 @@ class AdBlock:  # pylint: disable=too-few-public-methods
         # We create an instance of the checker.
         self.checker = Check()
 
-    def _remove_ignored(self, list_from_file):
-        """
-        Removed the ignored element from the given list.
-
-        :param list_from_file:
-            The list which represent the file we are decoding.
-        :type list_from_list: list
-
-        :return: The filtered list.
-        :rtype: list
-        """
-
-        return [x for x in list_from_file if not self._is_to_ignore(x)]
-
     @classmethod
     def _is_to_ignore(cls, line):
         """
@@ -111,22 +127,9 @@ class AdBlock:  # pylint: disable=too-few-public-methods
         :type line: str
         """
 
-        # We set the list of regex to match to be
-        # considered as ignored.
-        to_ignore = [r"(^!|^@@|^\/|^\[|^\.|^-|^_|^\?|^&)"]  # , r"(\$|,)(image)"]
-
-        for element in to_ignore:
-            # We loop through the list of regex.
-
-            if Regex(line, element, return_data=False).match():
-                # The currently read line match the currently read
-                # regex.
-
-                # We return true, it has to be ignored.
-                return True
-
-        # Wer return False, it does not has to be ignored.
-        return False
+        # We return True if the line starts with one of the beginning
+        # to ignore.
+        return line.startswith(cls.to_ignore)
 
     def _handle_options(self, options):
         """
@@ -142,35 +145,27 @@ class AdBlock:  # pylint: disable=too-few-public-methods
         # We initiate a variable which will save our result
         result = []
 
-        # We initiate the regex which will be used to extract the domain listed
-        # under the option domain=
-        regex_domain_option = r"domain=(.*)"
-
         for option in options:
             # We loop through the list of option.
-            try:
-                # We try to extract the list of domains from the currently read
-                # option.
-                domains = Regex(
-                    option, regex_domain_option, return_data=True, rematch=True, group=0
-                ).match()[-1]
-
-                if domains:
-                    # We could extract something.
-
-                    if self.aggressive:  # pragma: no cover
-                        result.extend(
-                            [
-                                x
-                                for x in domains.split("|")
-                                if x and not x.startswith("~")
-                            ]
-                        )
-                    else:
-                        # We return True.
-                        return True
-            except TypeError:
-                pass
+
+            # We try to extract the list of domains from the currently read
+            # option.
+            domains = self.regex_domain_option.search(option)
+
+            if domains and domains.group(1):
+                # We could extract something.
+
+                if self.aggressive:  # pragma: no cover
+                    result.extend(
+                        [
+                            x
+                            for x in domains.group(1).split("|")
+                            if x and not x.startswith("~")
+                        ]
+                    )
+                else:
+                    # We return True.
+                    return True
 
         # We return the result.
         return result
@@ -213,57 +208,35 @@ class AdBlock:  # pylint: disable=too-few-public-methods
         # We return the given element.
         return element
 
-    def decode(self):
+    def _decode_line(self, line):
         """
-        Decode/extract the domains to test from the adblock formated file.
+        Decode/extract the domains to test from the given line.
 
-        :return: The list of domains to test.
+        :param line: The line to decode.
+        :type line: str
+
+        :return: The domains to test (may contain duplicates).
         :rtype: list
         """
 
         # We initiate a variable which will save what we are going to return.
         result = []
 
-        # We initiate the first regex we are going to use to get
-        # the element to format.
-        regex = r"^(?:.*\|\|)([^\/\$\^]{1,}).*$"
+        # Note: Each regex is only executed if the line can match it. That way
+        # most lines are matched against a single regex - or none.
 
-        # We initiate the third regex we are going to use to get
-        # the element to format.
-        regex_v3 = (
-            r"(?:#+(?:[a-z]+?)?\[[a-z]+(?:\^|\*)\=(?:\'|\"))(.*\..*)(?:(?:\'|\")\])"
-        )
-
-        # We initiate the fourth regex we are going to use to get
-        # the element to format.
-        regex_v4 = r"^\|(.*\..*)\|$"
-
-        for line in self.to_format:
-            # We loop through the different line.
+        if "||" in line:
+            # The line may be a rule which starts with ||.
 
-            rematch = rematch_v3 = rematch_v4 = None
-
-            # We extract the different group from our first regex.
-            rematch = Regex(
-                line, regex, return_data=True, rematch=True, group=0
-            ).match()
-
-            # We extract the different group from our fourth regex.
-            #
-            # Note: We execute the following in second because it is more
-            # specific that others.
-            rematch_v4 = Regex(
-                line, regex_v4, return_data=True, rematch=True, group=0
-            ).match()
-
-            # We extract the different group from our third regex.
-            rematch_v3 = Regex(
-                line, regex_v3, return_data=True, rematch=True, group=0
-            ).match()
+            # We extract the element from our first regex.
+            rematch = self.regex_rule.match(line)
 
             if rematch:
                 # The first extraction was successfull.
 
+                # We get the extracted element.
+                rematch = rematch.group(1)
+
                 if self.options_separator in line:
                     options = line.split(self.options_separator)[-1].split(
                         self.option_separator
@@ -276,127 +249,137 @@ class AdBlock:  # pylint: disable=too-few-public-methods
                         or "popup" in options
                         or "xmlhttprequest" in options
                     ):
-                        # We extend the result with the extracted elements.
-                        result.extend(self._extract_base(rematch))
+                        # We extend the result with the extracted element.
+                        result.append(self._extract_base(rematch))
 
                     extra = self._handle_options(options)
 
                     if extra and isinstance(extra, list):  # pragma: no cover
-                        extra.extend(self._extract_base(rematch))
+                        extra.append(rematch)
                         result.extend(self._extract_base(extra))
                     elif extra:
-                        result.extend(self._extract_base(rematch))
-
+                        result.append(self._extract_base(rematch))
                 else:
-                    # We extend the result with the extracted elements.
-                    result.extend(self._extract_base(rematch))
+                    # We extend the result with the extracted element.
+                    result.append(self._extract_base(rematch))
 
-            if rematch_v4:
-                # The fourth extraction was successfull.
+        if line[:1] == "|" and line[-1:] == "|":
+            # The line may be a rule which is between two |.
 
-                # We extend the formatted elements from the extracted elements.
-                result.extend(List(self._format_decoded(rematch_v4)).format())
+            # We extract the element from our second regex.
+            rematch = self.regex_bar.match(line)
 
-            if rematch_v3:
+            if rematch:
                 # The second extraction was successfull.
 
-                # We extend the formatted elements from the extracted elements.
-                result.extend(List(self._format_decoded(rematch_v3)).format())
+                # We extend the result with the formatted element.
+                result.extend(self._format_decoded(rematch.group(1)))
 
-        # We return the result.
-        return List(result).format()
+        if "#" in line and "[" in line:
+            # The line may be an element hiding rule.
 
-    def _format_decoded(self, to_format, result=None):  # pragma: no cover
-        """
-        Format the exctracted adblock line before passing it to the system.
+            for rematch in self.regex_element_hiding.findall(line):
+                # We loop through the elements extracted by our third regex.
 
-        :param to_format: The extracted line from the file.
-        :type to_format: str
+                # We extend the result with the formatted element.
+                result.extend(self._format_decoded(rematch))
 
-        :param result: A list of the result of this method.
-        :type result: list
+        # We return the result.
+        return result
 
-        :return: The list of domains or IP to test.
-        :rtype: list
+    def stream(self):
         """
+        Decode/extract the domains to test from the adblock formated file,
+        line by line.
 
-        if not result:
-            # The result is not given.
+        :return: The domains to test. Each of them is given once.
+        :rtype: generator
+        """
 
-            # We set the result as an empty list.
-            result = []
+        # We initiate the set of already given domains.
+        seen = set()
 
-        for data in List(to_format).format():
-            # We loop through the different lines to format.
+        for line in self.to_format:
+            # We loop through the different line.
 
-            if data:
-                # The currently read line is not empty.
+            if not line or self._is_to_ignore(line):
+                # The line is empty or has to be ignored.
 
-                if "^" in data:
-                    # There is an accent in the currently read line.
+                # We continue to the next line.
+                continue
 
-                    # We recall this method but with the current result state
-                    # and splited data.
-                    return self._format_decoded(data.split("^"), result)
+            for subject in self._decode_line(line):
+                # We loop through the decoded domains.
 
-                if "#" in data:
-                    # There is a dash in the currently read line.
+                if subject and subject not in seen:
+                    # The domain was not given yet.
 
-                    # We recall this method but with the current result state
-                    # and splited data.
-                    return self._format_decoded(data.split("#"), result)
+                    # We save it.
+                    seen.add(subject)
 
-                if "," in data:
-                    # There is a comma in the currently read line.
+                    # And we give it.
+                    yield subject
 
-                    # We recall this method but with the current result state
-                    # and splited data.
-                    return self._format_decoded(data.split(","), result)
+    def decode(self):
+        """
+        Decode/extract the domains to test from the adblock formated file.
+
+        :return: The list of domains to test.
+        :rtype: list
+        """
 
-                if "!" in data:
-                    # There is an exclamation mark in the currently read line.
+        # We return the sorted list of decoded domains.
+        # Note: As stream() already removes the duplicates, we only sort once
+        # - at the very end.
+        return List(list(self.stream())).format()
 
-                    # We recall this method but with the current result state
-                    # and splited data.
-                    return self._format_decoded(data.split("!"), result)
+    def _format_decoded(self, to_format):
+        """
+        Format the exctracted adblock element before passing it to the system.
 
-                if "|" in data:
-                    # There is a vertival bar in the currently read line.
+        :param to_format: The extracted element from the line.
+        :type to_format: str
 
-                    # We recall this method but with the current result state
-                    # and splited data.
-                    return self._format_decoded(data.split("|"), result)
+        :return: The list of domains or IP to test.
+        :rtype: list
+        """
 
-                if data:
-                    # The currently read line is not empty.
+        # We initiate a variable which will save what we are going to return.
+        result = []
 
-                    data = self._extract_base(data)
+        for data in self.regex_separators.split(to_format):
+            # We loop through the parts of the element which are between
+            # the separators (^, #, comma, !, |).
 
-                    if data and (
-                        self.checker.is_domain_valid(data)
-                        or self.checker.is_ip_valid(data)
-                    ):
-                        # The extraced base is not empty.
-                        # and
-                        # * The currently read line is a valid domain.
-                        # or
-                        # * The currently read line is a valid IP.
-
-                        # We append the currently read line to the result.
-                        result.append(data)
-                    elif data:
-                        # * The currently read line is not a valid domain.
-                        # or
-                        # * The currently read line is not a valid IP.
-
-                        # We try to get the url base.
-                        url_base = self.checker.is_url_valid(data, return_base=True)
-
-                        if url_base:
-                            # The url_base is not empty or equal to False or None.
-
-                            # We append the url base to the result.
-                            result.append(url_base)
+            if data:
+                # The currently read part is not empty.
+
+                data = self._extract_base(data)
+
+                if data and (
+                    self.checker.is_domain_valid(data) or self.checker.is_ip_valid(data)
+                ):
+                    # The extraced base is not empty.
+                    # and
+                    # * The currently read part is a valid domain.
+                    # or
+                    # * The currently read part is a valid IP.
+
+                    # We append the currently read part to the result.
+                    result.append(data)
+                elif data:
+                    # * The currently read part is not a valid domain.
+                    # or
+                    # * The currently read part is not a valid IP.
+
+                    # We try to get the url base.
+                    url_base = self.checker.is_url_valid(data, return_base=True)
+
+                    if url_base:
+                        # The url_base is not empty or equal to False or None.
+
+                        # We append the url base to the result.
+                        result.append(url_base)
 
         # We return the result element.
         return result
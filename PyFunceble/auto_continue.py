@@ -62,13 +62,33 @@ License:
 """
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
+from json import dumps
+
 import PyFunceble
-from PyFunceble.helpers import Dict, File
+from PyFunceble.helpers import Dict, File, Hash
+from PyFunceble.timings import Timings
 
 
 class AutoContinue:
     """
     Provide the auto-continue subsystem.
+
+    .. note::
+        In order to avoid rewriting the whole log file after each tested
+        element, we only save it (atomically) every
+        :code:`subjects_before_auto_continue_backup` tested elements or every
+        :code:`seconds_before_auto_continue_backup` seconds.
+
+        Between two saves, what changed (the counters and the position of
+        the next element to test) is appended into a small journal which is
+        replayed when we restore.
+
+    .. note::
+        The final list to test is saved into a file and we save (with the
+        current state) the hash of the tested file and the position (in bytes)
+        of the next element to test into that file.
+        This way, if the tested file did not change, we can continue
+        exactly where we stopped without rebuilding the whole list to test.
     """
 
     def __init__(self):
@@ -87,6 +107,13 @@ class AutoContinue:
                 + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue"]
             )
 
+            # We set the journal file location.
+            self.autocontinue_journal_file = (
+                PyFunceble.OUTPUT_DIRECTORY
+                + PyFunceble.OUTPUTS["parent_directory"]
+                + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue_journal"]
+            )
+
             if PyFunceble.path.isfile(self.autocontinue_log_file):
                 # The log file already exist.
 
@@ -102,6 +129,392 @@ class AutoContinue:
                 # And we save our empty backup_content to the log file.
                 File(self.autocontinue_log_file).write(str(self.backup_content))
 
+            for file, state in self._journal_content().items():
+                # We loop through the states saved into the journal.
+
+                # We update the backup content with them.
+                self.backup_content.setdefault(file, {}).update(state)
+
+            # We set the list file location.
+            self.autocontinue_list_file = (
+                PyFunceble.OUTPUT_DIRECTORY
+                + PyFunceble.OUTPUTS["parent_directory"]
+                + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue_list"]
+            )
+
+        # We get the hash of the file we are testing.
+        self.input_hash = self._input_hash()
+
+        # We initiate the position (into the list file) of the next element
+        # to test and the position of the end of the line of each element.
+        self.list_state = {"offset": None, "offsets": {}}
+
+        # We initiate the number of tested elements and the time since the
+        # last backup and the latest state (of each file) we saved.
+        # Note: With the latest state, we only append what changed into
+        # the journal.
+        self.since_backup = {"tested": 0, "time": PyFunceble.time(), "state": {}}
+
+    def _journal_content(self):
+        """
+        Get the latest states which are saved into the journal.
+
+        :return: The latest state of each file saved into the journal.
+        :rtype: dict
+        """
+
+        # We initiate what we are going to return.
+        result = {}
+
+        if PyFunceble.path.isfile(self.autocontinue_journal_file):
+            # The journal exist.
+
+            for line in File(self.autocontinue_journal_file).read().splitlines():
+                # We loop through each line of the journal.
+                # Note: As the journal is written chronologically, the latest
+                # line overwrite what changed into the previous ones. The
+                # partially written lines are ignored. In the worst case, we will
+                # retest the elements related to that line.
+
+                for file, state in Dict().from_json_lines(line).items():
+                    # We loop through the (changed) state of each file.
+
+                    # And we update the result with it.
+                    result.setdefault(file, {}).update(state)
+
+        # We return the result.
+        return result
+
+    @classmethod
+    def _input_hash(cls):
+        """
+        Get the hash of the file we are testing.
+
+        .. note::
+            As they change the list to test, the hash also cover some
+            configuration indexes.
+
+        :return: The hash or :code:`None` if we are not testing a file.
+        :rtype: str|None
+        """
+
+        if (
+            PyFunceble.CONFIGURATION["auto_continue"]
+            and not PyFunceble.CONFIGURATION["no_files"]
+            and "file_to_test" in PyFunceble.INTERN
+            and PyFunceble.INTERN["file_to_test"]
+            and PyFunceble.path.isfile(PyFunceble.INTERN["file_to_test"])
+        ):
+            # * The auto_continue subsystem is activated.
+            # and
+            # * We are authorized to generate files.
+            # and
+            # * We are testing a file.
+
+            # We get the hash of the file content.
+            file_hash = Hash(
+                PyFunceble.INTERN["file_to_test"], "sha512", True
+            ).get()
+
+            # We get the configuration indexes which change the list to test.
+            configuration = [
+                PyFunceble.CONFIGURATION[x]
+                for x in [
+                    "adblock",
+                    "filter",
+                    "hierarchical_sorting",
+                    "idna_conversion",
+                    "inactive_database",
+                    "incremental",
+                ]
+            ]
+
+            # And we return the hash of both.
+            return Hash(data=file_hash + repr(configuration), only_hash=True).get()
+
+        # We are not testing a file.
+        return None
+
+    def _changed_state(self):
+        """
+        Get what changed into the current execution state since we
+        last saved it.
+
+        :return: What changed into the current state of the file we are testing.
+        :rtype: dict
+        """
+
+        # We initiate what we are going to return.
+        result = {}
+
+        for file, state in self._current_state().items():
+            # We loop through the current state of the file we are testing.
+
+            # We get the latest state we saved.
+            saved = self.since_backup["state"].setdefault(file, {})
+
+            # We get what changed since.
+            result[file] = {x: y for x, y in state.items() if saved.get(x) != y}
+
+            # And we save it as the latest state we saved.
+            saved.update(result[file])
+
+        # We return the result.
+        return result
+
+    def _current_state(self):
+        """
+        Get the current execution state.
+
+        :return: The current state of the file we are testing.
+        :rtype: dict
+        """
+
+        # We get the current counter states.
+        configuration_counter = PyFunceble.INTERN["counter"]["number"]
+
+        # We initiate the data we have to backup.
+        result = {
+            # We backup the number of tested.
+            "tested": configuration_counter["tested"],
+            # We backup the number of up.
+            "up": configuration_counter["up"],
+            # We backup the number of down.
+            "down": configuration_counter["down"],
+            # We backup the number of invalid.
+            "invalid": configuration_counter["invalid"],
+        }
+
+        if self.input_hash and self.list_state["offset"] is not None:
+            # The list to test is saved into the list file.
+
+            # We backup the hash of the tested file.
+            result["hash"] = self.input_hash
+            # And the position of the next element to test.
+            result["offset"] = self.list_state["offset"]
+
+        # We return the data we have to backup.
+        return {PyFunceble.INTERN["file_to_test"]: result}
+
+    @classmethod
+    def _list_line(cls, element, extracted):
+        """
+        Construct the line of the list file which represent the given element.
+
+        :param element: The element to represent.
+        :type element: str
+
+        :param extracted: Tell us if the element is into the tested file.
+        :type extracted: bool
+
+        :return: The line to write.
+        :rtype: str
+        """
+
+        return "%d %s\n" % (int(extracted), element)
+
+    def save_list_to_test(self, list_to_test):
+        """
+        Save the given (final) list to test into the list file.
+
+        :param list_to_test: The list to test.
+        :type list_to_test: list
+        """
+
+        if PyFunceble.CONFIGURATION["auto_continue"] and self.input_hash:
+            # * The auto_continue subsystem is activated.
+            # and
+            # * We are testing a file.
+
+            # We get the list of elements which are into the tested file.
+            extracted = set(PyFunceble.INTERN["extracted_list_to_test"])
+
+            # We construct the header of the file.
+            header = self.input_hash + "\n"
+
+            # We get the elements to write.
+            elements = [x for x in list_to_test if x]
+
+            # We construct the lines to write.
+            lines = [self._list_line(x, x in extracted) for x in elements]
+
+            # We write the list into the file.
+            File(self.autocontinue_list_file).write(
+                header + "".join(lines), overwrite=True
+            )
+
+            # We set the position of the next element to test.
+            self.list_state["offset"] = len(header.encode("utf-8"))
+
+            # And we save the position of the end of the line of each element.
+            self.list_state["offsets"] = self._offsets(
+                elements, lines, self.list_state["offset"]
+            )
+
+    @classmethod
+    def _offsets(cls, elements, lines, start):
+        """
+        Get the position of the end of the line of each element.
+
+        :param elements: The elements which are written into the list file.
+        :type elements: list
+
+        :param lines: The lines which represent the elements.
+        :type lines: list
+
+        :param start: The position of the first line into the list file.
+        :type start: int
+
+        :return: The position (in bytes) of the end of the line of each element.
+        :rtype: dict
+        """
+
+        # We initiate what we are going to return.
+        result = {}
+
+        for element, line in zip(elements, lines):
+            # We loop through the elements and their lines.
+
+            # We move the position after the currently read line.
+            start += len(line.encode("utf-8"))
+
+            # And we save it.
+            result[element] = start
+
+        # We return the result.
+        return result
+
+    def _can_continue(self):
+        """
+        Check if we can continue from the list file.
+
+        :rtype: bool
+        """
+
+        if (
+            PyFunceble.CONFIGURATION["auto_continue"]
+            and self.input_hash
+            and PyFunceble.INTERN["counter"]["number"]["tested"]
+            and PyFunceble.path.isfile(self.autocontinue_list_file)
+        ):
+            # * The auto_continue subsystem is activated.
+            # and
+            # * We are testing a file.
+            # and
+            # * We already tested some elements.
+            # and
+            # * The list file exist.
+
+            # We get the state of the tested file.
+            state = self.backup_content.get(PyFunceble.INTERN["file_to_test"], {})
+
+            # We return True if the tested file did not change since the last
+            # session and if we know where to continue.
+            return state.get("hash") == self.input_hash and "offset" in state
+
+        # We can't continue from the list file.
+        return False
+
+    def remaining_list_to_test(self):
+        """
+        Get the list of elements which are still to test from the list file.
+
+        .. note::
+            :code:`PyFunceble.INTERN["extracted_list_to_test"]` is also
+            set from the list file.
+
+        :return:
+            The list of elements which are still to test or :code:`None`
+            if we can't continue from the list file.
+        :rtype: list|None
+        """
+
+        if self._can_continue():
+            # We can continue from the list file.
+
+            # We get the position of the next element to test.
+            offset = self.backup_content[PyFunceble.INTERN["file_to_test"]]["offset"]
+
+            with open(self.autocontinue_list_file, "rb") as file:
+                # We open the list file.
+
+                if file.readline().decode("utf-8").strip() != self.input_hash:
+                    # The list file is not the one of the tested file.
+
+                    # We can't continue from it.
+                    return None
+
+                # We go to the next element to test.
+                file.seek(offset)
+
+                # And we read the remaining lines.
+                lines = [x + "\n" for x in file.read().decode("utf-8").split("\n") if x]
+
+            # We get the remaining elements to test.
+            result = [x[2:-1] for x in lines]
+
+            # We set the list of elements which are into the tested file.
+            PyFunceble.INTERN["extracted_list_to_test"] = [
+                x for x, y in zip(result, lines) if y[0] == "1"
+            ]
+
+            # We set the position of the next element to test.
+            self.list_state["offset"] = offset
+
+            # And we save the position of the end of the line of each element.
+            self.list_state["offsets"] = self._offsets(result, lines, offset)
+
+            # And we return the remaining elements to test.
+            return result
+
+        # We can't continue from the list file.
+        return None
+
+    def checkpoint(self, current=None):
+        """
+        Backup the current execution state if it is time to do it.
+        Otherwise, append the current execution state into the journal.
+
+        :param current: The currently (and just) tested element.
+        :type current: str
+        """
+
+        if PyFunceble.CONFIGURATION["auto_continue"]:
+            # The auto_continue subsystem is activated.
+
+            if current in self.list_state["offsets"]:
+                # The currently tested element is into the list file.
+
+                # We move the position of the next element to test
+                # after the line of the currently tested element.
+                # Note: The elements which are not into the list file (mined,
+                # from the database ...) do not move the position.
+                self.list_state["offset"] = self.list_state["offsets"][current]
+
+            # We increase the number of tested elements since the last backup.
+            self.since_backup["tested"] += 1
+
+            if (
+                self.since_backup["tested"]
+                >= PyFunceble.CONFIGURATION["subjects_before_auto_continue_backup"]
+                or PyFunceble.time() - self.since_backup["time"]
+                >= PyFunceble.CONFIGURATION["seconds_before_auto_continue_backup"]
+            ):
+                # * We tested enough elements since the last backup.
+                # or
+                # * Enough time passed since the last backup.
+
+                # We backup the current state.
+                self.backup()
+            else:
+                # It is not time to backup the current state.
+
+                # We append what changed into the journal.
+                File(self.autocontinue_journal_file).write(
+                    dumps(self._changed_state()) + "\n"
+                )
+
+    @Timings.timed("auto_continue_backup")
     def backup(self):
         """
         Backup the current execution state.
@@ -110,22 +523,8 @@ class AutoContinue:
         if PyFunceble.CONFIGURATION["auto_continue"]:
             # The auto_continue subsystem is activated.
 
-            # We initiate the location where we are going to save the data to backup.
-            data_to_backup = {}
-            # We get the current counter states.
-            configuration_counter = PyFunceble.INTERN["counter"]["number"]
-
             # We initiate the data we have to backup.
-            data_to_backup[PyFunceble.INTERN["file_to_test"]] = {
-                # We backup the number of tested.
-                "tested": configuration_counter["tested"],
-                # We backup the number of up.
-                "up": configuration_counter["up"],
-                # We backup the number of down.
-                "down": configuration_counter["down"],
-                # We backup the number of invalid.
-                "invalid": configuration_counter["invalid"],
-            }
+            data_to_backup = self._current_state()
 
             # We initiate the final data we have to save.
             # We initiate this variable instead of updating backup_content because
@@ -137,8 +536,24 @@ class AutoContinue:
             # And we overwrite with the newly data to backup.
             to_save.update(data_to_backup)
 
-            # Finaly, we save our informations into the log file.
-            Dict(to_save).to_json(self.autocontinue_log_file)
+            # We save our informations into a temporary file.
+            Dict(to_save).to_json(self.autocontinue_log_file + ".tmp")
+
+            # And we atomically replace the log file with it.
+            PyFunceble.replace(
+                self.autocontinue_log_file + ".tmp", self.autocontinue_log_file
+            )
+
+            # As everything is saved, we delete the journal.
+            File(self.autocontinue_journal_file).delete()
+
+            # We reset the number of tested elements and the time since the
+            # last backup and we save the latest state we saved.
+            self.since_backup = {
+                "tested": 0,
+                "time": PyFunceble.time(),
+                "state": data_to_backup,
+            }
 
     def restore(self):
         """
@@ -152,8 +567,14 @@ class AutoContinue:
             # We get the file we have to restore.
             file_to_restore = PyFunceble.INTERN["file_to_test"]
 
-            if file_to_restore in self.backup_content:
-                # The file we are working with is already into the backup content.
+            if file_to_restore in self.backup_content and (
+                "hash" not in self.backup_content[file_to_restore]
+                or self.backup_content[file_to_restore]["hash"] == self.input_hash
+            ):
+                # * The file we are working with is already into the backup content.
+                # and
+                # * The file we are working with did not change since the last
+                #   session.
 
                 # We initiate the different status to set.
                 to_initiate = ["up", "down", "invalid", "tested"]
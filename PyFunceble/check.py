@@ -63,6 +63,8 @@ License:
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
 
+from re import compile as comp
+
 from domain2idna import get as domain2idna
 
 import PyFunceble
@@ -77,9 +79,171 @@ class Check:
     :type element: str
     """
 
+    # We initiate our regex which will match for valid domains.
+    # Note: They are compiled once because they are used for each tested element.
+    regex_valid_domains = comp(
+        r"^(?=.{0,253}$)(([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9](?:\.)?|[a-z0-9](?:\.)?))$"  # pylint: disable=line-too-long
+    )
+
+    # We initiate our regex which will match for valid subdomains.
+    regex_valid_subdomains = comp(
+        r"^(?=.{0,253}$)(([a-z0-9_][a-z0-9-_]{0,61}[a-z0-9_-]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9]))$"  # pylint: disable=line-too-long
+    )
+
+    # We initate our regex which will match for valid IPv4.
+    regex_ipv4 = comp(
+        r"^(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,})$"  # pylint: disable=line-too-long
+    )
+
+    # We initiate the position of each suffix of the psl database.
+    # Note: It is saved per extension, along with the list it was generated from.
+    suffixes_positions = {}
+
     def __init__(self, element=None):
         self.element = element
 
+    @classmethod
+    def load_databases(cls):
+        """
+        Load the IANA and the public suffix databases if they were not
+        already loaded.
+
+        .. note::
+            They are loaded on first validation instead of with the
+            configuration so that we do not pay for them if we do not need them.
+        """
+
+        if not PyFunceble.INTERN.get("iana_db"):
+            # The IANA database is not loaded.
+
+            # We load the IANA database.
+            PyFunceble.IANA().load()
+
+        if not PyFunceble.INTERN.get("psl_db"):
+            # The public suffix database is not loaded.
+
+            # We load the public suffix database.
+            PyFunceble.PublicSuffix().load()
+
+    @classmethod
+    def is_domain_valid_many(cls, domains, ip_check=False):
+        """
+        Check the syntax of each of the given domains.
+
+        :param domains: The domains to validate.
+        :type domains: iterable
+
+        :param ip_check:
+            Also consider the valid IPv4 as valid.
+            (Like the syntax mode does.)
+        :type ip_check: bool
+
+        :return:
+            A generator of the validated domain and its validity.
+            (:code:`None` if the domain is empty or not a string.)
+        :rtype: generator
+
+        .. note::
+            The databases are loaded and the checker is initiated once for the
+            whole iterable, so it is the way to go for (very) large lists.
+        """
+
+        # We load the databases we need.
+        cls.load_databases()
+
+        # We initiate the checker we are going to use for all domains.
+        checker = cls()
+
+        for domain in domains:
+            # We loop through the domains to validate.
+
+            if not domain or not isinstance(domain, str):
+                # * The domain is empty.
+                # or
+                # * The domain is not a string.
+
+                # We yield None, there is nothing to check.
+                yield domain, None
+            elif checker.is_domain_valid(domain):
+                # The domain is valid.
+
+                # We yield True.
+                yield domain, True
+            else:
+                # The domain is not valid.
+
+                # We yield the IPv4 validity if we have to check it.
+                yield domain, ip_check and checker.is_ip_valid(domain)
+
+    @classmethod
+    def _suffixes_in(cls, to_test, extension):
+        """
+        Get the suffixes (of the given extension) of the psl database which are
+        in the given element.
+
+        :param to_test: The element to get the suffixes for.
+        :type to_test: str
+
+        :param extension: The extension of the element.
+        :type extension: str
+
+        :return: The suffixes, in the order of the psl database.
+        :rtype: list
+
+        .. note::
+            All suffixes of an extension ends with the extension. So instead of
+            looking for each of the (sometime thousands of) suffixes into the
+            element, we look for the pieces of the element (which start after a
+            point and end with the extension) into the suffixes.
+        """
+
+        # We get the suffixes of the extension.
+        suffixes = PyFunceble.INTERN["psl_db"][extension]
+
+        if (
+            extension not in cls.suffixes_positions
+            or cls.suffixes_positions[extension][0] is not suffixes
+        ):
+            # The positions of the suffixes of the extension are not known yet.
+
+            # We save them.
+            cls.suffixes_positions[extension] = (
+                suffixes,
+                {suffix: position for position, suffix in enumerate(suffixes)},
+            )
+
+        # We get the positions of the suffixes.
+        positions = cls.suffixes_positions[extension][1]
+
+        # We get the positions of the points.
+        points = [index for index, char in enumerate(to_test) if char == "."]
+
+        # We initiate the positions where the extension ends.
+        ends = []
+
+        # We get the first position of the extension.
+        start = to_test.find(extension)
+
+        while start != -1:
+            # We loop through each position of the extension.
+
+            # We save where it ends.
+            ends.append(start + len(extension))
+
+            # And we get its next position.
+            start = to_test.find(extension, start + 1)
+
+        # We get the pieces of the element which are known suffixes.
+        found = {
+            to_test[point + 1 : end]
+            for point in points
+            for end in ends
+            if point + 1 < end and to_test[point + 1 : end] in positions
+        }
+
+        # We return the found suffixes in the order of the psl database.
+        return sorted(found, key=positions.get)
+
     def is_url_valid(self, url=None, return_base=False, return_formatted=False):
         """
         Check if the given URL is valid.
@@ -210,12 +374,6 @@ class Check:
         :rtype: bool
         """
 
-        # We initate our regex which will match for valid domains.
-        regex_valid_domains = r"^(?=.{0,253}$)(([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9](?:\.)?|[a-z0-9](?:\.)?))$"  # pylint: disable=line-too-long
-
-        # We initiate our regex which will match for valid subdomains.
-        regex_valid_subdomains = r"^(?=.{0,253}$)(([a-z0-9_][a-z0-9-_]{0,61}[a-z0-9_-]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9]))$"  # pylint: disable=line-too-long
-
         if domain:
             # A domain is given.
 
@@ -232,6 +390,9 @@ class Check:
             # We set the element to test as the currently tested element.
             to_test = PyFunceble.INTERN["to_test"]
 
+        # We load the databases we need.
+        self.load_databases()
+
         try:
             # We get the position of the last point.
             last_point_index = to_test.rindex(".")
@@ -252,10 +413,7 @@ class Check:
                 # We return false.
                 return False
 
-            if (
-                Regex(to_test, regex_valid_domains, return_data=False).match()
-                and not subdomain_check
-            ):
+            if self.regex_valid_domains.search(to_test) and not subdomain_check:
                 # * The element pass the domain validation.
                 # and
                 # * We are not checking if it is a subdomain.
@@ -269,8 +427,9 @@ class Check:
             if extension in PyFunceble.INTERN["psl_db"]:
                 # The extension is into the psl database.
 
-                for suffix in PyFunceble.INTERN["psl_db"][extension]:
-                    # We loop through the element of the extension into the psl database.
+                for suffix in self._suffixes_in(to_test, extension):
+                    # We loop through the element of the extension into the psl
+                    # database which are in the element to test.
 
                     try:
                         # We try to get the position of the currently read suffix
@@ -306,9 +465,7 @@ class Check:
                             # We check if it passes our subdomain regex.
                             # * True: It's a valid domain.
                             # * False: It's an invalid domain.
-                            return Regex(
-                                to_check, regex_valid_subdomains, return_data=False
-                            ).match()
+                            return bool(self.regex_valid_subdomains.search(to_check))
 
                     except ValueError:
                         # In case of a value error because the position is not found,
@@ -338,9 +495,7 @@ class Check:
                 # We check if it passes our subdomain regex.
                 # * True: It's a valid domain.
                 # * False: It's an invalid domain.
-                return Regex(
-                    to_check, regex_valid_subdomains, return_data=False
-                ).match()
+                return bool(self.regex_valid_subdomains.search(to_check))
 
         except (ValueError, AttributeError):
             # In case of a value or attribute error we ignore them.
@@ -393,9 +548,6 @@ class Check:
             We only test IPv4 because for now we only them for now.
         """
 
-        # We initate our regex which will match for valid IPv4.
-        regex_ipv4 = r"^(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,})$"  # pylint: disable=line-too-long
-
         if ip_to_check:
             # An element is localy given.
 
@@ -415,7 +567,7 @@ class Check:
         # We check if it passes our IPv4 regex.
         # * True: It's a valid IPv4.
         # * False: It's an invalid IPv4.
-        return Regex(to_test, regex_ipv4, return_data=False).match()
+        return bool(self.regex_ipv4.search(to_test))
 
     def is_ip_range(self, ip_to_check=None):
         """
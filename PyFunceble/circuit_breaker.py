@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the circuit breaker interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+from threading import Lock
+from time import time
+
+import PyFunceble
+
+
+class CircuitBreaker:
+    """
+    Stop to request - for a while - the WHOIS servers and the (HTTP) IPs which
+    failed too many times in a row (when activated).
+
+    Each WHOIS server and each IP has its own circuit breaker which:
+
+        - opens after :code:`failures_before_opening` consecutive failures.
+        - skips every request while it is open.
+        - lets a request through after :code:`seconds_before_closing` seconds.
+          If it succeeds, the circuit breaker closes, otherwise it opens again.
+
+    .. note::
+        A skipped request is answered as a failed one so that the tested
+        subject falls back to the next source of status (NSLOOKUP).
+    """
+
+    # We set the number of consecutive failures before a circuit breaker opens.
+    failures_before_opening = 5
+
+    # We set the number of seconds a circuit breaker stays open.
+    seconds_before_closing = 60
+
+    # We save the state of each circuit breaker.
+    # Note: The index is (kind, key), for example ("whois", "whois.nic.fr")
+    # or ("http", "93.184.216.34").
+    states = {}
+
+    # We save the lock to use when we update the states.
+    lock = Lock()
+
+    # We save the function to call in order to count our events.
+    # Note: It is given by :class:`PyFunceble.metrics.Metrics` (which reports
+    # our states) so that we do not import each other.
+    counter = None
+
+    @classmethod
+    def _count(cls, event, kind, key):
+        """
+        Count the given event of the given circuit breaker.
+
+        :param event: The event to count.
+        :type event: str
+
+        :param kind: The kind of circuit breaker (:code:`whois` or :code:`http`).
+        :type kind: str
+
+        :param key: The WHOIS server or the IP.
+        :type key: str
+        """
+
+        if cls.counter:
+            # We were given a function to count our events.
+
+            # We count the event.
+            cls.counter(event, "%s:%s" % (kind, key))
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if the circuit breakers are activated.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION.get("circuit_breaker", False)
+
+    @classmethod
+    def allows(cls, kind, key):
+        """
+        Check if we can request the given WHOIS server or IP.
+
+        :param kind: The kind of request (:code:`whois` or :code:`http`).
+        :type kind: str
+
+        :param key: The WHOIS server or the IP we want to request.
+        :type key: str
+
+        :rtype: bool
+        """
+
+        if not cls.is_activated():
+            # The circuit breakers are not activated.
+
+            # We allow the request.
+            return True
+
+        with cls.lock:
+            # We get the state of the circuit breaker.
+            state = cls.states.get((kind, key))
+
+            if not state or state["opened"] is None:
+                # The circuit breaker is closed.
+
+                # We allow the request.
+                return True
+
+            if time() - state["opened"] >= cls.seconds_before_closing:
+                # The circuit breaker was open long enough.
+
+                # We let the request through.
+                # Note: We keep the failures so that one more failure opens
+                # the circuit breaker again.
+                state["opened"] = None
+                state["failures"] = cls.failures_before_opening - 1
+
+                return True
+
+        # The circuit breaker is open.
+
+        # We count the skipped request.
+        cls._count("circuit_breaker_skips", kind, key)
+
+        # We do not allow the request.
+        return False
+
+    @classmethod
+    def success(cls, kind, key):
+        """
+        Save that the request to the given WHOIS server or IP succeeded.
+
+        :param kind: The kind of request (:code:`whois` or :code:`http`).
+        :type kind: str
+
+        :param key: The WHOIS server or the IP we requested.
+        :type key: str
+        """
+
+        if not cls.is_activated():
+            # The circuit breakers are not activated.
+
+            # We stop here.
+            return
+
+        with cls.lock:
+            # We close the circuit breaker.
+            cls.states.pop((kind, key), None)
+
+    @classmethod
+    def failure(cls, kind, key):
+        """
+        Save that the request to the given WHOIS server or IP failed.
+
+        :param kind: The kind of request (:code:`whois` or :code:`http`).
+        :type kind: str
+
+        :param key: The WHOIS server or the IP we requested.
+        :type key: str
+        """
+
+        if not cls.is_activated():
+            # The circuit breakers are not activated.
+
+            # We stop here.
+            return
+
+        with cls.lock:
+            # We get the state of the circuit breaker.
+            state = cls.states.setdefault((kind, key), {"failures": 0, "opened": None})
+
+            # We count the failure.
+            state["failures"] += 1
+
+            # We check if we have to open the circuit breaker.
+            opening = (
+                state["opened"] is None
+                and state["failures"] >= cls.failures_before_opening
+            )
+
+            if opening:
+                # The circuit breaker is closed and failed too many times.
+
+                # We open it.
+                state["opened"] = time()
+
+        if opening:
+            # We opened the circuit breaker.
+
+            # We count it.
+            cls._count("circuit_breaker_opens", kind, key)
+
+    @classmethod
+    def summary(cls):
+        """
+        Summarize the open circuit breakers.
+
+        :return:
+            The number of consecutive failures and the number of seconds
+            before each open circuit breaker lets a request through.
+        :rtype: dict
+        """
+
+        # We get the current time.
+        now = time()
+
+        with cls.lock:
+            return {
+                "%s:%s" % key: {
+                    "failures": state["failures"],
+                    "seconds_before_closing": round(
+                        max(0, cls.seconds_before_closing - (now - state["opened"])),
+                        3,
+                    ),
+                }
+                for key, state in cls.states.items()
+                if state["opened"] is not None
+            }
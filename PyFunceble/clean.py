@@ -176,7 +176,7 @@ class Clean:
         """
 
         # We initiate the directory we have to look for.
-        directory = PyFunceble.CURRENT_DIRECTORY
+        directory = PyFunceble.get_current_directory()
 
         # We initate the result variable.
         result = []
@@ -198,12 +198,26 @@ class Clean:
             + PyFunceble.CONFIGURATION["outputs"]["default_files"]["public_suffix"]
         )
 
+        # We append the copy of the upstream public suffix file.
+        result.append(
+            directory
+            + PyFunceble.CONFIGURATION["outputs"]["default_files"][
+                "public_suffix_cache"
+            ]
+        )
+
         # We append the inactive database file.
         result.append(
             directory
             + PyFunceble.CONFIGURATION["outputs"]["default_files"]["inactive_db"]
         )
 
+        # We append the incremental database file.
+        result.append(
+            directory
+            + PyFunceble.CONFIGURATION["outputs"]["default_files"]["incremental_db"]
+        )
+
         # We append the mining database file.
         result.append(
             directory + PyFunceble.CONFIGURATION["outputs"]["default_files"]["mining"]
@@ -239,4 +253,4 @@ class Clean:
             File(file).delete()
 
         if clean_all:  # pragma: no cover
-            Load(PyFunceble.CURRENT_DIRECTORY)
+            Load(PyFunceble.get_current_directory())
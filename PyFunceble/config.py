@@ -64,8 +64,6 @@ License:
 # pylint: disable=bad-continuation
 import PyFunceble
 from PyFunceble.helpers import Dict, Directory, Download, File
-from PyFunceble.iana import IANA
-from PyFunceble.publicsuffix import PublicSuffix
 
 
 class Load:  # pylint: disable=too-few-public-methods
@@ -185,11 +183,8 @@ Install and load the default configuration at the mentioned location? [y/n] "
             {"done": PyFunceble.Fore.GREEN + "✔", "error": PyFunceble.Fore.RED + "✘"}
         )
 
-        # We load the PSL database.
-        PublicSuffix().load()
-
-        # We load the IANA database.
-        IANA().load()
+        # Note: The IANA and PSL databases are loaded on first validation.
+        # Please report to PyFunceble.check.Check.load_databases().
 
     @classmethod
     def _set_path_to_configs(cls, path_to_config):
@@ -304,7 +299,7 @@ Install and load the default configuration at the mentioned location? [y/n] "
         iana_link = Version(True).right_url_from_version(iana_link)
 
         # We set the destination of the downloaded file.
-        destination = PyFunceble.CURRENT_DIRECTORY + "iana-domains-db.json"
+        destination = PyFunceble.get_current_directory() + "iana-domains-db.json"
 
         if not Version(True).is_cloned() or not PyFunceble.path.isfile(destination):
             # The current version is not the cloned version.
@@ -333,7 +328,7 @@ Install and load the default configuration at the mentioned location? [y/n] "
 
         # We set the destination of the downloaded file.
         destination = (
-            PyFunceble.CURRENT_DIRECTORY
+            PyFunceble.get_current_directory()
             + PyFunceble.CONFIGURATION["outputs"]["default_files"]["public_suffix"]
         )
 
@@ -364,7 +359,7 @@ Install and load the default configuration at the mentioned location? [y/n] "
 
         # We set the destination of the downloaded file.
         destination = (
-            PyFunceble.CURRENT_DIRECTORY
+            PyFunceble.get_current_directory()
             + PyFunceble.CONFIGURATION["outputs"]["default_files"]["dir_structure"]
         )
 
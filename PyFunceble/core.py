@@ -70,16 +70,27 @@ from PyFunceble.adblock import AdBlock
 from PyFunceble.auto_continue import AutoContinue
 from PyFunceble.auto_save import AutoSave
 from PyFunceble.check import Check
-from PyFunceble.database import Inactive
+from PyFunceble.database import Inactive, Whois
+from PyFunceble.deferred import Deferred
+from PyFunceble.distributed import Distributed
 from PyFunceble.execution_time import ExecutionTime
 from PyFunceble.generate import Generate
-from PyFunceble.helpers import Command, Download, List, Regex
+from PyFunceble.helpers import Command, Download, File, List, Regex
+from PyFunceble.incremental import Incremental
+from PyFunceble.lookup import Lookup
+from PyFunceble.metrics import Metrics
 from PyFunceble.mining import Mining
 from PyFunceble.percentage import Percentage
+from PyFunceble.pipeline import Pipeline
 from PyFunceble.prints import Prints
+from PyFunceble.processes import Processes
+from PyFunceble.progress import Progress
+from PyFunceble.scheduler import Scheduler
 from PyFunceble.sort import Sort
 from PyFunceble.status import Status
 from PyFunceble.syntax import Syntax
+from PyFunceble.timings import Timings
+from PyFunceble.tokenizer import Tokenizer
 from PyFunceble.url import URL
 
 
@@ -118,6 +129,7 @@ class Core:  # pragma: no cover
             "url_file": None,
             "modulo_test": False,
             "link_to_test": None,
+            "distributed_worker": False,
         }
 
         # We initiate our optional_arguments in order to be usable all over the
@@ -149,6 +161,9 @@ class Core:  # pragma: no cover
         # We initiate a variable in order to avoid having to recall/declare
         # Inactive() over and over.
         self.inactive_database = Inactive()
+        # We initiate a variable in order to avoid having to recall/declare
+        # Incremental() over and over.
+        self.incremental_database = Incremental()
 
         # We manage the entries.
         self._entry_management()
@@ -214,6 +229,42 @@ class Core:  # pragma: no cover
                 "file_to_test"
             ] = self.url_file  # pylint: disable=no-member
 
+    def _entry_management_file(self):
+        """
+        Manage the testing of the given (or downloaded) file of domains or IPs.
+        """
+
+        # We initiate a variable which will tell the system the type
+        # of the tested element.
+        PyFunceble.INTERN["to_test_type"] = "domain"
+
+        if PyFunceble.CONFIGURATION["syntax"] and PyFunceble.CONFIGURATION["bulk"]:
+            # We only have to check the syntax, in bulk.
+
+            # We check the syntax of the given or the downloaded file.
+            self.file_bulk()
+        else:
+            # We test the given or the downloaded file.
+            self.file()
+
+    def _stop_and_log(self):
+        """
+        Stop and log the execution time, log the percentage and dump the
+        timings and the metrics at the end of a test.
+        """
+
+        # We stop and log the execution time.
+        ExecutionTime("stop", last=True)
+
+        # We show/log the percentage.
+        self.percentage.log()
+
+        # We dump the timings.
+        Timings.dump()
+
+        # We dump the metrics.
+        Metrics.dump()
+
     def _entry_management(self):  # pylint: disable=too-many-branches
         """
         Avoid to have 1 millions line into self.__init__()
@@ -338,12 +389,13 @@ class Core:  # pragma: no cover
                 # or
                 # * A link to test is given.
 
-                # We initiate a variable which will tell the system the type
-                # of the tested element.
-                PyFunceble.INTERN["to_test_type"] = "domain"
-
                 # We test the given or the downloaded file.
-                self.file()
+                self._entry_management_file()
+            elif self.distributed_worker:  # pylint: disable=no-member
+                # We have to work for a coordinator.
+
+                # We test what the coordinator gives us.
+                Distributed(self._test_in_worker).work()
             else:
                 # No file, domain, single url or file or url is given.
 
@@ -358,11 +410,9 @@ class Core:  # pragma: no cover
             ):
                 # We are testing a domain.
 
-                # We stop and log the execution time.
-                ExecutionTime("stop", last=True)
-
-                # We log the current percentage state.
-                self.percentage.log()
+                # We stop and log the execution time, the percentage, the timings
+                # and the metrics.
+                self._stop_and_log()
 
                 # We show the colored logo.
                 self.colorify_logo()
@@ -629,6 +679,12 @@ class Core:  # pragma: no cover
         :type status: str
         """
 
+        if status:
+            # The status is given.
+
+            # We count the currently tested element for the progress.
+            Progress.tested()
+
         if (
             status
             and not PyFunceble.CONFIGURATION["simple"]
@@ -640,6 +696,9 @@ class Core:  # pragma: no cover
             # and
             # * A file to test is set.
 
+            # We save that the currently tested element was just tested.
+            self.incremental_database.add()
+
             # We run the mining logic.
             self.mining.process()
 
@@ -675,23 +734,30 @@ class Core:  # pragma: no cover
                 # database.
                 self.inactive_database.add()
 
-            # We backup the current state of the file reading
-            # for the case that we need to continue later.
-            self.auto_continue.backup()
+            # We backup (if it is time to) the current state of the file
+            # reading for the case that we need to continue later.
+            self.auto_continue.checkpoint(current)
 
             if current != last:
                 # The current element is not the last one.
 
                 # We run the autosave logic.
                 AutoSave()
+
+                # We dump the timings (if it is time to).
+                Timings.dump(periodic=True)
+
+                # We dump the metrics (if it is time to).
+                Metrics.dump(periodic=True)
             else:
                 # The current element is the last one.
 
-                # We stop and log the execution time.
-                ExecutionTime("stop", last=True)
+                # We stop to report the progress.
+                Progress.stop()
 
-                # We show/log the percentage.
-                self.percentage.log()
+                # We stop and log the execution time, the percentage, the timings
+                # and the metrics.
+                self._stop_and_log()
 
                 # We reset the counters as we end the process.
                 self.reset_counters()
@@ -828,6 +894,224 @@ class Core:  # pragma: no cover
         # We return None, there is nothing to test.
         return None
 
+    @classmethod
+    def _test_in_worker(cls, subject):
+        """
+        Test the given element from a worker (process).
+
+        :param subject: The element to test.
+        :type subject: str
+
+        :return:
+            The tested element, its status, the records of what we
+            would have generated, the timings and the metrics.
+        :rtype: dict
+
+        .. note::
+            The main process is the only one which writes, so we defer
+            the generation of files to it.
+        """
+
+        # We start to record what we would have generated.
+        Deferred.start()
+
+        for index in ["http_code", "referer"]:
+            # We loop through some configuration index we have to empty.
+
+            if index in PyFunceble.INTERN:
+                # The index is in the configuration.
+
+                # We empty the configuration index.
+                PyFunceble.INTERN[index] = ""
+
+        if PyFunceble.INTERN["to_test_type"] == "domain":
+            # We are testing domains.
+
+            # We format and set the domain we are testing.
+            PyFunceble.INTERN["to_test"] = cls._format_domain(subject)
+        else:
+            # We are testing URLs.
+
+            # We set the URL we are testing.
+            PyFunceble.INTERN["to_test"] = subject
+
+        # We initiate the status.
+        status = None
+
+        if PyFunceble.INTERN["to_test"]:
+            # There is something to test.
+
+            if PyFunceble.CONFIGURATION["syntax"]:
+                # The syntax mode is activated.
+
+                # We get the status from Syntax.
+                status = Syntax().get()
+            elif PyFunceble.INTERN["to_test_type"] == "domain":
+                # We are testing a domain.
+
+                # We test and get the status of the domain.
+                status, _ = Status().get()
+            else:
+                # We are testing an URL.
+
+                # We get the status from URL.
+                status = URL().get()
+
+        # We return the result along with the records and the timings.
+        return {
+            "to_test": PyFunceble.INTERN["to_test"],
+            "status": status,
+            "deferred": Deferred.stop(),
+            "timings": Timings.pop(),
+            "metrics": Metrics.pop(),
+        }
+
+    def _tested_in_worker(self, result, last):
+        """
+        Manage the result of an element which was tested from a worker.
+
+        :param result: The result of :meth:`_test_in_worker`.
+        :type result: dict
+
+        :param last: The last element of the list we are testing.
+        :type last: str
+
+        :return: The tested element and its status.
+        :rtype: tuple
+        """
+
+        # We print the header.
+        self._print_header()
+
+        # We merge the timings of the worker.
+        Timings.merge(result.get("timings"))
+
+        # We merge the metrics of the worker.
+        Metrics.merge(result.get("metrics"))
+
+        # We set the element we are treating.
+        PyFunceble.INTERN["to_test"] = result["to_test"]
+
+        if PyFunceble.INTERN["to_test"]:
+            # Something was tested.
+
+            # We generate what the worker would have generated.
+            Processes.replay(result["deferred"])
+
+            # We set the element we are treating (again).
+            PyFunceble.INTERN["to_test"] = result["to_test"]
+
+            # We run the file decision logic.
+            self._file_decision(PyFunceble.INTERN["to_test"], last, result["status"])
+
+            if PyFunceble.CONFIGURATION["simple"]:
+                # The simple mode is activated.
+
+                # We print the element and the status.
+                print(PyFunceble.INTERN["to_test"], result["status"])
+
+            # We return the tested element and its status.
+            return PyFunceble.INTERN["to_test"], result["status"]
+
+        # We return None, there is nothing to test.
+        return None
+
+    def _test_list(self, list_to_test, tester):
+        """
+        Test each element of the given list.
+
+        :param list_to_test: The list to test.
+        :type list_to_test: list
+
+        :param tester:
+            The method to use to test a single element when we do not
+            test with multiple processes.
+        :type tester: method
+
+        :return: The tested elements and their statuses.
+        :rtype: list
+
+        :raises:
+            :code:`IndexError`
+                If the list to test is empty.
+        """
+
+        # We get the last element of the list.
+        last = list_to_test[-1]
+
+        if Distributed.is_coordinator():
+            # We are the coordinator.
+
+            # We hand each element out to the workers.
+            return [
+                self._tested_in_worker(x, last)
+                for x in Distributed(self._test_in_worker).test(
+                    [x for x in list_to_test if x]
+                )
+            ]
+
+        if Scheduler.is_activated():
+            # We have to test with the scheduler.
+
+            if PyFunceble.INTERN["to_test_type"] == "domain":
+                # We are testing domains.
+
+                # We initiate the scheduler with the formatting of domains.
+                scheduler = Scheduler(self._test_in_worker, self._format_domain)
+            else:
+                # We are testing URLs.
+
+                # We initiate the scheduler.
+                scheduler = Scheduler(self._test_in_worker)
+
+            # We test each element with the workers of its stage.
+            return [
+                self._tested_in_worker(x, last)
+                for x in scheduler.test([x for x in list_to_test if x])
+            ]
+
+        if Processes.is_activated():
+            # We have to test with multiple processes.
+
+            # We test each element with the workers.
+            return [
+                self._tested_in_worker(x, last)
+                for x in Processes(self._test_in_worker).test(
+                    [x for x in list_to_test if x]
+                )
+            ]
+
+        if (
+            Pipeline.is_batched()
+            and PyFunceble.INTERN["to_test_type"] == "domain"
+            and not PyFunceble.CONFIGURATION["syntax"]
+        ):
+            # We have to collect the data of multiple domains at once.
+
+            # We initiate the results.
+            results = []
+
+            # We get the size of a batch.
+            batch_size = PyFunceble.CONFIGURATION["pipeline_batch_size"]
+
+            for index in range(0, len(list_to_test), batch_size):
+                # We loop through the batches.
+
+                # We get the batch.
+                batch = [x for x in list_to_test[index : index + batch_size] if x]
+
+                # We collect the data of the whole batch.
+                Pipeline().prefetch([self._format_domain(x) for x in batch])
+
+                # We test each element of the batch.
+                results.extend([tester(x, last) for x in batch])
+
+            # We return the results.
+            return results
+
+        # We test each element of the list to test.
+        return [tester(x, last) for x in list_to_test if x]
+
     @classmethod
     def reset_counters(cls):
         """
@@ -908,54 +1192,8 @@ class Core:  # pragma: no cover
             of all the noises around the domain we want to test.
         """
 
-        if not extracted_domain.startswith("#"):
-            # The line is not a commented line.
-
-            if "#" in extracted_domain:
-                # There is a comment at the end of the line.
-
-                # We delete the comment from the line.
-                extracted_domain = extracted_domain[
-                    : extracted_domain.find("#")
-                ].strip()
-
-            if " " in extracted_domain or "\t" in extracted_domain:
-                # A space or a tabs is in the line.
-
-                # We remove all whitestring from the extracted line.
-                splited_line = extracted_domain.split()
-
-                # As there was a space or a tab in the string, we consider
-                # that we are working with the hosts file format which means
-                # that the domain we have to test is after the first string.
-                # So we set the index to 1.
-                index = 1
-
-                while index < len(splited_line):
-                    # We loop until the index is greater than the length of
-                    #  the splited line.
-
-                    if splited_line[index]:
-                        # The element at the current index is not an empty string.
-
-                        # We break the loop.
-                        break
-
-                    # The element at the current index is an empty string.
-
-                    # We increase the index number.
-                    index += 1
-
-                # We return the last read element.
-                return splited_line[index]
-
-            # We return the extracted line.
-            return extracted_domain
-
-        # The extracted line is a comment line.
-
-        # We return an empty string as we do not want to work with commented line.
-        return ""
+        # We return the subject of the line.
+        return Tokenizer.token(extracted_domain)
 
     @classmethod
     def _extract_domain_from_file(cls):
@@ -966,45 +1204,9 @@ class Core:  # pragma: no cover
         :rtype: list
         """
 
-        # We initiate the variable which will save what we are going to return.
-        result = []
-
-        if PyFunceble.path.isfile(PyFunceble.INTERN["file_to_test"]):
-            # The give file to test exist.
-
-            try:
-                with open(PyFunceble.INTERN["file_to_test"]) as file:
-                    # We open and read the file.
-
-                    for line in file:
-                        # We loop through each lines.
-
-                        if not line.startswith("#"):
-                            # The currently read line is not a commented line.
-
-                            # We append the current read line to the result.
-                            result.append(line.rstrip("\n").strip())
-            except UnicodeDecodeError:
-                with open(PyFunceble.INTERN["file_to_test"], encoding="utf-8") as file:
-                    # We open and read the file.
-
-                    for line in file:
-                        # We loop through each lines.
-
-                        if not line.startswith("#"):
-                            # The currently read line is not a commented line.
-
-                            # We append the current read line to the result.
-                            result.append(line.rstrip("\n").strip())
-
-        else:
-            # The given file to test does not exist.
-
-            # We raise a FileNotFoundError exception.
-            raise FileNotFoundError(PyFunceble.INTERN["file_to_test"])
-
-        # We return the result.
-        return result
+        # We return the (stripped) non commented lines of the file.
+        # Note: A FileNotFoundError is raised if the file does not exist.
+        return Tokenizer.lines(PyFunceble.INTERN["file_to_test"])
 
     def _file_list_to_test_filtering(self):
         """
@@ -1023,14 +1225,18 @@ class Core:  # pragma: no cover
         if mined_list:
             list_to_test.extend(mined_list)
 
-        # We generate the directory structure.
-        PyFunceble.DirectoryStructure()
+        if not self.auto_continue:
+            # The directory structure and the auto continue subsystem are
+            # not initiated yet.
 
-        # We update the auto continue variable.
-        self.auto_continue = AutoContinue()
+            # We generate the directory structure.
+            PyFunceble.DirectoryStructure()
 
-        # We restore the data from the last session if it does exist.
-        self.auto_continue.restore()
+            # We update the auto continue variable.
+            self.auto_continue = AutoContinue()
+
+            # We restore the data from the last session if it does exist.
+            self.auto_continue.restore()
 
         if PyFunceble.CONFIGURATION["adblock"]:
             # The adblock decoder is activated.
@@ -1041,10 +1247,15 @@ class Core:  # pragma: no cover
             # The adblock decoder is not activated.
 
             # We get the formatted list of domain to test.
-            list_to_test = [self._format_domain(x) for x in list_to_test]
+            list_to_test = Tokenizer.tokens(list_to_test)
 
-        # We clean the output directory if it is needed.
-        PyFunceble.Clean(list_to_test)
+        if not PyFunceble.CONFIGURATION["incremental"]:
+            # The incremental testing is not activated.
+
+            # We clean the output directory if it is needed.
+            # Note: Under the incremental testing, we keep the output directory
+            # as it contains the results of the elements we do not retest.
+            PyFunceble.Clean(list_to_test)
 
         # We set the start time.
         ExecutionTime("start")
@@ -1052,6 +1263,24 @@ class Core:  # pragma: no cover
         # We get the list we have to test in the current session (from the database).
         self.inactive_database.to_test()
 
+        if PyFunceble.CONFIGURATION["incremental"]:
+            # The incremental testing is activated.
+
+            # We get the elements the way they are tested (and saved into the
+            # databases).
+            tested_form = Incremental.tested_form(list_to_test)
+
+            # We remove the elements which are not into the tested file anymore
+            # from the databases.
+            self.inactive_database.prune(tested_form)
+            Whois().prune(tested_form)
+
+            # We only keep the newly added elements and those which were not
+            # tested for a while.
+            # Note: The elements we have to retest (from the inactive database)
+            # are added just after.
+            list_to_test = self.incremental_database.to_test(list_to_test, tested_form)
+
         if (
             PyFunceble.CONFIGURATION["inactive_database"]
             and PyFunceble.INTERN["file_to_test"] in PyFunceble.INTERN["inactive_db"]
@@ -1076,20 +1305,14 @@ class Core:  # pragma: no cover
                 ]
             )
 
-        # We set a regex of element to delete.
-        # Understand with this variable that we don't want to test those.
-        regex_delete = r"localhost$|localdomain$|local$|broadcasthost$|0\.0\.0\.0$|allhosts$|allnodes$|allrouters$|localnet$|loopback$|mcastprefix$|ip6-mcastprefix$|ip6-localhost$|ip6-loopback$|ip6-allnodes$|ip6-allrouters$|ip6-localnet$"  # pylint: disable=line-too-long
-
         # We load the flatten version of the database.
         PyFunceble.INTERN.update(
             {"flatten_inactive_db": self.inactive_database.content()}
         )
 
-        # We remove the element which are in the database from the
+        # We remove the reserved names (localhost, broadcasthost ...) from the
         # current list to test.
-        list_to_test = List(
-            Regex(list_to_test, regex_delete).not_matching_list()
-        ).format()
+        list_to_test = List(Tokenizer.without_reserved(list_to_test)).format()
         _ = list_to_test[-1]
 
         if PyFunceble.CONFIGURATION["filter"]:
@@ -1108,6 +1331,76 @@ class Core:  # pragma: no cover
         # We return the final list to test.
         return list_to_test
 
+    @classmethod
+    def _already_tested(cls):
+        """
+        Get the number of elements (from the beginning of the list to test) we
+        already tested.
+
+        :rtype: int
+        """
+
+        if PyFunceble.CONFIGURATION["incremental"]:
+            # The incremental testing is activated.
+
+            # We return 0.
+            # Indeed, the list to test is already cut down to the elements we
+            # did not test (see :func:`PyFunceble.incremental.Incremental.to_test`).
+            return 0
+
+        # We return the number of tested elements.
+        return PyFunceble.INTERN["counter"]["number"]["tested"]
+
+    def _file_list_to_test_resumed(self):
+        """
+        Get the list to test from where we stopped during the last session.
+
+        :return:
+            The list of elements which are still to test or :code:`None`
+            if we can't continue from where we stopped.
+        :rtype: list|None
+        """
+
+        # We generate the directory structure.
+        PyFunceble.DirectoryStructure()
+
+        # We update the auto continue variable.
+        self.auto_continue = AutoContinue()
+
+        # We restore the data from the last session if it does exist.
+        self.auto_continue.restore()
+
+        # We get the list of elements which are still to test.
+        list_to_test = self.auto_continue.remaining_list_to_test()
+
+        if list_to_test is None:
+            # We can't continue from where we stopped.
+
+            # We return None.
+            return None
+
+        # We set the start time.
+        ExecutionTime("start")
+
+        # We get the list we have to test in the current session (from the database).
+        self.inactive_database.to_test()
+
+        # We load the flatten version of the database.
+        PyFunceble.INTERN.update(
+            {"flatten_inactive_db": self.inactive_database.content()}
+        )
+
+        # We get the list of elements which are not tested yet.
+        not_tested = set(list_to_test)
+
+        # We append the newly mined elements at the end of the list to test.
+        list_to_test.extend(
+            [x for x in self.mining.list_of_mined() if x not in not_tested]
+        )
+
+        # We return the list to test.
+        return list_to_test
+
     def file(self):
         """
         Manage the case that need to test each domain of a given file path.
@@ -1116,6 +1409,189 @@ class Core:  # pragma: no cover
             1 domain per line.
         """
 
+        # We try to get the list to test from where we stopped.
+        list_to_test = self._file_list_to_test_resumed()
+
+        try:
+            if list_to_test is None:
+                # We can't continue from where we stopped.
+
+                # We get, format, filter, clean and save the list to test.
+                # Note: An IndexError is raised if there is nothing to test.
+                list_to_test = self._file_list_to_test()
+
+            # We save the time we started (for the metrics).
+            Metrics.start()
+
+            # We start to report the progress (if activated).
+            Progress.start(len([x for x in list_to_test if x]))
+
+            # We test each element of the list to test.
+            return self._test_list(list_to_test, self.domain)
+        except IndexError:
+            # We print a message on screen.
+            print(PyFunceble.Fore.CYAN + PyFunceble.Style.BRIGHT + "Nothing to test.")
+        finally:
+            # We stop to report the progress.
+            Progress.stop()
+
+            # We close the connections we opened ahead of time (if any).
+            Lookup.close_preconnections()
+
+    @classmethod
+    def _bulk_write(cls, destination, elements):
+        """
+        Write the given elements into the given (plain list) destination.
+
+        :param destination: The file to write into.
+        :type destination: str
+
+        :param elements: The elements to write.
+        :type elements: list
+        """
+
+        if elements and not PyFunceble.CONFIGURATION["no_files"]:
+            # * There is something to write.
+            # and
+            # * We are allowed to generate files.
+
+            if not PyFunceble.path.isfile(destination):
+                # The destination does not exist yet.
+
+                # We print the first element along with the header of the file.
+                Prints([elements[0]], "PlainDomain", destination).data()
+
+                # We remove the first element from the elements to write.
+                elements = elements[1:]
+
+            if elements:
+                # There is still something to write.
+
+                # We write all elements at once.
+                File(destination).write("\n".join(elements) + "\n")
+
+    def file_bulk(self):
+        """
+        Manage the case that we only have to check the syntax of each domain of
+        a given file path, in bulk.
+
+        .. note::
+            1 domain per line.
+
+        .. note::
+            The file is read line by line and the valid and invalid elements are
+            written by chunk into their plain list. Nothing else (databases,
+            mining, auto continue, hosts or JSON files) is involved.
+        """
+
+        # We initiate the number of elements we write at once.
+        chunk_size = 10000
+
+        # We initiate the path to the plain list files.
+        output_domains = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["domains"]["directory"]
+            + "%s"
+            + PyFunceble.directory_separator
+            + PyFunceble.OUTPUTS["domains"]["filename"]
+        )
+
+        # We initiate the destinations and the elements of each status.
+        destinations = {
+            True: output_domains % PyFunceble.STATUS["official"]["valid"],
+            False: output_domains % PyFunceble.STATUS["official"]["invalid"],
+        }
+        elements = {True: [], False: []}
+
+        # We clean the output directory and reset the counters.
+        PyFunceble.Clean(None)
+        self.reset_counters()
+
+        # We generate the directory structure.
+        PyFunceble.DirectoryStructure()
+
+        # We set the start time.
+        ExecutionTime("start")
+
+        if not PyFunceble.path.isfile(PyFunceble.INTERN["file_to_test"]):
+            # The given file to test does not exist.
+
+            # We raise a FileNotFoundError exception.
+            raise FileNotFoundError(PyFunceble.INTERN["file_to_test"])
+
+        with open(PyFunceble.INTERN["file_to_test"], encoding="utf-8") as file:
+            # We open the file to test.
+
+            # We get the formatted (non commented) elements to check.
+            to_check = (self._format_domain(line.strip()) for line in file)
+
+            if PyFunceble.CONFIGURATION["idna_conversion"]:
+                # We have to convert domains to idna.
+
+                # We convert each element.
+                to_check = (domain2idna(x) for x in to_check if x)
+
+            for element, valid in Check.is_domain_valid_many(to_check, True):
+                # We loop through the checked elements.
+
+                if valid is None:
+                    # There was nothing to check.
+
+                    # We continue to the next element.
+                    continue
+
+                # We save the element under its status.
+                elements[valid].append(element)
+
+                # We update the counters.
+                PyFunceble.INTERN["counter"]["number"]["tested"] += 1
+                PyFunceble.INTERN["counter"]["number"][
+                    "up" if valid else "invalid"
+                ] += 1
+
+                if PyFunceble.CONFIGURATION["simple"]:
+                    # The simple mode is activated.
+
+                    # We print the element and its status.
+                    print(
+                        element,
+                        PyFunceble.STATUS["official"]["valid" if valid else "invalid"],
+                    )
+
+                if len(elements[valid]) >= chunk_size:
+                    # We have enough elements to write.
+
+                    # We write them.
+                    self._bulk_write(destinations[valid], elements[valid])
+                    elements[valid] = []
+
+        for valid, destination in destinations.items():
+            # We loop through the destinations.
+
+            # We write what is left.
+            self._bulk_write(destination, elements[valid])
+
+        # We stop and log the execution time.
+        ExecutionTime("stop", last=True)
+
+        # We show/log the percentage.
+        self.percentage.log()
+
+        # We reset the counters as we end the process.
+        self.reset_counters()
+
+        # We show the colored logo.
+        self.colorify_logo()
+
+    def _file_list_to_test(self):
+        """
+        Construct the list of domains to test from the given file path.
+
+        :return: The list to test.
+        :rtype: list
+        """
+
         # We get, format, filter, clean the list to test.
         list_to_test = self._file_list_to_test_filtering()
 
@@ -1144,18 +1620,14 @@ class Core:  # pragma: no cover
             # current list to test.
             list_to_test = List(
                 list(
-                    set(
-                        list_to_test[PyFunceble.INTERN["counter"]["number"]["tested"] :]
-                    )
+                    set(list_to_test[self._already_tested() :])
                     - set(PyFunceble.INTERN["flatten_inactive_db"])
                 )
             ).format()
             _ = list_to_test[-1]
         except IndexError:
             # Our list to test is the one with the element from the database.
-            list_to_test = not_filtered[
-                PyFunceble.INTERN["counter"]["number"]["tested"] :
-            ]
+            list_to_test = not_filtered[self._already_tested() :]
 
             # We delete the undesired variable.
             del not_filtered
@@ -1166,12 +1638,11 @@ class Core:  # pragma: no cover
             # We format the list.
             list_to_test = List(list(list_to_test)).custom_format(Sort.hierarchical)
 
-        try:
-            # We test each element of the list to test.
-            return [self.domain(x, list_to_test[-1]) for x in list_to_test if x]
-        except IndexError:
-            # We print a message on screen.
-            print(PyFunceble.Fore.CYAN + PyFunceble.Style.BRIGHT + "Nothing to test.")
+        # We save the list to test for the case that we need to continue later.
+        self.auto_continue.save_list_to_test(list_to_test)
+
+        # We return the list to test.
+        return list_to_test
 
     def file_url(self):
         """
@@ -1192,18 +1663,14 @@ class Core:  # pragma: no cover
             # current list to test.
             list_to_test = List(
                 list(
-                    set(
-                        list_to_test[PyFunceble.INTERN["counter"]["number"]["tested"] :]
-                    )
+                    set(list_to_test[self._already_tested() :])
                     - set(PyFunceble.INTERN["flatten_inactive_db"])
                 )
             ).format()
             _ = list_to_test[-1]
         except IndexError:
             # Our list to test is the one with the element from the database.
-            list_to_test = not_filtered[
-                PyFunceble.INTERN["counter"]["number"]["tested"] :
-            ]
+            list_to_test = not_filtered[self._already_tested() :]
 
             # We delete the undesired variable.
             del not_filtered
@@ -1215,11 +1682,23 @@ class Core:  # pragma: no cover
             list_to_test = List(list(list_to_test)).custom_format(Sort.hierarchical)
 
         try:
+            # We save the time we started (for the metrics).
+            Metrics.start()
+
+            # We start to report the progress (if activated).
+            Progress.start(len([x for x in list_to_test if x]))
+
             # We test each URL from the list to test.
-            return [self.url(x, list_to_test[-1]) for x in list_to_test if x]
+            return self._test_list(list_to_test, self.url)
         except IndexError:
             # We print a message on screen.
             print(PyFunceble.Fore.CYAN + PyFunceble.Style.BRIGHT + "Nothing to test.")
+        finally:
+            # We stop to report the progress.
+            Progress.stop()
+
+            # We close the connections we opened ahead of time (if any).
+            Lookup.close_preconnections()
 
     @classmethod
     def switch(
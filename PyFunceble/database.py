@@ -62,9 +62,11 @@ License:
     SOFTWARE.
 """
 # pylint: enable=line-too-long
-# pylint: disable=bad-continuation
+# pylint: disable=bad-continuation, too-many-lines
 import PyFunceble
+from PyFunceble.deferred import Deferred
 from PyFunceble.helpers import Dict, File, List
+from PyFunceble.timings import Timings
 
 
 class Inactive:
@@ -90,7 +92,7 @@ class Inactive:
 
             # We set the path to the inactive database file.
             self.inactive_db_path = (
-                PyFunceble.CURRENT_DIRECTORY
+                PyFunceble.get_current_directory()
                 + PyFunceble.OUTPUTS["default_files"]["inactive_db"]
             )
 
@@ -119,7 +121,7 @@ class Inactive:
 
             # We construct the possible path to an older version of the database.
             historical_formating_error = (
-                PyFunceble.CURRENT_DIRECTORY + "inactive-db.json"
+                PyFunceble.get_current_directory() + "inactive-db.json"
             )
 
             if PyFunceble.path.isfile(historical_formating_error):
@@ -267,6 +269,7 @@ class Inactive:
                 # We merge our current database into already initiated one.
                 self._merge()
 
+    @Timings.timed("database_backup")
     def _backup(self):
         """
         Save the current database into the inactive-db.json file.
@@ -582,6 +585,35 @@ class Inactive:
             # And we save the data into the database.
             self._backup()
 
+    def prune(self, to_keep):
+        """
+        Remove every element which is not into the given list
+        from the database of the file we are testing.
+
+        :param to_keep: The list of elements to keep.
+        :type to_keep: list|set
+        """
+
+        # We get the database of the file we are testing.
+        database = PyFunceble.INTERN["inactive_db"].get(
+            PyFunceble.INTERN["file_to_test"]
+        )
+
+        if PyFunceble.CONFIGURATION["inactive_database"] and database:
+            # The database subsystem is activated and the file path is into
+            # the database.
+
+            # We convert the elements to keep to a set.
+            to_keep = set(to_keep)
+
+            for index, elements in database.items():
+                # We loop through the index of the file database and we only keep
+                # the elements which are to keep.
+                database[index] = [x for x in elements if x in to_keep]
+
+            # And we save the data into the database.
+            self._backup()
+
     @classmethod
     def content(cls):
         """
@@ -686,7 +718,7 @@ class Whois:
 
             # We set the path to the whois database file.
             self.whois_db_path = (
-                PyFunceble.CURRENT_DIRECTORY
+                PyFunceble.get_current_directory()
                 + PyFunceble.OUTPUTS["default_files"]["whois_db"]
             )
 
@@ -744,6 +776,7 @@ class Whois:
                 # We initiate an empty database.
                 PyFunceble.INTERN["whois_db"] = {}
 
+    @Timings.timed("database_backup")
     def _backup(self):
         """
         Backup the database into its file.
@@ -755,6 +788,32 @@ class Whois:
             # We backup the current state of the datbase.
             Dict(PyFunceble.INTERN["whois_db"]).to_json(self.whois_db_path)
 
+    def prune(self, to_keep):
+        """
+        Remove every element which is not into the given list
+        from the database of the file we are testing.
+
+        :param to_keep: The list of elements to keep.
+        :type to_keep: list|set
+        """
+
+        if self._authorization():
+            # We are authorized to work with the database.
+
+            # We get the database of the file we are testing.
+            database = PyFunceble.INTERN["whois_db"].get(
+                PyFunceble.INTERN["file_to_test"], {}
+            )
+
+            for element in set(database) - set(to_keep):
+                # We loop through the elements which are not to keep.
+
+                # We remove the currently read element.
+                del database[element]
+
+            # And we save the database.
+            self._backup()
+
     def is_in_database(self):
         """
         Check if the element is into the database.
@@ -851,6 +910,11 @@ class Whois:
         if self._authorization():
             # We are authorized to work.
 
+            if Deferred.record("whois", [self.expiration_date]):
+                # We are a worker, the main process will save it for us.
+
+                return
+
             if self.epoch < int(PyFunceble.time()):
                 state = "past"
             else:
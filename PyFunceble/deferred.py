@@ -0,0 +1,163 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the deferring logic (of file generation) of the workers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+import PyFunceble
+
+
+class Deferred:
+    """
+    Provide a way to defer the generation of files (and the update of the
+    databases) to another process.
+
+    Indeed, when we test with multiple workers, only one process
+    can write into the output directory and the databases. So, instead of
+    generating files, the workers record what they would have generated and
+    the process which writes replays those records.
+    """
+
+    @classmethod
+    def start(cls):
+        """
+        Start to record.
+        """
+
+        # We initiate the records.
+        PyFunceble.INTERN["deferred"] = []
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop to record.
+
+        :return: The records.
+        :rtype: list
+        """
+
+        if cls.is_started():
+            # We are recording.
+
+            # We get and delete the records.
+            return PyFunceble.INTERN.pop("deferred")
+
+        # We are not recording.
+        return []
+
+    @classmethod
+    def is_started(cls):
+        """
+        Check if we are recording.
+
+        :rtype: bool
+        """
+
+        return "deferred" in PyFunceble.INTERN
+
+    @classmethod
+    def record(cls, action, arguments, method_arguments=None):
+        """
+        Record the given action if we are recording.
+
+        :param action:
+            The action to record.
+            Can be :code:`status_file`, :code:`analytic_file`, :code:`whois`
+            or :code:`logs`.
+        :type action: str
+
+        :param arguments:
+            The arguments to give to the class which will execute the action.
+        :type arguments: list
+
+        :param method_arguments:
+            The arguments to give to the method which will execute the action.
+        :type method_arguments: list
+
+        :return: :code:`True` if the action was recorded.
+        :rtype: bool
+        """
+
+        if cls.is_started():
+            # We are recording.
+
+            if not method_arguments:
+                # The method arguments are not given.
+
+                # We initiate them.
+                method_arguments = []
+
+            # We record the action with the state needed to replay it.
+            PyFunceble.INTERN["deferred"].append(
+                {
+                    "action": action,
+                    "arguments": arguments,
+                    "method_arguments": method_arguments,
+                    "to_test": PyFunceble.INTERN["to_test"],
+                    "http_code": PyFunceble.INTERN.get("http_code", "*" * 3),
+                    "referer": PyFunceble.INTERN.get("referer", "Unknown"),
+                }
+            )
+
+            # We return True, the action was recorded.
+            return True
+
+        # We return False, the action was not recorded.
+        return False
@@ -0,0 +1,543 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the distributed (coordinator/worker) testing logic.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+from collections import deque
+from multiprocessing.managers import BaseManager
+from secrets import token_hex
+from threading import Condition, Thread
+
+import PyFunceble
+from PyFunceble.helpers import File
+from PyFunceble.processes import Processes
+
+
+class Coordination:
+    """
+    The state shared by the coordinator with the workers.
+
+    :param list_to_test: The list to test.
+    :type list_to_test: list
+
+    :param state: The state the workers have to start from.
+    :type state: tuple
+
+    .. note::
+        This object lives in the coordinator. The workers access it
+        through a proxy.
+    """
+
+    def __init__(self, list_to_test, state):
+        # We get the list to test.
+        self.list_to_test = list_to_test
+
+        # We get the state of the coordinator.
+        self.coordinator_state = state
+
+        # We get the size of a batch.
+        batch_size = max(1, PyFunceble.CONFIGURATION["distributed_batch_size"])
+
+        # We initiate the batches.
+        # Note: Under :code:`indexes` we save the indexes of the list to test
+        # of each batch, under :code:`waiting` the batches which are waiting for
+        # a worker and under :code:`handed_out` the batches which were handed
+        # out (and when).
+        self.batches = {
+            "indexes": [
+                list(range(index, min(index + batch_size, len(list_to_test))))
+                for index in range(0, len(list_to_test), batch_size)
+            ],
+            "waiting": deque(),
+            "handed_out": {},
+        }
+
+        # We put every batch into the waiting ones.
+        self.batches["waiting"].extend(range(len(self.batches["indexes"])))
+
+        # We initiate the results we got (but did not consume yet).
+        self.results = {}
+
+        # We initiate the indexes we got a result for.
+        self.received = set()
+
+        # We initiate the time we last got a result at.
+        self.last_received_at = PyFunceble.time()
+
+        # We initiate the condition to use to access the shared state.
+        self.condition = Condition()
+
+    def state(self):
+        """
+        Give the state the workers have to start from.
+
+        :rtype: tuple
+        """
+
+        return self.coordinator_state
+
+    def _requeue(self):
+        """
+        Requeue the batches which were handed out for too long.
+
+        .. note::
+            This is what we do when a worker dies or disappears
+            with a batch.
+        """
+
+        for batch_id, handed_out_at in list(self.batches["handed_out"].items()):
+            # We loop through the batches which were handed out.
+
+            if all(x in self.received for x in self.batches["indexes"][batch_id]):
+                # We got every result of the batch.
+
+                # We forget about it.
+                del self.batches["handed_out"][batch_id]
+            elif (
+                PyFunceble.time() - handed_out_at
+                >= PyFunceble.CONFIGURATION["seconds_before_distributed_requeue"]
+            ):
+                # The batch was handed out for too long.
+
+                # We forget about it.
+                del self.batches["handed_out"][batch_id]
+
+                # And we give it to the next worker.
+                self.batches["waiting"].append(batch_id)
+
+    def get_batch(self):
+        """
+        Give a batch of elements to test.
+
+        :return:
+            - :code:`None` if everything was tested.
+            - An empty :code:`dict` if there is nothing to test right now.
+            - A :code:`dict` with the :code:`id` of the batch and its
+              :code:`subjects` (a list of :code:`(index, subject)`) otherwise.
+        :rtype: dict|None
+        """
+
+        with self.condition:
+            if len(self.received) >= len(self.list_to_test):
+                # Everything was tested.
+
+                # We return None, the worker can stop.
+                return None
+
+            # We requeue the batches which were handed out for too long.
+            self._requeue()
+
+            while self.batches["waiting"]:
+                # We loop through the waiting batches.
+
+                # We get the next batch.
+                batch_id = self.batches["waiting"].popleft()
+
+                # We get the elements of the batch which are not tested yet.
+                subjects = [
+                    (x, self.list_to_test[x])
+                    for x in self.batches["indexes"][batch_id]
+                    if x not in self.received
+                ]
+
+                if subjects:
+                    # There is something to test.
+
+                    # We save when we handed the batch out.
+                    self.batches["handed_out"][batch_id] = PyFunceble.time()
+
+                    # And we return it.
+                    return {"id": batch_id, "subjects": subjects}
+
+            # There is nothing to test right now.
+            return {}
+
+    def put_result(self, index, result):
+        """
+        Save the result of the element at the given index.
+
+        :param index: The index of the tested element.
+        :type index: int
+
+        :param result: The result of the worker.
+        :type result: dict
+        """
+
+        with self.condition:
+            if index not in self.received:
+                # We did not get the result yet.
+
+                # We save it.
+                self.results[index] = result
+                self.received.add(index)
+                self.last_received_at = PyFunceble.time()
+
+                # And we tell the coordinator about it.
+                self.condition.notify_all()
+
+    def get_result(self, index):
+        """
+        Wait for and give the result of the element at the given index.
+
+        :param index: The index of the tested element.
+        :type index: int
+
+        :rtype: dict
+
+        :raise TimeoutError:
+            If we did not get any result (from any worker) since
+            :code:`seconds_before_distributed_timeout` seconds.
+        """
+
+        # We get the maximal number of seconds to wait without any result.
+        timeout = PyFunceble.CONFIGURATION["seconds_before_distributed_timeout"]
+
+        with self.condition:
+            while index not in self.results:
+                # We did not get the result yet.
+
+                if timeout and PyFunceble.time() - self.last_received_at >= timeout:
+                    # We did not get any result for too long.
+
+                    # We raise an exception, there is no worker left.
+                    raise TimeoutError(
+                        "No result from the workers since %d seconds." % timeout
+                    )
+
+                # We wait for it.
+                self.condition.wait(1)
+
+            # We return (and forget) the result.
+            return self.results.pop(index)
+
+
+class CoordinatorManager(BaseManager):
+    """
+    The manager which gives the workers an access to the coordination.
+    """
+
+
+class WorkerManager(BaseManager):
+    """
+    The manager which gives us an access to the coordination of the
+    coordinator.
+    """
+
+
+class Distributed:
+    """
+    Test a list of elements with workers which can be distributed
+    over several machines.
+
+    The coordinator hands out batches of elements, the workers stream back
+    the results and only the coordinator writes into the output directory
+    and the databases.
+
+    :param worker:
+        The function which tests a single element.
+        It should return a :code:`dict` with (at least) the :code:`deferred`
+        index which is the list of records of
+        :class:`PyFunceble.deferred.Deferred`.
+    :type worker: function
+    """
+
+    # We set the maximal number of times (1 per second) we try to
+    # reach the coordinator.
+    maximal_connection_retries = 60
+
+    def __init__(self, worker):
+        # We get the worker.
+        self.worker = worker
+
+    @classmethod
+    def is_coordinator(cls):
+        """
+        Check if we are the coordinator.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION["coordinator"]
+
+    @classmethod
+    def _address(cls):
+        """
+        Give the address (from the configuration) of the coordinator.
+
+        :rtype: tuple
+        """
+
+        # We get the host and the port.
+        host, port = PyFunceble.CONFIGURATION["distributed_address"].rsplit(":", 1)
+
+        # We return the address.
+        return (host, int(port))
+
+    @classmethod
+    def _authkey(cls):
+        """
+        Give the authentication key.
+
+        .. note::
+            We read (in order):
+
+                - The :code:`PYFUNCEBLE_DISTRIBUTED_AUTHKEY` environment
+                  variable.
+                - The file given by the :code:`distributed_authkey_file` index.
+                - The :code:`distributed_authkey` index.
+
+        .. warning::
+            As the coordination is shared through :code:`pickle`, anybody who
+            knows the key can execute code on the coordinator and the workers.
+
+        :rtype: bytes
+        """
+
+        if PyFunceble.environ.get("PYFUNCEBLE_DISTRIBUTED_AUTHKEY"):
+            # The key is given through the environment.
+
+            # We return it.
+            return PyFunceble.environ["PYFUNCEBLE_DISTRIBUTED_AUTHKEY"].encode("utf-8")
+
+        if PyFunceble.CONFIGURATION["distributed_authkey_file"]:
+            # The key is given through a file.
+
+            # We return its (stripped) content.
+            return (
+                File(PyFunceble.CONFIGURATION["distributed_authkey_file"])
+                .read()
+                .strip()
+                .encode("utf-8")
+            )
+
+        # We return the key from the configuration.
+        return PyFunceble.CONFIGURATION["distributed_authkey"].encode("utf-8")
+
+    @classmethod
+    def _coordinator_authkey(cls):
+        """
+        Give the authentication key of the coordinator.
+
+        .. note::
+            If no key is given, we generate a random one and print it so that
+            it can be given to the workers.
+
+        :rtype: bytes
+        """
+
+        # We get the key.
+        authkey = cls._authkey()
+
+        if not authkey:
+            # There is no key.
+
+            # We generate one.
+            authkey = token_hex(16).encode("utf-8")
+
+            # And we print it (even under the quiet mode) as the workers need it.
+            print(
+                PyFunceble.Fore.CYAN
+                + PyFunceble.Style.BRIGHT
+                + "Please give the following key to the workers "
+                "(PYFUNCEBLE_DISTRIBUTED_AUTHKEY): %s" % authkey.decode("utf-8")
+            )
+
+        return authkey
+
+    def test(self, list_to_test):
+        """
+        Hand the given list out to the workers.
+
+        :param list_to_test: The list to test.
+        :type list_to_test: list
+
+        :return:
+            The result of the worker for each element of the given list.
+            The results are given in the order of the given list.
+        :rtype: generator
+        """
+
+        # We get our state.
+        state = Processes.state()
+
+        # We initiate the coordination.
+        # Note: The workers are not coordinators.
+        coordination = Coordination(
+            list_to_test,
+            (dict(state[0], coordinator=False),) + state[1:],
+        )
+
+        # We register the coordination.
+        CoordinatorManager.register("coordination", callable=lambda: coordination)
+
+        # We initiate the server the workers will talk to.
+        server = CoordinatorManager(
+            address=self._address(), authkey=self._coordinator_authkey()
+        ).get_server()
+
+        # We serve in the background.
+        Thread(target=server.serve_forever, daemon=True).start()
+
+        if not PyFunceble.CONFIGURATION["quiet"]:
+            # The quiet mode is not activated.
+
+            # We tell the user where the workers can find us.
+            print(
+                PyFunceble.Fore.CYAN
+                + PyFunceble.Style.BRIGHT
+                + "Waiting for the workers on %s:%d." % server.address
+            )
+
+        try:
+            for index in range(len(list_to_test)):
+                # We loop through the indexes of the list to test.
+
+                # We give the result (once we got it).
+                yield coordination.get_result(index)
+        finally:
+            # We stop to serve.
+            server.stop_event.set()
+
+            # And we stop to accept new workers.
+            server.listener.close()
+
+    def work(self):
+        """
+        Work for the coordinator until everything is tested.
+        """
+
+        # We get the key.
+        authkey = self._authkey()
+
+        if not authkey:
+            # There is no key.
+
+            # We tell the user how to give it.
+            print(
+                PyFunceble.Fore.RED
+                + "Please give the key of the coordinator "
+                "(PYFUNCEBLE_DISTRIBUTED_AUTHKEY)."
+                + PyFunceble.Style.RESET_ALL
+            )
+
+            # And we stop here.
+            return
+
+        # We register the coordination.
+        WorkerManager.register("coordination")
+
+        # We initiate the manager.
+        manager = WorkerManager(address=self._address(), authkey=authkey)
+
+        for _ in range(self.maximal_connection_retries):
+            # We loop until the coordinator is reachable.
+
+            try:
+                # We try to connect to the coordinator.
+                manager.connect()
+                break
+            except ConnectionError:
+                # The coordinator is not reachable (yet).
+
+                # We wait before retrying.
+                PyFunceble.sleep(1)
+        else:
+            # The coordinator is not reachable.
+
+            # We stop here.
+            return
+
+        # We get the coordination.
+        # Note: The method is created by WorkerManager.register() which
+        # pylint can not see.
+        coordination = manager.coordination()  # pylint: disable=no-member
+
+        # We start from the state of the coordinator.
+        Processes.initiate(*coordination.state() + (PyFunceble.OUTPUT_DIRECTORY,))
+
+        try:
+            while True:
+                # We loop until everything is tested.
+
+                # We get a batch of elements to test.
+                batch = coordination.get_batch()
+
+                if batch is None:
+                    # Everything is tested.
+
+                    # We stop the loop.
+                    break
+
+                if not batch:
+                    # There is nothing to test right now.
+
+                    # We wait before asking again.
+                    PyFunceble.sleep(1)
+                    continue
+
+                for index, subject in batch["subjects"]:
+                    # We loop through the elements of the batch.
+
+                    # We test the element and give the result back.
+                    coordination.put_result(index, self.worker(subject))
+        except (ConnectionError, EOFError):
+            # The coordinator is gone, which means that everything is tested.
+            pass
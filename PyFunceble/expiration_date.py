@@ -62,15 +62,14 @@ License:
 """
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
+from re import compile as comp
+
 import PyFunceble
-from PyFunceble.check import Check
 from PyFunceble.database import Whois
 from PyFunceble.generate import Generate
 from PyFunceble.helpers import Regex
-from PyFunceble.http_code import HTTPCode
 from PyFunceble.logs import Logs
-from PyFunceble.lookup import Lookup
-from PyFunceble.referer import Referer
+from PyFunceble.timings import Timings
 
 
 class ExpirationDate:  # pylint: disable=too-few-public-methods
@@ -78,6 +77,60 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
     Get, format and return the expiration date of a domain, if exist.
     """
 
+    # We list the list of regex which will help us get an unformatted expiration date.
+    to_match = [
+        r"expire:(.*)",
+        r"expire on:(.*)",
+        r"Expiry Date:(.*)",
+        r"free-date(.*)",
+        r"expires:(.*)",
+        r"Expiration date:(.*)",
+        r"Expiry date:(.*)",
+        r"Expire Date:(.*)",
+        r"renewal date:(.*)",
+        r"Expires:(.*)",
+        r"validity:(.*)",
+        r"Expiration Date             :(.*)",
+        r"Expiry :(.*)",
+        r"expires at:(.*)",
+        r"domain_datebilleduntil:(.*)",
+        r"Data de expiração \/ Expiration Date \(dd\/mm\/yyyy\):(.*)",
+        r"Fecha de expiración \(Expiration date\):(.*)",
+        r"\[Expires on\](.*)",
+        r"Record expires on(.*)(\(YYYY-MM-DD\))",
+        r"status:      OK-UNTIL(.*)",
+        r"renewal:(.*)",
+        r"expires............:(.*)",
+        r"expire-date:(.*)",
+        r"Exp date:(.*)",
+        r"Valid-date(.*)",
+        r"Expires On:(.*)",
+        r"Fecha de vencimiento:(.*)",
+        r"Expiration:.........(.*)",
+        r"Fecha de Vencimiento:(.*)",
+        r"Registry Expiry Date:(.*)",
+        r"Expires on..............:(.*)",
+        r"Expiration Time:(.*)",
+        r"Expiration Date:(.*)",
+        r"Expired:(.*)",
+        r"Date d'expiration:(.*)",
+        r"expiration date:(.*)",
+    ]
+
+    # We compile - once - the regex which matches the full line of an expiration
+    # date into a raw (bytes) WHOIS record.
+    # Note: This is what let us stop reading a WHOIS record early.
+    line_to_match = comp(
+        "|".join(r"(?:%s)\n" % x for x in to_match).encode("utf-8")
+    )
+
+    # We compile - once - each regex of the list (in order) so that we can tell
+    # which line we are going to extract from a raw (bytes) WHOIS record.
+    patterns_to_match = [comp(x.encode("utf-8")) for x in to_match]
+
+    # We compile - once - the regex which tells us if a number is present.
+    numbers_to_match = comp(rb"[0-9]")
+
     def __init__(self):
         # We set the log separator.
         self.log_separator = "=" * 100 + " \n"
@@ -88,52 +141,42 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
         # We initate a variable which will save our WHOIS record.s
         self.whois_record = ""
 
-        # We initate an instance of Check
-        self.checker = Check()
-
-    def get(self):  # pragma: no cover
+    def get(self, dataset):  # pragma: no cover
         """
         Execute the logic behind the meaning of ExpirationDate + return the matched status.
 
+        :param dataset:
+            The data collected by the stages of
+            :class:`PyFunceble.pipeline.Pipeline` for the currently tested element.
+        :type dataset: dict
+
         :return:
             The status of the tested domain.
             Can be one of the official status.
         :rtype: str
         """
 
-        # We get the status of the domain validation.
-        domain_validation = self.checker.is_domain_valid()
-        # We get the status of the IPv4 validation.
-        ip_validation = self.checker.is_ip_valid()
-
         if "current_test_data" in PyFunceble.INTERN:
             # The end-user want more information whith his test.
 
             # We update some index.
             PyFunceble.INTERN["current_test_data"].update(
                 {
-                    "domain_syntax_validation": domain_validation,
-                    "ip4_syntax_validation": ip_validation,
+                    "domain_syntax_validation": dataset["domain_syntax_validation"],
+                    "ip4_syntax_validation": dataset["ip4_syntax_validation"],
                 }
             )
 
-        if (
-            domain_validation
-            and not ip_validation
-            or domain_validation
-            or PyFunceble.CONFIGURATION["local"]
-        ):
+        if dataset["type"] == "domain":
             # * The element is a valid domain.
-            # and
-            # * The element is not ahe valid IPv4.
             # or
-            # * The element is a valid domain.
+            # * We are testing in a local network.
 
-            # * We get the HTTP status code of the currently tested element.
+            # * We save the HTTP status code of the currently tested element.
             # and
-            # * We try to get the element status from the IANA database.
+            # * We save the element status from the IANA database.
             PyFunceble.INTERN.update(
-                {"http_code": HTTPCode().get(), "referer": Referer().get()}
+                {"http_code": dataset["http_code"], "referer": dataset["referer"]}
             )
 
             if not PyFunceble.INTERN["referer"]:
@@ -144,16 +187,14 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
 
             # The WHOIS record status is not into our list of official status.
 
-            if PyFunceble.INTERN["referer"] and not self.checker.is_subdomain():
-                # * The iana database comparison status is not None.
-                # and
-                # * The domain we are testing is not a subdomain.
+            if not dataset["subdomain"]:
+                # The domain we are testing is not a subdomain.
 
-                # We try to extract the expiration date from the WHOIS record.
+                # We handle the expiration date from the WHOIS record.
                 # And we return the matched status.
-                return self._extract()
+                return self._extract(dataset)
 
-            # The iana database comparison status is None.
+            # The domain we are testing is a subdomain.
 
             # We log our whois record if the debug mode is activated.
             Logs().whois(self.whois_record)
@@ -161,20 +202,11 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
             # And we return None, we could not extract the expiration date.
             return None
 
-        if (
-            ip_validation
-            and not domain_validation
-            or ip_validation
-            or PyFunceble.CONFIGURATION["local"]
-        ):
-            # * The element is a valid IPv4.
-            # and
-            # * The element is not a valid domain.
-            # or
-            # * The element is a valid IPv4.
+        if dataset["type"] == "ip":
+            # The element is a valid IPv4.
 
-            # We get the HTTP status code.
-            PyFunceble.INTERN["http_code"] = HTTPCode().get()
+            # We save the HTTP status code.
+            PyFunceble.INTERN["http_code"] = dataset["http_code"]
 
             # We log our whois record if the debug mode is activated.
             Logs().whois(self.whois_record)
@@ -190,6 +222,89 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
         # And we return False, the domain could not pass the IP and domains syntax validation.
         return False
 
+    @classmethod
+    def _line_to_extract(cls, record, end):
+        """
+        Give the line :meth:`extract` would extract the expiration date from.
+
+        :param record: The raw WHOIS record.
+        :type record: bytes|bytearray
+
+        :param end: The index to stop to look at.
+        :type end: int
+
+        :return: The match of the line or None if there is nothing to extract.
+        :rtype: _sre.SRE_Match|None
+        """
+
+        for pattern in cls.patterns_to_match:
+            # We loop through the list of regex (in the same order as extract()).
+
+            # We try to match the current regex.
+            matched = pattern.search(record, 0, end)
+
+            if matched:
+                # The current regex matched.
+
+                # We return the match, it is the one extract() picks.
+                return matched
+
+        # We return None, there is nothing to extract.
+        return None
+
+    @classmethod
+    def has_expiration_date(cls, record, start=0, end=None):
+        """
+        Check if the given raw (and maybe partial) WHOIS record already
+        contains the full line of an expiration date.
+
+        :param record: The raw WHOIS record.
+        :type record: bytes|bytearray
+
+        :param start: The index to start to look from.
+        :type start: int
+
+        :param end: The index to stop to look at.
+        :type end: int
+
+        :rtype: bool
+
+        .. note::
+            This is given to :func:`PyFunceble.lookup.Lookup.whois` so that it
+            stops to read a WHOIS record once we have what we need.
+
+        .. note::
+            We only stop if the line :meth:`extract` would pick from what we
+            read is complete and has a number. Otherwise, a line matched by a
+            regex with a higher priority could give another (or no)
+            expiration date than the one we stopped for.
+        """
+
+        if end is None:
+            # The end is not given.
+
+            # We look until the end of the record.
+            end = len(record)
+
+        for matched in cls.line_to_match.finditer(record, start, end):
+            # We loop through the matched lines.
+
+            if cls.numbers_to_match.search(matched.group(0)):
+                # The matched line has a number.
+
+                # We get the line extract() would pick.
+                to_extract = cls._line_to_extract(record, end)
+
+                # We return True if that line is complete and has a number.
+                return bool(
+                    to_extract
+                    and record.find(b"\n", to_extract.end(), end) >= 0
+                    and cls.numbers_to_match.search(to_extract.group(1))
+                )
+
+        # We return False, the expiration date is not (yet) in.
+        return False
+
     @classmethod
     def _convert_1_to_2_digits(cls, number):
         """
@@ -431,18 +546,76 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
         # We return an empty string as we were not eable to match the date format.
         return ""
 
-    def _extract(self):  # pragma: no cover
+    @Timings.timed("extraction")
+    def extract(self, whois_record):
+        """
+        Extract the expiration date from the given whois record.
+
+        :param whois_record: The whois record to extract the expiration date from.
+        :type whois_record: str
+
+        :return:
+            - The formatted expiration date.
+            - :code:`False` if the extracted expiration date does not have a number.
+            - :code:`None` if we could not extract the expiration date.
+        :rtype: str|bool|None
+
+        .. note::
+            Nothing is generated nor logged here so that it can be called
+            from any thread.
+        """
+
+        if whois_record:
+            # The whois record is not empty.
+
+            for string in self.to_match:
+                # We loop through the list of regex.
+
+                # We try tro extract the expiration date from the WHOIS record.
+                expiration_date = Regex(
+                    whois_record, string, return_data=True, rematch=True, group=0
+                ).match()
+
+                if expiration_date:
+                    # The expiration date could be extracted.
+
+                    # We get the extracted expiration date.
+                    self.expiration_date = expiration_date[0].strip()
+
+                    # We initate a regex which will help us know if a number
+                    # is present into the extracted expiration date.
+                    regex_rumbers = r"[0-9]"
+
+                    if Regex(
+                        self.expiration_date, regex_rumbers, return_data=False
+                    ).match():
+                        # The extracted expiration date has a number.
+
+                        # We format and return the extracted expiration date.
+                        return self._format()
+
+                    # The extracted expiration date does not have a number.
+
+                    # We return False, we could not get the expiration date.
+                    return False
+
+        # We return None, we could not extract the expiration date.
+        return None
+
+    def _extract(self, dataset):  # pragma: no cover
         """
-        Extract the expiration date from the whois record.
+        Handle the expiration date extracted from the whois record.
+
+        :param dataset:
+            The data collected by the stages of
+            :class:`PyFunceble.pipeline.Pipeline` for the currently tested element.
+        :type dataset: dict
 
         :return: The status of the domain.
         :rtype: str
         """
 
-        # We try to get the expiration date from the database.
-        expiration_date_from_database = Whois().get_expiration_date()
-
-        if expiration_date_from_database:
+        if dataset["expiration_date_from_database"]:
             # The hash of the current whois record did not changed and the
             # expiration date from the database is not empty not equal to
             # None or False.
@@ -452,54 +625,14 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
             Generate(
                 PyFunceble.STATUS["official"]["up"],
                 "WHOIS",
-                expiration_date_from_database,
+                dataset["expiration_date_from_database"],
             ).status_file()
 
             # We handle und return the official up status.
             return PyFunceble.STATUS["official"]["up"]
 
         # We get the whois record.
-        self.whois_record = Lookup().whois(PyFunceble.INTERN["referer"])
-
-        # We list the list of regex which will help us get an unformatted expiration date.
-        to_match = [
-            r"expire:(.*)",
-            r"expire on:(.*)",
-            r"Expiry Date:(.*)",
-            r"free-date(.*)",
-            r"expires:(.*)",
-            r"Expiration date:(.*)",
-            r"Expiry date:(.*)",
-            r"Expire Date:(.*)",
-            r"renewal date:(.*)",
-            r"Expires:(.*)",
-            r"validity:(.*)",
-            r"Expiration Date             :(.*)",
-            r"Expiry :(.*)",
-            r"expires at:(.*)",
-            r"domain_datebilleduntil:(.*)",
-            r"Data de expiração \/ Expiration Date \(dd\/mm\/yyyy\):(.*)",
-            r"Fecha de expiración \(Expiration date\):(.*)",
-            r"\[Expires on\](.*)",
-            r"Record expires on(.*)(\(YYYY-MM-DD\))",
-            r"status:      OK-UNTIL(.*)",
-            r"renewal:(.*)",
-            r"expires............:(.*)",
-            r"expire-date:(.*)",
-            r"Exp date:(.*)",
-            r"Valid-date(.*)",
-            r"Expires On:(.*)",
-            r"Fecha de vencimiento:(.*)",
-            r"Expiration:.........(.*)",
-            r"Fecha de Vencimiento:(.*)",
-            r"Registry Expiry Date:(.*)",
-            r"Expires on..............:(.*)",
-            r"Expiration Time:(.*)",
-            r"Expiration Date:(.*)",
-            r"Expired:(.*)",
-            r"Date d'expiration:(.*)",
-            r"expiration date:(.*)",
-        ]
+        self.whois_record = dataset["whois_record"]
 
         if self.whois_record:
             # The whois record is not empty.
@@ -512,82 +645,61 @@ class ExpirationDate:  # pylint: disable=too-few-public-methods
                     "whois_record"
                 ] = self.whois_record
 
-            for string in to_match:
-                # We loop through the list of regex.
-
-                # We try tro extract the expiration date from the WHOIS record.
-                expiration_date = Regex(
-                    self.whois_record, string, return_data=True, rematch=True, group=0
-                ).match()
-
-                if expiration_date:
-                    # The expiration date could be extracted.
-
-                    # We get the extracted expiration date.
-                    self.expiration_date = expiration_date[0].strip()
-
-                    # We initate a regex which will help us know if a number
-                    # is present into the extracted expiration date.
-                    regex_rumbers = r"[0-9]"
+            if dataset["expiration_date"] is False:
+                # The extracted expiration date does not have a number.
 
-                    if Regex(
-                        self.expiration_date, regex_rumbers, return_data=False
-                    ).match():
-                        # The extracted expiration date has a number.
+                # We log the whois record.
+                Logs().whois(self.whois_record)
 
-                        # We format the extracted expiration date.
-                        self.expiration_date = self._format()
+                # We return None, we could not get the expiration date.
+                return None
 
-                        if (
-                            self.expiration_date
-                            and not Regex(
-                                self.expiration_date,
-                                r"[0-9]{2}\-[a-z]{3}\-2[0-9]{3}",
-                                return_data=False,
-                            ).match()
-                        ):
-                            # The formatted expiration date does not match our unified format.
+            if dataset["expiration_date"] is not None:
+                # The expiration date could be extracted.
 
-                            # We log the problem.
-                            Logs().expiration_date(self.expiration_date)
+                # We get the formatted expiration date.
+                self.expiration_date = dataset["expiration_date"]
 
-                            # We log the whois record.
-                            Logs().whois(self.whois_record)
+                if (
+                    self.expiration_date
+                    and not Regex(
+                        self.expiration_date,
+                        r"[0-9]{2}\-[a-z]{3}\-2[0-9]{3}",
+                        return_data=False,
+                    ).match()
+                ):
+                    # The formatted expiration date does not match our unified format.
 
-                        if "current_test_data" in PyFunceble.INTERN:
-                            # The end-user want more information whith his test.
+                    # We log the problem.
+                    Logs().expiration_date(self.expiration_date)
 
-                            # We update the expiration_date index.
-                            PyFunceble.INTERN["current_test_data"][
-                                "expiration_date"
-                            ] = self.expiration_date
-
-                        # We generate the files and print the status.
-                        # It's an active element!
-                        Generate(
-                            PyFunceble.STATUS["official"]["up"],
-                            "WHOIS",
-                            self.expiration_date,
-                        ).status_file()
+                    # We log the whois record.
+                    Logs().whois(self.whois_record)
 
-                        # We log the whois record.
-                        Logs().whois(self.whois_record)
+                if "current_test_data" in PyFunceble.INTERN:
+                    # The end-user want more information whith his test.
 
-                        # We save the whois record into the database.
-                        Whois(expiration_date=self.expiration_date).add()
+                    # We update the expiration_date index.
+                    PyFunceble.INTERN["current_test_data"][
+                        "expiration_date"
+                    ] = self.expiration_date
 
-                        # We handle und return the official up status.
-                        return PyFunceble.STATUS["official"]["up"]
+                # We generate the files and print the status.
+                # It's an active element!
+                Generate(
+                    PyFunceble.STATUS["official"]["up"], "WHOIS", self.expiration_date
+                ).status_file()
 
-                    # The extracted expiration date does not have a number.
+                # We log the whois record.
+                Logs().whois(self.whois_record)
 
-                    # We log the whois record.
-                    Logs().whois(self.whois_record)
+                # We save the whois record into the database.
+                Whois(expiration_date=self.expiration_date).add()
 
-                    # We return None, we could not get the expiration date.
-                    return None
+                # We handle und return the official up status.
+                return PyFunceble.STATUS["official"]["up"]
 
-        # The whois record is empty.
+        # The whois record is empty or we could not extract the expiration date.
 
-        # We return None, we could not get the whois record.
+        # We return None, we could not get the expiration date.
         return None
@@ -65,8 +65,10 @@ License:
 import PyFunceble
 from PyFunceble import directory_separator
 from PyFunceble.database import Inactive
+from PyFunceble.deferred import Deferred
 from PyFunceble.percentage import Percentage
 from PyFunceble.prints import Prints
+from PyFunceble.timings import Timings
 
 
 class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes
@@ -444,6 +446,15 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes
         :type old_status: str
         """
 
+        if Deferred.record(
+            "analytic_file",
+            [self.domain_status, self.source, self.expiration_date],
+            [new_status, old_status],
+        ):
+            # We are a worker, the main process will generate it for us.
+
+            return
+
         if not old_status:
             # The old status is not given.
 
@@ -710,40 +721,52 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes
         Generate a file according to the domain status.
         """
 
-        if "file_to_test" in PyFunceble.INTERN:
-            # We are not testing as an imported module.
+        if Deferred.record(
+            "status_file", [self.domain_status, self.source, self.expiration_date]
+        ):
+            # We are a worker, the main process will generate it for us.
 
-            # We generate the hosts file.
-            Generate(self.domain_status, self.source, self.expiration_date).info_files()
+            return None
 
-            # We are testing a file content.
+        with Timings("generate"):
+            # We time the generation of the files.
 
-            # We increase the percentage count.
-            Percentage(self.domain_status).count()
+            if "file_to_test" in PyFunceble.INTERN:
+                # We are not testing as an imported module.
 
-            # We print on screen if needed.
-            self._prints_status_screen()
+                # We generate the hosts file.
+                Generate(
+                    self.domain_status, self.source, self.expiration_date
+                ).info_files()
 
-            if self._do_not_produce_file():
-                return None
+                # We are testing a file content.
 
-            if (
-                not PyFunceble.CONFIGURATION["no_files"]
-                and PyFunceble.CONFIGURATION["split"]
-            ):
-                # * The file non-generation of file is globaly deactivated.
-                # and
-                # * We have to split the outputs.
+                # We increase the percentage count.
+                Percentage(self.domain_status).count()
 
-                # We print or generate the files.
-                self._prints_status_file()
-            else:
-                # * The file non-generation of file is globaly activated.
-                # or
-                # * We do not have to split the outputs.
+                # We print on screen if needed.
+                self._prints_status_screen()
+
+                if self._do_not_produce_file():
+                    return None
+
+                if (
+                    not PyFunceble.CONFIGURATION["no_files"]
+                    and PyFunceble.CONFIGURATION["split"]
+                ):
+                    # * The file non-generation of file is globaly deactivated.
+                    # and
+                    # * We have to split the outputs.
+
+                    # We print or generate the files.
+                    self._prints_status_file()
+                else:
+                    # * The file non-generation of file is globaly activated.
+                    # or
+                    # * We do not have to split the outputs.
 
-                # We print or generate the unified files.
-                self.unified_file()
+                    # We print or generate the unified files.
+                    self.unified_file()
 
     def _do_not_produce_file(self):
         """
@@ -70,14 +70,9 @@ from re import escape
 from re import sub as substrings
 from subprocess import PIPE, Popen
 
-import urllib3.exceptions as urllib3_exceptions
-from urllib3 import disable_warnings
-from yaml import dump as dump_yaml
-from yaml import safe_load as load_yaml
-
-from PyFunceble import Fore, Style
+import PyFunceble
 from PyFunceble import copy as shutil_copy
-from PyFunceble import directory_separator, path, requests
+from PyFunceble import directory_separator, path
 
 
 class Hash:  # pylint: disable=too-few-public-methods
@@ -139,11 +134,12 @@ class Hash:  # pylint: disable=too-few-public-methods
         with open(self.path, "rb") as file:
             # We open an read the parsed path.
 
-            # We read the content.
-            content = file.read()
+            for block in iter(lambda: file.read(4096 * 256), b""):
+                # We read the content block by block so we never have
+                # the whole file in memory.
 
-            # We parse the content to the hash algorithm.
-            hash_data.update(content)
+                # We parse the block to the hash algorithm.
+                hash_data.update(block)
 
         # And we extract and return the hash.
         return hash_data.hexdigest()
@@ -593,7 +589,7 @@ class Dict:
             # Note: We always overwrite the destination.
 
             # We save the current dictionnary into a json format.
-            dump_yaml(
+            PyFunceble.yaml.dump(
                 self.main_dictionnary,
                 file,
                 encoding="utf-8",
@@ -623,6 +619,40 @@ class Dict:
             # we return and empty dictionnary.
             return {}
 
+    @classmethod
+    def from_json_lines(cls, data):
+        """
+        Convert a JSON Lines formatted string into a dictionary.
+
+        .. note::
+            Each line is a JSON object which update the previous ones. The lines
+            which can't be decoded (partially written lines) are ignored.
+
+        :param data: A JSON Lines formatted string to convert to dict format.
+        :type data: str
+
+        :return: The dict representation of the JSON Lines formatted string.
+        :rtype: dict
+        """
+
+        # We initiate what we are going to return.
+        result = {}
+
+        for line in data.splitlines():
+            # We loop through each lines.
+
+            try:
+                # We try to decode the line and we update the result with it.
+                result.update(loads(line))
+            except (decoder.JSONDecodeError, ValueError, TypeError):
+                # The line could not be decoded (partially written line).
+
+                # We continue the loop.
+                continue
+
+        # We return the result.
+        return result
+
     @classmethod
     def from_yaml(cls, data):
         """
@@ -636,7 +666,7 @@ class Dict:
         """
 
         # We read a YAML string and convert it into a dictionnary.
-        return load_yaml(data)
+        return PyFunceble.yaml.safe_load(data)
 
 
 class Directory:  # pylint: disable=too-few-public-methods
@@ -1103,43 +1133,75 @@ class Download:  # pragma: no cover pylint:disable=too-few-public-methods
 
         if not self.verification:
             # We disable the urllib warning.
-            disable_warnings(urllib3_exceptions.InsecureRequestWarning)
+            PyFunceble.urllib3.disable_warnings(
+                PyFunceble.urllib3.exceptions.InsecureRequestWarning
+            )
 
-    def text(self):
+    def response(self, headers=None):
         """
-        Download the given link and return or save its :code:`requests.text`
-        at the given destination.
+        Request the given link.
 
-        :rtype: mixed
+        :param headers: The headers to send along with the request.
+        :type headers: dict
+
+        :rtype: requests.Response
 
         :raises:
             :code:`Exception`
-                If the status code is not :code:`200`.
+                If the status code is neither :code:`200` nor :code:`304`.
+
+        .. note::
+            A :code:`304` is only possible if we sent the conditional
+            headers (:code:`If-None-Match` or :code:`If-Modified-Since`).
         """
 
         try:
             # We request the link.
-            req = requests.get(self.link, verify=self.verification)
+            req = PyFunceble.requests.get(
+                self.link, headers=headers, verify=self.verification
+            )
+        except PyFunceble.requests.exceptions.ConnectionError:
+            print(
+                PyFunceble.Fore.RED
+                + "No Internet connection available."
+                + PyFunceble.Style.RESET_ALL
+            )
+            exit(1)
 
-            if req.status_code == 200:
-                # The request http status code is equal to 200.
+        if req.status_code in [200, 304]:
+            # The request http status code is equal to 200 or 304.
 
-                if self.return_data:
-                    # We have to return the data.
+            # We return the response.
+            return req
 
-                    # We return the link content.
-                    return req.text
+        # The request http status code is neither equal to 200 nor 304.
 
-                # We save the link content to the parsed destination.
-                File(self.destination).write(req.text, overwrite=True)
+        # We raise an exception saying that we were unable to download.
+        raise Exception("Unable to download %s." % repr(self.link))
 
-                # We return True.
-                return True
+    def text(self):
+        """
+        Download the given link and return or save its :code:`requests.text`
+        at the given destination.
 
-            # The request http status code is not equal to 200.
+        :rtype: mixed
 
-            # We raise an exception saying that we were unable to download.
-            raise Exception("Unable to download %s." % repr(self.link))
-        except requests.exceptions.ConnectionError:
-            print(Fore.RED + "No Internet connection available." + Style.RESET_ALL)
-            exit(1)
+        :raises:
+            :code:`Exception`
+                If the status code is not :code:`200`.
+        """
+
+        # We request the link.
+        req = self.response()
+
+        if self.return_data:
+            # We have to return the data.
+
+            # We return the link content.
+            return req.text
+
+        # We save the link content to the parsed destination.
+        File(self.destination).write(req.text, overwrite=True)
+
+        # We return True.
+        return True
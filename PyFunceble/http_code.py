@@ -63,18 +63,36 @@ License:
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
 
+from time import perf_counter
+from urllib.parse import urlparse
+
 import urllib3.exceptions as urllib3_exceptions
 from urllib3 import disable_warnings
 
 import PyFunceble
+from PyFunceble.adaptive_timeout import AdaptiveTimeout
+from PyFunceble.circuit_breaker import CircuitBreaker
+from PyFunceble.metrics import Metrics
+from PyFunceble.timings import Timings
 
 
 class HTTPCode:  # pylint: disable=too-few-public-methods
     """
     Get and return the HTTP code status of a given domain.
+
+    :param to_test:
+        The element to get the HTTP code status from.
+        If not given, we use the currently tested element.
+    :type to_test: str
     """
 
-    def __init__(self):  # pragma: no cover
+    def __init__(self, to_test=None):  # pragma: no cover
+        if not to_test:
+            # The element to get is not given.
+
+            # We get the currently tested element.
+            to_test = PyFunceble.INTERN["to_test"]
+
         if PyFunceble.INTERN["to_test_type"] == "url":
             # We should work with full URL which actualy means that we have to get the
             # http status code from the URL we are currently testing.
@@ -83,14 +101,28 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
             disable_warnings(urllib3_exceptions.InsecureRequestWarning)
 
             # We initiate the element we have to get.
-            self.to_get = PyFunceble.INTERN["to_test"]
+            self.to_get = to_test
+
+            # We get the host of the element.
+            self.host = urlparse(to_test).hostname
+
+            # We get the extension of the element.
+            # Note: This is used to adapt the timeout.
+            self.extension = AdaptiveTimeout.extension(to_test)
         elif PyFunceble.INTERN["to_test_type"] == "domain":
             # We are working with domain.
 
             # We construct the element we have to get.
             # Note: As we may work with IP, we explicitly set the port we are
             # working with.
-            self.to_get = "http://%s:80" % PyFunceble.INTERN["to_test"]
+            self.to_get = "http://%s:80" % to_test
+
+            # We get the host of the element.
+            self.host = to_test
+
+            # We get the extension of the element.
+            # Note: This is used to adapt the timeout.
+            self.extension = AdaptiveTimeout.extension(to_test)
         else:
             raise Exception("Unknow type of test.")
 
@@ -106,6 +138,36 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
             # We return an empty header.
             self.headers = {}
 
+    def _address(self):
+        """
+        Get the IP the host of the element resolves to.
+
+        :return: The IP or None if the host could not be resolved.
+        :rtype: str|None
+
+        .. note::
+            This is the key of the circuit breaker of the request so that all
+            the domains hosted on a dead server share it.
+        """
+
+        if not self.host:
+            # There is no host to resolve.
+
+            # We return None.
+            return None
+
+        try:
+            # We resolve the host and return the first IP.
+            return PyFunceble.socket.getaddrinfo(
+                self.host, None, 0, PyFunceble.socket.SOCK_STREAM
+            )[0][4][0]
+        except (PyFunceble.socket.error, IndexError, UnicodeError):
+            # We could not resolve the host.
+
+            # We return None.
+            return None
+
+    @Timings.timed("http")
     def _access(self):  # pragma: no cover
         """
         Get the HTTP code status.
@@ -114,6 +176,32 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
         :rtype: int|None
         """
 
+        if CircuitBreaker.is_activated():
+            # The circuit breakers are activated.
+
+            # We get the IP we are going to request.
+            address = self._address()
+
+            if address and not CircuitBreaker.allows("http", address):
+                # The IP failed too many times in a row.
+
+                # We return None.
+                # Note: This way, we fall back to the next source of status.
+                return None
+        else:
+            # The circuit breakers are not activated.
+
+            # We do not need the IP.
+            address = None
+
+        # We get the timeout of the extension.
+        # Note: It is bounded by the configured timeout.
+        timeout = AdaptiveTimeout.get("http", self.extension)
+
+        # We save the time we started.
+        # Note: This is used to adapt the timeout of the extension.
+        started = perf_counter()
+
         try:
             # We try to get the HTTP status code.
 
@@ -123,7 +211,7 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
                 # We get the head of the URL.
                 req = PyFunceble.requests.head(
                     self.to_get,
-                    timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
+                    timeout=timeout,
                     headers=self.headers,
                     verify=PyFunceble.CONFIGURATION["verify_ssl_certificate"],
                 )
@@ -133,24 +221,55 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
                 # We get the head of the constructed URL.
                 req = PyFunceble.requests.head(
                     self.to_get,
-                    timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
+                    timeout=timeout,
                     headers=self.headers,
                 )
 
+            # We save the duration of the request.
+            AdaptiveTimeout.add("http", self.extension, perf_counter() - started)
+
+            if address:
+                # We know the IP we requested.
+
+                # We count the success.
+                CircuitBreaker.success("http", address)
+
             # And we try to get the status code.
             return req.status_code
 
+        except (PyFunceble.socket.timeout, PyFunceble.requests.exceptions.Timeout):
+            # We got a timeout, that means that we were unable to extract
+            # the status code.
+
+            # We count the timeout.
+            Metrics.count("timeouts", "http")
+
+            if address:
+                # We know the IP we requested.
+
+                # We count the failure.
+                CircuitBreaker.failure("http", address)
+
+            # We return None.
+            return None
         except (
             PyFunceble.requests.exceptions.InvalidURL,
-            PyFunceble.socket.timeout,
-            PyFunceble.requests.exceptions.Timeout,
             PyFunceble.requests.ConnectionError,
             urllib3_exceptions.InvalidHeader,
             UnicodeDecodeError,  # The probability that this happend in production is minimal.
-        ):
+        ) as exception:
             # If one of the listed exception is matched, that means that something
             # went wrong and we were unable to extract the status code.
 
+            # We count the error.
+            Metrics.count("errors", "http")
+
+            if address and isinstance(exception, PyFunceble.requests.ConnectionError):
+                # We could not connect to the IP we requested.
+
+                # We count the failure.
+                CircuitBreaker.failure("http", address)
+
             # We return None.
             return None
 
@@ -62,6 +62,9 @@ License:
 """
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
 import PyFunceble
 from PyFunceble.helpers import Dict, Download, File, Regex
 from PyFunceble.lookup import Lookup
@@ -70,12 +73,320 @@ from PyFunceble.lookup import Lookup
 class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
     """
     Logic behind the update and usage of `iana-domains-db.json`
+
+    .. note::
+        While updating, the WHOIS server of each extension is requested
+        concurrently (with at most :code:`maximal_workers` queries at once)
+        and we wait at least :code:`seconds_between_queries` seconds between
+        the start of two queries so that we do not flood the IANA WHOIS server.
     """
 
+    # We set the maximal number of WHOIS queries we run at once.
+    maximal_workers = 10
+
+    # We set the minimal number of seconds between the start of two
+    # WHOIS queries.
+    seconds_between_queries = 0.05
+
+    # We set the port of the IANA WHOIS server.
+    whois_port = 43
+
+    # We map the list of server which have to be set manually because
+    # they are not present into the IANA Root Zone Database.
+    manual_server = {
+        "aaa": "whois.nic.aaa",
+        "abb": "whois.nic.abb",
+        "able": "whois.nic.able",
+        "accenture": "whois.nic.accenture",
+        "aetna": "whois.nic.aetna",
+        "aig": "whois.nic.aig",
+        "americanexpress": "whois.nic.americanexpress",
+        "amex": "whois.nic.amex",
+        "amica": "whois.nic.amica",
+        "amsterdam": "whois.nic.amsterdam",
+        "analytics": "whois.nic.analytics",
+        "aramco": "whois.nic.aramco",
+        "arte": "whois.nic.arte",
+        "as": "whois.nic.as",
+        "athleta": "whois.nic.athleta",
+        "audible": "whois.nic.audible",
+        "author": "whois.nic.author",
+        "aws": "whois.nic.aws",
+        "axa": "whois.nic.axa",
+        "azure": "whois.nic.azure",
+        "baby": "whois.nic.baby",
+        "banamex": "whois.nic.banamex",
+        "bananarepublic": "whois.nic.bananarepublic",
+        "baseball": "whois.nic.baseball",
+        "bharti": "whois.nic.bharti",
+        "bing": "whois.nic.bing",
+        "bloomberg": "whois.nic.bloomberg",
+        "bm": "whois.afilias-srs.net",
+        "book": "whois.nic.book",
+        "booking": "whois.nic.booking",
+        "bot": "whois.nic.bot",
+        "buzz": "whois.nic.buzz",
+        "bz": "whois.afilias-grs.net",
+        "call": "whois.nic.call",
+        "calvinklein": "whois.nic.calvinklein",
+        "caravan": "whois.nic.caravan",
+        "cartier": "whois.nic.cartier",
+        "caseih": "whois.nic.caseih",
+        "cbn": "whois.nic.cbn",
+        "cbre": "whois.nic.cbre",
+        "cd": "chois.nic.cd",
+        "chase": "whois.nic.chase",
+        "circle": "whois.nic.circle",
+        "cisco": "whois.nic.cisco",
+        "citadel": "whois.nic.citadel",
+        "citi": "whois.nic.citi",
+        "citic": "whois.nic.citic",
+        "cm": "whois.netcom.cm",
+        "coupon": "whois.nic.coupon",
+        "crown": "whois.nic.crown",
+        "crs": "whois.nic.crs",
+        "deal": "whois.nic.deal",
+        "dealer": "whois.nic.dealer",
+        "dell": "whois.nic.dell",
+        "dhl": "whois.nic.dhl",
+        "discover": "whois.nic.discover",
+        "dnp": "whois.nic.dnp",
+        "doosan": "whois.nic.doosan",
+        "duns": "whois.nic.duns",
+        "dupont": "whois.nic.dupont",
+        "earth": "whois.nic.earth",
+        "energy": "whois.nic.energy",
+        "epost": "whois.nic.epost",
+        "everbank": "whois.nic.everbank",
+        "farmers": "whois.nic.farmers",
+        "fast": "whois.nic.fast",
+        "ferrero": "whois.nic.ferrero",
+        "fire": "whois.nic.fire",
+        "fj": "whois.usp.ac.fj",
+        "flickr": "whois.nic.flickr",
+        "flir": "whois.nic.flir",
+        "food": "whois.nic.food",
+        "ford": "whois.nic.ford",
+        "fox": "whois.nic.fox",
+        "free": "whois.nic.free",
+        "frontier": "whois.nic.frontier",
+        "ftr": "whois.nic.ftr",
+        "ga": "whois.my.ga",
+        "gap": "whois.nic.gap",
+        "gh": "whois.nic.gh",
+        "gmo": "whois.nic.gmo",
+        "got": "whois.nic.got",
+        "grainger": "whois.nic.grainger",
+        "grocery": "whois.nic.grocery",
+        "guardian": "whois.nic.guardian",
+        "gucci": "whois.nic.gucci",
+        "hair": "whois.nic.hair",
+        "hbo": "whois.nic.hbo",
+        "health": "whois.nic.health",
+        "homegoods": "whois.nic.homegoods",
+        "homesense": "whois.nic.homesense",
+        "honeywell": "whois.nic.honeywell",
+        "hot": "whois.nic.hot",
+        "hoteles": "whois.nic.hoteles",
+        "hotels": "whois.nic.hotels",
+        "hotmail": "whois.nic.hotmail",
+        "hsbc": "whois.nic.hsbc",
+        "htc": "whois.nic.htc",
+        "hyatt": "whois.nic.hyatt",
+        "ieee": "whois.nic.ieee",
+        "iinet": "whois.nic.iinet",
+        "imdb": "whois.nic.imdb",
+        "int": "whois.iana.org",
+        "intel": "whois.nic.intel",
+        "intuit": "whois.nic.intuit",
+        "ipiranga": "whois.nic.ipiranga",
+        "ipirange": "whois.nic.ipiranga",
+        "itau": "whois.nic.itau",
+        "iwc": "whois.nic.iwc",
+        "jetzt": "whois.nic.jetzt",
+        "jlc": "whois.nic.jlc",
+        "jmp": "whois.nic.jmp",
+        "jnj": "whois.nic.jnj",
+        "jot": "whois.nic.jot",
+        "joy": "whois.nic.joy",
+        "jpmorgan": "whois.nic.jpmorgan",
+        "jprs": "whois.nic.jprs",
+        "kinder": "whois.nic.kinder",
+        "kindle": "whois.nic.kindle",
+        "kpmg": "whois.nic.kpmg",
+        "kpn": "whois.nic.kpn",
+        "kred": "whois.nic.kred",
+        "kw": "whois.nic.kw",
+        "lanxess": "whois.nic.lanxess",
+        "lc": "whois2.afilias-grs.net",
+        "lifeinsurance": "whois.nic.lifeinsurance",
+        "like": "whois.nic.like",
+        "lilly": "whois.nic.lilly",
+        "lincoln": "whois.nic.lincoln",
+        "living": "whois.nic.living",
+        "lk": "whois.nic.lk",
+        "loft": "whois.nic.loft",
+        "lupin": "whois.nic.lupin",
+        "maif": "whois.nic.maif",
+        "marshalls": "whois.nic.marshalls",
+        "mattel": "whois.nic.mattel",
+        "mcd": "whois.nic.mcd",
+        "mcdonalds": "whois.nic.mcdonalds",
+        "merckmsd": "whois.nic.merckmsd",
+        "microsoft": "whois.nic.microsoft",
+        "mint": "whois.nic.mint",
+        "mlb": "whois.nic.mlb",
+        "mobily": "whois.nic.mobily",
+        "moi": "whois.nic.moi",
+        "montblanc": "whois.nic.montblanc",
+        "moto": "whois.nic.moto",
+        "msd": "whois.nic.msd",
+        "mtpc": "whois.nic.mtpc",
+        "mutual": "whois.nic.mutual",
+        "mutuelle": "whois.nic.mutuelle",
+        "nagoya": "whois.nic.nagoya",
+        "nba": "whois.nic.nba",
+        "netflix": "whois.nic.netflix",
+        "neustar": "whois.nic.neustar",
+        "nfl": "whois.nic.nfl",
+        "nhk": "whois.nic.nhk",
+        "nike": "whois.nic.nike",
+        "northwesternmutual": "whois.nic.northwesternmutual",
+        "now": "whois.nic.now",
+        "ntt": "whois.nic.ntt",
+        "nyc": "whois.nic.nyc",
+        "office": "whois.nic.office",
+        "okinawa": "whois.nic.okinawa",
+        "oldnavy": "whois.nic.oldnavy",
+        "open": "whois.nic.open",
+        "orientexpress": "whois.nic.orientexpress",
+        "otsuka": "whois.nic.otsuka",
+        "passagens": "whois.nic.passagens",
+        "pay": "whois.nic.pay",
+        "pfizer": "whois.nic.pfizer",
+        "pharmacy": "whois.nic.pharmacy",
+        "piaget": "whois.nic.piaget",
+        "pictet": "whois.nic.pictet",
+        "pin": "whois.nic.pin",
+        "ping": "whois.nic.ping",
+        "pramerica": "whois.nic.pramerica",
+        "praxi": "whois.nic.praxi",
+        "prime": "whois.nic.prime",
+        "pru": "whois.nic.pru",
+        "prudential": "whois.nic.prudential",
+        "ps": "whois.pnina.ps",
+        "qvc": "whois.nic.qvc",
+        "read": "whois.nic.read",
+        "realtor": "whois.nic.realtor",
+        "ren": "whois.nic.ren",
+        "rocher": "whois.nic.rocher",
+        "room": "whois.nic.room",
+        "rw": "whois.ricta.org.rw",
+        "ryukyu": "whois.nic.ryukyu",
+        "safe": "whois.nic.safe",
+        "safety": "whois.nic.safety",
+        "sakura": "whois.nic.sakura",
+        "sapo": "whois.nic.sapo",
+        "sas": "whois.nic.sas",
+        "save": "whois.nic.save",
+        "secure": "whois.nic.secure",
+        "sener": "whois.nic.sener",
+        "shaw": "whois.afilias-srs.net",
+        "shop": "whois.nic.shop",
+        "silk": "whois.nic.silk",
+        "skype": "whois.nic.skype",
+        "sl": "whois.nic.sl",
+        "smile": "whois.nic.smile",
+        "sohu": "whois.nic.sohu",
+        "song": "whois.nic.song",
+        "spot": "whois.nic.spot",
+        "staples": "whois.nic.staples",
+        "statefarm": "whois.nic.statefarm",
+        "stream": "whois.nic.stream",
+        "suzuki": "whois.nic.suzuki",
+        "swiftcover": "whois.nic.swiftcover",
+        "talk": "whois.nic.talk",
+        "taobao": "whois.nic.taobao",
+        "target": "whois.nic.target",
+        "tjmaxx": "whois.nic.tjmaxx",
+        "tjx": "whois.nic.tjx",
+        "tkmaxx": "whois.nic.tkmaxx",
+        "tmall": "whois.nic.tmall",
+        "tokyo": "whois.nic.tokyo",
+        "tube": "whois.nic.tube",
+        "tunes": "whois.nic.tunes",
+        "tushu": "whois.nic.tushu",
+        "tvs": "whois.nic.tvs",
+        "unicom": "whois.nic.unicom",
+        "uno": "whois.nic.uno",
+        "vivo": "whois.nic.vivo",
+        "vuelos": "whois.nic.vuelos",
+        "wanggou": "whois.nic.wanggou",
+        "watches": "whois.nic.watches",
+        "weather": "whois.nic.weather",
+        "weatherchannel": "whois.nic.weatherchannel",
+        "weir": "whois.nic.weir",
+        "whois": "whois.nic.qpon",
+        "windows": "whois.nic.windows",
+        "winners": "whois.nic.winners",
+        "wow": "whois.nic.wow",
+        "xbox": "whois.nic.xbox",
+        "xn--1ck2e1b": "whois.nic.xn--1ck2e1b",
+        "xn--2scrj9c": "whois.inregistry.net",
+        "xn--3hcrj9c": "whois.inregistry.net",
+        "xn--45br5cyl": "whois.inregistry.net",
+        "xn--45brj9c": "whois.inregistry.net",
+        "xn--8y0a063a": "whois.nic.xn--8y0a063a",
+        "xn--bck1b9a5dre4c": "whois.nic.xn--bck1b9a5dre4c",
+        "xn--cck2b3b": "whois.nic.xn--cck2b3b",
+        "xn--czr694b": "whois.nic.xn--czr694b",
+        "xn--e1a4c": "whois.eu",
+        "xn--eckvdtc9d": "whois.nic.xn--eckvdtc9d",
+        "xn--fct429k": "whois.nic.xn--fct429k",
+        "xn--fpcrj9c3d": "whois.inregistry.net",
+        "xn--fzc2c9e2c": "whois.nic.lk",
+        "xn--g2xx48c": "whois.nic.xn--g2xx48c",
+        "xn--gckr3f0f": "whois.nic.xn--gckr3f0f",
+        "xn--gecrj9c": "whois.inregistry.net",
+        "xn--gk3at1e": "whois.nic.xn--gk3at1e",
+        "xn--h2breg3eve": "whois.inregistry.net",
+        "xn--h2brj9c": "whois.inregistry.net",
+        "xn--h2brj9c8c": "whois.inregistry.net",
+        "xn--imr513n": "whois.nic.xn--imr513n",
+        "xn--jvr189m": "whois.nic.xn--jvr189m",
+        "xn--kpu716f": "whois.nic.xn--kpu716f",
+        "xn--mgba3a3ejt": "whois.nic.xn--mgba3a3ejt",
+        "xn--mgbb9fbpob": "whois.nic.xn--mgbb9fbpob",
+        "xn--mgbbh1a": "whois.inregistry.net",
+        "xn--mgbbh1a71e": "whois.inregistry.net",
+        "xn--mgbgu82a": "whois.inregistry.net",
+        "xn--nyqy26a": "whois.nic.xn--nyqy26a",
+        "xn--otu796d": "whois.nic.xn--otu796d",
+        "xn--pbt977c": "whois.nic.xn--pbt977c",
+        "xn--rhqv96g": "whois.nic.xn--rhqv96g",
+        "xn--rovu88b": "whois.nic.xn--rovu88b",
+        "xn--rvc1e0am3e": "whois.inregistry.net",
+        "xn--s9brj9c": "whois.inregistry.net",
+        "xn--ses554g": "whois.registry.knet.cn",
+        "xn--wgbh1c": "whois.dotmasr.eg",
+        "xn--xkc2al3hye2a": "whois.nic.lk",
+        "xn--xkc2dl3a5ee0h": "whois.inregistry.net",
+        "yahoo": "whois.nic.yahoo",
+        "yamaxun": "whois.nic.yamaxun",
+        "yandex": "whois.nic.yandex",
+        "yokohama": "whois.nic.yokohama",
+        "you": "whois.nic.you",
+        "za": "whois.registry.net.za",
+        "zappos": "whois.nic.zappos",
+        "zero": "whois.nic.zero",
+        "zippo": "whois.nic.zippo",
+    }
+
     def __init__(self):
         # We get the destination of the constructed IANA database.
         self.destination = (
-            PyFunceble.CURRENT_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["iana"]
+            PyFunceble.get_current_directory()
+            + PyFunceble.OUTPUTS["default_files"]["iana"]
         )
 
         if PyFunceble.path.isfile(self.destination):
@@ -95,296 +406,11 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
         # We iniitate an instance of Lookup.
         self.lookup = Lookup()
 
-        # We map the list of server which have to be set manually because
-        # they are not present into the IANA Root Zone Database.
-        self.manual_server = {
-            "aaa": "whois.nic.aaa",
-            "abb": "whois.nic.abb",
-            "able": "whois.nic.able",
-            "accenture": "whois.nic.accenture",
-            "aetna": "whois.nic.aetna",
-            "aig": "whois.nic.aig",
-            "americanexpress": "whois.nic.americanexpress",
-            "amex": "whois.nic.amex",
-            "amica": "whois.nic.amica",
-            "amsterdam": "whois.nic.amsterdam",
-            "analytics": "whois.nic.analytics",
-            "aramco": "whois.nic.aramco",
-            "arte": "whois.nic.arte",
-            "as": "whois.nic.as",
-            "athleta": "whois.nic.athleta",
-            "audible": "whois.nic.audible",
-            "author": "whois.nic.author",
-            "aws": "whois.nic.aws",
-            "axa": "whois.nic.axa",
-            "azure": "whois.nic.azure",
-            "baby": "whois.nic.baby",
-            "banamex": "whois.nic.banamex",
-            "bananarepublic": "whois.nic.bananarepublic",
-            "baseball": "whois.nic.baseball",
-            "bharti": "whois.nic.bharti",
-            "bing": "whois.nic.bing",
-            "bloomberg": "whois.nic.bloomberg",
-            "bm": "whois.afilias-srs.net",
-            "book": "whois.nic.book",
-            "booking": "whois.nic.booking",
-            "bot": "whois.nic.bot",
-            "buzz": "whois.nic.buzz",
-            "bz": "whois.afilias-grs.net",
-            "call": "whois.nic.call",
-            "calvinklein": "whois.nic.calvinklein",
-            "caravan": "whois.nic.caravan",
-            "cartier": "whois.nic.cartier",
-            "caseih": "whois.nic.caseih",
-            "cbn": "whois.nic.cbn",
-            "cbre": "whois.nic.cbre",
-            "cd": "chois.nic.cd",
-            "chase": "whois.nic.chase",
-            "circle": "whois.nic.circle",
-            "cisco": "whois.nic.cisco",
-            "citadel": "whois.nic.citadel",
-            "citi": "whois.nic.citi",
-            "citic": "whois.nic.citic",
-            "cm": "whois.netcom.cm",
-            "coupon": "whois.nic.coupon",
-            "crown": "whois.nic.crown",
-            "crs": "whois.nic.crs",
-            "deal": "whois.nic.deal",
-            "dealer": "whois.nic.dealer",
-            "dell": "whois.nic.dell",
-            "dhl": "whois.nic.dhl",
-            "discover": "whois.nic.discover",
-            "dnp": "whois.nic.dnp",
-            "doosan": "whois.nic.doosan",
-            "duns": "whois.nic.duns",
-            "dupont": "whois.nic.dupont",
-            "earth": "whois.nic.earth",
-            "energy": "whois.nic.energy",
-            "epost": "whois.nic.epost",
-            "everbank": "whois.nic.everbank",
-            "farmers": "whois.nic.farmers",
-            "fast": "whois.nic.fast",
-            "ferrero": "whois.nic.ferrero",
-            "fire": "whois.nic.fire",
-            "fj": "whois.usp.ac.fj",
-            "flickr": "whois.nic.flickr",
-            "flir": "whois.nic.flir",
-            "food": "whois.nic.food",
-            "ford": "whois.nic.ford",
-            "fox": "whois.nic.fox",
-            "free": "whois.nic.free",
-            "frontier": "whois.nic.frontier",
-            "ftr": "whois.nic.ftr",
-            "ga": "whois.my.ga",
-            "gap": "whois.nic.gap",
-            "gh": "whois.nic.gh",
-            "gmo": "whois.nic.gmo",
-            "got": "whois.nic.got",
-            "grainger": "whois.nic.grainger",
-            "grocery": "whois.nic.grocery",
-            "guardian": "whois.nic.guardian",
-            "gucci": "whois.nic.gucci",
-            "hair": "whois.nic.hair",
-            "hbo": "whois.nic.hbo",
-            "health": "whois.nic.health",
-            "homegoods": "whois.nic.homegoods",
-            "homesense": "whois.nic.homesense",
-            "honeywell": "whois.nic.honeywell",
-            "hot": "whois.nic.hot",
-            "hoteles": "whois.nic.hoteles",
-            "hotels": "whois.nic.hotels",
-            "hotmail": "whois.nic.hotmail",
-            "hsbc": "whois.nic.hsbc",
-            "htc": "whois.nic.htc",
-            "hyatt": "whois.nic.hyatt",
-            "ieee": "whois.nic.ieee",
-            "iinet": "whois.nic.iinet",
-            "imdb": "whois.nic.imdb",
-            "int": "whois.iana.org",
-            "intel": "whois.nic.intel",
-            "intuit": "whois.nic.intuit",
-            "ipiranga": " whois.nic.ipiranga",
-            "ipirange": "whois.nic.ipiranga",
-            "itau": "whois.nic.itau",
-            "iwc": "whois.nic.iwc",
-            "jetzt": "whois.nic.jetzt",
-            "jlc": "whois.nic.jlc",
-            "jmp": "whois.nic.jmp",
-            "jnj": "whois.nic.jnj",
-            "jot": "whois.nic.jot",
-            "joy": "whois.nic.joy",
-            "jpmorgan": "whois.nic.jpmorgan",
-            "jprs": "whois.nic.jprs",
-            "kinder": "whois.nic.kinder",
-            "kindle": "whois.nic.kindle",
-            "kpmg": "whois.nic.kpmg",
-            "kpn": "whois.nic.kpn",
-            "kred": "whois.nic.kred",
-            "kw": "whois.nic.kw",
-            "lanxess": "whois.nic.lanxess",
-            "lc": "whois2.afilias-grs.net",
-            "lifeinsurance": "whois.nic.lifeinsurance",
-            "like": "whois.nic.like",
-            "lilly": "whois.nic.lilly",
-            "lincoln": "whois.nic.lincoln",
-            "living": "whois.nic.living",
-            "lk": "whois.nic.lk",
-            "loft": "whois.nic.loft",
-            "lupin": "whois.nic.lupin",
-            "maif": "whois.nic.maif",
-            "marshalls": "whois.nic.marshalls",
-            "mattel": "whois.nic.mattel",
-            "mcd": "whois.nic.mcd",
-            "mcdonalds": "whois.nic.mcdonalds",
-            "merckmsd": "whois.nic.merckmsd",
-            "microsoft": "whois.nic.microsoft",
-            "mint": "whois.nic.mint",
-            "mlb": "whois.nic.mlb",
-            "mobily": "whois.nic.mobily",
-            "moi": "whois.nic.moi",
-            "montblanc": "whois.nic.montblanc",
-            "moto": "whois.nic.moto",
-            "msd": "whois.nic.msd",
-            "mtpc": "whois.nic.mtpc",
-            "mutual": "whois.nic.mutual",
-            "mutuelle": "whois.nic.mutuelle",
-            "nagoya": "whois.nic.nagoya",
-            "nba": "whois.nic.nba",
-            "netflix": "whois.nic.netflix",
-            "neustar": "whois.nic.neustar",
-            "nfl": "whois.nic.nfl",
-            "nhk": "whois.nic.nhk",
-            "nike": "whois.nic.nike",
-            "northwesternmutual": "whois.nic.northwesternmutual",
-            "now": " whois.nic.now",
-            "ntt": "whois.nic.ntt",
-            "nyc": "whois.nic.nyc",
-            "office": "whois.nic.office",
-            "okinawa": "whois.nic.okinawa",
-            "oldnavy": "whois.nic.oldnavy",
-            "open": "whois.nic.open",
-            "orientexpress": "whois.nic.orientexpress",
-            "otsuka": "whois.nic.otsuka",
-            "passagens": "whois.nic.passagens",
-            "pay": "whois.nic.pay",
-            "pfizer": "whois.nic.pfizer",
-            "pharmacy": " whois.nic.pharmacy",
-            "piaget": " whois.nic.piaget",
-            "pictet": "whois.nic.pictet",
-            "pin": "whois.nic.pin",
-            "ping": "whois.nic.ping",
-            "pramerica": "whois.nic.pramerica",
-            "praxi": "whois.nic.praxi",
-            "prime": "whois.nic.prime",
-            "pru": "whois.nic.pru",
-            "prudential": "whois.nic.prudential",
-            "ps": "whois.pnina.ps",
-            "qvc": "whois.nic.qvc",
-            "read": "whois.nic.read",
-            "realtor": "whois.nic.realtor",
-            "ren": "whois.nic.ren",
-            "rocher": "whois.nic.rocher",
-            "room": "whois.nic.room",
-            "rw": "whois.ricta.org.rw",
-            "ryukyu": "whois.nic.ryukyu",
-            "safe": "whois.nic.safe",
-            "safety": "whois.nic.safety",
-            "sakura": "whois.nic.sakura",
-            "sapo": "whois.nic.sapo",
-            "sas": "whois.nic.sas",
-            "save": "whois.nic.save",
-            "secure": "whois.nic.secure",
-            "sener": "whois.nic.sener",
-            "shaw": "whois.afilias-srs.net",
-            "shop": "whois.nic.shop",
-            "silk": "whois.nic.silk",
-            "skype": "whois.nic.skype",
-            "sl": "whois.nic.sl",
-            "smile": "whois.nic.smile",
-            "sohu": "whois.nic.sohu",
-            "song": "whois.nic.song",
-            "spot": "whois.nic.spot",
-            "staples": "whois.nic.staples",
-            "statefarm": "whois.nic.statefarm",
-            "stream": "whois.nic.stream",
-            "suzuki": "whois.nic.suzuki",
-            "swiftcover": "whois.nic.swiftcover",
-            "talk": "whois.nic.talk",
-            "taobao": "whois.nic.taobao",
-            "target": "whois.nic.target",
-            "tjmaxx": "whois.nic.tjmaxx",
-            "tjx": "whois.nic.tjx",
-            "tkmaxx": "whois.nic.tkmaxx",
-            "tmall": "whois.nic.tmall",
-            "tokyo": "whois.nic.tokyo",
-            "tube": "whois.nic.tube",
-            "tunes": "whois.nic.tunes",
-            "tushu": "whois.nic.tushu",
-            "tvs": "whois.nic.tvs",
-            "unicom": "whois.nic.unicom",
-            "uno": "whois.nic.uno",
-            "vivo": "whois.nic.vivo",
-            "vuelos": "whois.nic.vuelos",
-            "wanggou": "whois.nic.wanggou",
-            "watches": "whois.nic.watches",
-            "weather": "whois.nic.weather",
-            "weatherchannel": "whois.nic.weatherchannel",
-            "weir": "whois.nic.weir",
-            "whois": "whois.nic.qpon",
-            "windows": "whois.nic.windows",
-            "winners": "whois.nic.winners",
-            "wow": "whois.nic.wow",
-            "xbox": "whois.nic.xbox",
-            "xn--1ck2e1b": "whois.nic.xn--1ck2e1b",
-            "xn--2scrj9c": "whois.inregistry.net",
-            "xn--3hcrj9c": "whois.inregistry.net",
-            "xn--45br5cyl": "whois.inregistry.net",
-            "xn--45brj9c": "whois.inregistry.net",
-            "xn--8y0a063a": "whois.nic.xn--8y0a063a",
-            "xn--bck1b9a5dre4c": "whois.nic.xn--bck1b9a5dre4c",
-            "xn--cck2b3b": "whois.nic.xn--cck2b3b",
-            "xn--czr694b": "whois.nic.xn--czr694b",
-            "xn--e1a4c": "whois.eu",
-            "xn--eckvdtc9d": "whois.nic.xn--eckvdtc9d",
-            "xn--fct429k": "whois.nic.xn--fct429k",
-            "xn--fpcrj9c3d": "whois.inregistry.net",
-            "xn--fzc2c9e2c": "whois.nic.lk",
-            "xn--g2xx48c": "whois.nic.xn--g2xx48c",
-            "xn--gckr3f0f": "whois.nic.xn--gckr3f0f",
-            "xn--gecrj9c": "whois.inregistry.net",
-            "xn--gk3at1e": "whois.nic.xn--gk3at1e",
-            "xn--h2breg3eve": "whois.inregistry.net",
-            "xn--h2brj9c": "whois.inregistry.net",
-            "xn--h2brj9c8c": "whois.inregistry.net",
-            "xn--imr513n": "whois.nic.xn--imr513n",
-            "xn--jvr189m": "whois.nic.xn--jvr189m",
-            "xn--kpu716f": "whois.nic.xn--kpu716f",
-            "xn--mgba3a3ejt": "whois.nic.xn--mgba3a3ejt",
-            "xn--mgbb9fbpob": "whois.nic.xn--mgbb9fbpob",
-            "xn--mgbbh1a": "whois.inregistry.net",
-            "xn--mgbbh1a71e": "whois.inregistry.net",
-            "xn--mgbgu82a": "whois.inregistry.net",
-            "xn--nyqy26a": "whois.nic.xn--nyqy26a",
-            "xn--otu796d": "whois.nic.xn--otu796d",
-            "xn--pbt977c": "whois.nic.xn--pbt977c",
-            "xn--rhqv96g": "whois.nic.xn--rhqv96g",
-            "xn--rovu88b": "whois.nic.xn--rovu88b",
-            "xn--rvc1e0am3e": "whois.inregistry.net",
-            "xn--s9brj9c": "whois.inregistry.net",
-            "xn--ses554g": "whois.registry.knet.cn",
-            "xn--wgbh1c": "whois.dotmasr.eg",
-            "xn--xkc2al3hye2a": "whois.nic.lk",
-            "xn--xkc2dl3a5ee0h": "whois.inregistry.net",
-            "yahoo": "whois.nic.yahoo",
-            "yamaxun": "whois.nic.yamaxun",
-            "yandex": "whois.nic.yandex",
-            "yokohama": "whois.nic.yokohama",
-            "you": "whois.nic.you",
-            "za": "whois.registry.net.za",
-            "zappos": "whois.nic.zappos",
-            "zero": "whois.nic.zero",
-            "zippo": "whois.nic.zippo",
-        }
+        # We initiate the lock which will let us space the WHOIS queries.
+        self.lock = Lock()
+
+        # We initiate the time of the last WHOIS query.
+        self.last_query = 0
 
     def load(self):
         """
@@ -397,6 +423,28 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
             # We update it with the database content.
             PyFunceble.INTERN["iana_db"] = self.iana_db
 
+    def _wait(self):
+        """
+        Wait until we are allowed to start a new WHOIS query.
+        """
+
+        with self.lock:
+            # We are the only one allowed to start a query.
+
+            # We get the number of seconds we still have to wait.
+            to_wait = (
+                self.last_query + self.seconds_between_queries - PyFunceble.time()
+            )
+
+            if to_wait > 0:
+                # We have to wait.
+
+                # We wait.
+                PyFunceble.sleep(to_wait)
+
+            # We save the time of the query we are going to start.
+            self.last_query = PyFunceble.time()
+
     def _referer(self, extension):
         """
         Return the referer for the given extension.
@@ -408,11 +456,24 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
         :rtype: str
         """
 
+        # We wait until we are allowed to query the IANA WHOIS server.
+        self._wait()
+
         # We get the a copy of the page.
         iana_record = self.lookup.whois(
-            PyFunceble.CONFIGURATION["iana_whois_server"], "hello.%s" % extension
+            PyFunceble.CONFIGURATION["iana_whois_server"],
+            "hello.%s" % extension,
+            port=self.whois_port,
         )
 
+        if not iana_record and self.iana_db.get(extension):
+            # * We could not get the record (timeout, connection error ...).
+            # and
+            # * We already know the referer.
+
+            # We keep the referer we already know.
+            return self.iana_db[extension]
+
         if iana_record and "refer" in iana_record:
             # The record is not empty.
 
@@ -444,12 +505,17 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
         # the given extension.
         return None
 
-    def _extensions(self):
+    def _upstream_extensions(self):
         """
-        Extract the extention from the given block.
-        Plus get its referer.
+        Extract the extensions from the IANA Root Zone Database page.
+
+        :return: The list of extensions (in upstream order).
+        :rtype: list
         """
 
+        # We initiate the list of extensions.
+        result = []
+
         upstream_lines = (
             Download(self.iana_url, return_data=True)
             .text()
@@ -468,14 +534,41 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
                     block, regex_valid_extension, return_data=True, rematch=True
                 ).match()[1]
 
-                if matched:
+                if matched and matched not in result:
                     # The extraction is not empty or None.
 
-                    # We get the referer.
-                    referer = self._referer(matched)
+                    # We save the matched extension.
+                    result.append(matched)
+
+        # We return the extensions.
+        return result
+
+    def _extensions(self):
+        """
+        Extract the extention from the IANA Root Zone Database page.
+        Plus get its referer.
+
+        .. note::
+            The referers are requested concurrently but yielded in
+            upstream order.
+        """
+
+        # We get the extensions.
+        extensions = self._upstream_extensions()
+
+        if extensions:
+            # There is something to work with.
 
-                    # We yield the matched extension and its referer.
-                    yield (matched, referer)
+            with ThreadPoolExecutor(
+                min(len(extensions), self.maximal_workers)
+            ) as executor:
+                for extension, referer in zip(
+                    extensions, executor.map(self._referer, extensions)
+                ):
+                    # We loop through the referers.
+
+                    # We yield the extension and its referer.
+                    yield (extension, referer)
 
     def update(self):
         """
@@ -488,6 +581,9 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
             # We print on screen what we are doing.
             print("Update of iana-domains-db", end=" ")
 
+        # We initiate a variable which will tell us if the database changed.
+        changed = False
+
         # We loop through the line of the iana website.
         for extension, referer in self._extensions():
 
@@ -495,8 +591,14 @@ class IANA:  # pragma: no cover pylint: disable=too-few-public-methods
                 # We add the extension to the databae.
                 self.iana_db[extension] = referer
 
-                # We save the content of the constructed database.
-                Dict(self.iana_db).to_json(self.destination)
+                # We note that the database changed.
+                changed = True
+
+        if changed:
+            # The database changed.
+
+            # We save the content of the constructed database (once).
+            Dict(self.iana_db).to_json(self.destination)
 
         if not PyFunceble.CONFIGURATION["quiet"]:
             # The quiet mode is not activated.
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the incremental testing logic and interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+from hashlib import blake2b
+from json import decoder, dumps, loads
+
+from domain2idna import get as domain2idna
+
+import PyFunceble
+from PyFunceble.helpers import File
+from PyFunceble.timings import Timings
+
+
+class Incremental:
+    """
+    Logic behind the incremental testing.
+    The main idea behind this is to save when each element of the tested file
+    was tested for the last time so we only test the newly added elements and
+    those which were not tested for a while.
+
+    .. note::
+        We do not save the elements but a (short) hash of them.
+
+    .. note::
+        The database is written in the JSON Lines format. Indeed, after each
+        tested element, we only append a line at the end of the file
+        instead of rewriting the whole database.
+    """
+
+    def __init__(self):
+        if self._authorization():
+            # We are authorized to work with the database.
+
+            # We set the path to the incremental database file.
+            self.incremental_db_path = (
+                PyFunceble.get_current_directory()
+                + PyFunceble.OUTPUTS["default_files"]["incremental_db"]
+            )
+
+            # We convert the number of days between each retest to seconds.
+            self.days_in_seconds = (
+                PyFunceble.CONFIGURATION["days_between_incremental_retest"] * 24 * 3600
+            )
+
+            # We retrieve the database.
+            self._retrieve()
+
+    @classmethod
+    def _authorization(cls):
+        """
+        Check if we are authorized to work with our database.
+        """
+
+        if (
+            PyFunceble.CONFIGURATION["incremental"]
+            and not PyFunceble.CONFIGURATION["no_files"]
+        ):
+            # * The incremental testing is activated.
+            # and
+            # * We are authorized to generate files.
+
+            # We return True, we are authorized to work with our database.
+            return True
+
+        # We return False, we are not authorized to work with our database.
+        return False
+
+    @classmethod
+    def _hash(cls, element):
+        """
+        Get the hash of the given element.
+
+        :param element: The element to hash.
+        :type element: str
+
+        :return: The (short) hash of the given element.
+        :rtype: str
+        """
+
+        return blake2b(element.encode("utf-8"), digest_size=8).hexdigest()
+
+    @classmethod
+    def tested_form(cls, list_to_test):
+        """
+        Get the given elements the way they are tested (and saved into
+        the databases).
+
+        :param list_to_test: The list to convert.
+        :type list_to_test: list
+
+        :return: The converted list.
+        :rtype: list
+        """
+
+        if (
+            PyFunceble.CONFIGURATION["idna_conversion"]
+            and PyFunceble.INTERN.get("to_test_type") == "domain"
+        ):
+            # * We have to convert domains to IDNA.
+            # and
+            # * We are testing domains.
+
+            # We return the converted list.
+            return domain2idna(list_to_test)
+
+        # We return the given list.
+        return list_to_test
+
+    def _retrieve(self):
+        """
+        Retrieve the data from the database.
+        """
+
+        if self._authorization() and "incremental_db" not in PyFunceble.INTERN:
+            # * We are authorized to work with the database.
+            # and
+            # * The database is not already loaded.
+
+            # We initiate the database.
+            PyFunceble.INTERN["incremental_db"] = {}
+
+            if PyFunceble.path.isfile(self.incremental_db_path):
+                # The database file exist.
+
+                for line in File(self.incremental_db_path).read().splitlines():
+                    # We loop through each line of the database file.
+
+                    try:
+                        # We try to decode the line.
+                        data = loads(line)
+                    except (decoder.JSONDecodeError, ValueError, TypeError):
+                        # The line could not be decoded (partially written line).
+
+                        # We continue the loop.
+                        continue
+
+                    for file, content in data.items():
+                        # We loop through the decoded files.
+
+                        # And we update the database with their content.
+                        PyFunceble.INTERN["incremental_db"].setdefault(
+                            file, {}
+                        ).update(content)
+
+    @Timings.timed("database_backup")
+    def _backup(self):
+        """
+        Save the whole database into its file.
+        """
+
+        if self._authorization():
+            # We are authorized to work with the database.
+
+            # We save the database (one line per file) into a temporary file.
+            File(self.incremental_db_path + ".tmp").write(
+                "".join(
+                    [
+                        dumps({file: content}, sort_keys=True) + "\n"
+                        for file, content in PyFunceble.INTERN["incremental_db"].items()
+                    ]
+                ),
+                overwrite=True,
+            )
+
+            # And we atomically replace the database file with it.
+            PyFunceble.replace(
+                self.incremental_db_path + ".tmp", self.incremental_db_path
+            )
+
+    def to_test(self, list_to_test, tested_form=None):
+        """
+        Get the list of elements we have to test.
+
+        .. note::
+            The elements which are not into the given list anymore are removed
+            from the database.
+
+        :param list_to_test: The (complete) list to test.
+        :type list_to_test: list
+
+        :param tested_form:
+            The elements of the list to test the way they are tested.
+            If not given, we get it from :func:`tested_form`.
+        :type tested_form: list
+
+        :return:
+            The newly added elements and those which were not tested for
+            :code:`days_between_incremental_retest` days.
+        :rtype: list
+        """
+
+        if self._authorization():
+            # We are authorized to work with the database.
+
+            if tested_form is None:
+                # The tested form of the list to test is not given.
+
+                # We get it.
+                tested_form = self.tested_form(list_to_test)
+
+            # We get the hash of each element of the list to test.
+            # Note: We hash the elements the way they are tested because it is
+            # what we save (see :func:`add`) once they are tested.
+            hashes = [self._hash(x) for x in tested_form]
+
+            # We get the database related to the file we are testing.
+            current_database = PyFunceble.INTERN["incremental_db"].get(
+                PyFunceble.INTERN["file_to_test"], {}
+            )
+
+            # We only keep (into the database) the elements which are still
+            # into the list to test.
+            current_database = {
+                x: current_database[x] for x in hashes if x in current_database
+            }
+
+            # We update the database.
+            PyFunceble.INTERN["incremental_db"][
+                PyFunceble.INTERN["file_to_test"]
+            ] = current_database
+
+            # And we save it.
+            self._backup()
+
+            # We get the minimal timestamp of an element we do not have to retest.
+            minimal_timestamp = int(PyFunceble.time()) - self.days_in_seconds
+
+            # We return the list of elements which are not into the database or
+            # which were tested for the last time before the minimal timestamp.
+            return [
+                element
+                for element, element_hash in zip(list_to_test, hashes)
+                if element_hash not in current_database
+                or current_database[element_hash] < minimal_timestamp
+            ]
+
+        # We return the given list.
+        return list_to_test
+
+    def add(self):
+        """
+        Save that the currently tested element was just tested.
+        """
+
+        if self._authorization() and PyFunceble.INTERN["to_test"]:
+            # * We are authorized to work with the database.
+            # and
+            # * An element is currently tested.
+
+            # We construct the data to save.
+            to_save = {
+                PyFunceble.INTERN["file_to_test"]: {
+                    self._hash(PyFunceble.INTERN["to_test"]): int(PyFunceble.time())
+                }
+            }
+
+            # We update the database.
+            PyFunceble.INTERN["incremental_db"].setdefault(
+                PyFunceble.INTERN["file_to_test"], {}
+            ).update(to_save[PyFunceble.INTERN["file_to_test"]])
+
+            # And we append the data at the end of the database file.
+            File(self.incremental_db_path).write(dumps(to_save) + "\n")
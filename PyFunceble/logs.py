@@ -63,8 +63,16 @@ License:
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
 
+from atexit import register as register_at_exit
+from json import dumps
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from uuid import uuid4
+
 import PyFunceble
+from PyFunceble.deferred import Deferred
 from PyFunceble.helpers import Dict, File
+from PyFunceble.metrics import Metrics
 
 
 class Logs:  # pragma: no cover
@@ -72,10 +80,28 @@ class Logs:  # pragma: no cover
     Provide a clean and unique way to work with logs.
     Indeed, it's not good to have logs spread around the code :smile:
 
-    :param output: A path to the JSON file we are going to write.
+    .. note::
+        Logs are written in the `JSON Lines`_ format. In other words,
+        each record is written as a single JSON object on its own line
+        which means that we only append to the end of the file instead of
+        rewriting the whole file for each record.
+
+    .. _JSON Lines: http://jsonlines.org
+
+    :param output: A path to the JSON Lines file we are going to write.
     :type output: str
     """
 
+    # We set the maximal number of rotated files we keep.
+    # In other words, we keep :code:`file.1` to :code:`file.5`.
+    rotated_files = 5
+
+    # We save the files we already converted (or checked) during the
+    # current session.
+    # Note: That way, we check the format of each file only once instead of
+    # for each record.
+    converted_files = set()
+
     def __init__(self, output=None):
         self.output = output
         self.current_time = str(PyFunceble.time())
@@ -92,15 +118,91 @@ class Logs:  # pragma: no cover
         :rtype: dict
         """
 
+        # We initiate the variable which will save the content.
+        result = {}
+
         if PyFunceble.path.isfile(file):
-            return Dict().from_json(File(file).read())
+            # The given file exist.
+
+            # We get its content.
+            content = File(file).read()
+
+            if content.startswith("{\n"):
+                # The file is in the historical format (one big indented JSON).
+
+                # We return its content.
+                return Dict().from_json(content)
+
+            # We decode each line of the file.
+            result = Dict().from_json_lines(content)
 
-        return {}
+        # We return the content.
+        return result
+
+    @classmethod
+    def _convert_historical_format(cls, file):
+        """
+        Convert the given file from the historical format
+        (one big indented JSON) into the JSON Lines format.
+
+        :param file: The file to convert.
+        :type file: str
+        """
+
+        with open(file, "r", encoding="utf-8") as file_stream:
+            # We open the file for reading.
+
+            # And we read the 2 first characters in order to know if
+            # we are working with the historical format.
+            historical = file_stream.read(2) == "{\n"
+
+        if historical:
+            # We are working with the historical format.
+
+            # We get the content of the file.
+            content = cls._get_content(file)
+
+            # And we rewrite it, one record per line.
+            File(file).write(
+                "".join(
+                    [
+                        dumps({index: value}, ensure_ascii=False) + "\n"
+                        for index, value in content.items()
+                    ]
+                ),
+                overwrite=True,
+            )
+
+    @classmethod
+    def _rotate(cls, file):
+        """
+        Rotate the given file.
+
+        .. note::
+            :code:`file.4` become :code:`file.5`, :code:`file.3`
+            become :code:`file.4` and so on until :code:`file`
+            become :code:`file.1`.
+
+        :param file: The file to rotate.
+        :type file: str
+        """
+
+        for index in range(cls.rotated_files - 1, 0, -1):
+            # We loop through the rotated files, from the oldest to the newest.
+
+            if PyFunceble.path.isfile("%s.%d" % (file, index)):
+                # The rotated file exist.
+
+                # We move it to the next index.
+                PyFunceble.replace("%s.%d" % (file, index), "%s.%d" % (file, index + 1))
+
+        # We finally move the current file to the first index.
+        PyFunceble.replace(file, "%s.1" % file)
 
     @classmethod
     def _write_content(cls, content, file):
         """
-        Write the content into the given file.
+        Append the content into the given file.
 
         :param content: The dict to write.
         :type content: dict
@@ -113,7 +215,48 @@ class Logs:  # pragma: no cover
             if not isinstance(content, dict):
                 content = {}
 
-            Dict(content).to_json(file)
+            if Deferred.record("logs", [content, file]):
+                # We are a worker, the main process will write it for us.
+                # Note: That way, the records of the workers are not interleaved.
+
+                return
+
+            # We convert the record to its JSON Lines representation.
+            to_write = dumps(content, ensure_ascii=False) + "\n"
+
+            if file not in cls.converted_files:
+                # We did not check the format of the file yet.
+
+                if PyFunceble.path.isfile(file):
+                    # The file already exist.
+
+                    # We convert it if it is still in the historical format.
+                    cls._convert_historical_format(file)
+
+                # We save that the file is in the right format.
+                cls.converted_files.add(file)
+
+            # We get the maximal size of a log file.
+            maximal_size = (
+                PyFunceble.CONFIGURATION["megabytes_before_logs_rotation"] * 1024 * 1024
+            )
+
+            if maximal_size > 0 and PyFunceble.path.isfile(file):
+                # * The rotation is activated.
+                # and
+                # * The file already exist.
+
+                if (
+                    PyFunceble.path.getsize(file) + len(to_write.encode("utf-8"))
+                    > maximal_size
+                ):
+                    # We are going to exceed the maximal size (in bytes).
+
+                    # We rotate the file.
+                    cls._rotate(file)
+
+            # We finally append the record at the end of the file.
+            File(file).write(to_write)
 
     def whois(self, record):
         """
@@ -147,10 +290,7 @@ class Logs:  # pragma: no cover
                 output += PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
                 output += PyFunceble.OUTPUTS["logs"]["filenames"]["whois"]
 
-            current_content = self._get_content(output)
-            current_content.update(to_write)
-
-            self._write_content(current_content, output)
+            self._write_content(to_write, output)
 
     def expiration_date(self, extracted):
         """
@@ -184,18 +324,14 @@ class Logs:  # pragma: no cover
                 output += PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
                 output += PyFunceble.OUTPUTS["logs"]["filenames"]["date_format"]
 
-            current_content = self._get_content(output)
-            current_content.update(to_write)
-
-            self._write_content(current_content, output)
+            self._write_content(to_write, output)
 
             if PyFunceble.CONFIGURATION["share_logs"]:
                 # The logs sharing is activated.
 
                 # And we share the logs with the api.
-                PyFunceble.requests.post(
-                    PyFunceble.LINKS["api_date_format"],
-                    data=to_write[self.current_time],
+                LogsSharing().push(
+                    PyFunceble.LINKS["api_date_format"], to_write[self.current_time]
                 )
 
     def referer_not_found(self, extension):
@@ -224,15 +360,294 @@ class Logs:  # pragma: no cover
                 output += PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
                 output += PyFunceble.OUTPUTS["logs"]["filenames"]["no_referer"]
 
-            current_content = self._get_content(output)
-            current_content.update(to_write)
-
-            self._write_content(current_content, output)
+            self._write_content(to_write, output)
 
             if PyFunceble.CONFIGURATION["share_logs"]:
                 # The logs sharing is activated.
 
                 # And we share the logs with the api.
-                PyFunceble.requests.post(
-                    PyFunceble.LINKS["api_no_referer"], data=to_write[self.current_time]
+                LogsSharing().push(
+                    PyFunceble.LINKS["api_no_referer"], to_write[self.current_time]
                 )
+
+    def skipped(self, subjects, check, reason):
+        """
+        Logs the case that we skipped a check because a cheaper one
+        already settled the status.
+
+        :param subjects: The domains or IPs we skipped the check of.
+        :type subjects: list
+
+        :param check: The skipped check.
+        :type check: str
+
+        :param reason: The check which settled the status.
+        :type reason: str
+
+        .. note::
+            We write a single record for all the given subjects. Its index is
+            unique (the current time and a random suffix) so that the records
+            we write within the same instant do not overwrite each other.
+        """
+
+        if PyFunceble.CONFIGURATION["logs"] and subjects:
+            # * The logs subsystem is activated.
+            # and
+            # * There is something to log.
+
+            to_write = {
+                "%s-%s"
+                % (self.current_time, uuid4().hex): {
+                    "domains": subjects,
+                    "skipped": check,
+                    "reason": reason,
+                }
+            }
+
+            if self.output:
+                output = self.output
+            else:
+                output = PyFunceble.OUTPUT_DIRECTORY
+                output += PyFunceble.OUTPUTS["parent_directory"]
+                output += PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+                output += PyFunceble.OUTPUTS["logs"]["filenames"]["skipped"]
+
+            self._write_content(to_write, output)
+
+
+class LogsSharing:
+    """
+    Share the logs with the API in the background.
+
+    Indeed, instead of posting each record while we are testing, we push
+    them into a (bounded) queue which is consumed by a background worker.
+    The worker sends them in batches (over a single HTTP session),
+    retry (with backoff) the failing submissions and the queue is flushed
+    when we exit.
+
+    .. note::
+        If the queue is full, the record is dropped as we never
+        want to block the test loop because of the logs sharing.
+    """
+
+    # We set the maximal number of records we keep in the queue.
+    maximal_queue_size = 1000
+
+    # We set the maximal number of records we send in a single batch.
+    batch_size = 50
+
+    # We set the maximal number of retries per record.
+    maximal_retries = 3
+
+    # We set the number of seconds to wait before the first retry.
+    # Note: The number of seconds is doubled after each retry.
+    seconds_before_retry = 0.5
+
+    # We set the timeout to apply to each submission.
+    seconds_before_timeout = 5
+
+    # We set the maximal number of seconds we wait for the queue to be
+    # flushed when we exit.
+    seconds_before_flush_timeout = 10
+
+    # We save the queue we are going to work with.
+    queue = None
+
+    # We save the background worker.
+    worker = None
+
+    # We save the number of records we dropped.
+    dropped = 0
+
+    # We save the number of records we could not send.
+    failed = 0
+
+    # We save the lock to use when we start the worker.
+    lock = Lock()
+
+    # We save whether the flush of the queue is registered at exit.
+    registered = False
+
+    @classmethod
+    def _start(cls):
+        """
+        Start the background worker (if it is not already started).
+        """
+
+        with cls.lock:
+            if cls.worker is None or not cls.worker.is_alive():
+                # The worker is not started.
+
+                if cls.queue is None:
+                    # The queue is not initiated yet.
+
+                    # We initiate the queue.
+                    # Note: On restart, we keep the existing queue so that
+                    # the records which are still in it are not lost.
+                    cls.queue = Queue(maxsize=cls.maximal_queue_size)
+
+                # We initiate the worker.
+                cls.worker = Thread(target=cls._work, name="PyFunceble-LogsSharing")
+                cls.worker.daemon = True
+
+                # We start the worker.
+                cls.worker.start()
+
+                if not cls.registered:
+                    # The flush of the queue is not registered yet.
+
+                    # We register the flush of the queue at exit.
+                    register_at_exit(cls.flush)
+
+                    # And we save that it is registered.
+                    cls.registered = True
+
+    @classmethod
+    def _send(cls, session, link, data):
+        """
+        Send the given data to the given link.
+
+        :param session: The session to use.
+        :type session: requests.Session
+
+        :param link: The link to send the data to.
+        :type link: str
+
+        :param data: The data to send.
+        :type data: dict
+
+        :return: The submission state.
+        :rtype: bool
+        """
+
+        for retry in range(cls.maximal_retries + 1):
+            # We loop through the number of tries.
+
+            if retry:
+                # We are retrying.
+
+                # We count the retry.
+                Metrics.count("retries", "logs_sharing")
+
+                # We wait before retrying.
+                PyFunceble.sleep(cls.seconds_before_retry * (2 ** (retry - 1)))
+
+            try:
+                # We try to send the data.
+                req = session.post(link, data=data, timeout=cls.seconds_before_timeout)
+
+                if req.status_code < 500:
+                    # The server did not fail.
+
+                    # We return True, the submission was done.
+                    return True
+            except PyFunceble.requests.exceptions.RequestException:
+                # We could not reach the API.
+
+                # We continue to the next try.
+                continue
+
+        # We could not send the data.
+        return False
+
+    @classmethod
+    def _work(cls):
+        """
+        Consume the queue and send its content (in batch) to the API.
+        """
+
+        # We initiate the session we are going to use.
+        session = PyFunceble.requests.Session()
+
+        # We initiate the state of the loop.
+        running = True
+
+        while running:
+            # We get the first element of the batch.
+            batch = [cls.queue.get()]
+
+            while len(batch) < cls.batch_size:
+                # We did not reach the size of a batch.
+
+                try:
+                    # We get the next element of the queue.
+                    batch.append(cls.queue.get_nowait())
+                except Empty:
+                    # There is no more element into the queue.
+
+                    # We stop to wait for more elements.
+                    break
+
+            for element in batch:
+                # We loop through the batch.
+
+                if element is None:
+                    # We are asked to stop.
+
+                    # We stop the loop once the batch is processed.
+                    running = False
+                elif not cls._send(session, *element):
+                    # The submission failed.
+
+                    # We increase the number of failures.
+                    cls.failed += 1
+
+                # We tell the queue that the element is processed.
+                cls.queue.task_done()
+
+        # We close the session.
+        session.close()
+
+    def push(self, link, data):  # pylint: disable=no-self-use
+        """
+        Push the given data into the queue of data to send.
+
+        :param link: The link to send the data to.
+        :type link: str
+
+        :param data: The data to send.
+        :type data: dict
+        """
+
+        # We start the worker if needed.
+        self._start()
+
+        try:
+            # We try to push the data into the queue.
+            self.queue.put_nowait((link, data))
+        except Full:
+            # The queue is full.
+
+            # We increase the number of dropped records.
+            LogsSharing.dropped += 1
+
+    @classmethod
+    def flush(cls, timeout=None):
+        """
+        Stop the background worker once everything is sent.
+
+        :param timeout:
+            The maximal number of seconds to wait for the queue to be flushed.
+        :type timeout: int|float
+        """
+
+        if cls.worker is not None and cls.worker.is_alive():
+            # The worker is running.
+
+            if timeout is None:
+                # The timeout is not given.
+
+                # We use the default one.
+                timeout = cls.seconds_before_flush_timeout
+
+            try:
+                # We ask the worker to stop once everything is sent.
+                cls.queue.put(None, timeout=timeout)
+            except Full:
+                # The queue is still full.
+
+                # We do not wait any longer.
+                return
+
+            # And we wait for it.
+            cls.worker.join(timeout)
@@ -62,8 +62,15 @@ License:
 """
 # pylint: enable=line-too-long
 
+from threading import Lock, Thread
+from time import perf_counter, time
+
 import PyFunceble
+from PyFunceble.adaptive_timeout import AdaptiveTimeout
 from PyFunceble.check import Check
+from PyFunceble.circuit_breaker import CircuitBreaker
+from PyFunceble.metrics import Metrics
+from PyFunceble.timings import Timings
 
 
 class Lookup:
@@ -71,24 +78,65 @@ class Lookup:
     Can be used to NSLOOKUP or WHOIS lookup.
     """
 
+    # We set the port of the WHOIS servers.
+    # Note: This can be overwritten in order to talk to a local WHOIS server.
+    whois_port = 43
+
+    # We set the number of seconds a pre-opened connection to a WHOIS server
+    # can wait for its query before we consider it as stale.
+    # Note: WHOIS servers close idle connections, so we do not keep them long.
+    seconds_before_preconnection_expiry = 5
+
+    # We set the size (in bytes) of the buffer we receive a WHOIS record into.
+    # Note: The buffer is doubled each time it is full.
+    initial_record_size = 16 * 1024
+
+    # We set the maximal size (in bytes) of a WHOIS record.
+    # Note: We stop to read a WHOIS record which is bigger than that.
+    maximal_record_size = 1024 * 1024
+
+    # We save the address of each WHOIS server we already resolved.
+    # Note: The index is the WHOIS server and the value its IP.
+    whois_addresses = {}
+
+    # We save the connections we opened ahead of time.
+    # Note: The index is (IP, port) and the value is a list of
+    # (socket, time of the connection).
+    preconnections = {}
+
+    # We set the lock which protects the pre-opened connections.
+    lock = Lock()
+
     @classmethod
-    def nslookup(cls):
+    @Timings.timed("nslookup")
+    def nslookup(cls, to_test=None):
         """
         Implementation of UNIX nslookup.
+
+        :param to_test:
+            The domain or IP to lookup.
+            If not given, we use the currently tested element.
+        :type to_test: str
         """
 
+        if not to_test:
+            # The element to lookup is not given.
+
+            # We get the currently tested element.
+            to_test = PyFunceble.INTERN["to_test"]
+
         try:
             # We try to get the addresse information of the given domain or IP.
 
             if "current_test_data" in PyFunceble.INTERN:  # pragma: no cover
                 # The end-user want more information whith his test.
 
-                if not Check().is_ip_valid():
+                if not Check().is_ip_valid(to_test):
                     # The element we are testing is not an IP.
 
                     # We request the address informations.
                     request = PyFunceble.socket.getaddrinfo(
-                        PyFunceble.INTERN["to_test"],
+                        to_test,
                         80,
                         0,
                         0,
@@ -104,9 +152,7 @@ class Lookup:
                         )
                 else:
                     # The element we are testing is an IP.
-                    request = PyFunceble.socket.gethostbyaddr(
-                        PyFunceble.INTERN["to_test"]
-                    )
+                    request = PyFunceble.socket.gethostbyaddr(to_test)
 
                     # We append the NS informations into the nslookup index.
                     PyFunceble.INTERN["current_test_data"]["nslookup"][
@@ -120,32 +166,448 @@ class Lookup:
                     ]
             else:
 
-                if not Check().is_ip_valid():
+                if not Check().is_ip_valid(to_test):
                     # The element we are testing is not an IP.
                     PyFunceble.socket.getaddrinfo(
-                        PyFunceble.INTERN["to_test"],
-                        80,
-                        0,
-                        0,
-                        PyFunceble.socket.IPPROTO_TCP,
+                        to_test, 80, 0, 0, PyFunceble.socket.IPPROTO_TCP
                     )
                 else:
                     # The element we are testing is an IP.
-                    PyFunceble.socket.gethostbyaddr(PyFunceble.INTERN["to_test"])
+                    PyFunceble.socket.gethostbyaddr(to_test)
 
             # It was done successfuly, we return True.
             # Note: we don't need to read the addresses so we consider as successful
             # as long as there is no error.
             return True
 
-        except (OSError, PyFunceble.socket.herror, PyFunceble.socket.gaierror):
+        except (
+            OSError,
+            PyFunceble.socket.herror,
+            PyFunceble.socket.gaierror,
+        ) as exception:
             # One of the listed exception is matched.
 
+            if exception.errno == PyFunceble.socket.EAI_AGAIN:
+                # The resolver did not answer in time.
+
+                # We count the timeout.
+                Metrics.count("timeouts", "nslookup")
+
             # It was done unsuccesfuly, we return False.
             return False
 
     @classmethod
-    def whois(cls, whois_server, domain=None, timeout=None):  # pragma: no cover
+    def _address(cls, whois_server, port):
+        """
+        Get the IP of the given whois server.
+
+        :param whois_server: The whois server to resolve.
+        :type whois_server: str
+
+        :param port: The port of the whois server.
+        :type port: int
+
+        :return: The IP of the whois server or None if it can not be resolved.
+        :rtype: str|None
+
+        .. note::
+            We resolve each whois server only once so that we do not
+            resolve it at each :code:`connect()`.
+        """
+
+        if whois_server not in cls.whois_addresses:
+            # The whois server was never resolved.
+
+            try:
+                # We resolve the whois server.
+                cls.whois_addresses[whois_server] = PyFunceble.socket.getaddrinfo(
+                    whois_server,
+                    port,
+                    PyFunceble.socket.AF_INET,
+                    PyFunceble.socket.SOCK_STREAM,
+                )[0][4][0]
+            except (PyFunceble.socket.error, IndexError):
+                # We could not resolve the whois server.
+
+                # We return None.
+                # Note: We do not save anything so that we try again the
+                # next time.
+                return None
+
+        # We return the address of the whois server.
+        return cls.whois_addresses[whois_server]
+
+    @classmethod
+    def _connect(cls, address, port, timeout):  # pragma: no cover
+        """
+        Connect to the given whois server.
+
+        :param address: The IP of the whois server.
+        :type address: str
+
+        :param port: The port of the whois server.
+        :type port: int
+
+        :param timeout: The timeout to apply to the connection.
+        :type timeout: int
+
+        :return: The connected socket or None if we could not connect.
+        :rtype: socket.socket|None
+        """
+
+        # We initiate a PyFunceble.socket.
+        req = PyFunceble.socket.socket(
+            PyFunceble.socket.AF_INET, PyFunceble.socket.SOCK_STREAM
+        )
+
+        # We report the timeout to our initiated PyFunceble.socket.
+        req.settimeout(timeout)
+
+        try:
+            with Timings("whois_connect"):
+                # We try to connect to the whois server at the given port.
+                req.connect((address, port))
+        except PyFunceble.socket.error as exception:
+            # We got an error.
+
+            # We count the timeout or the error.
+            Metrics.count(
+                "timeouts"
+                if isinstance(exception, PyFunceble.socket.timeout)
+                else "errors",
+                "whois",
+            )
+
+            # We close the socket.
+            req.close()
+
+            # We return None.
+            return None
+
+        # We return the connected socket.
+        return req
+
+    @classmethod
+    def preconnect(cls, address, port, timeout):  # pragma: no cover
+        """
+        Open - in the background - a connection to the given whois server
+        for the next subject which will use it.
+
+        :param address: The IP of the whois server.
+        :type address: str
+
+        :param port: The port of the whois server.
+        :type port: int
+
+        :param timeout: The timeout to apply to the connection.
+        :type timeout: int
+        """
+
+        def _preconnect():
+            """
+            Connect and save the connection.
+            """
+
+            # We connect to the whois server.
+            req = cls._connect(address, port, timeout)
+
+            if req is not None:
+                # We are connected.
+
+                with cls.lock:
+                    # We save the connection.
+                    cls.preconnections.setdefault((address, port), []).append(
+                        (req, time())
+                    )
+
+        # We connect in the background.
+        Thread(target=_preconnect, daemon=True).start()
+
+    @classmethod
+    def _preconnected(cls, address, port):
+        """
+        Get a connection we opened ahead of time.
+
+        :param address: The IP of the whois server.
+        :type address: str
+
+        :param port: The port of the whois server.
+        :type port: int
+
+        :return: The connected socket or None if there is none.
+        :rtype: socket.socket|None
+        """
+
+        with cls.lock:
+            # We get the connections which are waiting for the given server.
+            waiting = cls.preconnections.get((address, port), [])
+
+            while waiting:
+                # We loop while there is a connection waiting.
+
+                # We get the oldest one.
+                req, connected = waiting.pop(0)
+
+                if time() - connected < cls.seconds_before_preconnection_expiry:
+                    # The connection is still fresh.
+
+                    # We return it.
+                    return req
+
+                # The connection is stale.
+
+                # We close it.
+                req.close()
+
+        # There is no connection waiting for us.
+
+        # We return None.
+        return None
+
+    @classmethod
+    def close_preconnections(cls):
+        """
+        Close the connections which we opened ahead of time but did not use.
+        """
+
+        with cls.lock:
+            for waiting in cls.preconnections.values():
+                # We loop through the connections of each whois server.
+
+                for req, _ in waiting:
+                    # We loop through the connections.
+
+                    # We close the connection.
+                    req.close()
+
+            # We forget all connections.
+            cls.preconnections.clear()
+
+    @classmethod
+    def _query(cls, req, domain, count=True, until=None):  # pragma: no cover
+        """
+        Send the query to the given connection, read the response until the
+        server closes the connection and close it.
+
+        :param req: The connected socket.
+        :type req: socket.socket
+
+        :param domain: The domain to get the whois record from.
+        :type domain: str
+
+        :param count:
+            Tell us if we have to count the timeouts and errors.
+            (We do not for the connections we opened ahead of time as the
+            server - or anything in between - may have silently dropped them
+            while they were waiting. We retry those with a new connection.)
+        :type count: bool
+
+        :param until:
+            A function which tells us - from the record, the index to look from
+            and the index to stop to look at - if we can stop to read the record.
+        :type until: callable
+
+        :return: The raw response or None if we got an error.
+        :rtype: bytearray|None
+        """
+
+        # We initiate the buffer which will save the response from the server.
+        # Note: We receive directly into it so that we do not copy the
+        # response at each received chunk.
+        response = bytearray(cls.initial_record_size)
+
+        # We initiate the size of what we received.
+        size = 0
+
+        try:
+            # We send end encode the domain we want the data from.
+            req.send((domain + "\r\n").encode())
+
+            with Timings("whois_recv"):
+                # We time the reception of the record.
+
+                while size < cls.maximal_record_size:
+                    # We loop until we reach the maximal size of a record.
+
+                    if size == len(response):
+                        # The buffer is full.
+
+                        # We double its size (in the limit of the maximal size).
+                        response.extend(
+                            bytes(min(size, cls.maximal_record_size - size))
+                        )
+
+                    # We receive the data into the free part of the buffer.
+                    received = req.recv_into(memoryview(response)[size:])
+
+                    if not received:
+                        # The data is empty.
+
+                        # We break the loop.
+                        break
+
+                    # We get the start of the line we were receiving.
+                    # Note: This way, we only look into what we just received.
+                    start = response.rfind(b"\n", 0, size) + 1
+
+                    # We update the size of what we received.
+                    size += received
+
+                    if until and until(response, start, size):
+                        # We have what we need.
+
+                        # We break the loop.
+                        break
+        except PyFunceble.socket.error as exception:
+            # We got an error.
+
+            if count:
+                # We have to count the error.
+
+                # We count the timeout or the error.
+                Metrics.count(
+                    "timeouts"
+                    if isinstance(exception, PyFunceble.socket.timeout)
+                    else "errors",
+                    "whois",
+                )
+
+            # We close the connection.
+            req.close()
+
+            # And we return None.
+            return None
+
+        # We close the connection.
+        req.close()
+
+        # We drop the free part of the buffer.
+        del response[size:]
+
+        # We return what we received.
+        return response
+
+    @classmethod
+    def _timeout(cls, whois_server, timeout):
+        """
+        Give the timeout to apply to the given whois server.
+
+        :param whois_server: The whois server.
+        :type whois_server: str
+
+        :param timeout: The given (or configured) timeout.
+        :type timeout: int
+
+        :rtype: int|float
+        """
+
+        if AdaptiveTimeout.is_activated():
+            # The adaptive timeouts are activated.
+
+            # We return the timeout of the whois server.
+            # Note: It is bounded by the given timeout.
+            return AdaptiveTimeout.get("whois", whois_server, timeout)
+
+        if timeout % 3 != 0:
+            # The timeout is not modulo 3.
+
+            # We use 3 seconds as the timeout.
+            return 3
+
+        # We return the given timeout.
+        return timeout
+
+    @classmethod
+    def _record(cls, whois_server, domain, port, timeout, until):  # pragma: no cover
+        """
+        Get the raw record of the given domain from the given whois server.
+
+        :param whois_server: The whois server to use to get the record.
+        :type whois_server: str
+
+        :param domain: The domain to get the whois record from.
+        :type domain: str
+
+        :param port: The port of the whois server.
+        :type port: int
+
+        :param timeout: The timeout to apply to the request.
+        :type timeout: int|float
+
+        :param until: See :meth:`whois`.
+        :type until: callable
+
+        :return: The raw record or None if we could not get it.
+        :rtype: bytearray|None
+        """
+
+        # We get the address of the whois server.
+        address = cls._address(whois_server, port)
+
+        if not address:
+            # We could not resolve the whois server.
+
+            # We count the error.
+            Metrics.count("errors", "whois")
+
+            # We return None.
+            return None
+
+        # We get a connection we opened ahead of time (if any).
+        req = cls._preconnected(address, port)
+
+        # We save whether the connection was opened ahead of time.
+        preconnected = req is not None
+
+        if not preconnected:
+            # There is no connection waiting for us.
+
+            # We connect to the whois server.
+            req = cls._connect(address, port, timeout)
+
+            if req is None:
+                # We could not connect.
+
+                # We forget the address of the whois server so that it is
+                # resolved again the next time.
+                cls.whois_addresses.pop(whois_server, None)
+
+                # We return None.
+                return None
+
+        # We report the timeout to the connection.
+        req.settimeout(timeout)
+
+        if PyFunceble.CONFIGURATION.get("whois_preconnect"):
+            # We have to connect ahead of time.
+
+            # We open the connection the next subject of the same
+            # whois server will use, while the server answers us.
+            cls.preconnect(address, port, timeout)
+
+        # We get the record.
+        response = cls._query(req, domain, count=not preconnected, until=until)
+
+        if not response and preconnected:
+            # The connection we opened ahead of time was dropped while it
+            # was waiting.
+
+            # We count the retry.
+            Metrics.count("retries", "whois")
+
+            # We connect again.
+            req = cls._connect(address, port, timeout)
+
+            # And we get the record (if we could connect).
+            response = cls._query(req, domain, until=until) if req else None
+
+        # We return the record.
+        return response
+
+    @classmethod
+    def whois(
+        cls, whois_server, domain=None, timeout=None, port=None, until=None
+    ):  # pragma: no cover
         """
         Implementation of UNIX whois.
 
@@ -158,6 +620,17 @@ class Lookup:
         :param timeout: The timeout to apply to the request.
         :type timeout: int
 
+        :param port:
+            The port of the whois server.
+            If not given, we use :code:`Lookup.whois_port`.
+        :type port: int
+
+        :param until:
+            A function which tells us - from the raw record, the index to look
+            from and the index to stop to look at - if we can stop to read the
+            record. (Useful when we only need a part of the record.)
+        :type until: callable
+
         :return: The whois record from the given whois server, if exist.
         :rtype: str|None
         """
@@ -174,85 +647,50 @@ class Lookup:
             # We consider the timeout from the configuration as the timeout to use.
             timeout = PyFunceble.CONFIGURATION["seconds_before_http_timeout"]
 
-        if whois_server:
-            # A whois server is given.
-
-            # We initiate a PyFunceble.socket.
-            req = PyFunceble.socket.socket(
-                PyFunceble.socket.AF_INET, PyFunceble.socket.SOCK_STREAM
-            )
-
-            if timeout % 3 == 0:
-                # The timeout is modulo 3.
-
-                # We report the timeout to our initiated PyFunceble.socket.
-                req.settimeout(timeout)
-            else:
-                # The timeout is not modulo 3.
-
-                # We report 3 seconds as the timeout to our initiated PyFunceble.socket.
-                req.settimeout(3)
-
-            try:
-                # We try to connect to the whois server at the port 43.
-                req.connect((whois_server, 43))
-            except PyFunceble.socket.error:
-                # We got an error.
-
-                # We return None.
-                return None
-
-            # We send end encode the domain we want the data from.
-            req.send((domain + "\r\n").encode())
+        if port is None:
+            # The port is not given (localy).
 
-            # We initiate a bytes variable which will save the response
-            # from the server.
-            response = b""
+            # We consider the default WHOIS port as the port to use.
+            port = cls.whois_port
 
-            while True:
-                # We loop infinitly.
-                try:
-                    # We try to receive the data in a buffer of 4096 bytes.
-                    data = req.recv(4096)
-                except (PyFunceble.socket.timeout, ConnectionResetError):
-                    # We got an error.
+        # We initiate the record.
+        response = None
 
-                    # We close the connection.
-                    req.close()
+        if whois_server and CircuitBreaker.allows("whois", whois_server):
+            # * A whois server is given.
+            # and
+            # * The whois server did not fail too many times in a row.
+            # (Otherwise, we fall back to the next source of status.)
 
-                    # And we return None.
-                    return None
+            # We get the timeout to apply to the whois server.
+            timeout = cls._timeout(whois_server, timeout)
 
-                # Everything goes right.
+            # We save the time we started.
+            # Note: This is used to adapt the timeout of the whois server.
+            started = perf_counter()
 
-                # We append data to the response we got.
-                response += data
+            # We get the record.
+            response = cls._record(whois_server, domain, port, timeout, until)
 
-                if not data:
-                    # The data is empty.
+            if response is None:
+                # We could not get the record.
 
-                    # We break the loop.
-                    break
-
-            # We close the connection.
-            req.close()
-
-            try:
+                # We count the failure.
+                CircuitBreaker.failure("whois", whois_server)
+            else:
+                # We got the record.
 
-                # We finally decode and return the response we got from the
-                # server.
-                return response.decode()
+                # We count the success.
+                CircuitBreaker.success("whois", whois_server)
 
-            except UnicodeDecodeError:
-                # We got an encoding error.
+                # We save the duration of the request.
+                AdaptiveTimeout.add("whois", whois_server, perf_counter() - started)
 
-                # We decode the response.
+                # We decode the record.
                 # Note: Because we don't want to deal with other issue, we
                 # decided to use `replace` in order to automatically replace
                 # all non utf-8 encoded characters.
-                return response.decode("utf-8", "replace")
+                response = response.decode("utf-8", "replace")
 
-        # The whois server is not given.
-
-        # We return None.
-        return None
+        # We return the record (or None).
+        return response
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the metrics interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+
+from threading import Lock
+from time import time
+
+import PyFunceble
+from PyFunceble.circuit_breaker import CircuitBreaker
+from PyFunceble.helpers import Dict, File
+from PyFunceble.timings import PeriodicDump, Timings
+
+
+class Metrics(PeriodicDump):
+    """
+    Count the events (timeouts, errors, retries, cache hits ...) of a test and
+    export them (when activated) along with the counters of statuses and the
+    timings of each stage.
+
+    The export is a Prometheus text file (for the textfile collector of the
+    node exporter) or a JSON snapshot into the output directory.
+
+    .. note::
+        The counting is always done as it only increments an integer.
+        The export is done every :code:`seconds_between_dumps` seconds
+        and at the end of the test.
+    """
+
+    # We set the formats we can export to.
+    formats = ["json", "prometheus"]
+
+    # We set the prefix of the name of our Prometheus metrics.
+    prefix = "pyfunceble_"
+
+    # We set the label and the description of each of our counters.
+    descriptions = {
+        "cache_hits": ("cache", "The number of hits of each cache."),
+        "cache_misses": ("cache", "The number of misses of each cache."),
+        "circuit_breaker_opens": (
+            "breaker",
+            "The number of times each circuit breaker opened.",
+        ),
+        "circuit_breaker_skips": (
+            "breaker",
+            "The number of requests each (open) circuit breaker skipped.",
+        ),
+        "errors": ("stage", "The number of (connection) errors of each stage."),
+        "retries": ("stage", "The number of retries of each stage."),
+        "timeouts": ("stage", "The number of timeouts of each stage."),
+    }
+
+    # We save our counters.
+    counters = {}
+
+    # We save the time we started and the number of tested elements at that time.
+    started = started_tested = None
+
+    # We save the lock to use when we update the counters.
+    lock = Lock()
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if the metrics are exported.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION.get("metrics", False)
+
+    @classmethod
+    def count(cls, name, label, value=1):
+        """
+        Increment the given counter.
+
+        :param name: The name of the counter. (e.g. :code:`timeouts`)
+        :type name: str
+
+        :param label: The label (stage, cache ...) to count for.
+        :type label: str
+
+        :param value: The value to add.
+        :type value: int
+        """
+
+        with cls.lock:
+            if name not in cls.counters:
+                # The counter is not known yet.
+
+                # We initiate it.
+                cls.counters[name] = {}
+
+            # We increment the counter.
+            cls.counters[name][label] = cls.counters[name].get(label, 0) + value
+
+    @classmethod
+    def cache(cls, name, hit):
+        """
+        Count a hit or a miss of the given cache.
+
+        :param name: The name of the cache.
+        :type name: str
+
+        :param hit: Tell us if we got what we wanted from the cache.
+        :type hit: bool
+        """
+
+        cls.count("cache_hits" if hit else "cache_misses", name)
+
+    @classmethod
+    def get(cls, name, label):
+        """
+        Get the value of the given counter.
+
+        :param name: The name of the counter.
+        :type name: str
+
+        :param label: The label to get the value of.
+        :type label: str
+
+        :rtype: int
+        """
+
+        with cls.lock:
+            return cls.counters.get(name, {}).get(label, 0)
+
+    @classmethod
+    def pop(cls):
+        """
+        Get and reset the counters.
+
+        :return: The counters.
+        :rtype: dict
+
+        .. note::
+            The workers (processes) send them along with their results so that
+            the main process can merge them.
+        """
+
+        with cls.lock:
+            # We get the counters.
+            counters = cls.counters
+
+            # And we reset them.
+            cls.counters = {}
+
+        # We return the counters.
+        return counters
+
+    @classmethod
+    def merge(cls, counters):
+        """
+        Merge the given counters into ours.
+
+        :param counters: The counters to merge (from :meth:`pop`).
+        :type counters: dict
+        """
+
+        if not counters:
+            # There is nothing to merge.
+
+            # We stop here.
+            return
+
+        for name, labels in counters.items():
+            # We loop through the given counters.
+
+            for label, value in labels.items():
+                # We loop through the labels.
+
+                # And we merge them.
+                cls.count(name, label, value)
+
+    @classmethod
+    def start(cls):
+        """
+        Save the time we started to test a list so that we can tell
+        the rate of the test.
+        """
+
+        cls.started = time()
+        cls.started_tested = PyFunceble.INTERN["counter"]["number"]["tested"]
+        cls.last_dump = None
+
+    @classmethod
+    def snapshot(cls):
+        """
+        Take a snapshot of our metrics.
+
+        :return:
+            The time of the snapshot, the elapsed time and the rate since we
+            started, the counters of statuses, our counters, the summary
+            of the timings and the open circuit breakers.
+        :rtype: dict
+        """
+
+        # We get the current time.
+        now = time()
+
+        # We get the counters of statuses.
+        subjects = dict(PyFunceble.INTERN["counter"]["number"])
+
+        if cls.started:
+            # We know when we started.
+
+            # We compute the elapsed time.
+            elapsed = now - cls.started
+        else:
+            # We do not know when we started.
+
+            # We can't compute the elapsed time.
+            elapsed = 0.0
+
+        if elapsed:
+            # Some time passed.
+
+            # We compute the rate.
+            rate = (subjects["tested"] - (cls.started_tested or 0)) / elapsed
+        else:
+            # No time passed.
+
+            # We can't compute the rate.
+            rate = 0.0
+
+        with cls.lock:
+            # We get a copy of our counters.
+            counters = {x: dict(y) for x, y in cls.counters.items()}
+
+        return {
+            "timestamp": round(now, 3),
+            "elapsed": round(elapsed, 3),
+            "subjects_per_second": round(rate, 2),
+            "subjects": subjects,
+            "counters": counters,
+            "stages": Timings.summary(),
+            "circuit_breakers": CircuitBreaker.summary(),
+        }
+
+    @classmethod
+    def _escape(cls, value):
+        """
+        Escape the given value of a Prometheus label.
+
+        :param value: The value to escape.
+        :type value: str
+
+        :rtype: str
+        """
+
+        return (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+
+    @classmethod
+    def to_prometheus(cls, snapshot):
+        """
+        Convert the given snapshot into the Prometheus text format.
+
+        :param snapshot: The snapshot to convert (from :meth:`snapshot`).
+        :type snapshot: dict
+
+        :rtype: str
+        """
+
+        # We initiate the lines to write.
+        result = []
+
+        # We construct the format of the header of a metric.
+        header = "# HELP %(name)s %(description)s\n# TYPE %(name)s %(kind)s"
+
+        for name, description, value in [
+            (
+                "elapsed_seconds",
+                "The number of seconds since the start of the test.",
+                snapshot["elapsed"],
+            ),
+            (
+                "subjects_per_second",
+                "The number of tested subjects per second.",
+                snapshot["subjects_per_second"],
+            ),
+            (
+                "last_dump_timestamp_seconds",
+                "The time of the dump.",
+                snapshot["timestamp"],
+            ),
+        ]:
+            # We loop through our gauges.
+
+            result.append(
+                header
+                % {
+                    "name": cls.prefix + name,
+                    "description": description,
+                    "kind": "gauge",
+                }
+            )
+            result.append("%s%s %s" % (cls.prefix, name, value))
+
+        result.append(
+            header
+            % {
+                "name": cls.prefix + "subjects",
+                "description": "The number of tested subjects (per status).",
+                "kind": "gauge",
+            }
+        )
+
+        for status, value in sorted(snapshot["subjects"].items()):
+            # We loop through the counters of statuses.
+
+            result.append(
+                '%ssubjects{status="%s"} %d' % (cls.prefix, cls._escape(status), value)
+            )
+
+        for name, (label, description) in sorted(cls.descriptions.items()):
+            # We loop through our counters.
+
+            if name not in snapshot["counters"]:
+                # Nothing was counted.
+
+                # We continue to the next one.
+                continue
+
+            result.append(
+                header
+                % {
+                    "name": cls.prefix + name + "_total",
+                    "description": description,
+                    "kind": "counter",
+                }
+            )
+
+            for value_label, value in sorted(snapshot["counters"][name].items()):
+                # We loop through the labels of the counter.
+
+                result.append(
+                    '%s%s_total{%s="%s"} %d'
+                    % (cls.prefix, name, label, cls._escape(value_label), value)
+                )
+
+        if snapshot.get("circuit_breakers"):
+            # Some circuit breakers are open.
+
+            # We construct the name of the gauge.
+            name = cls.prefix + "circuit_breaker_open"
+
+            result.append(
+                header
+                % {
+                    "name": name,
+                    "description": "The open circuit breakers.",
+                    "kind": "gauge",
+                }
+            )
+
+            for breaker in sorted(snapshot["circuit_breakers"]):
+                # We loop through the open circuit breakers.
+
+                result.append('%s{breaker="%s"} 1' % (name, cls._escape(breaker)))
+
+        if snapshot["stages"]:
+            # We have some timings.
+
+            # We construct the name of the histogram.
+            name = cls.prefix + "stage_duration_seconds"
+
+            result.append(
+                header
+                % {
+                    "name": name,
+                    "description": "The duration of each stage.",
+                    "kind": "histogram",
+                }
+            )
+
+            for stage, summary in sorted(snapshot["stages"].items()):
+                # We loop through the summary of each stage.
+
+                # We initiate the cumulative count.
+                cumulative = 0
+
+                for bound in Timings.dumped_bounds:
+                    # We loop through the bounds of the histogram.
+
+                    # We add the count of the bucket.
+                    cumulative += summary["histogram"]["<= %ss" % bound]
+
+                    result.append(
+                        '%s_bucket{stage="%s",le="%s"} %d'
+                        % (name, cls._escape(stage), bound, cumulative)
+                    )
+
+                result.append(
+                    '%s_bucket{stage="%s",le="+Inf"} %d'
+                    % (name, cls._escape(stage), summary["count"])
+                )
+                result.append(
+                    '%s_sum{stage="%s"} %s'
+                    % (name, cls._escape(stage), summary["total"])
+                )
+                result.append(
+                    '%s_count{stage="%s"} %d'
+                    % (name, cls._escape(stage), summary["count"])
+                )
+
+        return "\n".join(result) + "\n"
+
+    @classmethod
+    def dump(cls, periodic=False):
+        """
+        Export our metrics into the output directory.
+
+        :param periodic:
+            Tell us if we are dumping while testing. If it is the case,
+            we only dump every :code:`seconds_between_dumps` seconds.
+        :type periodic: bool
+        """
+
+        if not cls.is_activated() or PyFunceble.CONFIGURATION["no_files"]:
+            # * The metrics are not exported.
+            # or
+            # * We are not allowed to generate files.
+
+            # We stop here.
+            return
+
+        if not cls.is_time_to_dump(periodic):
+            # It is not time to dump.
+
+            # We stop here.
+            return
+
+        # We check if we have to export to JSON.
+        to_json = PyFunceble.CONFIGURATION.get("metrics_format") == "json"
+
+        # We initiate the location of the file we dump into.
+        output = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"][
+                "metrics_json" if to_json else "metrics_prometheus"
+            ]
+        )
+
+        if not PyFunceble.path.isdir(PyFunceble.path.dirname(output)):
+            # The directory was not found.
+
+            # We construct the output directory.
+            PyFunceble.DirectoryStructure()
+
+        # We take the snapshot.
+        snapshot = cls.snapshot()
+
+        if to_json:
+            # We have to export to JSON.
+
+            # We save the snapshot into a temporary file.
+            Dict(snapshot).to_json(output + ".tmp")
+        else:
+            # We have to export to the Prometheus text format.
+
+            # We save the converted snapshot into a temporary file.
+            File(output + ".tmp").write(cls.to_prometheus(snapshot), overwrite=True)
+
+        # And we atomically replace the file with it.
+        # Note: This way, a collector never reads a partial file.
+        PyFunceble.replace(output + ".tmp", output)
+
+
+# We count the events of the circuit breakers.
+CircuitBreaker.counter = Metrics.count
@@ -107,7 +107,8 @@ class Mining:
 
         # We get the file we are going to save our data.
         self.file = (
-            PyFunceble.CURRENT_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["mining"]
+            PyFunceble.get_current_directory()
+            + PyFunceble.OUTPUTS["default_files"]["mining"]
         )
 
         if "mined" not in PyFunceble.INTERN:
@@ -0,0 +1,479 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the stages we go through to get the status of a domain or IP.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+from concurrent.futures import ThreadPoolExecutor
+
+import PyFunceble
+from PyFunceble.check import Check
+from PyFunceble.database import Whois
+from PyFunceble.expiration_date import ExpirationDate
+from PyFunceble.http_code import HTTPCode
+from PyFunceble.logs import Logs
+from PyFunceble.lookup import Lookup
+from PyFunceble.metrics import Metrics
+from PyFunceble.referer import Referer
+
+
+class Pipeline:
+    """
+    Collect what we need to get the status of domains or IPs through
+    explicit stages.
+
+    The stages are (in order):
+
+    #. :code:`syntax`: The syntax validation and the WHOIS server (referer).
+    #. :code:`http`: The HTTP status code.
+    #. :code:`whois`: The WHOIS record and its expiration date.
+    #. :code:`dns`: The DNS lookup.
+
+    If :code:`short_circuit` is activated, the HTTP status code is requested
+    last and only if the DNS lookup of the domain did not fail, as
+    the request could not reach any server anyway.
+
+    The classification (and the generation of files) is then done by
+    :class:`PyFunceble.status.Status` from the collected data.
+
+    Each stage has a batch interface so that it can be called with many
+    elements at once. In that case, the network stages work
+    with :code:`pipeline_threads` threads.
+
+    .. note::
+        A stage does not work for an element which is already settled by a
+        previous stage. For example, we do not lookup the DNS of an element
+        we already know (from its WHOIS record) to be ACTIVE.
+    """
+
+    # We list the stages.
+    stages = ["syntax", "http", "whois", "dns"]
+
+    # We list the stages (ordered by cost) of the short-circuit mode.
+    # Note: The WHOIS record is requested before the DNS lookup because
+    # it can settle the status (so that we do not lookup the DNS) while
+    # the opposite is not true.
+    short_circuit_stages = ["syntax", "whois", "dns", "http"]
+
+    # We save the data we collected before testing.
+    prefetched = {}
+
+    @classmethod
+    def is_batched(cls):
+        """
+        Check if we have to collect the data of multiple elements at once.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION["pipeline_batch_size"] > 1
+
+    @classmethod
+    def get_stages(cls):
+        """
+        Give the stages to run (in order).
+
+        :rtype: list
+        """
+
+        if PyFunceble.CONFIGURATION["short_circuit"]:
+            # The short-circuit mode is activated.
+
+            # We return the stages ordered by cost.
+            return cls.short_circuit_stages
+
+        # We return the default stages.
+        return cls.stages
+
+    @classmethod
+    def dataset(cls, subject):
+        """
+        Initiate the data of the given element.
+
+        :param subject: The domain or IP.
+        :type subject: str
+
+        :rtype: dict
+        """
+
+        return {
+            "to_test": subject,
+            "domain_syntax_validation": None,
+            "ip4_syntax_validation": None,
+            "subdomain": None,
+            "type": None,
+            "http_code": None,
+            "referer": None,
+            "expiration_date_from_database": None,
+            "whois_record": None,
+            "expiration_date": None,
+            "nslookup": None,
+            "skipped": [],
+        }
+
+    @classmethod
+    def _map(cls, function, elements):
+        """
+        Apply the given function to each given element.
+
+        :param function: The function to apply.
+        :type function: function
+
+        :param elements: The elements.
+        :type elements: list
+
+        :return: The result of the function for each element (in order).
+        :rtype: list
+        """
+
+        if len(elements) > 1 and PyFunceble.CONFIGURATION["pipeline_threads"] > 1:
+            # There is more than one element and we are allowed to use threads.
+
+            with ThreadPoolExecutor(
+                min(len(elements), PyFunceble.CONFIGURATION["pipeline_threads"])
+            ) as executor:
+                # We apply the function with the threads.
+                return list(executor.map(function, elements))
+
+        # We apply the function one by one.
+        return [function(x) for x in elements]
+
+    @classmethod
+    def is_settled(cls, dataset):
+        """
+        Check if the given data are enough to give the status of the element.
+
+        :param dataset: The data of the element.
+        :type dataset: dict
+
+        :rtype: bool
+        """
+
+        return (
+            not dataset["type"]
+            or (dataset["type"] == "domain" and dataset["referer"] is False)
+            or bool(dataset["expiration_date_from_database"])
+            or dataset["expiration_date"] not in [None, False]
+        )
+
+    @classmethod
+    def syntax(cls, datasets):
+        """
+        Validate the syntax of the given elements.
+
+        :param datasets: The data of the elements.
+        :type datasets: list
+        """
+
+        for dataset in datasets:
+            # We loop through the data.
+
+            # We initiate the checker.
+            checker = Check(dataset["to_test"])
+
+            # We get the status of the domain validation.
+            dataset["domain_syntax_validation"] = checker.is_domain_valid()
+            # We get the status of the IPv4 validation.
+            dataset["ip4_syntax_validation"] = checker.is_ip_valid()
+
+            if (
+                dataset["domain_syntax_validation"]
+                or PyFunceble.CONFIGURATION["local"]
+            ):
+                # * The element is a valid domain.
+                # or
+                # * We are testing in a local network.
+
+                # We have to work with a domain.
+                dataset["type"] = "domain"
+
+                # We get the status of the subdomain validation.
+                dataset["subdomain"] = checker.is_subdomain()
+
+                # We get the element status from the IANA database.
+                dataset["referer"] = Referer(dataset["to_test"]).get()
+            elif dataset["ip4_syntax_validation"]:
+                # The element is a valid IPv4.
+
+                # We have to work with an IP.
+                dataset["type"] = "ip"
+
+    @classmethod
+    def http(cls, datasets):
+        """
+        Get the HTTP status code of the given elements.
+
+        :param datasets: The data of the elements.
+        :type datasets: list
+        """
+
+        # We initiate the elements we have to work with.
+        to_work = []
+
+        # We initiate the elements we skip the HTTP status code request of.
+        skipped = []
+
+        for dataset in [x for x in datasets if x["type"]]:
+            # We loop through the elements which passed the syntax validation.
+
+            if (
+                PyFunceble.CONFIGURATION["short_circuit"]
+                and PyFunceble.HTTP_CODE["active"]
+                and dataset["type"] == "domain"
+                and dataset["nslookup"] is False
+            ):
+                # * The short-circuit mode is activated.
+                # and
+                # * The HTTP status code request is activated.
+                # and
+                # * We are working with a domain.
+                # and
+                # * The DNS lookup failed.
+
+                # We set what the request would have given us as it could not
+                # reach any server.
+                dataset["http_code"] = "*" * 3
+
+                # We report that we skip the HTTP status code request.
+                dataset["skipped"].append("http_code")
+                skipped.append(dataset["to_test"])
+
+                continue
+
+            # We have to get the HTTP status code.
+            to_work.append(dataset)
+
+        # We log (at once) the elements we skipped the HTTP status code request of.
+        Logs().skipped(skipped, "http_code", "nslookup")
+
+        for dataset, http_code in zip(
+            to_work, cls._map(lambda x: HTTPCode(x["to_test"]).get(), to_work)
+        ):
+            # We loop through the HTTP status codes.
+
+            # We save the HTTP status code.
+            dataset["http_code"] = http_code
+
+    @classmethod
+    def whois(cls, datasets):
+        """
+        Get the WHOIS record (and its expiration date) of the given elements.
+
+        :param datasets: The data of the elements.
+        :type datasets: list
+        """
+
+        # We initiate the elements we have to get the WHOIS record of.
+        to_work = []
+
+        # We save the currently tested element.
+        currently_tested = PyFunceble.INTERN.get("to_test")
+
+        for dataset in datasets:
+            # We loop through the data.
+
+            if (
+                dataset["type"] == "domain"
+                and dataset["referer"]
+                and not dataset["subdomain"]
+            ):
+                # * We are working with a domain.
+                # and
+                # * The referer is known.
+                # and
+                # * The domain is not a subdomain.
+
+                # We set the element we are working with.
+                PyFunceble.INTERN["to_test"] = dataset["to_test"]
+
+                # We try to get the expiration date from the database.
+                dataset["expiration_date_from_database"] = Whois().get_expiration_date()
+
+                if PyFunceble.CONFIGURATION["whois_database"]:
+                    # The whois database is activated.
+
+                    # We count the hit or the miss of the database.
+                    Metrics.cache(
+                        "whois_db", bool(dataset["expiration_date_from_database"])
+                    )
+
+                if not dataset["expiration_date_from_database"]:
+                    # The expiration date is not into the database.
+
+                    # We have to get the WHOIS record.
+                    to_work.append(dataset)
+
+        # We restore the currently tested element.
+        PyFunceble.INTERN["to_test"] = currently_tested
+
+        if (
+            PyFunceble.CONFIGURATION["debug"] and PyFunceble.CONFIGURATION["logs"]
+        ) or "current_test_data" in PyFunceble.INTERN:
+            # * The WHOIS records are logged.
+            # or
+            # * The end-user want more information with his test.
+
+            # We read the full WHOIS records.
+            until = None
+        else:
+            # We only need the expiration date.
+
+            # We stop to read each WHOIS record once its expiration date is in.
+            until = ExpirationDate.has_expiration_date
+
+        for dataset, whois_record in zip(
+            to_work,
+            cls._map(
+                lambda x: Lookup().whois(x["referer"], x["to_test"], until=until),
+                to_work,
+            ),
+        ):
+            # We loop through the WHOIS records.
+
+            # We save the WHOIS record.
+            dataset["whois_record"] = whois_record
+
+            # We extract the expiration date.
+            dataset["expiration_date"] = ExpirationDate().extract(whois_record)
+
+    @classmethod
+    def dns(cls, datasets):
+        """
+        Lookup the DNS of the given elements.
+
+        :param datasets: The data of the elements.
+        :type datasets: list
+        """
+
+        # We get the elements we have to work with.
+        to_work = [x for x in datasets if not cls.is_settled(x)]
+
+        for dataset, nslookup in zip(
+            to_work, cls._map(lambda x: Lookup().nslookup(x["to_test"]), to_work)
+        ):
+            # We loop through the results.
+
+            # We save the result of the lookup.
+            dataset["nslookup"] = nslookup
+
+    def get_many(self, subjects):
+        """
+        Collect the data of the given elements through all stages.
+
+        :param subjects: The domains or IPs.
+        :type subjects: list
+
+        :return: The data of each element (in order).
+        :rtype: list
+        """
+
+        # We initiate the data of each element.
+        datasets = [self.dataset(x) for x in subjects]
+
+        for stage in self.get_stages():
+            # We loop through the stages.
+
+            # We run the stage.
+            getattr(self, stage)(datasets)
+
+        # We return the data.
+        return datasets
+
+    def prefetch(self, subjects):
+        """
+        Collect the data of the given elements before testing them.
+
+        :param subjects: The domains or IPs.
+        :type subjects: list
+        """
+
+        # We forget the data we did not use.
+        self.prefetched.clear()
+
+        for dataset in self.get_many([x for x in subjects if x]):
+            # We loop through the data.
+
+            # We save them.
+            self.prefetched[dataset["to_test"]] = dataset
+
+    def get(self, subject):
+        """
+        Give the data of the given element.
+
+        :param subject: The domain or IP.
+        :type subject: str
+
+        :rtype: dict
+        """
+
+        if self.is_batched():
+            # We collect the data of multiple elements at once.
+
+            # We count the hit or the miss of the prefetched data.
+            Metrics.cache("prefetch", subject in self.prefetched)
+
+        if subject in self.prefetched:
+            # We already collected the data.
+
+            # We return (and forget) them.
+            return self.prefetched.pop(subject)
+
+        # We collect and return the data.
+        return self.get_many([subject])[0]
@@ -0,0 +1,259 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the multiprocessing logic.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
+
+import PyFunceble
+from PyFunceble.database import Whois
+from PyFunceble.generate import Generate
+from PyFunceble.logs import Logs, LogsSharing
+
+
+class Processes:
+    """
+    Test a list of elements with multiple processes.
+
+    :param worker:
+        The (picklable) function which tests a single element.
+        It should return a :code:`dict` with (at least) the :code:`deferred`
+        index which is the list of records of
+        :class:`PyFunceble.deferred.Deferred`.
+    :type worker: function
+
+    .. note::
+        Only the current process writes into the output directory and the
+        databases. Indeed, the workers only give us the statuses and
+        the records of what they would have generated.
+        We replay those records in the order of the list to test so that
+        the outputs are the same as if we were testing with a single process.
+    """
+
+    def __init__(self, worker):
+        # We get the worker.
+        self.worker = worker
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if we have to test with multiple processes.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION["processes"] > 1
+
+    @classmethod
+    def state(cls):
+        """
+        Give the state the workers have to start from.
+
+        :return:
+            The configuration, the internal state, the status, the outputs,
+            the http codes and the links.
+        :rtype: tuple
+        """
+
+        return (
+            PyFunceble.CONFIGURATION,
+            PyFunceble.INTERN,
+            PyFunceble.STATUS,
+            PyFunceble.OUTPUTS,
+            PyFunceble.HTTP_CODE,
+            PyFunceble.LINKS,
+        )
+
+    @classmethod
+    def initiate(
+        cls, configuration, intern, status, outputs, http_code, links, output_directory
+    ):  # pylint: disable=too-many-arguments
+        """
+        Initiate a worker with the state of the main process.
+
+        .. note::
+            This is needed when the processes are spawned instead of
+            forked.
+        """
+
+        # We update the configuration.
+        PyFunceble.CONFIGURATION.update(configuration)
+
+        # We update the internal state.
+        PyFunceble.INTERN.update(intern)
+
+        # We update the status.
+        PyFunceble.STATUS.update(status)
+
+        # We update the outputs.
+        PyFunceble.OUTPUTS.update(outputs)
+
+        # We update the http codes.
+        PyFunceble.HTTP_CODE.update(http_code)
+
+        # We update the links.
+        PyFunceble.LINKS.update(links)
+
+        # We update the output directory.
+        PyFunceble.OUTPUT_DIRECTORY = output_directory
+
+        # The worker does not have a logs sharing worker of its own yet.
+        LogsSharing.worker = None
+
+        # And we flush the logs sharing queue when the worker exits.
+        Finalize(None, LogsSharing.flush, exitpriority=10)
+
+    @classmethod
+    def pool(cls, processes):
+        """
+        Initiate a pool of workers which start from the state of the
+        current process.
+
+        :param processes: The number of workers.
+        :type processes: int
+
+        :rtype: multiprocessing.pool.Pool
+        """
+
+        return Pool(
+            processes,
+            initializer=cls.initiate,
+            initargs=cls.state() + (PyFunceble.OUTPUT_DIRECTORY,),
+        )
+
+    def test(self, list_to_test):
+        """
+        Test the given list with the workers.
+
+        :param list_to_test: The list to test.
+        :type list_to_test: list
+
+        :return:
+            The result of the worker for each element of the given list.
+            The results are given in the order of the given list.
+        :rtype: generator
+        """
+
+        # We initiate the pool of workers.
+        pool = self.pool(PyFunceble.CONFIGURATION["processes"])
+
+        try:
+            # We give the results (in order).
+            yield from pool.imap(self.worker, list_to_test, chunksize=1)
+
+            # We do not have anything else to give to the workers.
+            pool.close()
+        except BaseException:
+            # Something went wrong (or we were interrupted).
+
+            # We stop the workers.
+            pool.terminate()
+
+            # And we raise the exception again.
+            raise
+        finally:
+            # We wait for the workers to exit.
+            pool.join()
+
+    @classmethod
+    def replay(cls, records):
+        """
+        Replay the given records.
+
+        :param records:
+            The records of :class:`PyFunceble.deferred.Deferred`
+            to replay.
+        :type records: list
+        """
+
+        for record in records:
+            # We loop through the records.
+
+            # We set the element the record is about.
+            PyFunceble.INTERN["to_test"] = record["to_test"]
+
+            # We set the http code of the record.
+            PyFunceble.INTERN["http_code"] = record["http_code"]
+
+            # We set the referer of the record.
+            PyFunceble.INTERN["referer"] = record["referer"]
+
+            if record["action"] == "status_file":
+                # We have to generate the status file.
+
+                Generate(*record["arguments"]).status_file()
+            elif record["action"] == "analytic_file":
+                # We have to generate the analytic file.
+
+                Generate(*record["arguments"]).analytic_file(
+                    *record["method_arguments"]
+                )
+            elif record["action"] == "whois":
+                # We have to save the expiration date into the whois database.
+
+                Whois(*record["arguments"]).add()
+            elif record["action"] == "logs":
+                # We have to append the record into the log file.
+
+                Logs._write_content(  # pylint: disable=protected-access
+                    *record["arguments"]
+                )
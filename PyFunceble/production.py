@@ -152,19 +152,19 @@ class Production:  # pylint: disable=too-few-public-methods
                 )
 
                 # We fix the urls in the README file.
-                self._update_docs(PyFunceble.CURRENT_DIRECTORY + "README.rst")
+                self._update_docs(PyFunceble.get_current_directory() + "README.rst")
 
                 # We fix the urls in the configuration file.
                 self._update_docs(
-                    PyFunceble.CURRENT_DIRECTORY + ".PyFunceble_production.yaml"
+                    PyFunceble.get_current_directory() + ".PyFunceble_production.yaml"
                 )
 
                 # We fix the urls in the setup.py file.
-                self._update_docs(PyFunceble.CURRENT_DIRECTORY + "setup.py")
+                self._update_docs(PyFunceble.get_current_directory() + "setup.py")
 
                 # We fix the urls in the documentation index.
                 self._update_docs(
-                    PyFunceble.CURRENT_DIRECTORY
+                    PyFunceble.get_current_directory()
                     + PyFunceble.directory_separator
                     + "docs"
                     + PyFunceble.directory_separator
@@ -173,7 +173,7 @@ class Production:  # pylint: disable=too-few-public-methods
 
                 # We fix the urls in the documentation logic representation.
                 self._update_docs(
-                    PyFunceble.CURRENT_DIRECTORY
+                    PyFunceble.get_current_directory()
                     + PyFunceble.directory_separator
                     + "docs"
                     + PyFunceble.directory_separator
@@ -182,7 +182,7 @@ class Production:  # pylint: disable=too-few-public-methods
 
                 # We fix the urls in the usage documentation.
                 self._update_docs(
-                    PyFunceble.CURRENT_DIRECTORY
+                    PyFunceble.get_current_directory()
                     + PyFunceble.directory_separator
                     + "docs"
                     + PyFunceble.directory_separator
@@ -193,7 +193,7 @@ class Production:  # pylint: disable=too-few-public-methods
 
                 # We fix the urls in the links configuration documentation.
                 self._update_docs(
-                    PyFunceble.CURRENT_DIRECTORY
+                    PyFunceble.get_current_directory()
                     + PyFunceble.directory_separator
                     + "docs"
                     + PyFunceble.directory_separator
@@ -213,7 +213,7 @@ class Production:  # pylint: disable=too-few-public-methods
 
                 # We save our version data into our `version.yaml` file.
                 Dict(self.data_version_yaml).to_yaml(
-                    PyFunceble.CURRENT_DIRECTORY + "version.yaml", flow_style=None
+                    PyFunceble.get_current_directory() + "version.yaml", flow_style=None
                 )
 
                 # We prepare the message we are going to print on screen.
@@ -253,7 +253,7 @@ class Production:  # pylint: disable=too-few-public-methods
         to_ignore = [".gitignore", ".keep"]
 
         for root, _, files in PyFunceble.walk(
-            PyFunceble.CURRENT_DIRECTORY
+            PyFunceble.get_current_directory()
             + PyFunceble.directory_separator
             + "PyFunceble"
             + PyFunceble.directory_separator
@@ -281,7 +281,7 @@ class Production:  # pylint: disable=too-few-public-methods
                         self._update_docs(root + PyFunceble.directory_separator + file)
 
         for root, _, files in PyFunceble.walk(
-            PyFunceble.CURRENT_DIRECTORY
+            PyFunceble.get_current_directory()
             + PyFunceble.directory_separator
             + "tests"
             + PyFunceble.directory_separator
@@ -314,7 +314,7 @@ class Production:  # pylint: disable=too-few-public-methods
         """
 
         return Dict().from_yaml(
-            File(PyFunceble.CURRENT_DIRECTORY + "version.yaml").read()
+            File(PyFunceble.get_current_directory() + "version.yaml").read()
         )
 
     def _is_version_greater(self):
@@ -480,7 +480,7 @@ class Production:  # pylint: disable=too-few-public-methods
         """
 
         # We initiate the path to the file we have to filter.
-        setup_py_path = PyFunceble.CURRENT_DIRECTORY + "setup.py"
+        setup_py_path = PyFunceble.get_current_directory() + "setup.py"
 
         if self.is_dev_version():
             # The current version is the `dev` version.
@@ -525,7 +525,7 @@ class Production:  # pylint: disable=too-few-public-methods
         """
 
         # We initiate the file we have to filter/update.
-        travis_yml_path = PyFunceble.CURRENT_DIRECTORY + ".travis.yml"
+        travis_yml_path = PyFunceble.get_current_directory() + ".travis.yml"
 
         if self.is_dev_version():
             # The current version is the `dev` version.
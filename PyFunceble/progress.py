@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the progress reporting interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+
+from sys import stderr
+from threading import Event, Thread
+from time import time
+
+import PyFunceble
+from PyFunceble.helpers import Dict
+from PyFunceble.metrics import Metrics
+from PyFunceble.timings import Timings
+
+
+class Progress:
+    """
+    Report the progress of the test of a list (when activated).
+
+    A thread samples our counters every :code:`seconds_between_samples` seconds
+    and reports the number of tested elements, the rate (subjects per second),
+    the ETA, the stages in flight and the cache hit ratios.
+
+    .. note::
+        The ETA is computed from an exponential moving average of the rate
+        so that it does not jump from one sample to another.
+    """
+
+    # We set the number of seconds between two samples.
+    seconds_between_samples = 1
+
+    # We set the weight of the last sample into the moving average of the rate.
+    smoothing = 0.3
+
+    # We save the number of elements we have to test.
+    total = 0
+
+    # We save the number of tested elements.
+    done = 0
+
+    # We save the (smoothed) rate.
+    rate = None
+
+    # We save the time we started, the time and the number of tested elements
+    # of the last sample.
+    started = last_sample = last_done = None
+
+    # We save the sampling thread and the event which stops it.
+    thread = stopped = None
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if the progress is reported.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION.get("progress", False)
+
+    @classmethod
+    def start(cls, total):
+        """
+        Start to report the progress of the test of a list.
+
+        :param total: The number of elements we have to test.
+        :type total: int
+        """
+
+        if not cls.is_activated() or cls.thread:
+            # * The progress is not reported.
+            # or
+            # * We are already reporting.
+
+            # We stop here.
+            return
+
+        # We initiate our state.
+        cls.total = total
+        cls.done = cls.last_done = 0
+        cls.rate = None
+        cls.started = cls.last_sample = time()
+
+        # We initiate and start the sampling thread.
+        cls.stopped = Event()
+        cls.thread = Thread(target=cls._sample_periodically, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop to report the progress and report it for the last time.
+        """
+
+        if not cls.thread:
+            # We are not reporting.
+
+            # We stop here.
+            return
+
+        # We stop and wait for the sampling thread.
+        cls.stopped.set()
+        cls.thread.join()
+        cls.thread = None
+
+        # We report for the last time.
+        cls.report(last=True)
+
+    @classmethod
+    def tested(cls):
+        """
+        Count an element as tested.
+        """
+
+        # We count the element.
+        # Note: This is only called from the main thread.
+        cls.done += 1
+
+    @classmethod
+    def _sample_periodically(cls):
+        """
+        Report the progress every :code:`seconds_between_samples` seconds
+        until we are stopped.
+        """
+
+        while not cls.stopped.wait(cls.seconds_between_samples):
+            # We loop until we are stopped.
+
+            # We report the progress.
+            cls.report()
+
+    @classmethod
+    def sample(cls):
+        """
+        Sample our counters.
+
+        :return:
+            The number of tested elements, the total, the (smoothed and average)
+            rates, the ETA (in seconds), the stages in flight and the
+            cache hit ratios.
+        :rtype: dict
+        """
+
+        # We get the current time and the number of tested elements.
+        now, done = time(), cls.done
+
+        if now > cls.last_sample:
+            # Some time passed since the last sample.
+
+            # We compute the rate since the last sample.
+            rate = (done - cls.last_done) / (now - cls.last_sample)
+
+            if cls.rate is None:
+                # This is our first sample.
+
+                # We use it as the rate.
+                cls.rate = rate
+            else:
+                # We already have a rate.
+
+                # We update its moving average.
+                cls.rate = cls.smoothing * rate + (1 - cls.smoothing) * cls.rate
+
+            # We save the sample.
+            cls.last_sample, cls.last_done = now, done
+
+        if cls.rate:
+            # We have a rate.
+
+            # We compute the ETA.
+            eta = round(max(cls.total - done, 0) / cls.rate, 2)
+        else:
+            # We do not have a rate.
+
+            # We can't compute the ETA.
+            eta = None
+
+        with Timings.lock:
+            # We get the stages in flight.
+            in_flight = {x: y for x, y in Timings.in_flight.items() if y}
+
+        # We initiate the cache hit ratios.
+        caches = {}
+
+        for name in set(Metrics.counters.get("cache_hits", {})) | set(
+            Metrics.counters.get("cache_misses", {})
+        ):
+            # We loop through the caches.
+
+            # We get the number of hits and misses.
+            hits = Metrics.get("cache_hits", name)
+            misses = Metrics.get("cache_misses", name)
+
+            # We compute the hit ratio.
+            caches[name] = round(hits * 100 / (hits + misses), 2)
+
+        return {
+            "tested": done,
+            "total": cls.total,
+            "percentage": round(done * 100 / cls.total, 2) if cls.total else 100.0,
+            "rate": round(cls.rate or 0.0, 2),
+            "average_rate": round(done / (now - cls.started), 2)
+            if now > cls.started
+            else 0.0,
+            "eta": eta,
+            "in_flight": in_flight,
+            "caches": caches,
+        }
+
+    @classmethod
+    def _format(cls, sample):
+        """
+        Format the given sample into a single line.
+
+        :param sample: The sample to format (from :meth:`sample`).
+        :type sample: dict
+
+        :rtype: str
+        """
+
+        if sample["eta"] is None:
+            # We do not know the ETA.
+            eta = "?"
+        else:
+            # We know the ETA.
+
+            # We format it.
+            minutes, seconds = divmod(int(sample["eta"]), 60)
+            eta = "%d:%02d:%02d" % (minutes // 60, minutes % 60, seconds)
+
+        # We construct the line.
+        result = "%d/%d (%s%%) | %s subjects/s | ETA %s" % (
+            sample["tested"],
+            sample["total"],
+            sample["percentage"],
+            sample["rate"],
+            eta,
+        )
+
+        if sample["in_flight"]:
+            # Some stages are in flight.
+
+            # We append them.
+            result += " | in flight: " + ", ".join(
+                "%s %d" % x for x in sorted(sample["in_flight"].items())
+            )
+
+        if sample["caches"]:
+            # We have some cache hit ratios.
+
+            # We append them.
+            result += " | cache hits: " + ", ".join(
+                "%s %s%%" % x for x in sorted(sample["caches"].items())
+            )
+
+        return result
+
+    @classmethod
+    def report(cls, last=False):
+        """
+        Report the progress into :code:`stderr` and into the status file
+        (if we are allowed to generate files).
+
+        :param last: Tell us if this is the last report.
+        :type last: bool
+        """
+
+        # We sample our counters.
+        sample = cls.sample()
+
+        # We overwrite the line we previously printed.
+        stderr.write("\r\033[K" + cls._format(sample) + ("\n" if last else ""))
+        stderr.flush()
+
+        if not PyFunceble.CONFIGURATION["no_files"]:
+            # We are allowed to generate files.
+
+            # We initiate the location of the status file.
+            output = (
+                PyFunceble.OUTPUT_DIRECTORY
+                + PyFunceble.OUTPUTS["parent_directory"]
+                + PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+                + PyFunceble.OUTPUTS["logs"]["filenames"]["progress"]
+            )
+
+            try:
+                # We write the sample.
+                Dict(sample).to_json(output)
+            except FileNotFoundError:
+                # The directory was not found.
+
+                # We construct the output directory.
+                PyFunceble.DirectoryStructure()
+
+                # And we retry to write the sample.
+                Dict(sample).to_json(output)
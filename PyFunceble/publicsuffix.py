@@ -69,15 +69,32 @@ from PyFunceble.helpers import Dict, Download, File, List
 class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
     """
     Let us interact with the public suffix database.
+
+    .. note::
+        While updating, we keep the :code:`ETag` and :code:`Last-Modified`
+        headers of the upstream file so that we only download and parse it
+        again if it changed upstream.
     """
 
+    # We set the link to the upstream public suffix file.
+    public_suffix_url = (
+        "https://raw.githubusercontent.com/publicsuffix/list/%s/public_suffix_list.dat"
+        % "master"
+    )
+
     def __init__(self):
         # We initiate the destination of our database.
         self.destination = (
-            PyFunceble.CURRENT_DIRECTORY
+            PyFunceble.get_current_directory()
             + PyFunceble.OUTPUTS["default_files"]["public_suffix"]
         )
 
+        # We initiate the destination of the validators of the upstream file.
+        self.cache_destination = (
+            PyFunceble.get_current_directory()
+            + PyFunceble.OUTPUTS["default_files"]["public_suffix_cache"]
+        )
+
         # We initiate a variablw which will save the database we are going to save.
         self.public_suffix_db = {}
 
@@ -86,20 +103,73 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
 
             PyFunceble.INTERN["psl_db"] = {}
 
-    @classmethod
-    def _data(cls):
+    def _cache(self):
+        """
+        Get the validators of the upstream file we saved during the last update.
+
+        :return: The saved :code:`etag` and :code:`last_modified`.
+        :rtype: dict
+        """
+
+        if PyFunceble.path.isfile(self.cache_destination):
+            # The validators exist.
+
+            # We return its content.
+            return Dict().from_json(File(self.cache_destination).read())
+
+        # We return empty validators.
+        return {}
+
+    def _data(self):
         """
         Get the database from the public suffix repository.
+
+        :return:
+            The content of the upstream file or :code:`None` if it did not
+            change since our last update.
+        :rtype: str|None
         """
 
-        # We initiate a variable which will save the link to the upstream public suffix file.
-        public_suffix_url = (
-            "https://raw.githubusercontent.com/publicsuffix/list/%s/public_suffix_list.dat"
-            % "master"
-        )
+        # We initiate the headers of our request.
+        headers = {}
+
+        if PyFunceble.path.isfile(self.destination):
+            # Our database exist.
+
+            # We get the validators of the upstream file we parsed it from.
+            cache = self._cache()
 
-        # And we return the content of the previously declared link.
-        return Download(public_suffix_url, return_data=True).text()
+            if cache.get("etag"):
+                # We know the ETag of the upstream file.
+
+                # We only want the file if its ETag changed.
+                headers["If-None-Match"] = cache["etag"]
+
+            if cache.get("last_modified"):
+                # We know the last modification date of the upstream file.
+
+                # We only want the file if it was modified since.
+                headers["If-Modified-Since"] = cache["last_modified"]
+
+        # We request the link.
+        req = Download(self.public_suffix_url).response(headers=headers)
+
+        if req.status_code == 304:
+            # The upstream file did not change.
+
+            # We return None, there is nothing to parse.
+            return None
+
+        # We save the validators of the upstream file.
+        Dict(
+            {
+                "etag": req.headers.get("ETag"),
+                "last_modified": req.headers.get("Last-Modified"),
+            }
+        ).to_json(self.cache_destination)
+
+        # And we return the content of the upstream file.
+        return req.text
 
     def _extensions(self, line):
         """
@@ -107,6 +177,10 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
 
         :param line: The line from the official public suffix repository.
         :type line: str
+
+        .. note::
+            The suffixes of each extension are collected into a :code:`set`.
+            They are sorted once by :meth:`parse`.
         """
 
         # We strip the parsed line.
@@ -134,16 +208,81 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
 
                 # We update the content of the 1st level TDL with
                 # the content of the suffix.
-                # In between, we format so that we ensure that there is no
-                # duplicate in the database index content.
-                self.public_suffix_db[extension] = List(
-                    self.public_suffix_db[extension] + [line]
-                ).format()
+                # Note: As we work with a set, there is no duplicate.
+                self.public_suffix_db[extension].add(line)
             else:
                 # The extension is not already in our database.
 
                 # We append the currently formatted extension and the line content.
-                self.public_suffix_db.update({extension: [line]})
+                self.public_suffix_db.update({extension: {line}})
+
+    def parse(self, data):
+        """
+        Parse the given upstream file in a single pass.
+
+        :param data: The content of the upstream file.
+        :type data: str
+
+        :return: The suffixes of each extension.
+        :rtype: dict
+        """
+
+        # We initiate our database.
+        self.public_suffix_db = {}
+
+        for line in data.split("\n"):
+            # We loop through the line of the upstream file.
+
+            # We extract the extension and the suffix.
+            self._extensions(line)
+
+        # We sort (and convert to list) the suffixes of each extension.
+        self.public_suffix_db = {
+            extension: List(list(suffixes)).format()
+            for extension, suffixes in self.public_suffix_db.items()
+        }
+
+        # We return our database.
+        return self.public_suffix_db
+
+    @classmethod
+    def diff(cls, old, new):
+        """
+        Compare the given databases.
+
+        :param old: The database we already have.
+        :type old: dict
+
+        :param new: The database we just constructed.
+        :type new: dict
+
+        :return:
+            The :code:`added` and :code:`removed` suffixes.
+        :rtype: dict
+        """
+
+        # We initiate the result.
+        result = {"added": [], "removed": []}
+
+        for extension in set(old) | set(new):
+            # We loop through all extensions.
+
+            # We get the suffixes we already have.
+            old_suffixes = set(old.get(extension, []))
+            # We get the suffixes we just got.
+            new_suffixes = set(new.get(extension, []))
+
+            # We save the suffixes which were added.
+            result["added"].extend(new_suffixes - old_suffixes)
+            # We save the suffixes which were removed.
+            result["removed"].extend(old_suffixes - new_suffixes)
+
+        # We format the result.
+        result["added"] = List(result["added"]).format()
+        result["removed"] = List(result["removed"]).format()
+
+        # We return the result.
+        return result
 
     def update(self):
         """
@@ -159,11 +298,42 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
                 end=" ",
             )
 
-        # We loop through the line of the upstream file.
-        list(map(self._extensions, self._data().split("\n")))
+        # We get the content of the upstream file.
+        data = self._data()
+
+        if data is None:
+            # The upstream file did not change since our last update.
+
+            if not PyFunceble.CONFIGURATION["quiet"]:
+                # The quiet mode is not activated.
+
+                # We inform the user that everything goes right.
+                print(PyFunceble.INTERN["done"])
+
+                # And that there is nothing to update.
+                print("Unchanged upstream file.")
+
+            return
+
+        if PyFunceble.path.isfile(self.destination):
+            # Our database exist.
 
-        # We save the content of our database in the final testination.
-        Dict(self.public_suffix_db).to_json(self.destination)
+            # We get its content.
+            old = Dict().from_json(File(self.destination).read())
+        else:
+            # Our database does not exist.
+
+            # We initiate an empty one.
+            old = {}
+
+        # We compare our database with the one we construct from the upstream file.
+        diff = self.diff(old, self.parse(data))
+
+        if diff["added"] or diff["removed"] or not old:
+            # Something changed.
+
+            # We save the content of our database in the final testination.
+            Dict(self.public_suffix_db).to_json(self.destination)
 
         if not PyFunceble.CONFIGURATION["quiet"]:
             # The quiet mode is not activated.
@@ -171,6 +341,11 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
             # We inform the user that everything goes right.
             print(PyFunceble.INTERN["done"])
 
+            # We show the number of added and removed suffixes.
+            print(
+                "Added: %d | Removed: %d" % (len(diff["added"]), len(diff["removed"]))
+            )
+
     def load(self):
         """
         Load the public suffix database into the system.
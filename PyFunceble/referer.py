@@ -63,6 +63,8 @@ License:
 # pylint: enable=line-too-long
 # pylint: disable=bad-continuation
 import PyFunceble
+from PyFunceble.check import Check
+from PyFunceble.iana import IANA
 from PyFunceble.logs import Logs
 
 
@@ -70,200 +72,266 @@ class Referer:  # pragma: no cover pylint: disable=too-few-public-methods
     """
     Get the WHOIS server (referer) of the current domain extension according to
     the IANA database.
+
+    :param to_test:
+        The domain to get the referer of.
+        If not given, we use the currently tested element.
+    :type to_test: str
     """
 
-    def __init__(self):
+    # We list the ignored extensions.
+    # Note: We need the following because those extension does
+    # not have a centralized whois server (yet).
+    ignored_extensions = [
+        "ad",
+        "al",
+        "an",
+        "ao",
+        "aq",
+        "arpa",
+        "az",
+        "ba",
+        "bb",
+        "bd",
+        "bf",
+        "bh",
+        "bl",
+        "boots",
+        "bq",
+        "bs",
+        "bt",
+        "bv",
+        "cg",
+        "chloe",
+        "ck",
+        "cu",
+        "cv",
+        "cw",
+        "cy",
+        "dj",
+        "doosan",
+        "eg",
+        "eh",
+        "er",
+        "et",
+        "fk",
+        "flsmidth",
+        "fm",
+        "gb",
+        "gm",
+        "gn",
+        "goodhands",
+        "gp",
+        "gr",
+        "gt",
+        "gu",
+        "gw",
+        "htc",
+        "iinet",
+        "jm",
+        "jo",
+        "kh",
+        "km",
+        "kp",
+        "lb",
+        "lr",
+        "mc",
+        "meo",
+        "mf",
+        "mh",
+        "mil",
+        "mm",
+        "mt",
+        "mv",
+        "mw",
+        "ne",
+        "ni",
+        "np",
+        "nr",
+        "pa",
+        "pamperedchef",
+        "panerai",
+        "pg",
+        "ph",
+        "pk",
+        "pn",
+        "py",
+        "sd",
+        "sj",
+        "spiegel",
+        "sr",
+        "ss",
+        "sv",
+        "sz",
+        "telecity",
+        "tj",
+        "tp",
+        "tt",
+        "um",
+        "va",
+        "vi",
+        "vista",
+        "vn",
+        "xn--0zwm56d",
+        "xn--11b5bs3a9aj6g",
+        "xn--54b7fta0cc",
+        "xn--80akhbyknj4f",
+        "xn--9t4b11yi5a",
+        "xn--deba0ad",
+        "xn--g6w251d",
+        "xn--hgbk6aj7f53bba",
+        "xn--hlcj6aya9esc7a",
+        "xn--hlcj6aya9esc7a",
+        "xn--jxalpdlp",
+        "xn--kgbechtv",
+        "xn--l1acc",
+        "xn--mgbai9azgqp6j",
+        "xn--mgbayh7gpa",
+        "xn--mgbc0a9azcg",
+        "xn--mgbpl2fh",
+        "xn--pgbs0dh",
+        "xn--qxam",
+        "xn--zckzah",
+        "xperia",
+        "ye",
+        "zw",
+    ]
+
+    # We save the referer of each extension.
+    # Note: The value is the referer, an empty string if the referer is not
+    # known or None if the extension is ignored.
+    referers = {}
+
+    # We save the IANA database we built the referers from.
+    referers_source = None
+
+    def __init__(self, to_test=None):
         # Note: A URL testing or an IP testing does not come around
         # here. So there is no need to be scared by the following.
 
+        if not to_test:
+            # The domain is not given.
+
+            # We get the currently tested element.
+            to_test = PyFunceble.INTERN["to_test"]
+
         try:
             # We get the extension of the currently tested element.
             # We basically get everything after the last point.
-            self.domain_extension = PyFunceble.INTERN["to_test"][
-                PyFunceble.INTERN["to_test"].rindex(".") + 1 :
-            ]
-
-            if not self.domain_extension and PyFunceble.INTERN["to_test"].endswith("."):
-                self.domain_extension = [
-                    x for x in PyFunceble.INTERN["to_test"].split(".") if x
-                ][-1]
+            self.domain_extension = to_test[to_test.rindex(".") + 1 :]
+
+            if not self.domain_extension and to_test.endswith("."):
+                self.domain_extension = [x for x in to_test.split(".") if x][-1]
         except ValueError:
             # There was not point, so no extension to work with.
             self.domain_extension = None
 
-        # We create a list of ignored extension.
-        # Note: We need the following because those extension does
-        # not have a centralized whois server (yet).
-        self.ignored_extension = [
-            "ad",
-            "al",
-            "an",
-            "ao",
-            "aq",
-            "arpa",
-            "az",
-            "ba",
-            "bb",
-            "bd",
-            "bf",
-            "bh",
-            "bl",
-            "boots",
-            "bq",
-            "bs",
-            "bt",
-            "bv",
-            "cg",
-            "chloe",
-            "ck",
-            "cu",
-            "cv",
-            "cw",
-            "cy",
-            "dj",
-            "doosan",
-            "eg",
-            "eh",
-            "er",
-            "et",
-            "fk",
-            "flsmidth",
-            "fm",
-            "gb",
-            "gm",
-            "gn",
-            "goodhands",
-            "gp",
-            "gr",
-            "gt",
-            "gu",
-            "gw",
-            "htc",
-            "iinet",
-            "jm",
-            "jo",
-            "kh",
-            "km",
-            "kp",
-            "lb",
-            "lr",
-            "mc",
-            "meo",
-            "mf",
-            "mh",
-            "mil",
-            "mm",
-            "mt",
-            "mv",
-            "mw",
-            "ne",
-            "ni",
-            "np",
-            "nr",
-            "pa",
-            "pamperedchef",
-            "panerai",
-            "pg",
-            "ph",
-            "pk",
-            "pn",
-            "py",
-            "sd",
-            "sj",
-            "spiegel",
-            "sr",
-            "ss",
-            "sv",
-            "sz",
-            "telecity",
-            "tj",
-            "tp",
-            "tt",
-            "um",
-            "va",
-            "vi",
-            "vista",
-            "vn",
-            "xn--0zwm56d",
-            "xn--11b5bs3a9aj6g",
-            "xn--54b7fta0cc",
-            "xn--80akhbyknj4f",
-            "xn--9t4b11yi5a",
-            "xn--deba0ad",
-            "xn--g6w251d",
-            "xn--hgbk6aj7f53bba",
-            "xn--hlcj6aya9esc7a",
-            "xn--hlcj6aya9esc7a",
-            "xn--jxalpdlp",
-            "xn--kgbechtv",
-            "xn--l1acc",
-            "xn--mgbai9azgqp6j",
-            "xn--mgbayh7gpa",
-            "xn--mgbc0a9azcg",
-            "xn--mgbpl2fh",
-            "xn--pgbs0dh",
-            "xn--qxam",
-            "xn--zckzah",
-            "xperia",
-            "ye",
-            "zw",
-        ]
-
-    def get(self):
+    @classmethod
+    def build(cls, iana_db):
         """
-        Return the referer aka the WHOIS server of the current domain extension.
+        Build the referer of each extension of the given IANA database.
+
+        :param iana_db: The IANA database.
+        :type iana_db: dict
+
+        :return:
+            The referer of each extension, an empty string if the referer is
+            not known or None if the extension is ignored.
+        :rtype: dict
+
+        .. note::
+            If the IANA database does not give the referer of an extension,
+            we use the one we set manually (if any).
         """
 
-        if not PyFunceble.CONFIGURATION["local"]:
-            # We are not running a test in a local network.
+        # We initiate the referers.
+        result = {}
 
-            if self.domain_extension not in self.ignored_extension:
-                # The extension of the domain we are testing is not into
-                # the list of ignored extensions.
+        for extension, referer in iana_db.items():
+            # We loop through the extensions of the IANA database.
 
-                # We set the referer to None as we do not have any.
-                referer = None
+            if not referer:
+                # The referer is not given by the IANA database.
 
-                if self.domain_extension in PyFunceble.INTERN["iana_db"]:
-                    # The domain extension is in the iana database.
+                # We get the one we set manually (if any).
+                referer = IANA.manual_server.get(extension)
 
-                    if not PyFunceble.CONFIGURATION["no_whois"]:
-                        # We are authorized to use WHOIS for the test result.
+            # We save the referer without its stray whitespaces.
+            result[extension] = referer.strip() if referer else ""
 
-                        # We get the referer from the database.
-                        referer = PyFunceble.INTERN["iana_db"][self.domain_extension]
+        for extension in cls.ignored_extensions:
+            # We loop through the ignored extensions.
 
-                        if not referer:
-                            # The referer is not filled.
+            # We save that we have to ignore it.
+            result[extension] = None
 
-                            # We log the case of the current extension.
-                            Logs().referer_not_found(self.domain_extension)
+        # We return the referers.
+        return result
 
-                            # And we handle and return None status.
-                            return None
+    @classmethod
+    def _referers(cls):
+        """
+        Get the referer of each extension.
 
-                        # The referer is into the database.
+        :rtype: dict
 
-                        # We return the extracted referer.
-                        return referer
+        .. note::
+            The referers are only built when the IANA database is (re)loaded.
+        """
 
-                    # We are not authorized to use WHOIS for the test result.
+        if cls.referers_source is not PyFunceble.INTERN["iana_db"]:
+            # The IANA database was (re)loaded since we built the referers.
 
-                    # We return None.
-                    return None
+            # We build the referers.
+            cls.referers = cls.build(PyFunceble.INTERN["iana_db"])
 
-                # The domain extension is not in the iana database.
+            # We save the IANA database we built them from.
+            cls.referers_source = PyFunceble.INTERN["iana_db"]
 
-                # We return False, it is an invalid domain.
-                return False
+        # We return the referers.
+        return cls.referers
 
-            # The extension of the domain we are testing is not into
-            # the list of ignored extensions.
+    def get(self):
+        """
+        Return the referer aka the WHOIS server of the current domain extension.
+        """
+
+        # We load the databases we need.
+        Check.load_databases()
+
+        if PyFunceble.CONFIGURATION["local"]:
+            # We are running a test in a local network.
 
-            # We return None, the domain does not have a whois server.
+            # We return None.
             return None
 
-        # We are running a test in a local network.
+        # We get the referer of the extension.
+        # Note: It is False if the extension is not in the IANA database.
+        referer = self._referers().get(self.domain_extension, False)
+
+        if referer is False or referer is None:
+            # * The extension is not in the IANA database.
+            # or
+            # * The extension is ignored.
+
+            # We return False (it is an invalid domain) or None (the domain
+            # does not have a whois server).
+            return referer
+
+        if PyFunceble.CONFIGURATION["no_whois"]:
+            # We are not authorized to use WHOIS for the test result.
+
+            # We return None.
+            return None
+
+        if not referer:
+            # The referer is not filled.
+
+            # We log the case of the current extension.
+            Logs().referer_not_found(self.domain_extension)
+
+            # And we handle and return None status.
+            return None
 
-        # We return None.
-        return None
+        # We return the referer.
+        return referer
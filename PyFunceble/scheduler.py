@@ -0,0 +1,301 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the scheduling logic (of the fast and slow elements).
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+from collections import deque
+
+import PyFunceble
+from PyFunceble.check import Check
+from PyFunceble.processes import Processes
+from PyFunceble.referer import Referer
+
+
+class Scheduler:
+    """
+    Test a list of elements with one pool of workers per stage.
+
+    Indeed, an element with an invalid syntax is tested in microseconds while
+    an element which needs a WHOIS record or an HTTP status code can take
+    :code:`seconds_before_http_timeout` seconds. So we cheaply classify
+    each element before testing it and each stage is tested by its own
+    workers so that the slow elements never block the fast ones.
+
+    :param worker:
+        The function which tests a single element.
+        It should return a :code:`dict` with (at least) the :code:`deferred`
+        index which is the list of records of
+        :class:`PyFunceble.deferred.Deferred`.
+    :type worker: function
+
+    :param formatter:
+        The function which gives us the element to test from
+        the element of the list to test.
+    :type formatter: function
+
+    .. note::
+        The results are still given in the order of the list to test
+        so that the outputs are the same as if we were testing with a single
+        process.
+    """
+
+    # We list the stages (from the fastest to the slowest).
+    stages = ["fast", "http", "whois"]
+
+    # We set the maximal number of elements which can wait (for a result)
+    # per worker.
+    pending_per_worker = 16
+
+    def __init__(self, worker, formatter=None):
+        # We get the worker.
+        self.worker = worker
+
+        # We get the formatter.
+        self.formatter = formatter
+
+        # We initiate the number of elements we scheduled into each stage.
+        self.scheduled = {x: 0 for x in self.stages}
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if we have to use the scheduler.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION["scheduler"]
+
+    @classmethod
+    def _is_whois_cached(cls, subject):
+        """
+        Check if the expiration date of the given element is
+        in the future into our whois database.
+
+        :param subject: The element to check.
+        :type subject: str
+
+        :rtype: bool
+        """
+
+        try:
+            return (
+                PyFunceble.INTERN["whois_db"][PyFunceble.INTERN["file_to_test"]][
+                    subject
+                ]["state"]
+                == "future"
+            )
+        except KeyError:
+            return False
+
+    def classify(self, subject):  # pylint: disable=too-many-return-statements
+        """
+        Give the stage of the given element.
+
+        :param subject: The element of the list to test.
+        :type subject: str
+
+        :return:
+            - :code:`fast` if we do not have to go through the network.
+            - :code:`http` if we only need the HTTP status code
+              and/or a DNS lookup.
+            - :code:`whois` if we need a WHOIS record.
+        :rtype: str
+        """
+
+        if self.formatter:
+            # A formatter is given.
+
+            # We get the element to test.
+            subject = self.formatter(subject)
+
+        if not subject or PyFunceble.CONFIGURATION["syntax"]:
+            # * There is nothing to test.
+            # or
+            # * We are only checking the syntax.
+
+            # We return the fast stage.
+            return "fast"
+
+        if PyFunceble.INTERN["to_test_type"] == "url":
+            # We are testing URLs.
+
+            # We return the http stage.
+            return "http"
+
+        # We initiate the checker.
+        checker = Check(subject)
+
+        if not checker.is_domain_valid() and not checker.is_ip_valid():
+            # The element does not have a valid syntax.
+
+            # We return the fast stage, it is INVALID.
+            return "fast"
+
+        if (
+            PyFunceble.CONFIGURATION["no_whois"]
+            or PyFunceble.CONFIGURATION["local"]
+            or checker.is_ip_valid()
+            or checker.is_subdomain()
+            or self._is_whois_cached(subject)
+        ):
+            # * We do not use WHOIS.
+            # or
+            # * We are testing in a local network.
+            # or
+            # * The element is an IP or a subdomain.
+            # or
+            # * We already know its (future) expiration date.
+
+            # We return the http stage.
+            return "http"
+
+        if not Referer(subject).get():
+            # The extension does not have a (usable) WHOIS server.
+
+            # We return the http stage.
+            return "http"
+
+        # We need a WHOIS record.
+        return "whois"
+
+    def test(self, list_to_test):
+        """
+        Test the given list with the workers of each stage.
+
+        :param list_to_test: The list to test.
+        :type list_to_test: list
+
+        :return:
+            The result of the worker for each element of the given list.
+            The results are given in the order of the given list.
+        :rtype: generator
+        """
+
+        # We initiate the pools of workers (of each stage).
+        pools = {}
+
+        # We get the maximal number of results which can be pending.
+        # Note: Without it, we would keep the whole list (and its results)
+        # into memory when the slowest stage can not follow.
+        max_pending = self.pending_per_worker * sum(
+            max(1, x) for x in PyFunceble.CONFIGURATION["processes_per_stage"].values()
+        )
+
+        try:
+            # We initiate the results which are pending.
+            pending = deque()
+
+            for subject in list_to_test:
+                # We loop through the list to test.
+
+                # We get the stage of the element.
+                stage = self.classify(subject)
+
+                if stage not in pools:
+                    # The workers of the stage are not started yet.
+
+                    # We start them.
+                    pools[stage] = Processes.pool(
+                        max(1, PyFunceble.CONFIGURATION["processes_per_stage"][stage])
+                    )
+
+                # We give the element to the workers of its stage.
+                pending.append(pools[stage].apply_async(self.worker, (subject,)))
+
+                # We increase the number of elements of the stage.
+                self.scheduled[stage] += 1
+
+                while len(pending) >= max_pending:
+                    # There are too many pending results.
+
+                    # We give the oldest one (once we got it) before giving
+                    # more elements to the workers.
+                    yield pending.popleft().get()
+
+            while pending:
+                # We loop through the remaining results (in order).
+
+                # And we give them (once we got them).
+                yield pending.popleft().get()
+
+            for pool in pools.values():
+                # We loop through the pools.
+
+                # We do not have anything else to give to the workers.
+                pool.close()
+        except BaseException:
+            # Something went wrong (or we were interrupted).
+
+            for pool in pools.values():
+                # We loop through the pools.
+
+                # We stop the workers.
+                pool.terminate()
+
+            # And we raise the exception again.
+            raise
+        finally:
+            for pool in pools.values():
+                # We loop through the pools.
+
+                # We wait for the workers to exit.
+                pool.join()
@@ -132,6 +132,9 @@ class Sort:  # pylint: disable=too-few-public-methods
         # We convert the parsed element to lower case.
         element = element.lower()
 
+        # We load the databases we need.
+        Check.load_databases()
+
         # We try to get the url base.
         url_base = Check().is_url_valid(element, return_base=True)
 
@@ -69,6 +69,7 @@ from PyFunceble.expiration_date import ExpirationDate
 from PyFunceble.generate import Generate
 from PyFunceble.helpers import Regex
 from PyFunceble.lookup import Lookup
+from PyFunceble.pipeline import Pipeline
 
 
 class Status:  # pragma: no cover pylint: disable=too-few-public-methods
@@ -96,7 +97,10 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
         """
 
         if "to_test" in PyFunceble.INTERN and PyFunceble.INTERN["to_test"]:
-            expiration_date = ExpirationDate().get()
+            # We get the data collected by the stages of the pipeline.
+            dataset = Pipeline().get(PyFunceble.INTERN["to_test"])
+
+            expiration_date = ExpirationDate().get(dataset)
 
             if expiration_date is False:
                 return cls.handle(status="invalid")
@@ -104,12 +108,12 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
             if expiration_date == PyFunceble.STATUS["official"]["up"]:
                 return expiration_date, "WHOIS"
 
-            return cls.handle(status="inactive")
+            return cls.handle(status="inactive", nslookup=dataset["nslookup"])
 
         raise NotImplementedError("We expect `INTERN['to_test']` to be set.")
 
     @classmethod
-    def handle(cls, status, invalid_source="IANA"):
+    def handle(cls, status, invalid_source="IANA", nslookup=None):
         """
         Handle the lack of WHOIS and expiration date. :smile_cat:
 
@@ -120,6 +124,10 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
             The source to set when we handle INVALID element.
         :type invalid_source: str
 
+        :param nslookup:
+            The result of the DNS lookup (if already done).
+        :type nslookup: bool
+
         :return:
             The strus of the domain after generating the files desired
             by the user.
@@ -132,7 +140,13 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
             # We initiate the source we are going to parse to the Generate class.
             source = "NSLOOKUP"
 
-            if Lookup().nslookup():
+            if nslookup is None:
+                # The DNS lookup was not already done.
+
+                # We lookup the DNS.
+                nslookup = Lookup().nslookup()
+
+            if nslookup:
                 # We could execute the nslookup logic.
 
                 # We get the status and source after extra rules check.
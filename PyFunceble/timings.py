@@ -0,0 +1,556 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the timing (per stage) of the tested elements.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+
+
+from functools import wraps
+from math import ceil, log
+from threading import Lock
+from time import perf_counter, time
+
+import PyFunceble
+from PyFunceble.helpers import Dict
+
+
+class PeriodicDump:  # pylint: disable=too-few-public-methods
+    """
+    Tell the classes which dump into the output directory while testing if
+    it is time to dump.
+
+    .. note::
+        Each child class saves the time of its own last dump.
+    """
+
+    # We set the number of seconds between each dump (while testing).
+    seconds_between_dumps = 60
+
+    # We save the time of the last dump.
+    last_dump = None
+
+    @classmethod
+    def is_time_to_dump(cls, periodic):
+        """
+        Check if it is time to dump and save the time of the dump if it is
+        the case.
+
+        :param periodic:
+            Tell us if we are dumping while testing. If it is the case,
+            we only dump every :code:`seconds_between_dumps` seconds.
+        :type periodic: bool
+
+        :rtype: bool
+        """
+
+        if periodic and cls.last_dump is None:
+            # We never dumped.
+
+            # We consider the first periodic call as the last dump.
+            cls.last_dump = time()
+
+            # We stop here.
+            return False
+
+        if periodic and time() - cls.last_dump < cls.seconds_between_dumps:
+            # It is not time to dump.
+
+            # We stop here.
+            return False
+
+        # We save the time of the dump.
+        cls.last_dump = time()
+
+        # And we return that it is time to dump.
+        return True
+
+
+class Timings(PeriodicDump):
+    """
+    Time the stages of the test of each element (when activated).
+
+    The durations are saved into histograms (per stage) so that we can tell the
+    p50, p95 and p99 of each stage without keeping each duration.
+
+    :param stage: The name of the stage we are timing.
+    :type stage: str
+
+    .. note::
+        Can be used as a context manager (:code:`with Timings("http"): ...`)
+        or as a decorator (:code:`@Timings.timed("http")`).
+    """
+
+    # We set the lower bound (in seconds) of our histograms.
+    lowest_duration = 0.000001
+
+    # We set the growth factor between the bounds of two buckets.
+    # Note: This is the precision of the computed percentiles (10%).
+    bucket_growth = 1.1
+
+    # We set the percentiles we dump.
+    percentiles = [50, 95, 99]
+
+    # We set the (upper) bounds of the histogram we dump.
+    dumped_bounds = [0.001, 0.01, 0.1, 1, 10]
+
+    # We save the histogram of each stage.
+    histograms = {}
+
+    # We save the number of stages which are in flight (running).
+    # Note: It is only counted when the progress is reported.
+    in_flight = {}
+
+    # We save the lock to use when we update the histograms.
+    lock = Lock()
+
+    def __init__(self, stage):
+        # We save the stage we are timing.
+        self.stage = stage
+
+        # We initiate the time we started.
+        self.start = None
+
+        # We initiate the state of the in flight counting.
+        self.flying = False
+
+    def __enter__(self):
+        if self.is_activated():
+            # The timings are activated.
+
+            # We save the time we started.
+            self.start = perf_counter()
+
+        if PyFunceble.CONFIGURATION.get("progress", False):
+            # The progress is reported.
+
+            with self.lock:
+                # We count the stage as in flight.
+                self.in_flight[self.stage] = self.in_flight.get(self.stage, 0) + 1
+
+            # We save that we have to uncount it.
+            self.flying = True
+
+        return self
+
+    def __exit__(self, *args):
+        if self.start is not None:
+            # We were timing.
+
+            # We save the duration of the stage.
+            self.add(self.stage, perf_counter() - self.start)
+
+        if self.flying:
+            # The stage was counted as in flight.
+
+            with self.lock:
+                # We uncount it.
+                self.in_flight[self.stage] -= 1
+
+    @classmethod
+    def timed(cls, stage):
+        """
+        Time each call of the decorated function as the given stage.
+
+        :param stage: The name of the stage.
+        :type stage: str
+        """
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not cls.is_activated() and not PyFunceble.CONFIGURATION.get(
+                    "progress", False
+                ):
+                    # The timings are not activated and the progress is
+                    # not reported.
+
+                    # We only call the function.
+                    return func(*args, **kwargs)
+
+                with cls(stage):
+                    # We time the call of the function.
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def is_activated(cls):
+        """
+        Check if the timings are activated.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION.get("timings", False)
+
+    @classmethod
+    def _bucket(cls, duration):
+        """
+        Get the bucket of the given duration.
+
+        :param duration: The duration (in seconds).
+        :type duration: float
+
+        :rtype: int
+        """
+
+        if duration <= cls.lowest_duration:
+            # The duration is lower than our lower bound.
+
+            # We return the first bucket.
+            return 0
+
+        # We return the bucket which has the duration as upper bound.
+        return int(ceil(log(duration / cls.lowest_duration, cls.bucket_growth)))
+
+    @classmethod
+    def _bound(cls, bucket):
+        """
+        Get the upper bound (in seconds) of the given bucket.
+
+        :param bucket: The bucket.
+        :type bucket: int
+
+        :rtype: float
+        """
+
+        return cls.lowest_duration * cls.bucket_growth ** bucket
+
+    @classmethod
+    def add(cls, stage, duration):
+        """
+        Save the given duration of the given stage.
+
+        :param stage: The name of the stage.
+        :type stage: str
+
+        :param duration: The duration (in seconds).
+        :type duration: float
+        """
+
+        # We get the bucket of the duration.
+        bucket = cls._bucket(duration)
+
+        with cls.lock:
+            if stage not in cls.histograms:
+                # The stage is not known yet.
+
+                # We initiate its histogram.
+                cls.histograms[stage] = {
+                    "count": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "buckets": {},
+                }
+
+            # We get the histogram of the stage.
+            histogram = cls.histograms[stage]
+
+            # We update the histogram.
+            histogram["count"] += 1
+            histogram["total"] += duration
+            histogram["max"] = max(histogram["max"], duration)
+            histogram["buckets"][bucket] = histogram["buckets"].get(bucket, 0) + 1
+
+    @classmethod
+    def pop(cls):
+        """
+        Get and reset the histograms.
+
+        :return: The histograms.
+        :rtype: dict
+
+        .. note::
+            The workers (processes) send them along with their results so that
+            the main process can merge them.
+        """
+
+        with cls.lock:
+            # We get the histograms.
+            histograms = cls.histograms
+
+            # And we reset them.
+            cls.histograms = {}
+
+        # We return the histograms.
+        return histograms
+
+    @classmethod
+    def merge(cls, histograms):
+        """
+        Merge the given histograms into ours.
+
+        :param histograms: The histograms to merge (from :meth:`pop`).
+        :type histograms: dict
+        """
+
+        if not histograms:
+            # There is nothing to merge.
+
+            # We stop here.
+            return
+
+        with cls.lock:
+            for stage, histogram in histograms.items():
+                # We loop through the given histograms.
+
+                if stage not in cls.histograms:
+                    # The stage is not known yet.
+
+                    # We initiate its histogram.
+                    cls.histograms[stage] = {
+                        "count": 0,
+                        "total": 0.0,
+                        "max": 0.0,
+                        "buckets": {},
+                    }
+
+                # We get our histogram of the stage.
+                ours = cls.histograms[stage]
+
+                # We merge the given histogram into ours.
+                ours["count"] += histogram["count"]
+                ours["total"] += histogram["total"]
+                ours["max"] = max(ours["max"], histogram["max"])
+
+                for bucket, count in histogram["buckets"].items():
+                    # We loop through the buckets of the given histogram.
+
+                    # And we merge them into ours.
+                    ours["buckets"][bucket] = ours["buckets"].get(bucket, 0) + count
+
+    @classmethod
+    def percentile(cls, histogram, percent):
+        """
+        Get the given percentile of the given histogram.
+
+        :param histogram: The histogram of a stage.
+        :type histogram: dict
+
+        :param percent: The percentile to get.
+        :type percent: int
+
+        :return: The percentile (in seconds).
+        :rtype: float
+        """
+
+        if not histogram["count"]:
+            # The histogram is empty.
+
+            # We return 0.
+            return 0.0
+
+        # We get the rank of the percentile.
+        rank = max(1, int(ceil(percent / 100 * histogram["count"])))
+
+        # We initiate the number of durations we went through.
+        seen = 0
+
+        for bucket in sorted(histogram["buckets"]):
+            # We loop through the buckets (from the fastest to the slowest).
+
+            # We count the durations of the bucket.
+            seen += histogram["buckets"][bucket]
+
+            if seen >= rank:
+                # The percentile is in the current bucket.
+
+                # We return the upper bound of the bucket.
+                # Note: It can't be greater than the slowest duration.
+                return min(cls._bound(bucket), histogram["max"])
+
+        # We return the slowest duration.
+        return histogram["max"]
+
+    @classmethod
+    def summary(cls):
+        """
+        Summarize the histograms.
+
+        :return:
+            The number of durations, the total, mean, maximal duration,
+            the percentiles and the (coarse) histogram of each stage.
+        :rtype: dict
+        """
+
+        # We initiate the summary.
+        result = {}
+
+        with cls.lock:
+            # We get a copy of the histograms.
+            histograms = {
+                x: dict(y, buckets=dict(y["buckets"]))
+                for x, y in cls.histograms.items()
+            }
+
+        for stage, histogram in histograms.items():
+            # We loop through the histograms.
+
+            # We initiate the summary of the stage.
+            result[stage] = {
+                "count": histogram["count"],
+                "total": round(histogram["total"], 6),
+                "mean": round(histogram["total"] / histogram["count"], 6),
+                "max": round(histogram["max"], 6),
+            }
+
+            for percent in cls.percentiles:
+                # We loop through the percentiles we dump.
+
+                # We append the percentile.
+                result[stage]["p%d" % percent] = round(
+                    cls.percentile(histogram, percent), 6
+                )
+
+            # We initiate the (coarse) histogram.
+            result[stage]["histogram"] = {}
+
+            for bound in cls.dumped_bounds + [None]:
+                # We loop through the bounds of the histogram we dump.
+
+                if bound is None:
+                    # We are at the end of the bounds.
+
+                    # We initiate the name of the last bucket.
+                    name = "> %ss" % cls.dumped_bounds[-1]
+                else:
+                    # We initiate the name of the bucket.
+                    name = "<= %ss" % bound
+
+                result[stage]["histogram"][name] = 0
+
+            for bucket, count in histogram["buckets"].items():
+                # We loop through the buckets.
+
+                # We get the upper bound of the bucket.
+                upper_bound = cls._bound(bucket)
+
+                for bound in cls.dumped_bounds:
+                    # We loop through the bounds of the histogram we dump.
+
+                    if upper_bound <= bound:
+                        # The bucket is under the current bound.
+
+                        # We count it.
+                        result[stage]["histogram"]["<= %ss" % bound] += count
+                        break
+                else:
+                    # The bucket is above all bounds.
+
+                    # We count it.
+                    result[stage]["histogram"][
+                        "> %ss" % cls.dumped_bounds[-1]
+                    ] += count
+
+        # We return the summary.
+        return result
+
+    @classmethod
+    def dump(cls, periodic=False):
+        """
+        Dump the summary of the histograms into the output directory.
+
+        :param periodic:
+            Tell us if we are dumping while testing. If it is the case,
+            we only dump every :code:`seconds_between_dumps` seconds.
+        :type periodic: bool
+        """
+
+        if (
+            not cls.is_activated()
+            or PyFunceble.CONFIGURATION["no_files"]
+            or not cls.histograms
+        ):
+            # * The timings are not activated.
+            # or
+            # * We are not allowed to generate files.
+            # or
+            # * There is nothing to dump.
+
+            # We stop here.
+            return
+
+        if not cls.is_time_to_dump(periodic):
+            # It is not time to dump.
+
+            # We stop here.
+            return
+
+        # We initiate the location of the file we dump into.
+        output = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"]["timings"]
+        )
+
+        try:
+            # We dump the summary.
+            Dict(cls.summary()).to_json(output)
+        except FileNotFoundError:
+            # The directory was not found.
+
+            # We construct the output directory.
+            PyFunceble.DirectoryStructure()
+
+            # And we retry to dump the summary.
+            Dict(cls.summary()).to_json(output)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the tokenizer of the hosts and plain formats.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=bad-continuation
+import PyFunceble
+
+
+class Tokenizer:
+    """
+    Extract the subjects to test from the lines of a file in the hosts
+    (:code:`0.0.0.0 example.org`) or plain (:code:`example.org`) format.
+
+    .. note::
+        Each line is read in a single pass and the reserved names (of the
+        hosts files) are looked up into a :code:`frozenset`.
+    """
+
+    # We set the names (of the hosts files) we do not want to test.
+    reserved = frozenset(
+        [
+            "0.0.0.0",
+            "allhosts",
+            "allnodes",
+            "allrouters",
+            "broadcasthost",
+            "ip6-allnodes",
+            "ip6-allrouters",
+            "ip6-localhost",
+            "ip6-localnet",
+            "ip6-loopback",
+            "ip6-mcastprefix",
+            "local",
+            "localdomain",
+            "localhost",
+            "localnet",
+            "loopback",
+            "mcastprefix",
+        ]
+    )
+
+    # We set the reserved names as a tuple so that we can - cheaply - find the
+    # subjects which end with one of them.
+    reserved_suffixes = tuple(sorted(reserved))
+
+    @classmethod
+    def lines(cls, file_path):
+        """
+        Get the (stripped) non commented lines of the given file.
+
+        :param file_path: The file to read.
+        :type file_path: str
+
+        :return: The non commented lines.
+        :rtype: list
+
+        :raise FileNotFoundError: If the given file does not exist.
+
+        .. note::
+            The file is read and decoded (as UTF-8) at once.
+        """
+
+        if not PyFunceble.path.isfile(file_path):
+            # The given file does not exist.
+
+            # We raise a FileNotFoundError exception.
+            raise FileNotFoundError(file_path)
+
+        with open(file_path, "rb") as file:
+            # We open the file.
+
+            # We read it.
+            content = file.read()
+
+        # We decode it.
+        # Note: The UTF-8 decoder has a fast path for ASCII content.
+        content = content.decode("utf-8")
+
+        # We return the stripped non commented lines.
+        return [x.strip() for x in content.split("\n") if x[:1] != "#"]
+
+    @classmethod
+    def token(cls, line):
+        """
+        Get the subject to test from the given line.
+
+        :param line: The line to get the subject from.
+        :type line: str
+
+        :return:
+            The subject to test or an empty string if there is nothing to test.
+        :rtype: str
+
+        .. note::
+            If the line has more than one token (hosts format), the subject
+            is the second one.
+        """
+
+        if "#" in line:
+            # There is a comment into the line.
+
+            # We delete the comment from the line.
+            line = line[: line.find("#")]
+
+        # We split the line.
+        # Note: We do not need more than the second token.
+        tokens = line.split(None, 2)
+
+        if len(tokens) > 1:
+            # There is more than one token (hosts format).
+
+            # We return the second one.
+            return tokens[1]
+
+        # We return the only token (plain format) or an empty string if there
+        # is nothing to test.
+        return tokens[0] if tokens else ""
+
+    @classmethod
+    def tokens(cls, lines):
+        """
+        Get the subject to test from each of the given lines.
+
+        :param lines: The lines to get the subjects from.
+        :type lines: list
+
+        :return: The subjects (an empty string if there is nothing to test).
+        :rtype: list
+        """
+
+        # We get the subject of each line.
+        # Note: The lines without any comment, space or tab are kept as they
+        # are so that we do not pay for the tokenization of plain lists.
+        return [
+            x if "#" not in x and " " not in x and "\t" not in x else cls.token(x)
+            for x in lines
+        ]
+
+    @classmethod
+    def is_reserved(cls, subject):
+        """
+        Check if the given subject is (or is under) a reserved name.
+
+        :param subject: The subject to check.
+        :type subject: str
+
+        :rtype: bool
+        """
+
+        if not subject.endswith(cls.reserved_suffixes):
+            # The subject does not end with a reserved name.
+
+            # We return False.
+            return False
+
+        # We get what is after the last slash (for the case of URLs).
+        subject = subject[subject.rfind("/") + 1 :]
+
+        # We check the subject and its last label.
+        return (
+            subject in cls.reserved or subject[subject.rfind(".") + 1 :] in cls.reserved
+        )
+
+    @classmethod
+    def without_reserved(cls, subjects):
+        """
+        Remove the reserved names from the given subjects.
+
+        :param subjects: The subjects to filter.
+        :type subjects: list
+
+        :return: The subjects which are not (or not under) a reserved name.
+        :rtype: list
+        """
+
+        # We get the reserved names as a tuple.
+        suffixes = cls.reserved_suffixes
+
+        # We return the subjects which are not reserved.
+        # Note: Only the subjects which end with a reserved name are checked
+        # further.
+        return [
+            x for x in subjects if not x.endswith(suffixes) or not cls.is_reserved(x)
+        ]
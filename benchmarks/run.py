@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the benchmark runner.
+
+Usage (from the root of the repository):
+
+::
+
+    $ python -m benchmarks.run --subjects 10000
+    $ python -m benchmarks.run --subjects 100000 --latency 0.05 -c processes=4
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+# pylint: disable=import-outside-toplevel
+import argparse
+from json import dumps
+from multiprocessing import get_context, set_start_method
+from os import environ, path
+from shutil import copyfile, rmtree
+from sys import platform
+from tempfile import mkdtemp
+from time import perf_counter
+
+from yaml import safe_load
+
+from benchmarks.servers import Resolver, StandIns, Subject
+
+# We set the location of the repository.
+REPOSITORY = path.dirname(path.dirname(path.abspath(__file__)))
+
+
+class Benchmark:
+    """
+    Prepare and run a benchmark.
+
+    :param arguments: The arguments of the benchmark (from the command line).
+    :type arguments: dict
+    """
+
+    # We set the files we copy into the workspace (source: destination).
+    files = {
+        ".PyFunceble_production.yaml": ".PyFunceble_production.yaml",
+        "dir_structure_production.json": "dir_structure.json",
+        "iana-domains-db.json": "iana-domains-db.json",
+        "public-suffix.json": "public-suffix.json",
+    }
+
+    # We set the name of the list we test.
+    list_name = "benchmark.list"
+
+    # We set the environment variables we remove so that we do not go through
+    # a proxy.
+    proxy_variables = ["http_proxy", "https_proxy", "all_proxy"]
+
+    def __init__(self, arguments):
+        self.arguments = arguments
+
+        # We create the workspace.
+        # Note: It is used as our configuration and output directory so that
+        # a benchmark never touches the repository.
+        self.workspace = mkdtemp(prefix="pyfunceble-benchmark-") + path.sep
+
+        for source, destination in self.files.items():
+            # We loop through the files to copy.
+
+            # And we copy them.
+            copyfile(path.join(REPOSITORY, source), self.workspace + destination)
+
+        with open(self.workspace + self.list_name, "w") as file:
+            # We write the list to test.
+            for subject in Subject.generate(
+                arguments["subjects"], arguments["mix"], arguments["extensions"]
+            ):
+                file.write(subject + "\n")
+
+    def run(self):
+        """
+        Start the stand-in servers and measure the test of the list into a
+        dedicated process.
+
+        :return: The report of the benchmark.
+        :rtype: dict
+        """
+
+        # We use a spawned process so that the measured process starts clean
+        # and that the threads of the stand-ins do not compete with it.
+        context = get_context("spawn")
+
+        with StandIns(
+            latency=self.arguments["latency"],
+            status_codes=self.arguments["status_codes"],
+            whois_port=self.arguments["whois_port"],
+        ) as stand_ins:
+            # We start the stand-in servers.
+
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=self.measure,
+                args=(self.arguments, self.workspace, stand_ins.ports, sender),
+            )
+
+            process.start()
+
+            # We close our copy of the sender so that we do not wait forever
+            # if the measured process dies.
+            sender.close()
+
+            try:
+                # We get the report.
+                report = receiver.recv()
+            finally:
+                # We wait for the end of the measured process.
+                process.join()
+
+        if not self.arguments["keep"]:
+            # We do not have to keep the workspace.
+
+            # We delete it.
+            rmtree(self.workspace)
+        else:
+            # We have to keep the workspace.
+
+            # We report its location.
+            report["workspace"] = self.workspace
+
+        return report
+
+    @classmethod
+    def measure(cls, arguments, workspace, ports, sender):
+        """
+        Measure the test of the list.
+
+        :param arguments: The arguments of the benchmark.
+        :type arguments: dict
+
+        :param workspace: The configuration and output directory.
+        :type workspace: str
+
+        :param ports: The ports of the stand-in servers.
+        :type ports: dict
+
+        :param sender: The connection to send the report with.
+        :type sender: multiprocessing.connection.Connection
+
+        .. note::
+            It is run into the measured process.
+        """
+
+        import resource
+
+        # We go back to the default start method of the platform.
+        # Note: Otherwise, the workers of PyFunceble would be spawned as we
+        # were and they would not know the stand-in servers.
+        set_start_method(None, force=True)
+
+        for variable in cls.proxy_variables:
+            # We loop through the proxy variables.
+
+            # And we remove them.
+            environ.pop(variable, None)
+            environ.pop(variable.upper(), None)
+
+        # We work from the workspace.
+        # Note: The current directory stays the repository so that the
+        # cloned version is detected and that nothing is downloaded.
+        environ["PYFUNCEBLE_OUTPUT_DIR"] = workspace
+
+        # We route the DNS resolution through the DNS stand-in.
+        Resolver(ports["dns"], ports["http"]).install()
+
+        import PyFunceble
+        from PyFunceble.check import Check
+        from PyFunceble.core import Core
+        from PyFunceble.lookup import Lookup
+        from PyFunceble.timings import Timings
+
+        # We write the outputs into the workspace.
+        PyFunceble.OUTPUT_DIRECTORY = workspace
+
+        # We load the configuration.
+        PyFunceble.load_config(
+            custom=dict(
+                {
+                    "quiet": not arguments["verbose"],
+                    "share_logs": False,
+                    "timings": True,
+                },
+                **arguments["configuration"]
+            )
+        )
+
+        # We route the WHOIS queries to the WHOIS stand-in.
+        Lookup.whois_port = ports["whois"]
+        Check.load_databases()
+
+        for extension in arguments["extensions"]:
+            # We loop through the extensions of the subjects.
+
+            # And we give the WHOIS stand-in as their referer.
+            PyFunceble.INTERN["iana_db"][extension] = "127.0.0.1"
+
+        start = perf_counter()
+
+        if arguments["mode"] == "api":
+            # We have to test through the API.
+
+            for subject in Subject.generate(
+                arguments["subjects"], arguments["mix"], arguments["extensions"]
+            ):
+                # We loop through the subjects.
+
+                # And we test them.
+                PyFunceble.test(subject)
+        else:
+            # We have to test the file.
+            Core(file_path=workspace + cls.list_name)
+
+        elapsed = perf_counter() - start
+
+        # We get the peak memory of the process and of its workers.
+        peak_memory = max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        )
+
+        if platform != "darwin":
+            # The peak memory is given in kilobytes.
+
+            # We convert it to bytes.
+            peak_memory *= 1024
+
+        sender.send(
+            {
+                "subjects": arguments["subjects"],
+                "elapsed": round(elapsed, 6),
+                "subjects_per_second": round(arguments["subjects"] / elapsed, 2),
+                "peak_memory": peak_memory,
+                "timings": Timings.summary(),
+            }
+        )
+
+
+def _key_value(argument, value_type=str):
+    """
+    Convert a :code:`key=value[,key=value]` argument into a dict.
+
+    :param argument: The argument to convert.
+    :type argument: str
+
+    :param value_type: The type to convert the values to.
+    :type value_type: type
+
+    :rtype: dict
+    """
+
+    result = {}
+
+    for item in argument.split(","):
+        # We loop through the given items.
+
+        key, value = item.split("=", 1)
+        result[key.strip()] = value_type(value)
+
+    return result
+
+
+def _print(report):
+    """
+    Print the given report in a human readable format.
+
+    :param report: The report to print.
+    :type report: dict
+    """
+
+    print("Subjects:       %d" % report["subjects"])
+    print("Elapsed:        %.3fs" % report["elapsed"])
+    print("Throughput:     %.2f subjects/s" % report["subjects_per_second"])
+    print("Peak memory:    %.1f MiB" % (report["peak_memory"] / 1024 / 1024))
+
+    if "workspace" in report:
+        # The workspace was kept.
+
+        print("Workspace:      %s" % report["workspace"])
+
+    # We construct the format of a line of the stages table.
+    line = "%-24s %10s %12s %10s %10s %10s"
+
+    print(
+        "\n" + line % ("Stage", "Count", "Total (s)", "p50 (s)", "p95 (s)", "p99 (s)")
+    )
+
+    for stage, summary in sorted(report["timings"].items()):
+        # We loop through the summary of each stage.
+
+        print(
+            line
+            % (
+                stage,
+                summary["count"],
+                "%.3f" % summary["total"],
+                "%.6f" % summary["p50"],
+                "%.6f" % summary["p95"],
+                "%.6f" % summary["p99"],
+            )
+        )
+
+
+def main():
+    """
+    Provide the command line interface of the benchmarks.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark PyFunceble against local stand-in DNS, WHOIS "
+        "and HTTP servers."
+    )
+
+    parser.add_argument(
+        "-c",
+        "--config",
+        action="append",
+        default=[],
+        help="Overwrite a configuration index (from .PyFunceble.yaml). "
+        "The value is read as YAML. (e.g. processes=4)",
+    )
+    parser.add_argument(
+        "--extensions",
+        type=lambda x: x.split(","),
+        default=Subject.default_extensions,
+        help="The extensions to generate the subjects with. %(default)s",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the report as JSON."
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the workspace (outputs)."
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="The number of seconds the stand-in servers wait before answering. "
+        "%(default)s",
+    )
+    parser.add_argument(
+        "--mix",
+        type=lambda x: _key_value(x, int),
+        default=Subject.default_mix,
+        help="The weight of each kind of subjects. (%s) %%(default)s"
+        % ", ".join("%s: %s" % x for x in Subject.kinds.items()),
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["file", "api"],
+        default="file",
+        help="Test the list as a file or through the API. %(default)s",
+    )
+    parser.add_argument(
+        "--status-codes",
+        type=lambda x: [int(y) for y in x.split(",")],
+        default=[200],
+        help="The HTTP status codes to distribute on the subjects. %(default)s",
+    )
+    parser.add_argument(
+        "-s",
+        "--subjects",
+        type=int,
+        default=10000,
+        help="The number of subjects to test. %(default)s",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Do not run PyFunceble quietly."
+    )
+    parser.add_argument(
+        "--whois-port",
+        type=int,
+        default=0,
+        help="The port of the WHOIS stand-in. (0: a free one) %(default)s",
+    )
+
+    arguments = vars(parser.parse_args())
+
+    # We convert the configuration indexes to overwrite.
+    arguments["configuration"] = {}
+
+    for item in arguments.pop("config"):
+        # We loop through the configuration indexes to overwrite.
+
+        key, value = item.split("=", 1)
+        arguments["configuration"][key] = safe_load(value)
+
+    report = Benchmark(arguments).run()
+
+    if arguments["json"]:
+        # We have to print the report as JSON.
+        print(dumps(report, indent=4, sort_keys=True))
+    else:
+        # We have to print the report in a human readable format.
+        _print(report)
+
+
+if __name__ == "__main__":
+    main()
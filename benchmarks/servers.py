@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the local stand-in DNS, WHOIS and HTTP servers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+# pylint: disable=invalid-name
+import socketserver
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from ipaddress import ip_address
+from itertools import cycle, islice
+from os import urandom
+from socket import (
+    AF_INET,
+    AF_INET6,
+    IPPROTO_TCP,
+    SOCK_DGRAM,
+    SOCK_STREAM,
+    gaierror,
+    inet_aton,
+    socket,
+    timeout,
+)
+from struct import pack, unpack
+from threading import Thread
+from time import sleep
+
+
+class Subject:
+    """
+    Generate the synthetic subjects and tell the stand-in servers how they
+    have to behave with them.
+
+    .. note::
+        The first character of a synthetic subject is its kind. The digits
+        which follow are its index into the generated list.
+    """
+
+    # We set the kinds of subjects we know.
+    #   * w: registered (the WHOIS stand-in gives an expiration date).
+    #   * h: unregistered but resolved (and answered by the HTTP stand-in).
+    #   * n: unregistered and not resolved (NXDOMAIN).
+    kinds = {
+        "w": "registered (WHOIS)",
+        "h": "resolved (DNS and HTTP)",
+        "n": "not resolved (NXDOMAIN)",
+    }
+
+    # We set the default mix of subjects.
+    default_mix = {"w": 1, "h": 1, "n": 1}
+
+    # We set the default extensions of the generated subjects.
+    default_extensions = ["com", "net", "org"]
+
+    @classmethod
+    def generate(cls, number, mix=None, extensions=None):
+        """
+        Generate the synthetic subjects.
+
+        :param number: The number of subjects to generate.
+        :type number: int
+
+        :param mix:
+            The weight of each kind of subject.
+            (e.g. :code:`{"w": 2, "h": 1, "n": 1}`)
+        :type mix: dict
+
+        :param extensions: The extensions to distribute the subjects on.
+        :type extensions: list
+
+        :return: A generator of subjects.
+        :rtype: generator
+
+        .. note::
+            The generation is deterministic so that two runs with the same
+            arguments test the same list.
+        """
+
+        if not mix:
+            # The mix is not given.
+
+            # We use the default one.
+            mix = cls.default_mix
+
+        if not extensions:
+            # The extensions are not given.
+
+            # We use the default ones.
+            extensions = cls.default_extensions
+
+        # We construct the pattern of kinds which will be repeated.
+        pattern = [kind for kind, weight in sorted(mix.items()) for _ in range(weight)]
+
+        for index, (kind, extension) in enumerate(
+            islice(zip(cycle(pattern), cycle(extensions)), number)
+        ):
+            # We loop through the kinds and extensions to generate.
+
+            # We yield the subject.
+            yield "%s%08d.%s" % (kind, index, extension)
+
+    @classmethod
+    def kind_of(cls, subject):
+        """
+        Get the kind of the given subject.
+
+        :param subject: The subject to get the kind of.
+        :type subject: str
+
+        :return: The kind of the subject or :code:`None` if it is not synthetic.
+        :rtype: str|None
+        """
+
+        if subject and subject[0] in cls.kinds and subject[1:9].isdigit():
+            # The subject is one of ours.
+
+            # We return its kind.
+            return subject[0]
+
+        # The subject is not one of ours.
+        return None
+
+    @classmethod
+    def index_of(cls, subject):
+        """
+        Get the index of the given subject.
+
+        :param subject: The subject to get the index of.
+        :type subject: str
+
+        :rtype: int
+        """
+
+        if cls.kind_of(subject):
+            # The subject is one of ours.
+
+            # We return its index.
+            return int(subject[1:9])
+
+        # The subject is not one of ours.
+        return 0
+
+
+class _DNSHandler(socketserver.BaseRequestHandler):
+    """
+    Answer a DNS (A) query.
+
+    .. note::
+        Everything but the :code:`n` kind of subjects resolves
+        to :code:`127.0.0.1`.
+    """
+
+    def handle(self):
+        data, connection = self.request
+
+        # We wait the configured latency.
+        sleep(self.server.latency)
+
+        # We initiate the position of the question.
+        position = 12
+        # We initiate the labels of the requested name.
+        labels = []
+
+        while data[position]:
+            # We loop until the end of the requested name.
+
+            # We append the label.
+            labels.append(data[position + 1 : position + 1 + data[position]].decode())
+
+            # And we go to the next one.
+            position += 1 + data[position]
+
+        # We get the type of the query.
+        query_type = unpack("!H", data[position + 1 : position + 3])[0]
+
+        # We check if the name has to be resolved.
+        found = Subject.kind_of(".".join(labels)) != "n"
+        # We check if we answer with a record.
+        answer = found and query_type == 1
+
+        # We construct the header of the response.
+        # Note: 0x8180 is a NOERROR response and 0x8183 a NXDOMAIN one.
+        response = data[:2] + pack(
+            "!HHHHH", 0x8180 if found else 0x8183, 1, int(answer), 0, 0
+        )
+
+        # We append the question.
+        response += data[12 : position + 5]
+
+        if answer:
+            # We have to answer with a record.
+
+            # We append it.
+            response += pack("!HHHLH", 0xC00C, 1, 1, 60, 4) + inet_aton("127.0.0.1")
+
+        connection.sendto(response, self.client_address)
+
+
+class _WHOISHandler(socketserver.StreamRequestHandler):
+    """
+    Answer a WHOIS query with a recorded record.
+    """
+
+    # We set the record we give for the registered subjects.
+    registered = """   Domain Name: {domain}
+   Registry Domain ID: 2138514_DOMAIN_COM-VRSN
+   Registrar WHOIS Server: whois.example.org
+   Registrar URL: http://www.example.org
+   Updated Date: 2019-05-08T15:54:12Z
+   Creation Date: 1997-09-15T04:00:00Z
+   Registry Expiry Date: 2028-09-14T04:00:00Z
+   Registrar: Example Registrar, Inc.
+   Registrar IANA ID: 292
+   Domain Status: clientDeleteProhibited
+   Domain Status: clientTransferProhibited
+   Name Server: NS1.EXAMPLE.ORG
+   Name Server: NS2.EXAMPLE.ORG
+   DNSSEC: unsigned
+>>> Last update of whois database: 2019-06-01T08:00:00Z <<<
+"""
+
+    # We set the record we give for the other subjects.
+    not_found = """No match for "{domain}".
+>>> Last update of whois database: 2019-06-01T08:00:00Z <<<
+"""
+
+    def handle(self):
+        # We read the query.
+        domain = self.rfile.readline().strip().decode()
+
+        # We wait the configured latency.
+        sleep(self.server.latency)
+
+        if Subject.kind_of(domain) == "w":
+            # The subject is registered.
+
+            # We give the registered record.
+            record = self.registered
+        else:
+            # The subject is not registered.
+
+            # We give the not found record.
+            record = self.not_found
+
+        self.wfile.write(record.format(domain=domain.upper()).encode())
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    """
+    Answer a HTTP request with the configured status codes.
+
+    .. note::
+        The status codes are distributed on the subjects according to
+        their index.
+    """
+
+    def do_HEAD(self):  # pylint: disable=missing-docstring
+        # We wait the configured latency.
+        sleep(self.server.latency)
+
+        # We get the status code to give.
+        status_codes = self.server.status_codes
+        status_code = status_codes[
+            Subject.index_of(self.headers.get("Host", "").split(":")[0])
+            % len(status_codes)
+        ]
+
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_HEAD
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        # We do not log the requests.
+        pass
+
+
+class _UDPServer(socketserver.ThreadingMixIn, socketserver.UDPServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class StandIns:  # pylint: disable=too-few-public-methods
+    """
+    Start the local stand-in DNS, WHOIS and HTTP servers.
+
+    :param latency: The number of seconds to wait before answering.
+    :type latency: float
+
+    :param status_codes: The HTTP status codes to distribute on the subjects.
+    :type status_codes: list
+
+    :param whois_port:
+        The port of the WHOIS stand-in.
+        If :code:`0` is given, a free one is choosen.
+    :type whois_port: int
+
+    .. note::
+        The servers are started into daemon threads and can be stopped with
+        :code:`StandIns.stop()` or by using the object as a context manager.
+    """
+
+    # We set the address to listen to.
+    address = "127.0.0.1"
+
+    def __init__(self, latency=0.0, status_codes=None, whois_port=0):
+        if not status_codes:
+            # The status codes are not given.
+
+            # We only give 200.
+            status_codes = [200]
+
+        # We initiate the servers.
+        self.servers = {
+            "dns": _UDPServer((self.address, 0), _DNSHandler),
+            "whois": _TCPServer((self.address, whois_port), _WHOISHandler),
+            "http": _HTTPServer((self.address, 0), _HTTPHandler),
+        }
+
+        for server in self.servers.values():
+            # We loop through the servers.
+
+            # We share the configuration with the handlers.
+            server.latency = latency
+            server.status_codes = status_codes
+
+        # We get the ports the servers are listening to.
+        self.ports = {x: y.server_address[1] for x, y in self.servers.items()}
+
+    def __enter__(self):
+        for server in self.servers.values():
+            # We loop through the servers.
+
+            # And we start them.
+            Thread(target=server.serve_forever, daemon=True).start()
+
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def stop(self):
+        """
+        Stop the servers.
+        """
+
+        for server in self.servers.values():
+            # We loop through the servers.
+
+            # We stop and close them.
+            server.shutdown()
+            server.server_close()
+
+
+class Resolver:
+    """
+    Resolve through the DNS stand-in.
+
+    :param port: The port of the DNS stand-in.
+    :type port: int
+
+    :param http_port:
+        The port of the HTTP stand-in.
+        It is given instead of the port 80.
+    :type http_port: int
+
+    .. note::
+        Once installed, :code:`socket.getaddrinfo` query the DNS stand-in for
+        everything which is not an IP nor :code:`localhost`.
+    """
+
+    # We set the number of seconds before a query timeout.
+    seconds_before_timeout = 3
+
+    def __init__(self, port, http_port):
+        self.address = (StandIns.address, port)
+        self.http_port = http_port
+
+        # We save the original getaddrinfo.
+        self.original = None
+
+    def query(self, name):
+        """
+        Query the A record of the given name.
+
+        :param name: The name to query.
+        :type name: str
+
+        :return: The resolved IP.
+        :rtype: str
+
+        :raises:
+            :code:`socket.gaierror`
+                If the name is not resolved.
+        """
+
+        # We construct the query.
+        request = urandom(2) + pack("!HHHHH", 0x0100, 1, 0, 0, 0)
+
+        for label in name.rstrip(".").split("."):
+            # We loop through the labels of the name.
+
+            # We append the label.
+            request += pack("!B", len(label)) + label.encode("idna")
+
+        request += pack("!BHH", 0, 1, 1)
+
+        with socket(AF_INET, SOCK_DGRAM) as connection:
+            # We send the query.
+            connection.settimeout(self.seconds_before_timeout)
+            connection.sendto(request, self.address)
+
+            try:
+                # We get the response.
+                response = connection.recv(512)
+            except timeout:
+                raise gaierror(-3, "Temporary failure in name resolution")
+
+        # We get the flags and the number of answers.
+        flags, answers = unpack("!H", response[2:4])[0], unpack("!H", response[6:8])[0]
+
+        if flags & 0xF or not answers:
+            # The name is not resolved.
+
+            # We raise the usual exception.
+            raise gaierror(-2, "Name or service not known")
+
+        # We return the IP of the (only) record.
+        return ".".join(str(x) for x in response[-4:])
+
+    def getaddrinfo(  # pylint: disable=too-many-arguments
+        self, host, port, family=0, type=0, proto=0, flags=0
+    ):  # pylint: disable=redefined-builtin
+        """
+        Replace :code:`socket.getaddrinfo`.
+        """
+
+        if isinstance(host, bytes):
+            # The host is given as bytes.
+
+            # We decode it.
+            host = host.decode()
+
+        try:
+            # We check if the host is an IP.
+            ip_address(host)
+            local = True
+        except ValueError:
+            # We check if the host is the local one.
+            local = host == "localhost"
+
+        if local or family == AF_INET6:
+            # The host is an IP or the local one.
+
+            # We use the original getaddrinfo.
+            return self.original(host, port, family, type, proto, flags)
+
+        if port in [80, "80", "http"]:
+            # The port is the HTTP one.
+
+            # We give the port of the HTTP stand-in.
+            port = self.http_port
+
+        return [(AF_INET, SOCK_STREAM, IPPROTO_TCP, "", (self.query(host), port))]
+
+    def install(self):
+        """
+        Route :code:`socket.getaddrinfo` through the DNS stand-in.
+        """
+
+        # We import the socket module.
+        import socket as module  # pylint: disable=import-outside-toplevel
+
+        # We save the original getaddrinfo.
+        self.original = module.getaddrinfo
+
+        # And we replace it.
+        module.getaddrinfo = self.getaddrinfo
@@ -0,0 +1,183 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.adaptive_timeout.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.adaptive_timeout import AdaptiveTimeout
+from PyFunceble.config import Load
+
+
+class TestAdaptiveTimeout(TestCase):
+    """
+    Testing of PyFunceble.adaptive_timeout.AdaptiveTimeout().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["adaptive_timeout"] = True
+        PyFunceble.CONFIGURATION["seconds_before_http_timeout"] = 6
+        AdaptiveTimeout.histograms = {}
+
+    def tearDown(self):
+        """
+        Reset everything we changed.
+        """
+
+        PyFunceble.CONFIGURATION["adaptive_timeout"] = False
+        PyFunceble.CONFIGURATION["seconds_before_http_timeout"] = 3
+        AdaptiveTimeout.histograms = {}
+
+    def test_extension(self):
+        """
+        Test AdaptiveTimeout.extension().
+        """
+
+        expected = ["com", "fr", "uk", ""]
+        actual = [
+            AdaptiveTimeout.extension(x)
+            for x in ["example.com", "example.FR.", "https://a.b.co.uk:8080/x", ""]
+        ]
+
+        self.assertEqual(expected, actual)
+
+    def test_get_not_enough_samples(self):
+        """
+        Test AdaptiveTimeout.get() for the case that we did not observe
+        enough durations.
+        """
+
+        for _ in range(AdaptiveTimeout.minimal_samples - 1):
+            AdaptiveTimeout.add("whois", "whois.example.org", 0.1)
+
+        expected = 6
+        actual = AdaptiveTimeout.get("whois", "whois.example.org")
+
+        self.assertEqual(expected, actual)
+
+        expected = 9
+        actual = AdaptiveTimeout.get("whois", "whois.example.org", maximum=9)
+
+        self.assertEqual(expected, actual)
+
+    def test_get(self):
+        """
+        Test AdaptiveTimeout.get() for the case that we observed enough
+        durations.
+        """
+
+        for _ in range(AdaptiveTimeout.minimal_samples):
+            AdaptiveTimeout.add("whois", "fast.example.org", 0.01)
+            AdaptiveTimeout.add("whois", "medium.example.org", 1)
+            AdaptiveTimeout.add("http", "org", 5)
+
+        # The fast one gets the minimal timeout.
+        expected = AdaptiveTimeout.minimal_timeout
+        actual = AdaptiveTimeout.get("whois", "fast.example.org")
+
+        self.assertEqual(expected, actual)
+
+        # The medium one gets 3 times its p99.
+        actual = AdaptiveTimeout.get("whois", "medium.example.org")
+
+        self.assertAlmostEqual(3, actual, delta=0.3)
+
+        # The slow one can't get more than the configured timeout.
+        expected = 6
+        actual = AdaptiveTimeout.get("http", "org")
+
+        self.assertEqual(expected, actual)
+
+        # The kinds do not mix.
+        expected = 6
+        actual = AdaptiveTimeout.get("http", "fast.example.org")
+
+        self.assertEqual(expected, actual)
+
+    def test_not_activated(self):
+        """
+        Test AdaptiveTimeout for the case that it is not activated.
+        """
+
+        PyFunceble.CONFIGURATION["adaptive_timeout"] = False
+
+        for _ in range(AdaptiveTimeout.minimal_samples):
+            AdaptiveTimeout.add("whois", "whois.example.org", 0.01)
+
+        expected = {}
+
+        self.assertEqual(expected, AdaptiveTimeout.histograms)
+
+        expected = 6
+        actual = AdaptiveTimeout.get("whois", "whois.example.org")
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
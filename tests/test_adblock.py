@@ -127,6 +127,28 @@ class TestAdblockDecode(TestCase):
         actual = AdBlock(self.lines).decode()
         self.assertEqual(self.expected, actual)
 
+    def test_adblock_stream(self):
+        """
+        Test that the adblock decoding system gives each domain once, from any
+        iterable.
+        """
+
+        actual = list(AdBlock(x for x in self.lines + self.lines).stream())
+
+        self.assertEqual(len(set(actual)), len(actual))
+        self.assertEqual(self.expected, sorted(actual, key=str.lower))
+
+    def test_adblock_decode_separators(self):
+        """
+        Test that the adblock decoding system keeps all parts of an element
+        with several separators.
+        """
+
+        expected = ["a.example.org", "b.example.org", "c.example.org"]
+        actual = AdBlock(["|a.example.org#b.example.org^c.example.org|"]).decode()
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -79,7 +79,7 @@ class TestsAutoContinue(TestCase):
         Setup the needed variables.
         """
 
-        Load(PyFunceble.CURRENT_DIRECTORY)
+        Load(PyFunceble.get_current_directory())
 
         self.file_to_work_with = (
             PyFunceble.OUTPUT_DIRECTORY
@@ -87,6 +87,18 @@ class TestsAutoContinue(TestCase):
             + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue"]
         )
 
+        self.list_to_work_with = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue_list"]
+        )
+
+        self.journal_to_work_with = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue_journal"]
+        )
+
         PyFunceble.INTERN["file_to_test"] = "hello.world"
         self.types = ["up", "down", "invalid", "tested"]
 
@@ -108,6 +120,8 @@ class TestsAutoContinue(TestCase):
         """
 
         File(self.file_to_work_with).delete()
+        File(self.journal_to_work_with).delete()
+        File(self.list_to_work_with).delete()
 
         expected = False
         actual = PyFunceble.path.isfile(self.file_to_work_with)
@@ -241,6 +255,207 @@ class TestsAutoContinue(TestCase):
         del PyFunceble.CONFIGURATION["auto_continue"]
         self.test_delete_file()
 
+    def test_checkpoint(self):
+        """
+        Test AutoContinue().checkpoint().
+        """
+
+        self.test_delete_file()
+        PyFunceble.CONFIGURATION["auto_continue"] = True
+        PyFunceble.CONFIGURATION["subjects_before_auto_continue_backup"] = 3
+        PyFunceble.CONFIGURATION["seconds_before_auto_continue_backup"] = 3600
+
+        auto_continue = AutoContinue()
+
+        for index in range(1, 3):
+            self.set_counter(index)
+            auto_continue.checkpoint()
+
+        expected = {}
+        actual = Dict().from_json(File(self.file_to_work_with).read())
+
+        self.assertEqual(expected, actual)
+
+        expected = 2
+        actual = len(File(self.journal_to_work_with).read().splitlines())
+
+        self.assertEqual(expected, actual)
+
+        self.set_counter(3)
+        auto_continue.checkpoint()
+
+        expected = {
+            PyFunceble.INTERN["file_to_test"]: {
+                "up": 3,
+                "down": 3,
+                "invalid": 3,
+                "tested": 3,
+            }
+        }
+        actual = Dict().from_json(File(self.file_to_work_with).read())
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(PyFunceble.path.isfile(self.journal_to_work_with))
+
+        del PyFunceble.CONFIGURATION["auto_continue"]
+        self.set_counter(0)
+        self.test_delete_file()
+
+    def test_checkpoint_journal(self):
+        """
+        Test that AutoContinue().checkpoint() only appends what changed
+        into the journal.
+        """
+
+        self.test_delete_file()
+        PyFunceble.CONFIGURATION["auto_continue"] = True
+        PyFunceble.CONFIGURATION["subjects_before_auto_continue_backup"] = 100
+        PyFunceble.CONFIGURATION["seconds_before_auto_continue_backup"] = 3600
+
+        auto_continue = AutoContinue()
+
+        self.set_counter(1)
+        auto_continue.checkpoint()
+
+        PyFunceble.INTERN["counter"]["number"].update({"up": 2, "tested": 2})
+        auto_continue.checkpoint()
+
+        expected = [
+            {
+                PyFunceble.INTERN["file_to_test"]: {
+                    "up": 1,
+                    "down": 1,
+                    "invalid": 1,
+                    "tested": 1,
+                }
+            },
+            {PyFunceble.INTERN["file_to_test"]: {"up": 2, "tested": 2}},
+        ]
+        actual = [
+            Dict().from_json(x)
+            for x in File(self.journal_to_work_with).read().splitlines()
+        ]
+
+        self.assertEqual(expected, actual)
+
+        self.set_counter(0)
+        AutoContinue().restore()
+
+        expected = {"up": 2, "down": 1, "invalid": 1, "tested": 2}
+        actual = PyFunceble.INTERN["counter"]["number"]
+
+        self.assertEqual(expected, actual)
+
+        del PyFunceble.CONFIGURATION["auto_continue"]
+        self.set_counter(0)
+        self.test_delete_file()
+
+    def test_restore_journal(self):
+        """
+        Test AutoContinue().restore() for the case that some states
+        were only saved into the journal.
+        """
+
+        self.test_delete_file()
+        PyFunceble.CONFIGURATION["auto_continue"] = True
+        PyFunceble.CONFIGURATION["subjects_before_auto_continue_backup"] = 100
+        PyFunceble.CONFIGURATION["seconds_before_auto_continue_backup"] = 3600
+
+        self.set_counter(5)
+        AutoContinue().backup()
+
+        auto_continue = AutoContinue()
+
+        self.set_counter(6)
+        auto_continue.checkpoint()
+        self.set_counter(7)
+        auto_continue.checkpoint()
+
+        # We simulate a partially written line.
+        File(self.journal_to_work_with).write('{"hello.world": {"tes')
+
+        self.set_counter(0)
+        AutoContinue().restore()
+
+        expected = {"up": 7, "down": 7, "invalid": 7, "tested": 7}
+        actual = PyFunceble.INTERN["counter"]["number"]
+
+        self.assertEqual(expected, actual)
+
+        del PyFunceble.CONFIGURATION["auto_continue"]
+        self.set_counter(0)
+        self.test_delete_file()
+
+    def test_remaining_list_to_test(self):
+        """
+        Test AutoContinue().remaining_list_to_test().
+        """
+
+        self.test_delete_file()
+        PyFunceble.CONFIGURATION["auto_continue"] = True
+        PyFunceble.CONFIGURATION["subjects_before_auto_continue_backup"] = 100
+        PyFunceble.CONFIGURATION["seconds_before_auto_continue_backup"] = 3600
+
+        file_to_test = "hello.world.list"
+        File(file_to_test).write("hello.world\nwörld.hello\nfun.ilrys\n", True)
+        PyFunceble.INTERN["file_to_test"] = file_to_test
+        PyFunceble.INTERN["extracted_list_to_test"] = ["hello.world", "fun.ilrys"]
+
+        auto_continue = AutoContinue()
+        auto_continue.save_list_to_test(["hello.world", "wörld.hello", "fun.ilrys"])
+
+        self.set_counter(1)
+        auto_continue.checkpoint("hello.world")
+        # An element which is not into the list file (mined for example) must
+        # not move the position of the next element to test.
+        self.set_counter(2)
+        auto_continue.checkpoint("mined.hello.world")
+        self.set_counter(3)
+        auto_continue.checkpoint("wörld.hello")
+
+        self.set_counter(0)
+        auto_continue = AutoContinue()
+        auto_continue.restore()
+
+        expected = ["fun.ilrys"]
+        actual = auto_continue.remaining_list_to_test()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(expected, PyFunceble.INTERN["extracted_list_to_test"])
+        self.assertEqual(3, PyFunceble.INTERN["counter"]["number"]["tested"])
+
+        PyFunceble.CONFIGURATION["incremental"] = True
+
+        self.set_counter(0)
+        auto_continue = AutoContinue()
+        auto_continue.restore()
+
+        # The incremental mode changes the list to test.
+        expected = None
+        actual = auto_continue.remaining_list_to_test()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["incremental"] = False
+
+        File(file_to_test).write("fun.ilrys\n", True)
+
+        self.set_counter(0)
+        auto_continue = AutoContinue()
+        auto_continue.restore()
+
+        expected = None
+        actual = auto_continue.remaining_list_to_test()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(0, PyFunceble.INTERN["counter"]["number"]["tested"])
+
+        File(file_to_test).delete()
+        PyFunceble.INTERN["file_to_test"] = "hello.world"
+        del PyFunceble.CONFIGURATION["auto_continue"]
+        self.set_counter(0)
+        self.test_delete_file()
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -317,6 +317,68 @@ class TestCheck(TestCase):
 
             del PyFunceble.INTERN["to_test"]
 
+    def test_is_domain_valid_many(self):
+        """
+        Test Check.is_domain_valid_many().
+        """
+
+        domains = self.valid_domain + self.not_valid_domain + ["", None]
+
+        expected = (
+            [(x, True) for x in self.valid_domain]
+            + [(x, False) for x in self.not_valid_domain]
+            + [("", None), (None, None)]
+        )
+        actual = list(Check.is_domain_valid_many(iter(domains)))
+
+        self.assertEqual(expected, actual)
+
+        expected = [("45.66.255.240", False), ("300.66.255.240", False)]
+        actual = list(Check.is_domain_valid_many([x[0] for x in expected]))
+
+        self.assertEqual(expected, actual)
+
+        expected = [("45.66.255.240", True), ("300.66.255.240", False)]
+        actual = list(
+            Check.is_domain_valid_many([x[0] for x in expected], ip_check=True)
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_suffixes_in(self):
+        """
+        Test Check()._suffixes_in().
+        """
+
+        Check.load_databases()
+
+        expected = ["co.za"]
+        actual = Check._suffixes_in(  # pylint: disable=protected-access
+            "hello.abuse.co.za", "za"
+        )
+
+        self.assertEqual(expected, actual)
+
+        # We ensure that we get the same as if we look for each suffix.
+        for domain in ["hello.co.uk", "hello.ac.uk.co.uk", "hello.co.ukraine.uk"]:
+            expected = [
+                x
+                for x in PyFunceble.INTERN["psl_db"]["uk"]
+                if "." + x in domain
+            ]
+            actual = Check._suffixes_in(  # pylint: disable=protected-access
+                domain, "uk"
+            )
+
+            self.assertEqual(expected, actual, msg=domain)
+
+        expected = []
+        actual = Check._suffixes_in(  # pylint: disable=protected-access
+            "hello.world.com", "com"
+        )
+
+        self.assertEqual(expected, actual)
+
     def test_is_subdomain_valid(self):
         """
         Test Check().is_subdomain() for the case subdomains
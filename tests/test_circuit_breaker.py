@@ -0,0 +1,198 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.circuit_breaker.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.circuit_breaker import CircuitBreaker
+from PyFunceble.config import Load
+from PyFunceble.metrics import Metrics
+
+
+class TestCircuitBreaker(TestCase):
+    """
+    Testing of PyFunceble.circuit_breaker.CircuitBreaker().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["circuit_breaker"] = True
+        CircuitBreaker.states = {}
+        Metrics.counters = {}
+
+    def tearDown(self):
+        """
+        Reset everything we changed.
+        """
+
+        PyFunceble.CONFIGURATION["circuit_breaker"] = False
+        CircuitBreaker.states = {}
+        Metrics.counters = {}
+
+    def test_open(self):
+        """
+        Test CircuitBreaker for the case that it opens after too many
+        consecutive failures.
+        """
+
+        for _ in range(CircuitBreaker.failures_before_opening - 1):
+            CircuitBreaker.failure("whois", "whois.example.org")
+
+        # A success resets the failures.
+        CircuitBreaker.success("whois", "whois.example.org")
+
+        for _ in range(CircuitBreaker.failures_before_opening - 1):
+            CircuitBreaker.failure("whois", "whois.example.org")
+
+        self.assertTrue(CircuitBreaker.allows("whois", "whois.example.org"))
+
+        with patch("PyFunceble.circuit_breaker.time", return_value=100):
+            CircuitBreaker.failure("whois", "whois.example.org")
+
+        with patch("PyFunceble.circuit_breaker.time", return_value=110):
+            self.assertFalse(CircuitBreaker.allows("whois", "whois.example.org"))
+            self.assertFalse(CircuitBreaker.allows("whois", "whois.example.org"))
+
+            # The other kinds and keys are not affected.
+            self.assertTrue(CircuitBreaker.allows("http", "whois.example.org"))
+            self.assertTrue(CircuitBreaker.allows("whois", "whois.example.net"))
+
+            expected = {
+                "whois:whois.example.org": {
+                    "failures": CircuitBreaker.failures_before_opening,
+                    "seconds_before_closing": CircuitBreaker.seconds_before_closing
+                    - 10,
+                }
+            }
+            actual = CircuitBreaker.summary()
+
+            self.assertEqual(expected, actual)
+
+        expected = {
+            "circuit_breaker_opens": {"whois:whois.example.org": 1},
+            "circuit_breaker_skips": {"whois:whois.example.org": 2},
+        }
+
+        self.assertEqual(expected, Metrics.counters)
+
+    def test_close(self):
+        """
+        Test CircuitBreaker for the case that it lets a request through after
+        the cooldown.
+        """
+
+        with patch("PyFunceble.circuit_breaker.time", return_value=100):
+            for _ in range(CircuitBreaker.failures_before_opening):
+                CircuitBreaker.failure("http", "192.0.2.1")
+
+        cooldown = 100 + CircuitBreaker.seconds_before_closing
+
+        with patch("PyFunceble.circuit_breaker.time", return_value=cooldown):
+            self.assertTrue(CircuitBreaker.allows("http", "192.0.2.1"))
+
+            # One more failure opens it again.
+            CircuitBreaker.failure("http", "192.0.2.1")
+
+            self.assertFalse(CircuitBreaker.allows("http", "192.0.2.1"))
+
+        cooldown += CircuitBreaker.seconds_before_closing
+
+        with patch("PyFunceble.circuit_breaker.time", return_value=cooldown):
+            self.assertTrue(CircuitBreaker.allows("http", "192.0.2.1"))
+
+            # A success closes it.
+            CircuitBreaker.success("http", "192.0.2.1")
+            CircuitBreaker.failure("http", "192.0.2.1")
+
+            self.assertTrue(CircuitBreaker.allows("http", "192.0.2.1"))
+
+        expected = {}
+        actual = CircuitBreaker.summary()
+
+        self.assertEqual(expected, actual)
+
+    def test_not_activated(self):
+        """
+        Test CircuitBreaker for the case that it is not activated.
+        """
+
+        PyFunceble.CONFIGURATION["circuit_breaker"] = False
+
+        for _ in range(CircuitBreaker.failures_before_opening):
+            CircuitBreaker.failure("whois", "whois.example.org")
+
+        self.assertTrue(CircuitBreaker.allows("whois", "whois.example.org"))
+
+        expected = {}
+
+        self.assertEqual(expected, CircuitBreaker.states)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -60,13 +60,15 @@ License:
 """
 # pylint: enable=line-too-long
 # pylint: disable=protected-access, import-error, ungrouped-imports
-import unittest.mock as mock  # pylint: disable=useless-import-alias
+from os import path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest import main as launch_tests
 
 import PyFunceble
 from helpers import BaseStdout, sys
 from PyFunceble.core import Core
+from PyFunceble.helpers import File
 
 
 class TestsResetCounters(TestCase):
@@ -376,14 +378,11 @@ class TestExtractDomain(TestCase):
 
         del PyFunceble.INTERN["file_to_test"]
 
-    @mock.patch("PyFunceble.path.isfile")
-    def test_extracting_from_file(self, mock_isfile):
+    def test_extracting_from_file(self):
         """
         Test the extraction.
         """
 
-        mock_isfile.return_value = True
-
         actual = [
             "google.com # Leaked ?",
             "facebook.com # Was it a breach or not ?",
@@ -391,15 +390,15 @@ class TestExtractDomain(TestCase):
         ]
         expected = ["google.com # Leaked ?", "facebook.com # Was it a breach or not ?"]
 
-        with mock.patch("builtins.open") as mock_open:
-            mock_open.return_value.__enter__ = mock_open
-            mock_open.return_value.__iter__ = mock.Mock(return_value=iter(actual))
+        with TemporaryDirectory() as directory:
+            file_to_test = path.join(directory, "this_file_is_a_ghost")
 
-            PyFunceble.INTERN["file_to_test"] = mock_open
+            File(file_to_test).write("\n".join(actual), overwrite=True)
 
-            self.assertEqual(expected, Core._extract_domain_from_file())
+            PyFunceble.INTERN["file_to_test"] = file_to_test
+            self.addCleanup(PyFunceble.INTERN.pop, "file_to_test")
 
-        del PyFunceble.INTERN["file_to_test"]
+            self.assertEqual(expected, Core._extract_domain_from_file())
 
 
 class TestSwitch(TestCase):
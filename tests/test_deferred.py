@@ -0,0 +1,141 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.deferred.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.deferred import Deferred
+
+
+class TestDeferred(TestCase):
+    """
+    Testing of PyFunceble.deferred.Deferred().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.INTERN["to_test"] = "hello.world"
+        PyFunceble.INTERN["http_code"] = 200
+        PyFunceble.INTERN["referer"] = "whois.hello.world"
+
+    def tearDown(self):
+        """
+        Stop to record.
+        """
+
+        Deferred.stop()
+
+    def test_record_not_started(self):
+        """
+        Test Deferred.record() while we are not recording.
+        """
+
+        expected = False
+        actual = Deferred.record("status_file", ["ACTIVE", "SOA", None])
+
+        self.assertEqual(expected, actual)
+
+        expected = []
+        actual = Deferred.stop()
+
+        self.assertEqual(expected, actual)
+
+    def test_record(self):
+        """
+        Test Deferred.record() while we are recording.
+        """
+
+        Deferred.start()
+
+        self.assertEqual(True, Deferred.is_started())
+
+        expected = True
+        actual = Deferred.record(
+            "analytic_file", ["ACTIVE", None, None], ["potentially_down"]
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = [
+            {
+                "action": "analytic_file",
+                "arguments": ["ACTIVE", None, None],
+                "method_arguments": ["potentially_down"],
+                "to_test": "hello.world",
+                "http_code": 200,
+                "referer": "whois.hello.world",
+            }
+        ]
+        actual = Deferred.stop()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(False, Deferred.is_started())
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,247 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.distributed.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error, protected-access
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.distributed import Coordination, Distributed
+from PyFunceble.helpers import File
+
+
+class TestCoordination(TestCase):
+    """
+    Testing of PyFunceble.distributed.Coordination().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["distributed_batch_size"] = 2
+        PyFunceble.CONFIGURATION["seconds_before_distributed_requeue"] = 300
+        PyFunceble.CONFIGURATION["seconds_before_distributed_timeout"] = 3600
+
+        self.list_to_test = ["hello.world", "world.hello", "hello.com"]
+        self.coordination = Coordination(self.list_to_test, ("state",))
+
+    def test_state(self):
+        """
+        Test Coordination().state().
+        """
+
+        expected = ("state",)
+        actual = self.coordination.state()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_batch(self):
+        """
+        Test Coordination().get_batch().
+        """
+
+        expected = {"id": 0, "subjects": [(0, "hello.world"), (1, "world.hello")]}
+        actual = self.coordination.get_batch()
+
+        self.assertEqual(expected, actual)
+
+        expected = {"id": 1, "subjects": [(2, "hello.com")]}
+        actual = self.coordination.get_batch()
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = self.coordination.get_batch()
+
+        self.assertEqual(expected, actual)
+
+        for index, _ in enumerate(self.list_to_test):
+            self.coordination.put_result(index, {"status": "VALID"})
+
+        expected = None
+        actual = self.coordination.get_batch()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_batch_requeue(self):
+        """
+        Test Coordination().get_batch() when a worker disappears with a batch.
+        """
+
+        self.coordination.get_batch()
+        self.coordination.put_result(0, {"status": "VALID"})
+
+        PyFunceble.CONFIGURATION["seconds_before_distributed_requeue"] = 0
+        self.coordination.get_batch()
+
+        expected = {"id": 0, "subjects": [(1, "world.hello")]}
+        actual = self.coordination.get_batch()
+
+        self.assertEqual(expected, actual)
+
+    def test_put_get_result(self):
+        """
+        Test Coordination().put_result() and Coordination().get_result().
+        """
+
+        self.coordination.put_result(1, {"status": "VALID"})
+        self.coordination.put_result(1, {"status": "INVALID"})
+
+        expected = {"status": "VALID"}
+        actual = self.coordination.get_result(1)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_result_timeout(self):
+        """
+        Test Coordination().get_result() when every worker disappeared.
+        """
+
+        self.coordination.last_received_at -= 60
+        PyFunceble.CONFIGURATION["seconds_before_distributed_timeout"] = 30
+
+        self.assertRaises(TimeoutError, lambda: self.coordination.get_result(0))
+
+
+class TestDistributed(TestCase):
+    """
+    Testing of PyFunceble.distributed.Distributed().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["distributed_authkey"] = ""
+        PyFunceble.CONFIGURATION["distributed_authkey_file"] = ""
+        PyFunceble.environ.pop("PYFUNCEBLE_DISTRIBUTED_AUTHKEY", None)
+
+        self.file = PyFunceble.get_current_directory() + "authkey_test"
+
+    def tearDown(self):
+        """
+        Cleanup everything.
+        """
+
+        PyFunceble.environ.pop("PYFUNCEBLE_DISTRIBUTED_AUTHKEY", None)
+        File(self.file).delete()
+
+    def test_authkey(self):
+        """
+        Test Distributed()._authkey().
+        """
+
+        expected = b""
+        actual = Distributed._authkey()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["distributed_authkey"] = "hello"
+
+        expected = b"hello"
+        actual = Distributed._authkey()
+
+        self.assertEqual(expected, actual)
+
+        File(self.file).write("world\n", overwrite=True)
+        PyFunceble.CONFIGURATION["distributed_authkey_file"] = self.file
+
+        expected = b"world"
+        actual = Distributed._authkey()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.environ["PYFUNCEBLE_DISTRIBUTED_AUTHKEY"] = "hello world"
+
+        expected = b"hello world"
+        actual = Distributed._authkey()
+
+        self.assertEqual(expected, actual)
+
+    def test_coordinator_authkey(self):
+        """
+        Test Distributed()._coordinator_authkey().
+        """
+
+        PyFunceble.CONFIGURATION["distributed_authkey"] = "hello"
+
+        expected = b"hello"
+        actual = Distributed._coordinator_authkey()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["distributed_authkey"] = ""
+
+        actual = Distributed._coordinator_authkey()
+
+        self.assertEqual(32, len(actual))
+        self.assertNotEqual(actual, Distributed._coordinator_authkey())
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -174,6 +174,56 @@ class TestExpirationDate(TestCase):
                 expected, actual, msg="Error for %s" % special_case[data[0]]
             )
 
+    def test_has_expiration_date(self):
+        """
+        Test ExpirationDate.has_expiration_date().
+        """
+
+        record = b"Domain Name: EXAMPLE.COM\nRegistry Expiry Date: 2028-09-14"
+
+        expected = False
+        actual = ExpirationDate.has_expiration_date(record)
+
+        self.assertEqual(expected, actual)
+
+        record += b"T04:00:00Z\n"
+
+        expected = True
+        actual = ExpirationDate.has_expiration_date(record)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = ExpirationDate.has_expiration_date(record, start=len(record) - 1)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = ExpirationDate.has_expiration_date(b"Expiry Date: unknown\n")
+
+        self.assertEqual(expected, actual)
+
+        record = b"Expiration Date: 2028-09-14\nRegistry Expiry Date: 2029"
+
+        expected = False
+        actual = ExpirationDate.has_expiration_date(record)
+
+        self.assertEqual(expected, actual)
+
+        record += b"-09-14\n"
+
+        expected = True
+        actual = ExpirationDate.has_expiration_date(record)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = ExpirationDate.has_expiration_date(
+            b"Expiration Date: 2028-09-14\nexpire: unknown\n"
+        )
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -471,6 +471,18 @@ world: Fun Ilrys
 
         self.assertEqual(expected, actual)
 
+    def test_from_json_lines(self):
+        """
+        Test of Dict().from_json_lines().
+        """
+
+        given = '{"hello": "world"}\n{"world": "hello"}\n{"hello": "fun"}\n{"Py'
+
+        expected = {"hello": "fun", "world": "hello"}
+        actual = Dict().from_json_lines(given)
+
+        self.assertEqual(expected, actual)
+
 
 class TestDirectory(TestCase):
     """
@@ -0,0 +1,250 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.iana.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+import socketserver
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Lock, Thread
+from time import sleep
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.helpers import Dict, File
+from PyFunceble.iana import IANA
+
+
+class StubWhoisHandler(socketserver.StreamRequestHandler):
+    """
+    Answer like the IANA WHOIS server.
+    """
+
+    # We save the number of queries we are currently answering.
+    active = 0
+
+    # We save the maximal number of queries we answered at once.
+    maximal_active = 0
+
+    # We save the queries we answered.
+    queries = []
+
+    # We save the lock which protect the counters.
+    lock = Lock()
+
+    def handle(self):
+        """
+        Answer the query.
+        """
+
+        query = self.rfile.readline().decode().strip()
+
+        with self.lock:
+            self.__class__.active += 1
+            self.__class__.maximal_active = max(
+                self.__class__.maximal_active, self.__class__.active
+            )
+            self.__class__.queries.append(query)
+
+        sleep(0.05)
+
+        extension = query[query.rindex(".") + 1 :]
+
+        if extension != "unknown":
+            self.wfile.write(
+                ("domain: %s\n\nrefer: whois.nic.%s\n\n" % (extension, extension))
+                .encode()
+            )
+
+        with self.lock:
+            self.__class__.active -= 1
+
+
+class TestIANA(TestCase):
+    """
+    Testing of PyFunceble.iana.IANA() against a local WHOIS server.
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["quiet"] = True
+        PyFunceble.CONFIGURATION["iana_whois_server"] = "127.0.0.1"
+
+        StubWhoisHandler.active = 0
+        StubWhoisHandler.maximal_active = 0
+        StubWhoisHandler.queries = []
+
+        self.server = socketserver.ThreadingTCPServer(
+            ("127.0.0.1", 0), StubWhoisHandler
+        )
+        self.server.daemon_threads = True
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+
+        self.iana = IANA()
+        self.iana.iana_db = {}
+        self.iana.destination = path.join(self.directory.name, "iana-domains-db.json")
+        self.iana.whois_port = self.server.server_address[1]
+        self.iana.seconds_between_queries = 0
+
+        self.extensions = ["com", "org", "net", "dev", "app", "io", "fr", "be"]
+
+    def tearDown(self):
+        """
+        Stop the server.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+        PyFunceble.CONFIGURATION["quiet"] = False
+
+    def test_update(self):
+        """
+        Test IANA().update().
+        """
+
+        self.iana.maximal_workers = 4
+
+        with mock.patch.object(IANA, "_upstream_extensions") as upstream:
+            upstream.return_value = self.extensions
+
+            self.iana.update()
+
+        expected = {x: "whois.nic.%s" % x for x in self.extensions}
+        actual = Dict().from_json(File(self.iana.destination).read())
+
+        self.assertEqual(expected, actual)
+
+        expected = sorted(["hello.%s" % x for x in self.extensions])
+        actual = sorted(StubWhoisHandler.queries)
+
+        self.assertEqual(expected, actual)
+
+        self.assertGreater(StubWhoisHandler.maximal_active, 1)
+        self.assertLessEqual(StubWhoisHandler.maximal_active, 4)
+
+    def test_update_spaced(self):
+        """
+        Test that IANA().update() waits between two queries.
+        """
+
+        self.iana.seconds_between_queries = 0.1
+
+        with mock.patch.object(IANA, "_upstream_extensions") as upstream:
+            upstream.return_value = self.extensions[:3]
+
+            start = PyFunceble.time()
+            self.iana.update()
+
+        self.assertGreaterEqual(PyFunceble.time() - start, 0.2)
+        self.assertEqual(1, StubWhoisHandler.maximal_active)
+
+    def test_update_reuse(self):
+        """
+        Test that IANA().update() keeps what we already know and writes
+        the database once.
+        """
+
+        self.iana.iana_db = {"com": "whois.nic.com", "unknown": "whois.nic.unknown"}
+
+        with mock.patch.object(IANA, "_upstream_extensions") as upstream:
+            upstream.return_value = ["com", "unknown"]
+
+            with mock.patch("PyFunceble.iana.Dict.to_json") as to_json:
+                self.iana.update()
+
+                expected = 0
+                actual = to_json.call_count
+
+                self.assertEqual(expected, actual)
+
+            upstream.return_value = self.extensions + ["unknown"]
+
+            with mock.patch("PyFunceble.iana.Dict.to_json") as to_json:
+                self.iana.update()
+
+                expected = 1
+                actual = to_json.call_count
+
+                self.assertEqual(expected, actual)
+
+        expected = "whois.nic.unknown"
+        actual = self.iana.iana_db["unknown"]
+
+        self.assertEqual(expected, actual)
+
+        expected = "whois.nic.be"
+        actual = self.iana.iana_db["be"]
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,191 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test the lazy initialisation of PyFunceble.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from subprocess import PIPE, Popen
+from sys import executable
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+
+
+class TestsImport(TestCase):
+    """
+    Testing of the lazy initialisation of PyFunceble.
+    """
+
+    @classmethod
+    def run_python(cls, code):
+        """
+        Run the given code into a fresh interpreter and return its output.
+
+        :param code: The code to run.
+        :type code: str
+
+        :rtype: str
+        """
+
+        with Popen(
+            [executable, "-c", code], stdout=PIPE, stderr=PIPE, cwd=PyFunceble.getcwd()
+        ) as process:
+            output, _ = process.communicate()
+
+        return output.decode("utf-8").strip()
+
+    def test_heavy_modules_not_imported(self):
+        """
+        Test that :code:`import PyFunceble` does not import the heavy
+        third-party modules.
+        """
+
+        code = (
+            "import sys, PyFunceble; "
+            "print(sorted(x for x in ('requests', 'yaml', 'urllib3', 'colorama', "
+            "'PyFunceble.core', 'PyFunceble.iana', 'PyFunceble.publicsuffix') "
+            "if x in sys.modules))"
+        )
+
+        expected = "[]"
+        actual = self.run_python(code)
+
+        self.assertEqual(expected, actual)
+
+    def test_import_time(self):
+        """
+        Test that :code:`import PyFunceble` stays under our budget.
+        """
+
+        code = (
+            "from time import perf_counter; start = perf_counter(); "
+            "import PyFunceble; print(perf_counter() - start)"
+        )
+
+        # Note: The whole package used to take around 200ms to import. We keep a
+        # large margin so that slow machines are not reported.
+        expected = 0.15
+        actual = float(self.run_python(code))
+
+        self.assertLess(actual, expected)
+
+    def test_lazy_import(self):
+        """
+        Test that the lazy imports are resolved on first use.
+        """
+
+        from PyFunceble.check import Check  # pylint: disable=import-outside-toplevel
+
+        expected = Check
+        actual = PyFunceble.Check.lazy_target()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.Load(PyFunceble.get_current_directory())
+
+        expected = True
+        actual = PyFunceble.Check("google.com").is_domain_valid()
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(AttributeError, lambda: PyFunceble.requests.hello_world)
+
+    def test_lazy_import_mock(self):
+        """
+        Test that the attributes of a lazy import can still be mocked.
+        """
+
+        original = PyFunceble.requests.get
+
+        with mock.patch("PyFunceble.requests.get") as get:
+            expected = get
+            actual = PyFunceble.requests.get
+
+            self.assertEqual(expected, actual)
+
+        expected = original
+        actual = PyFunceble.requests.get
+
+        self.assertEqual(expected, actual)
+
+    def test_current_directory(self):
+        """
+        Test that the directory we are working with is computed once.
+        """
+
+        expected = PyFunceble.get_current_directory()
+        actual = PyFunceble.get_current_directory()
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(actual.endswith(PyFunceble.directory_separator))
+
+        expected = (
+            "import PyFunceble; "
+            "print(PyFunceble.get_current_directory() is vars(PyFunceble)"
+            "['CURRENT_DIRECTORY'])"
+        )
+        actual = self.run_python(expected)
+
+        self.assertEqual("True", actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,263 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.incremental.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=protected-access, import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.database import Inactive, Whois
+from PyFunceble.helpers import File
+from PyFunceble.incremental import Incremental
+
+
+class TestIncremental(TestCase):
+    """
+    Test PyFunceble.incremental.Incremental
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the test
+        """
+
+        PyFunceble.load_config(True)
+
+        PyFunceble.INTERN["file_to_test"] = "this_file_is_a_ghost"
+        PyFunceble.CONFIGURATION["incremental"] = True
+        PyFunceble.CONFIGURATION["days_between_incremental_retest"] = 7
+
+        self.file = (
+            PyFunceble.get_current_directory()
+            + PyFunceble.OUTPUTS["default_files"]["incremental_db"]
+        )
+
+        self.test_file_not_exist()
+
+    def tearDown(self):
+        """
+        Clean everything we did.
+        """
+
+        PyFunceble.CONFIGURATION["incremental"] = False
+        self.test_file_not_exist()
+
+    def test_file_not_exist(self):
+        """
+        Test if everything is right with the generated
+        file.
+        """
+
+        File(self.file).delete()
+
+        if "incremental_db" in PyFunceble.INTERN:
+            del PyFunceble.INTERN["incremental_db"]
+
+        expected = False
+        actual = PyFunceble.path.isfile(self.file)
+
+        self.assertEqual(expected, actual)
+
+    def test_authorization(self):
+        """
+        Test the authorization method.
+        """
+
+        PyFunceble.CONFIGURATION["incremental"] = False
+
+        self.assertEqual(False, Incremental()._authorization())
+
+        PyFunceble.CONFIGURATION["incremental"] = True
+
+        self.assertEqual(True, Incremental()._authorization())
+
+    def test_to_test(self):
+        """
+        Test Incremental.to_test() and Incremental.add().
+        """
+
+        list_to_test = ["hello.world", "world.hello", "fun.ilrys"]
+
+        expected = list_to_test
+        actual = Incremental().to_test(list_to_test)
+
+        self.assertEqual(expected, actual)
+
+        for element in list_to_test[:2]:
+            PyFunceble.INTERN["to_test"] = element
+            Incremental().add()
+
+        # We simulate a restart.
+        del PyFunceble.INTERN["incremental_db"]
+
+        expected = ["fun.ilrys"]
+        actual = Incremental().to_test(list_to_test)
+
+        self.assertEqual(expected, actual)
+
+        # We simulate that hello.world was tested a long time ago.
+        PyFunceble.INTERN["incremental_db"][PyFunceble.INTERN["file_to_test"]][
+            Incremental._hash("hello.world")
+        ] = int(PyFunceble.time()) - (8 * 24 * 3600)
+
+        expected = ["hello.world", "fun.ilrys", "github.com"]
+        actual = Incremental().to_test(["hello.world", "fun.ilrys", "github.com"])
+
+        self.assertEqual(expected, actual)
+
+        # We simulate a restart.
+        del PyFunceble.INTERN["incremental_db"]
+
+        expected = {
+            PyFunceble.INTERN["file_to_test"]: {
+                Incremental._hash("hello.world"): int(PyFunceble.time())
+                - (8 * 24 * 3600)
+            }
+        }
+
+        Incremental()
+
+        self.assertEqual(expected, PyFunceble.INTERN["incremental_db"])
+
+    def test_to_test_idna(self):
+        """
+        Test Incremental.to_test() and Incremental.add() for the case that the
+        elements are converted to IDNA before being tested.
+        """
+
+        PyFunceble.CONFIGURATION["idna_conversion"] = True
+        PyFunceble.INTERN["to_test_type"] = "domain"
+
+        list_to_test = ["bücher.de", "hello.world"]
+
+        expected = ["xn--bcher-kva.de", "hello.world"]
+        actual = Incremental.tested_form(list_to_test)
+
+        self.assertEqual(expected, actual)
+
+        for element in actual:
+            PyFunceble.INTERN["to_test"] = element
+            Incremental().add()
+
+        # We simulate a restart.
+        del PyFunceble.INTERN["incremental_db"]
+
+        expected = []
+        actual = Incremental().to_test(list_to_test)
+
+        self.assertEqual(expected, actual)
+
+        # And the converted elements are not pruned.
+        actual = PyFunceble.INTERN["incremental_db"][PyFunceble.INTERN["file_to_test"]]
+
+        self.assertEqual(2, len(actual))
+
+        PyFunceble.CONFIGURATION["idna_conversion"] = False
+
+    def test_prune(self):
+        """
+        Test Inactive.prune() and Whois.prune().
+        """
+
+        PyFunceble.INTERN["inactive_db"] = {
+            PyFunceble.INTERN["file_to_test"]: {
+                "1523447416": ["hello.world", "fun.ilrys"],
+                "to_test": ["hello.world", "world.hello"],
+            }
+        }
+        PyFunceble.INTERN["whois_db"] = {
+            PyFunceble.INTERN["file_to_test"]: {
+                "hello.world": {"expiration_date": "25-dec-2007"},
+                "fun.ilrys": {"expiration_date": "25-dec-2007"},
+            }
+        }
+
+        Inactive().prune(["hello.world", "github.com"])
+        Whois().prune(["hello.world", "github.com"])
+
+        expected = {
+            PyFunceble.INTERN["file_to_test"]: {
+                "1523447416": ["hello.world"],
+                "to_test": ["hello.world"],
+            }
+        }
+
+        self.assertEqual(expected, PyFunceble.INTERN["inactive_db"])
+
+        expected = {
+            PyFunceble.INTERN["file_to_test"]: {
+                "hello.world": {"expiration_date": "25-dec-2007"}
+            }
+        }
+
+        self.assertEqual(expected, PyFunceble.INTERN["whois_db"])
+
+        for database in ["inactive_db", "whois_db"]:
+            File(
+                PyFunceble.get_current_directory()
+                + PyFunceble.OUTPUTS["default_files"][database]
+            ).delete()
+
+            del PyFunceble.INTERN[database]
+
+
+if __name__ == "__main__":
+    launch_tests()
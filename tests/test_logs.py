@@ -0,0 +1,377 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.logs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.deferred import Deferred
+from PyFunceble.helpers import File
+from PyFunceble.logs import Logs, LogsSharing
+from PyFunceble.processes import Processes
+
+
+class TestsLogs(TestCase):
+    """
+    Testing of PyFunceble.logs.Logs().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        self.file_to_work_with = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + "logs_test.json"
+        )
+
+        self.files = [self.file_to_work_with] + [
+            "%s.%d" % (self.file_to_work_with, x)
+            for x in range(1, Logs.rotated_files + 1)
+        ]
+
+        PyFunceble.CONFIGURATION["no_files"] = False
+        PyFunceble.CONFIGURATION["share_logs"] = False
+        PyFunceble.CONFIGURATION["megabytes_before_logs_rotation"] = 10
+        PyFunceble.INTERN["to_test"] = "hello.world"
+        PyFunceble.INTERN["referer"] = "whois.hello.world"
+
+        Logs.converted_files.clear()
+
+        for file in self.files:
+            File(file).delete()
+
+    def tearDown(self):
+        """
+        Delete the files we worked with.
+        """
+
+        for file in self.files:
+            File(file).delete()
+
+    def test_append(self):
+        """
+        Test that each record is appended as one line.
+        """
+
+        Logs(output=self.file_to_work_with).expiration_date("01-jan-1970")
+        Logs(output=self.file_to_work_with).expiration_date("02-jan-1970")
+
+        actual = File(self.file_to_work_with).read().splitlines()
+
+        self.assertEqual(2, len(actual))
+
+        actual = [
+            x["expiration_date"]
+            for x in Logs._get_content(  # pylint: disable=protected-access
+                self.file_to_work_with
+            ).values()
+        ]
+
+        self.assertIn("02-jan-1970", actual)
+
+    def test_skipped(self):
+        """
+        Test that the skipped elements are logged at once and that the
+        records of the same instant do not overwrite each other.
+        """
+
+        PyFunceble.CONFIGURATION["logs"] = True
+
+        logs = Logs(output=self.file_to_work_with)
+
+        logs.skipped(["hello.world", "world.hello"], "http_code", "nslookup")
+        logs.skipped(["hello.com"], "http_code", "nslookup")
+        logs.skipped([], "http_code", "nslookup")
+
+        expected = [["hello.world", "world.hello"], ["hello.com"]]
+        actual = sorted(
+            [
+                x["domains"]
+                for x in Logs._get_content(  # pylint: disable=protected-access
+                    self.file_to_work_with
+                ).values()
+            ],
+            key=len,
+            reverse=True,
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_historical_format(self):
+        """
+        Test that a file in the historical format is converted.
+        """
+
+        File(self.file_to_work_with).write(
+            '{\n    "1": {\n        "domain": "world.hello"\n    }\n}', overwrite=True
+        )
+
+        Logs(output=self.file_to_work_with).referer_not_found("world")
+
+        expected = ['{"1": {"domain": "world.hello"}}']
+        actual = File(self.file_to_work_with).read().splitlines()
+
+        self.assertEqual(expected, actual[:1])
+        self.assertEqual(2, len(actual))
+
+        self.assertIn(self.file_to_work_with, Logs.converted_files)
+
+        File(self.file_to_work_with).write(
+            '{\n    "2": {\n        "domain": "hello.world"\n    }\n}', overwrite=True
+        )
+
+        Logs(output=self.file_to_work_with).referer_not_found("world")
+
+        # The format is only checked once per session.
+        expected = '{\n    "2": {\n        "domain": "hello.world"\n    }\n}'
+        actual = File(self.file_to_work_with).read()
+
+        self.assertTrue(actual.startswith(expected))
+
+    def test_deferred(self):
+        """
+        Test that the records of a worker are written by the main process.
+        """
+
+        Deferred.start()
+
+        Logs(output=self.file_to_work_with).expiration_date("01-jan-1970")
+
+        records = Deferred.stop()
+
+        self.assertFalse(PyFunceble.path.isfile(self.file_to_work_with))
+        self.assertEqual(["logs"], [x["action"] for x in records])
+
+        Processes.replay(records)
+
+        expected = 1
+        actual = len(File(self.file_to_work_with).read().splitlines())
+
+        self.assertEqual(expected, actual)
+
+    def test_rotation(self):
+        """
+        Test the rotation of the log files.
+        """
+
+        PyFunceble.CONFIGURATION["megabytes_before_logs_rotation"] = 0.0001
+
+        for _ in range(Logs.rotated_files + 2):
+            Logs(output=self.file_to_work_with).expiration_date("x" * 100)
+
+        for file in self.files:
+            self.assertTrue(PyFunceble.path.isfile(file))
+
+        self.assertFalse(
+            PyFunceble.path.isfile(
+                "%s.%d" % (self.file_to_work_with, Logs.rotated_files + 1)
+            )
+        )
+
+        expected = 1
+        actual = len(File(self.file_to_work_with).read().splitlines())
+
+        self.assertEqual(expected, actual)
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """
+    Provide a stub of the logs sharing API.
+    """
+
+    # Save the received submissions.
+    received = []
+
+    # Save the number of submissions to fail before accepting them.
+    to_fail = 0
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """
+        Handle a submission.
+        """
+
+        data = self.rfile.read(int(self.headers["Content-Length"])).decode()
+
+        if StubAPIHandler.to_fail:
+            StubAPIHandler.to_fail -= 1
+            self.send_response(503)
+        else:
+            StubAPIHandler.received.append(data)
+            self.send_response(200)
+
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """
+        Silence the stub.
+        """
+
+
+class TestsLogsSharing(TestCase):
+    """
+    Testing of PyFunceble.logs.LogsSharing().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        StubAPIHandler.received = []
+        StubAPIHandler.to_fail = 0
+
+        self.server = HTTPServer(("127.0.0.1", 0), StubAPIHandler)
+        self.link = "http://127.0.0.1:%d/api/date-format" % self.server.server_port
+
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+        LogsSharing.seconds_before_retry = 0.01
+        LogsSharing.failed = 0
+
+    def tearDown(self):
+        """
+        Stop the stub.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_push_flush(self):
+        """
+        Test that everything is sent once flushed.
+        """
+
+        for index in range(10):
+            LogsSharing().push(self.link, {"domain": "hello%d.world" % index})
+
+        LogsSharing.flush()
+
+        expected = ["domain=hello%d.world" % x for x in range(10)]
+        actual = StubAPIHandler.received
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(LogsSharing.worker.is_alive())
+
+    def test_restart(self):
+        """
+        Test that a restart keeps the records of the queue and does not
+        register the flush twice.
+        """
+
+        LogsSharing().push(self.link, {"domain": "hello.world"})
+        LogsSharing.flush()
+
+        queue = LogsSharing.queue
+
+        # We simulate a record which was left into the queue.
+        queue.put_nowait((self.link, {"domain": "left.over"}))
+
+        LogsSharing().push(self.link, {"domain": "world.hello"})
+        LogsSharing.flush()
+
+        expected = ["domain=hello.world", "domain=left.over", "domain=world.hello"]
+        actual = StubAPIHandler.received
+
+        self.assertEqual(expected, actual)
+        self.assertIs(queue, LogsSharing.queue)
+        self.assertTrue(LogsSharing.registered)
+
+    def test_retry(self):
+        """
+        Test that a failing submission is retried.
+        """
+
+        StubAPIHandler.to_fail = 2
+
+        LogsSharing().push(self.link, {"domain": "hello.world"})
+        LogsSharing.flush()
+
+        expected = ["domain=hello.world"]
+        actual = StubAPIHandler.received
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(0, LogsSharing.failed)
+
+    def test_give_up(self):
+        """
+        Test that we give up after the maximal number of retries.
+        """
+
+        StubAPIHandler.to_fail = LogsSharing.maximal_retries + 1
+
+        LogsSharing().push(self.link, {"domain": "hello.world"})
+        LogsSharing.flush()
+
+        self.assertEqual([], StubAPIHandler.received)
+        self.assertEqual(1, LogsSharing.failed)
+
+
+if __name__ == "__main__":
+    launch_tests()
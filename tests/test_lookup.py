@@ -63,6 +63,7 @@ from unittest import TestCase
 from unittest import main as launch_tests
 
 import PyFunceble
+from PyFunceble.expiration_date import ExpirationDate
 from PyFunceble.lookup import Lookup
 
 
@@ -115,6 +116,116 @@ class TestLookup(TestCase):
         self.assertEqual(expected, actual)
         del PyFunceble.INTERN["to_test"]
 
+    def test_whois_address(self):
+        """
+        Test of Lookup._address() for the case that we resolve a whois server
+        once.
+        """
+
+        Lookup.whois_addresses.clear()
+
+        expected = "127.0.0.1"
+        actual = Lookup._address("127.0.0.1", 43)  # pylint: disable=protected-access
+
+        self.assertEqual(expected, actual)
+
+        expected = {"127.0.0.1": "127.0.0.1"}
+
+        self.assertEqual(expected, Lookup.whois_addresses)
+
+        Lookup.whois_addresses["whois.example.org"] = "127.0.0.2"
+
+        expected = "127.0.0.2"
+        actual = Lookup._address(  # pylint: disable=protected-access
+            "whois.example.org", 43
+        )
+
+        self.assertEqual(expected, actual)
+
+        Lookup.whois_addresses.clear()
+
+    def test_whois_preconnected(self):
+        """
+        Test of Lookup._preconnected() for the case that we get the fresh
+        connections and close the stale ones.
+        """
+
+        stale = PyFunceble.socket.socket()
+        fresh = PyFunceble.socket.socket()
+
+        Lookup.preconnections[("127.0.0.1", 43)] = [
+            (stale, PyFunceble.time() - 60),
+            (fresh, PyFunceble.time()),
+        ]
+
+        expected = fresh
+        actual = Lookup._preconnected(  # pylint: disable=protected-access
+            "127.0.0.1", 43
+        )
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(-1, stale.fileno())
+
+        expected = None
+        actual = Lookup._preconnected(  # pylint: disable=protected-access
+            "127.0.0.1", 43
+        )
+
+        self.assertEqual(expected, actual)
+
+        Lookup.preconnections[("127.0.0.1", 43)] = [(stale, PyFunceble.time())]
+        Lookup.close_preconnections()
+
+        expected = {}
+
+        self.assertEqual(expected, Lookup.preconnections)
+
+        fresh.close()
+
+    def test_whois_query(self):
+        """
+        Test of Lookup._query() for the case that we read a record bigger than
+        the initial buffer, stop early and truncate it.
+        """
+
+        # pylint: disable=protected-access
+        initial_record_size = Lookup.initial_record_size
+        maximal_record_size = Lookup.maximal_record_size
+
+        Lookup.initial_record_size = 8
+        Lookup.maximal_record_size = 64
+
+        record = b"Domain: example.com\nExpiry Date: 2028-09-14\n"
+
+        client, server = PyFunceble.socket.socketpair()
+        client.settimeout(1)
+
+        # We do not close the connection so that we only get a record if we
+        # stop early.
+        server.send(record)
+
+        expected = record
+        actual = Lookup._query(
+            client, "example.com", until=ExpirationDate.has_expiration_date
+        )
+        server.close()
+
+        self.assertEqual(expected, actual)
+
+        client, server = PyFunceble.socket.socketpair()
+
+        server.send(record * 2)
+        server.shutdown(PyFunceble.socket.SHUT_WR)
+
+        expected = (record * 2)[:64]
+        actual = Lookup._query(client, "example.com")
+        server.close()
+
+        self.assertEqual(expected, actual)
+
+        Lookup.initial_record_size = initial_record_size
+        Lookup.maximal_record_size = maximal_record_size
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -0,0 +1,284 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.metrics.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.helpers import Dict, File
+from PyFunceble.metrics import Metrics
+from PyFunceble.timings import Timings
+
+
+class TestMetrics(TestCase):
+    """
+    Testing of PyFunceble.metrics.Metrics().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["metrics"] = True
+        Metrics.counters = {}
+        Metrics.started = Metrics.started_tested = Metrics.last_dump = None
+        Timings.histograms = {}
+
+        self.files = [
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"][x]
+            for x in ["metrics_json", "metrics_prometheus"]
+        ]
+
+        for file in self.files:
+            File(file).delete()
+
+    def tearDown(self):
+        """
+        Clean what we generated.
+        """
+
+        PyFunceble.CONFIGURATION["metrics"] = False
+        PyFunceble.CONFIGURATION["metrics_format"] = "prometheus"
+        Metrics.counters = {}
+        Metrics.started = Metrics.started_tested = Metrics.last_dump = None
+        Timings.histograms = {}
+
+        for file in self.files:
+            File(file).delete()
+
+    def test_count_pop_merge(self):
+        """
+        Test Metrics.count(), Metrics.cache(), Metrics.pop() and Metrics.merge().
+        """
+
+        Metrics.count("timeouts", "http")
+        Metrics.count("timeouts", "http", 2)
+        Metrics.cache("whois_db", True)
+        Metrics.cache("whois_db", False)
+
+        expected = 3
+        actual = Metrics.get("timeouts", "http")
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = Metrics.get("timeouts", "whois")
+
+        self.assertEqual(expected, actual)
+
+        worker = Metrics.pop()
+
+        expected = {
+            "timeouts": {"http": 3},
+            "cache_hits": {"whois_db": 1},
+            "cache_misses": {"whois_db": 1},
+        }
+        actual = worker
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = Metrics.counters
+
+        self.assertEqual(expected, actual)
+
+        Metrics.count("timeouts", "http")
+        Metrics.merge(worker)
+        Metrics.merge(None)
+
+        expected = 4
+        actual = Metrics.get("timeouts", "http")
+
+        self.assertEqual(expected, actual)
+
+    def test_snapshot(self):
+        """
+        Test Metrics.snapshot().
+        """
+
+        PyFunceble.INTERN["counter"]["number"].update({"tested": 5})
+
+        with patch("PyFunceble.metrics.time", return_value=100):
+            Metrics.start()
+
+        PyFunceble.INTERN["counter"]["number"].update({"tested": 25, "up": 20})
+        Metrics.count("errors", "whois")
+
+        with patch("PyFunceble.metrics.time", return_value=110):
+            actual = Metrics.snapshot()
+
+        PyFunceble.INTERN["counter"]["number"].update({"tested": 0, "up": 0})
+
+        expected = {
+            "timestamp": 110,
+            "elapsed": 10,
+            "subjects_per_second": 2.0,
+            "subjects": {"down": 0, "invalid": 0, "tested": 25, "up": 20},
+            "counters": {"errors": {"whois": 1}},
+            "stages": {},
+            "circuit_breakers": {},
+        }
+
+        self.assertEqual(expected, actual)
+
+    def test_to_prometheus(self):
+        """
+        Test Metrics.to_prometheus().
+        """
+
+        snapshot = {
+            "timestamp": 110,
+            "elapsed": 10,
+            "subjects_per_second": 2.0,
+            "subjects": {"down": 0, "invalid": 0, "tested": 25, "up": 20},
+            "counters": {"timeouts": {"http": 3}, "unknown": {"hello": 1}},
+            "stages": {
+                "http": {
+                    "count": 3,
+                    "total": 1.5,
+                    "histogram": {
+                        "<= 0.001s": 0,
+                        "<= 0.01s": 1,
+                        "<= 0.1s": 0,
+                        "<= 1s": 1,
+                        "<= 10s": 0,
+                        "> 10s": 1,
+                    },
+                }
+            },
+            "circuit_breakers": {
+                "whois:whois.example.org": {
+                    "failures": 5,
+                    "seconds_before_closing": 42,
+                }
+            },
+        }
+
+        actual = Metrics.to_prometheus(snapshot)
+
+        for expected in [
+            "# TYPE pyfunceble_elapsed_seconds gauge\npyfunceble_elapsed_seconds 10\n",
+            "pyfunceble_subjects_per_second 2.0\n",
+            "pyfunceble_last_dump_timestamp_seconds 110\n",
+            'pyfunceble_subjects{status="up"} 20\n',
+            "# TYPE pyfunceble_timeouts_total counter\n"
+            'pyfunceble_timeouts_total{stage="http"} 3\n',
+            'pyfunceble_stage_duration_seconds_bucket{stage="http",le="0.01"} 1\n',
+            'pyfunceble_stage_duration_seconds_bucket{stage="http",le="10"} 2\n',
+            'pyfunceble_stage_duration_seconds_bucket{stage="http",le="+Inf"} 3\n',
+            'pyfunceble_stage_duration_seconds_sum{stage="http"} 1.5\n',
+            'pyfunceble_stage_duration_seconds_count{stage="http"} 3\n',
+            "# TYPE pyfunceble_circuit_breaker_open gauge\n"
+            'pyfunceble_circuit_breaker_open{breaker="whois:whois.example.org"} 1\n',
+        ]:
+            self.assertIn(expected, actual)
+
+        self.assertNotIn("unknown", actual)
+
+    def test_dump(self):
+        """
+        Test Metrics.dump().
+        """
+
+        Metrics.count("timeouts", "http")
+
+        Metrics.dump()
+
+        self.assertTrue(PyFunceble.path.isfile(self.files[1]))
+        self.assertFalse(PyFunceble.path.isfile(self.files[1] + ".tmp"))
+        self.assertIn(
+            'pyfunceble_timeouts_total{stage="http"} 1', File(self.files[1]).read()
+        )
+
+        PyFunceble.CONFIGURATION["metrics_format"] = "json"
+
+        Metrics.dump(periodic=True)
+
+        self.assertFalse(PyFunceble.path.isfile(self.files[0]))
+
+        Metrics.last_dump -= Metrics.seconds_between_dumps
+
+        Metrics.dump(periodic=True)
+
+        expected = {"timeouts": {"http": 1}}
+        actual = Dict().from_json(File(self.files[0]).read())["counters"]
+
+        self.assertEqual(expected, actual)
+
+        File(self.files[0]).delete()
+        PyFunceble.CONFIGURATION["metrics"] = False
+
+        Metrics.dump()
+
+        self.assertFalse(PyFunceble.path.isfile(self.files[0]))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,327 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.pipeline.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.expiration_date import ExpirationDate
+from PyFunceble.pipeline import Pipeline
+
+
+class TestPipeline(TestCase):
+    """
+    Testing of PyFunceble.pipeline.Pipeline().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.INTERN["to_test_type"] = "domain"
+        Pipeline.prefetched.clear()
+
+    def tearDown(self):
+        """
+        Reset the saved data.
+        """
+
+        Pipeline.prefetched.clear()
+
+    def test_syntax(self):
+        """
+        Test Pipeline().syntax().
+        """
+
+        datasets = [
+            Pipeline.dataset(x)
+            for x in ["google.com", "www.google.com", "192.168.0.1", "hello"]
+        ]
+
+        Pipeline.syntax(datasets)
+
+        expected = [
+            ("domain", False),
+            ("domain", True),
+            ("ip", None),
+            (None, None),
+        ]
+        actual = [(x["type"], x["subdomain"]) for x in datasets]
+
+        self.assertEqual(expected, actual)
+
+        expected = [False, False, False, True]
+        actual = [Pipeline.is_settled(x) for x in datasets]
+
+        self.assertEqual(expected, actual)
+
+    def test_is_settled(self):
+        """
+        Test Pipeline().is_settled().
+        """
+
+        dataset = Pipeline.dataset("google.com")
+        dataset["type"] = "domain"
+
+        self.assertFalse(Pipeline.is_settled(dataset))
+
+        dataset["expiration_date"] = False
+
+        self.assertFalse(Pipeline.is_settled(dataset))
+
+        dataset["expiration_date"] = "14-sep-2020"
+
+        self.assertTrue(Pipeline.is_settled(dataset))
+
+        dataset["expiration_date"] = None
+        dataset["referer"] = False
+
+        self.assertTrue(Pipeline.is_settled(dataset))
+
+    def test_http_threads(self):
+        """
+        Test Pipeline().http() with multiple threads.
+        """
+
+        PyFunceble.CONFIGURATION["short_circuit"] = False
+        PyFunceble.HTTP_CODE["active"] = True
+
+        subjects = ["example%d.org" % x for x in range(20)]
+
+        for threads in [4, 1]:
+            PyFunceble.CONFIGURATION["pipeline_threads"] = threads
+
+            datasets = [Pipeline.dataset(x) for x in subjects]
+
+            Pipeline.syntax(datasets)
+
+            with mock.patch("PyFunceble.pipeline.HTTPCode") as http_code:
+                http_code.side_effect = lambda x: mock.Mock(
+                    get=mock.Mock(return_value=len(x))
+                )
+
+                Pipeline.http(datasets)
+
+            expected = [len(x) for x in subjects]
+            actual = [x["http_code"] for x in datasets]
+
+            self.assertEqual(expected, actual, threads)
+
+    def test_get_stages(self):
+        """
+        Test Pipeline().get_stages().
+        """
+
+        PyFunceble.CONFIGURATION["short_circuit"] = False
+
+        expected = ["syntax", "http", "whois", "dns"]
+        actual = Pipeline.get_stages()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["short_circuit"] = True
+
+        expected = ["syntax", "whois", "dns", "http"]
+        actual = Pipeline.get_stages()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["short_circuit"] = False
+
+    def test_http_short_circuit(self):
+        """
+        Test Pipeline().http() while the short-circuit mode is activated.
+        """
+
+        PyFunceble.CONFIGURATION["short_circuit"] = True
+        PyFunceble.CONFIGURATION["logs"] = False
+        PyFunceble.HTTP_CODE["active"] = True
+
+        datasets = [
+            Pipeline.dataset(x)
+            for x in ["google.com", "example.org", "192.168.0.1", "hello"]
+        ]
+
+        Pipeline.syntax(datasets)
+
+        datasets[0]["nslookup"] = True
+        datasets[1]["nslookup"] = False
+        datasets[2]["nslookup"] = False
+
+        with mock.patch("PyFunceble.pipeline.HTTPCode.get") as http_code:
+            http_code.return_value = 200
+
+            Pipeline.http(datasets)
+
+            expected = 2
+            actual = http_code.call_count
+
+            self.assertEqual(expected, actual)
+
+        expected = [
+            (200, []),
+            ("***", ["http_code"]),
+            (200, []),
+            (None, []),
+        ]
+        actual = [(x["http_code"], x["skipped"]) for x in datasets]
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["short_circuit"] = False
+
+        datasets = [Pipeline.dataset("example.org")]
+
+        Pipeline.syntax(datasets)
+
+        datasets[0]["nslookup"] = False
+
+        with mock.patch("PyFunceble.pipeline.HTTPCode.get") as http_code:
+            http_code.return_value = 200
+
+            Pipeline.http(datasets)
+
+        expected = (200, [])
+        actual = (datasets[0]["http_code"], datasets[0]["skipped"])
+
+        self.assertEqual(expected, actual)
+
+    def test_extract(self):
+        """
+        Test ExpirationDate().extract().
+        """
+
+        whois_record = """
+Domain Name: GOOGLE.COM
+Registry Expiry Date: 2020-09-14T04:00:00Z
+Registrar: MarkMonitor Inc.
+"""
+
+        expected = "14-sep-2020"
+        actual = ExpirationDate().extract(whois_record)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = ExpirationDate().extract("Expiry Date: never")
+
+        self.assertEqual(expected, actual)
+
+        for whois_record in [None, "", "Hello, World!"]:
+            actual = ExpirationDate().extract(whois_record)
+
+            self.assertIsNone(actual, whois_record)
+
+    def test_prefetch(self):
+        """
+        Test Pipeline().prefetch() and Pipeline().get().
+        """
+
+        with mock.patch.object(Pipeline, "get_many") as get_many:
+            get_many.side_effect = lambda subjects: [
+                Pipeline.dataset(x) for x in subjects
+            ]
+
+            Pipeline().prefetch(["google.com", "", "github.com"])
+
+            expected = ["google.com", "github.com"]
+            actual = list(Pipeline.prefetched.keys())
+
+            self.assertEqual(expected, actual)
+
+            expected = 1
+            actual = get_many.call_count
+
+            self.assertEqual(expected, actual)
+
+            expected = "google.com"
+            actual = Pipeline().get("google.com")["to_test"]
+
+            self.assertEqual(expected, actual)
+
+            expected = 1
+            actual = get_many.call_count
+
+            self.assertEqual(expected, actual)
+
+            expected = "google.com"
+            actual = Pipeline().get("google.com")["to_test"]
+
+            self.assertEqual(expected, actual)
+
+            expected = 2
+            actual = get_many.call_count
+
+            self.assertEqual(expected, actual)
+
+            expected = ["github.com"]
+            actual = list(Pipeline.prefetched.keys())
+
+            self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
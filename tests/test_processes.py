@@ -0,0 +1,146 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.processes.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.core import Core
+from PyFunceble.processes import Processes
+
+
+class TestProcesses(TestCase):
+    """
+    Testing of PyFunceble.processes.Processes().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["syntax"] = True
+        PyFunceble.CONFIGURATION["share_logs"] = False
+        PyFunceble.CONFIGURATION["processes"] = 2
+        PyFunceble.INTERN["to_test_type"] = "domain"
+        PyFunceble.INTERN["file_to_test"] = "this_file_is_a_ghost"
+
+    def tearDown(self):
+        """
+        Reset the configuration.
+        """
+
+        PyFunceble.CONFIGURATION["syntax"] = False
+        PyFunceble.CONFIGURATION["processes"] = 1
+        del PyFunceble.INTERN["file_to_test"]
+
+    def test_is_activated(self):
+        """
+        Test Processes.is_activated().
+        """
+
+        self.assertEqual(True, Processes.is_activated())
+
+        PyFunceble.CONFIGURATION["processes"] = 1
+
+        self.assertEqual(False, Processes.is_activated())
+
+    def test_test(self):
+        """
+        Test Processes().test().
+        """
+
+        list_to_test = ["google.com", "hello", "# comment", "0.0.0.0 github.com"]
+
+        expected = [
+            ("google.com", "VALID"),
+            ("hello", "INVALID"),
+            ("", None),
+            ("github.com", "VALID"),
+        ]
+        results = list(
+            Processes(Core._test_in_worker).test(  # pylint: disable=protected-access
+                list_to_test
+            )
+        )
+        actual = [(x["to_test"], x["status"]) for x in results]
+
+        self.assertEqual(expected, actual)
+
+        expected = [
+            ["VALID", "SYNTAX", "Unknown"],
+            ["INVALID", "SYNTAX", "Unknown"],
+            [],
+        ]
+        actual = [
+            [y["arguments"] for y in x["deferred"] if y["action"] == "status_file"]
+            for x in results[:3]
+        ]
+        actual = [x[0] if x else x for x in actual]
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,253 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.progress.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from io import StringIO
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.helpers import Dict, File
+from PyFunceble.metrics import Metrics
+from PyFunceble.progress import Progress
+from PyFunceble.timings import Timings
+
+
+class TestProgress(TestCase):
+    """
+    Testing of PyFunceble.progress.Progress().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["progress"] = True
+        Metrics.counters = {}
+        Timings.in_flight = {}
+
+        self.file = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"]["progress"]
+        )
+
+        File(self.file).delete()
+
+    def tearDown(self):
+        """
+        Clean what we generated.
+        """
+
+        PyFunceble.CONFIGURATION["progress"] = False
+        Metrics.counters = {}
+        Timings.in_flight = {}
+
+        File(self.file).delete()
+
+    def test_in_flight(self):
+        """
+        Test the counting of the stages in flight.
+        """
+
+        with Timings("hello"):
+            expected = {"hello": 1}
+            actual = Timings.in_flight
+
+            self.assertEqual(expected, actual)
+
+        expected = {"hello": 0}
+        actual = Timings.in_flight
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["progress"] = False
+
+        with Timings("world"):
+            pass
+
+        self.assertNotIn("world", Timings.in_flight)
+
+    def test_sample(self):
+        """
+        Test Progress.sample().
+        """
+
+        Progress.total = 100
+        Progress.done = Progress.last_done = 0
+        Progress.rate = None
+        Progress.started = Progress.last_sample = 0
+
+        Metrics.cache("hello", True)
+        Metrics.cache("hello", False)
+        Metrics.cache("hello", False)
+        Metrics.cache("hello", False)
+        Timings.in_flight = {"http": 2, "nslookup": 0}
+
+        with patch("PyFunceble.progress.time", return_value=10):
+            Progress.done = 20
+            actual = Progress.sample()
+
+        expected = {
+            "tested": 20,
+            "total": 100,
+            "percentage": 20.0,
+            "rate": 2.0,
+            "average_rate": 2.0,
+            "eta": 40.0,
+            "in_flight": {"http": 2},
+            "caches": {"hello": 25.0},
+        }
+
+        self.assertEqual(expected, actual)
+
+        with patch("PyFunceble.progress.time", return_value=20):
+            Progress.done = 70
+            actual = Progress.sample()
+
+        # 0.3 * 5 + 0.7 * 2
+        expected = 2.9
+        self.assertEqual(expected, actual["rate"])
+
+        expected = round(30 / 2.9, 2)
+        self.assertEqual(expected, actual["eta"])
+
+        expected = 3.5
+        self.assertEqual(expected, actual["average_rate"])
+
+    def test_report_format(self):
+        """
+        Test the line written by Progress.report().
+        """
+
+        sample = {
+            "tested": 20,
+            "total": 100,
+            "percentage": 20.0,
+            "rate": 2.0,
+            "average_rate": 2.0,
+            "eta": 3725.0,
+            "in_flight": {"nslookup": 1, "http": 2},
+            "caches": {"whois_db": 25.0},
+        }
+
+        expected = (
+            "\r\033[K20/100 (20.0%) | 2.0 subjects/s | ETA 1:02:05 | "
+            "in flight: http 2, nslookup 1 | cache hits: whois_db 25.0%\n"
+        )
+
+        with patch.object(Progress, "sample", return_value=sample), patch(
+            "PyFunceble.progress.stderr", new_callable=StringIO
+        ) as output:
+            Progress.report(last=True)
+
+        actual = output.getvalue()
+
+        self.assertEqual(expected, actual)
+
+        sample.update({"eta": None, "in_flight": {}, "caches": {}})
+
+        expected = "\r\033[K20/100 (20.0%) | 2.0 subjects/s | ETA ?"
+
+        with patch.object(Progress, "sample", return_value=sample), patch(
+            "PyFunceble.progress.stderr", new_callable=StringIO
+        ) as output:
+            Progress.report()
+
+        actual = output.getvalue()
+
+        self.assertEqual(expected, actual)
+
+    def test_start_stop(self):
+        """
+        Test Progress.start() and Progress.stop().
+        """
+
+        with patch("PyFunceble.progress.stderr", new_callable=StringIO) as output:
+            Progress.start(2)
+            Progress.tested()
+            Progress.tested()
+            Progress.stop()
+
+        self.assertIsNone(Progress.thread)
+        self.assertTrue(output.getvalue().endswith("\n"))
+        self.assertIn("2/2 (100.0%)", output.getvalue())
+
+        expected = 2
+        actual = Dict().from_json(File(self.file).read())["tested"]
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["progress"] = False
+
+        Progress.start(2)
+
+        self.assertIsNone(Progress.thread)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,213 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.publicsuffix.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.helpers import Dict, File
+from PyFunceble.publicsuffix import PublicSuffix
+
+
+class TestPublicSuffix(TestCase):
+    """
+    Testing of PyFunceble.publicsuffix.PublicSuffix().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        self.public_suffix = PublicSuffix()
+        self.public_suffix.destination = (
+            PyFunceble.get_current_directory() + "public-suffix_test.json"
+        )
+        self.public_suffix.cache_destination = (
+            PyFunceble.get_current_directory() + "public-suffix-cache_test.json"
+        )
+
+        self.data = """// ===BEGIN ICANN DOMAINS===
+
+// ac : https://en.wikipedia.org/wiki/.ac
+ac
+com.ac
+edu.ac
+com.ac
+
+// jp : https://en.wikipedia.org/wiki/.jp
+jp
+*.kawasaki.jp
+ac.jp
+ac.jp
+// Comment.jp
+
+// xn--p1ai ("rf", Russian-Cyrillic) : RU
+рф
+"""
+
+    def tearDown(self):
+        """
+        Delete the files we worked with.
+        """
+
+        File(self.public_suffix.destination).delete()
+        File(self.public_suffix.cache_destination).delete()
+
+    def test_parse(self):
+        """
+        Test PublicSuffix().parse().
+        """
+
+        expected = {
+            "ac": ["com.ac", "edu.ac"],
+            "jp": ["ac.jp", "kawasaki.jp"],
+        }
+        actual = self.public_suffix.parse(self.data)
+
+        self.assertEqual(expected, actual)
+
+    def test_diff(self):
+        """
+        Test PublicSuffix().diff().
+        """
+
+        old = {"ac": ["com.ac", "edu.ac"], "jp": ["ac.jp"]}
+        new = {"ac": ["com.ac", "net.ac"], "fr": ["gouv.fr"]}
+
+        expected = {"added": ["gouv.fr", "net.ac"], "removed": ["ac.jp", "edu.ac"]}
+        actual = PublicSuffix.diff(old, new)
+
+        self.assertEqual(expected, actual)
+
+        expected = {"added": [], "removed": []}
+        actual = PublicSuffix.diff(new, new)
+
+        self.assertEqual(expected, actual)
+
+    @mock.patch("PyFunceble.requests.get")
+    def test_update(self, get):
+        """
+        Test PublicSuffix().update().
+        """
+
+        PyFunceble.CONFIGURATION["quiet"] = True
+
+        get.return_value = mock.Mock(
+            status_code=200,
+            text=self.data,
+            headers={
+                "ETag": '"hello"',
+                "Last-Modified": "Mon, 14 Sep 2020 04:00:00 GMT",
+            },
+        )
+
+        self.public_suffix.update()
+
+        expected = self.public_suffix.parse(self.data)
+        actual = Dict().from_json(File(self.public_suffix.destination).read())
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = get.call_args[1]["headers"]
+
+        self.assertEqual(expected, actual)
+
+        expected = {
+            "etag": '"hello"',
+            "last_modified": "Mon, 14 Sep 2020 04:00:00 GMT",
+        }
+        actual = Dict().from_json(File(self.public_suffix.cache_destination).read())
+
+        self.assertEqual(expected, actual)
+
+        get.return_value = mock.Mock(status_code=304, text="", headers={})
+
+        with mock.patch.object(PublicSuffix, "parse") as parse:
+            self.public_suffix.update()
+
+            expected = 0
+            actual = parse.call_count
+
+            self.assertEqual(expected, actual)
+
+        expected = {
+            "If-None-Match": '"hello"',
+            "If-Modified-Since": "Mon, 14 Sep 2020 04:00:00 GMT",
+        }
+        actual = get.call_args[1]["headers"]
+
+        self.assertEqual(expected, actual)
+
+        get.return_value = mock.Mock(status_code=500, text="", headers={})
+
+        self.assertRaises(Exception, self.public_suffix.update)
+
+        PyFunceble.CONFIGURATION["quiet"] = False
+
+
+if __name__ == "__main__":
+    launch_tests()
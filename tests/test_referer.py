@@ -0,0 +1,154 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.referer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble import load_config
+from PyFunceble.referer import Referer
+
+
+class TestReferer(TestCase):
+    """
+    Testing of PyFunceble.referer.Referer().
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        load_config(True)
+
+        self.iana_db = PyFunceble.INTERN.get("iana_db")
+        self.logs = PyFunceble.CONFIGURATION["logs"]
+
+        PyFunceble.CONFIGURATION["logs"] = False
+
+        PyFunceble.INTERN["iana_db"] = {
+            "com": "whois.verisign-grs.com",
+            "now": " whois.nic.now",
+            "ad": "",
+            "aaa": "",
+            "example": "",
+        }
+
+    def tearDown(self):
+        """
+        Reset everything we changed.
+        """
+
+        PyFunceble.INTERN["iana_db"] = self.iana_db
+        PyFunceble.CONFIGURATION["logs"] = self.logs
+        PyFunceble.CONFIGURATION["no_whois"] = False
+
+    def test_build(self):
+        """
+        Test Referer.build().
+        """
+
+        expected = {
+            "com": "whois.verisign-grs.com",
+            "now": "whois.nic.now",
+            "ad": None,
+            "aaa": "whois.nic.aaa",
+            "example": "",
+        }
+        actual = Referer.build(PyFunceble.INTERN["iana_db"])
+
+        for extension, referer in expected.items():
+            self.assertEqual(referer, actual[extension])
+
+        expected = set(Referer.ignored_extensions)
+        actual = {x for x, y in actual.items() if y is None}
+
+        self.assertEqual(expected, actual)
+
+    def test_get(self):
+        """
+        Test Referer().get().
+        """
+
+        expected = {
+            "example.com": "whois.verisign-grs.com",
+            "example.now": "whois.nic.now",
+            "example.aaa": "whois.nic.aaa",
+            "example.ad": None,
+            "example.example": None,
+            "example.org": False,
+            "example": False,
+        }
+        actual = {x: Referer(x).get() for x in expected}
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["no_whois"] = True
+
+        expected = {"example.com": None, "example.org": False}
+        actual = {x: Referer(x).get() for x in expected}
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,206 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.scheduler.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.core import Core
+from PyFunceble.scheduler import Scheduler
+
+
+class TestScheduler(TestCase):
+    """
+    Testing of PyFunceble.scheduler.Scheduler().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["syntax"] = False
+        PyFunceble.CONFIGURATION["no_whois"] = False
+        PyFunceble.CONFIGURATION["share_logs"] = False
+        PyFunceble.INTERN["to_test_type"] = "domain"
+        PyFunceble.INTERN["file_to_test"] = "this_file_is_a_ghost"
+        PyFunceble.INTERN["whois_db"] = {}
+
+        self.scheduler = Scheduler(
+            None, Core._format_domain  # pylint: disable=protected-access
+        )
+
+    def tearDown(self):
+        """
+        Reset the configuration.
+        """
+
+        PyFunceble.CONFIGURATION["syntax"] = False
+        PyFunceble.CONFIGURATION["no_whois"] = False
+        del PyFunceble.INTERN["file_to_test"]
+        del PyFunceble.INTERN["whois_db"]
+
+    def test_classify_fast(self):
+        """
+        Test Scheduler().classify() for the fast elements.
+        """
+
+        expected = "fast"
+
+        for subject in ["# hello.world", "hello", "hello.world_hello"]:
+            actual = self.scheduler.classify(subject)
+
+            self.assertEqual(expected, actual, subject)
+
+        PyFunceble.CONFIGURATION["syntax"] = True
+
+        actual = self.scheduler.classify("google.com")
+
+        self.assertEqual(expected, actual)
+
+    def test_classify_http(self):
+        """
+        Test Scheduler().classify() for the elements which only
+        need the HTTP status code.
+        """
+
+        expected = "http"
+
+        for subject in [
+            "www.google.com",
+            "192.168.0.1",
+            "0.0.0.0 www.github.com",
+            "hello.mw",
+        ]:
+            actual = self.scheduler.classify(subject)
+
+            self.assertEqual(expected, actual, subject)
+
+        PyFunceble.INTERN["whois_db"] = {
+            "this_file_is_a_ghost": {"google.com": {"state": "future"}}
+        }
+
+        actual = self.scheduler.classify("google.com")
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["no_whois"] = True
+
+        actual = self.scheduler.classify("github.com")
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["no_whois"] = False
+        PyFunceble.INTERN["to_test_type"] = "url"
+
+        actual = self.scheduler.classify("https://github.com")
+
+        self.assertEqual(expected, actual)
+
+    def test_classify_whois(self):
+        """
+        Test Scheduler().classify() for the elements which need
+        a WHOIS record.
+        """
+
+        expected = "whois"
+
+        for subject in ["google.com", "0.0.0.0 github.com"]:
+            actual = self.scheduler.classify(subject)
+
+            self.assertEqual(expected, actual, subject)
+
+    def test_test(self):
+        """
+        Test Scheduler().test().
+        """
+
+        PyFunceble.CONFIGURATION["syntax"] = True
+        scheduler = Scheduler(
+            Core._test_in_worker,  # pylint: disable=protected-access
+            Core._format_domain,  # pylint: disable=protected-access
+        )
+
+        # We want to get the results while we are still giving elements.
+        scheduler.pending_per_worker = 1
+
+        list_to_test = ["google.com", "hello", "0.0.0.0 github.com"]
+
+        expected = [
+            ("google.com", "VALID"),
+            ("hello", "INVALID"),
+            ("github.com", "VALID"),
+        ]
+        actual = [(x["to_test"], x["status"]) for x in scheduler.test(list_to_test)]
+
+        self.assertEqual(expected, actual)
+
+        expected = {"fast": 3, "http": 0, "whois": 0}
+        actual = scheduler.scheduled
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,255 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.timings.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.config import Load
+from PyFunceble.helpers import Dict, File
+from PyFunceble.timings import Timings
+
+
+class TestTimings(TestCase):
+    """
+    Testing of PyFunceble.timings.Timings().
+    """
+
+    def setUp(self):
+        """
+        Setup the needed variables.
+        """
+
+        Load(PyFunceble.get_current_directory())
+
+        PyFunceble.CONFIGURATION["timings"] = True
+        Timings.histograms = {}
+        Timings.last_dump = None
+
+        self.file = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS["parent_directory"]
+            + PyFunceble.OUTPUTS["logs"]["directories"]["parent"]
+            + PyFunceble.OUTPUTS["logs"]["filenames"]["timings"]
+        )
+
+        File(self.file).delete()
+
+    def tearDown(self):
+        """
+        Clean what we generated.
+        """
+
+        PyFunceble.CONFIGURATION["timings"] = False
+        Timings.histograms = {}
+        Timings.last_dump = None
+
+        File(self.file).delete()
+
+    def test_context_manager(self):
+        """
+        Test the usage as a context manager.
+        """
+
+        with Timings("hello"):
+            pass
+
+        expected = 1
+        actual = Timings.histograms["hello"]["count"]
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["timings"] = False
+
+        with Timings("world"):
+            pass
+
+        self.assertNotIn("world", Timings.histograms)
+
+    def test_timed(self):
+        """
+        Test the usage as a decorator.
+        """
+
+        @Timings.timed("hello")
+        def hello(name):
+            """
+            Say hello.
+            """
+
+            return "Hello, %s!" % name
+
+        expected = "Hello, world!"
+        actual = hello("world")
+
+        self.assertEqual(expected, actual)
+
+        expected = 1
+        actual = Timings.histograms["hello"]["count"]
+
+        self.assertEqual(expected, actual)
+
+    def test_percentile(self):
+        """
+        Test Timings.percentile().
+        """
+
+        for index in range(1, 101):
+            Timings.add("hello", index / 1000)
+
+        histogram = Timings.histograms["hello"]
+
+        for percent in [50, 95, 99]:
+            expected = percent / 1000
+            actual = Timings.percentile(histogram, percent)
+
+            # The percentiles are precise to 10%.
+            self.assertLessEqual(expected, actual)
+            self.assertLessEqual(actual, expected * Timings.bucket_growth)
+
+        expected = 0.1
+        actual = Timings.percentile(histogram, 100)
+
+        self.assertEqual(expected, actual)
+
+    def test_pop_merge(self):
+        """
+        Test Timings.pop() and Timings.merge().
+        """
+
+        Timings.add("hello", 0.5)
+        Timings.add("hello", 2)
+
+        worker = Timings.pop()
+
+        expected = {}
+        actual = Timings.histograms
+
+        self.assertEqual(expected, actual)
+
+        Timings.add("hello", 0.002)
+        Timings.merge(worker)
+        Timings.merge(None)
+
+        expected = {"count": 3, "total": 2.502, "max": 2}
+        actual = Timings.histograms["hello"]
+
+        self.assertEqual(expected["count"], actual["count"])
+        self.assertAlmostEqual(expected["total"], actual["total"])
+        self.assertEqual(expected["max"], actual["max"])
+        self.assertEqual(3, sum(actual["buckets"].values()))
+
+    def test_summary(self):
+        """
+        Test Timings.summary().
+        """
+
+        for duration in [0.0005, 0.005, 0.05, 0.5, 5, 50]:
+            Timings.add("hello", duration)
+
+        actual = Timings.summary()["hello"]
+
+        self.assertEqual(6, actual["count"])
+        self.assertEqual(50, actual["max"])
+        self.assertEqual(
+            {
+                "<= 0.001s": 1,
+                "<= 0.01s": 1,
+                "<= 0.1s": 1,
+                "<= 1s": 1,
+                "<= 10s": 1,
+                "> 10s": 1,
+            },
+            actual["histogram"],
+        )
+
+        for index in ["mean", "total", "p50", "p95", "p99"]:
+            self.assertIn(index, actual)
+
+    def test_dump(self):
+        """
+        Test Timings.dump().
+        """
+
+        Timings.add("hello", 0.5)
+
+        Timings.dump(periodic=True)
+
+        self.assertFalse(PyFunceble.path.isfile(self.file))
+
+        Timings.dump()
+
+        expected = Timings.summary()
+        actual = Dict().from_json(File(self.file).read())
+
+        self.assertEqual(expected, actual)
+
+        File(self.file).delete()
+        Timings.last_dump -= Timings.seconds_between_dumps
+
+        Timings.dump(periodic=True)
+
+        self.assertTrue(PyFunceble.path.isfile(self.file))
+
+
+if __name__ == "__main__":
+    launch_tests()
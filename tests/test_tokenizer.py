@@ -0,0 +1,163 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.tokenizer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Contributors:
+    http://pyfunceble.readthedocs.io/en/master/special-thanks.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://funilrys.github.io/PyFunceble/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017-2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=import-error
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from PyFunceble.helpers import File
+from PyFunceble.tokenizer import Tokenizer
+
+
+class TestTokenizer(TestCase):
+    """
+    Testing of PyFunceble.tokenizer.Tokenizer().
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        self.file = "this_file_is_a_ghost"
+
+        File(self.file).delete()
+
+    def tearDown(self):
+        """
+        Delete everything we created.
+        """
+
+        File(self.file).delete()
+
+    def test_lines(self):
+        """
+        Test Tokenizer.lines().
+        """
+
+        self.assertRaises(FileNotFoundError, lambda: Tokenizer.lines(self.file))
+
+        content = "# Hello\n0.0.0.0 example.org\n  example.net \t\n\n# World"
+
+        for encoding, subject in [("ascii", ""), ("utf-8", "\n0.0.0.0 bücher.de")]:
+            with open(self.file, "w", encoding=encoding) as file:
+                file.write(content + subject)
+
+            expected = ["0.0.0.0 example.org", "example.net", ""]
+
+            if subject:
+                expected.append("0.0.0.0 bücher.de")
+
+            actual = Tokenizer.lines(self.file)
+
+            self.assertEqual(expected, actual)
+
+    def test_token(self):
+        """
+        Test Tokenizer.token() and Tokenizer.tokens().
+        """
+
+        expected = {
+            "": "",
+            "# Hello World": "",
+            "example.org": "example.org",
+            "example.org # Hello": "example.org",
+            "0.0.0.0 example.org": "example.org",
+            "0.0.0.0\texample.org # Hello": "example.org",
+            "0.0.0.0  \t example.org example.net": "example.org",
+            "0.0.0.0#example.org": "0.0.0.0",
+        }
+
+        for line, subject in expected.items():
+            self.assertEqual(subject, Tokenizer.token(line))
+
+        self.assertEqual(
+            list(expected.values()), Tokenizer.tokens(list(expected.keys()))
+        )
+
+    def test_is_reserved(self):
+        """
+        Test Tokenizer.is_reserved() and Tokenizer.without_reserved().
+        """
+
+        expected = {
+            "localhost": True,
+            "0.0.0.0": True,
+            "ip6-allrouters": True,
+            "hello.localdomain": True,
+            "http://localhost": True,
+            "example.org": False,
+            "mylocalhost": False,
+            "10.0.0.0": False,
+            "localhost.example.org": False,
+        }
+
+        for subject, reserved in expected.items():
+            self.assertEqual(reserved, Tokenizer.is_reserved(subject), subject)
+
+        self.assertEqual(
+            [x for x, y in expected.items() if not y],
+            Tokenizer.without_reserved(list(expected.keys())),
+        )
+
+
+if __name__ == "__main__":
+    launch_tests()